@@ -0,0 +1,43 @@
+"""Retention indexes
+
+Revision ID: b41c7e2d9a13
+Revises: 8fb7b572de90
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b41c7e2d9a13"
+down_revision: Union[str, Sequence[str], None] = "8fb7b572de90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES: tuple[str, ...] = (
+    "current_weather_response",
+    "forecast_response",
+    "location_response",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_retain_created_at",
+            table,
+            ["retain", "created_at"],
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_retain_created_at", table_name=table, if_exists=True)
@@ -6,14 +6,19 @@ from weatherapi_collector.domain import (
     CurrentWeatherJSONCollectorOut,
 )
 
-all_current_weather_responses = db_client.get_all_current_weather_responses()
-print(f"Retrieved {len(all_current_weather_responses)} current weather responses:")
-for response in all_current_weather_responses:
-    output_schema = CurrentWeatherJSONCollectorOut(
-        current_weather_json=response.current_weather_json,
-        id=response.id,
-        created_at=response.created_at,
-        retain=response.retain,
-    )
+## Stream responses in batches, so large tables are never loaded all at once
+total: int = 0
+for batch in db_client.iter_current_weather_responses(batch_size=500):
+    for response in batch:
+        output_schema = CurrentWeatherJSONCollectorOut(
+            current_weather_json=response.current_weather_json,
+            id=response.id,
+            created_at=response.created_at,
+            retain=response.retain,
+        )
 
-    print(output_schema.model_dump_json(indent=2))
+        print(output_schema.model_dump_json(indent=2))
+
+    total += len(batch)
+
+print(f"Retrieved {total} current weather responses")
@@ -0,0 +1,111 @@
+"""Benchmark saves/second with a per-call engine vs. the shared engine registry.
+
+Usage:
+    python scripts/db/bench_engine_cache.py [--rows 500] [--db-file .db/bench.sqlite3]
+
+Writes to a throwaway SQLite database, never the configured collector database.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+from shared import db
+
+import sqlalchemy as sa
+from weatherapi_collector.db_client import Base
+from weatherapi_collector.domain import (
+    CurrentWeatherJSONCollectorModel,
+    CurrentWeatherJSONCollectorRepository,
+)
+
+## Roughly the size of a real current weather response
+SAMPLE_RESPONSE: dict = {
+    "location": {"name": "London", "region": "City of London", "country": "UK"},
+    "current": {"last_updated_epoch": 1760000000, "temp_c": 12.3, "humidity": 81},
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Engine registry benchmark.")
+    parser.add_argument("--rows", type=int, default=500, help="Rows to save per run.")
+    parser.add_argument(
+        "--db-file",
+        type=str,
+        default=None,
+        help="SQLite file to write to. Defaults to a temporary file.",
+    )
+
+    return parser.parse_args()
+
+
+def _save(session_pool) -> None:
+    with session_pool() as session:
+        repo = CurrentWeatherJSONCollectorRepository(session=session)
+        repo.create(
+            CurrentWeatherJSONCollectorModel(current_weather_json=SAMPLE_RESPONSE)
+        )
+
+
+def bench_uncached(db_uri: sa.URL, rows: int) -> float:
+    """Build a new engine & session pool for every save (previous behavior)."""
+    start = time.perf_counter()
+
+    for _ in range(rows):
+        engine = db.get_engine(url=db_uri)
+        _save(db.get_session_pool(engine=engine))
+        engine.dispose()
+
+    return rows / (time.perf_counter() - start)
+
+
+def bench_cached(db_uri: sa.URL, rows: int) -> float:
+    """Reuse the shared engine & session pool from the registry."""
+    start = time.perf_counter()
+
+    for _ in range(rows):
+        _save(db.get_cached_session_pool(url=db_uri))
+
+    elapsed = time.perf_counter() - start
+    db.dispose_cached_engines()
+
+    return rows / elapsed
+
+
+def main():
+    args = parse_args()
+
+    if args.db_file:
+        db_file = Path(args.db_file)
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+    else:
+        db_file = Path(tempfile.mkdtemp()) / "bench.sqlite3"
+
+    db_uri: sa.URL = db.get_db_uri(
+        drivername="sqlite+pysqlite",
+        username=None,
+        password=None,
+        host=None,
+        port=None,
+        database=str(db_file),
+    )
+
+    setup_engine = db.get_engine(url=db_uri)
+    db.create_base_metadata(base=Base, engine=setup_engine)
+    setup_engine.dispose()
+
+    uncached: float = bench_uncached(db_uri, args.rows)
+    cached: float = bench_cached(db_uri, args.rows)
+
+    print(f"Database: {db_file}")
+    print(f"Rows per run: {args.rows}")
+    print(f"Engine per call:  {uncached:10.1f} saves/s")
+    print(f"Shared engine:    {cached:10.1f} saves/s")
+    print(f"Speedup:          {cached / uncached:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
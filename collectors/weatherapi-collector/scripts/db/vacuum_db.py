@@ -1,17 +1,41 @@
 from __future__ import annotations
 
+import argparse
+
 from loguru import logger as log
 from shared.setup import setup_loguru_logging
 from weatherapi_collector.config import DB_SETTINGS
-from weatherapi_collector.db_client import vacuum_current_weather
+from weatherapi_collector.db_client import (
+    vacuum_current_weather_json_responses,
+    vacuum_forecast_weather_json_responses,
+)
 
 if __name__ == "__main__":
     setup_loguru_logging()
     log.debug("DEBUG logging enabled")
 
+    parser = argparse.ArgumentParser(
+        description="Delete collector responses marked retain=false."
+    )
+    parser.add_argument(
+        "--older-than-days",
+        type=float,
+        default=None,
+        help="Only delete rows older than this many days.",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None, help="Rows deleted per commit."
+    )
+    args = parser.parse_args()
+
     log.info("Starting database vacuum process")
     try:
-        rows_deleted = vacuum_current_weather()
+        rows_deleted = vacuum_current_weather_json_responses(
+            older_than_days=args.older_than_days, chunk_size=args.chunk_size
+        )
+        rows_deleted += vacuum_forecast_weather_json_responses(
+            older_than_days=args.older_than_days, chunk_size=args.chunk_size
+        )
         log.info(f"Database vacuum complete. Rows deleted: {rows_deleted}")
     except Exception as exc:
         log.error(f"Error during database vacuum: {exc}")
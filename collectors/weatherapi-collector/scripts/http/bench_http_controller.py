@@ -0,0 +1,150 @@
+"""Benchmark request latency with a per-call HttpxController vs. a long-lived one.
+
+Usage:
+    python scripts/http/bench_http_controller.py [--requests 200] [--url https://...] [--use-cache]
+
+Without `--url`, requests go to a throwaway local HTTP server, so no WeatherAPI quota is spent.
+"cold" builds a controller (cache storage, transport, client & connection) for every request,
+like the client functions did before a controller could be injected. "warm" reuses one
+persistent controller, so its cache storage & keep-alive connections are reused.
+"""
+
+from __future__ import annotations
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import statistics
+import tempfile
+import threading
+import time
+
+from shared import http_lib
+
+import httpx
+
+_BODY: bytes = b'{"current": {"temp_c": 12.3}}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ## Send headers & body in one write, avoiding delayed-ACK stalls on keep-alive connections
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HttpxController lifecycle benchmark.")
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests to send per run."
+    )
+    parser.add_argument(
+        "--url",
+        type=str,
+        default=None,
+        help="URL to request. Defaults to a local HTTP server.",
+    )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Enable the hishel SQLite cache (in a temporary directory).",
+    )
+
+    return parser.parse_args()
+
+
+def _controller(cache_db_file: str, use_cache: bool, persistent: bool):
+    ## Disable coalescing & the memory tier, so every request reaches the transport
+    return http_lib.get_http_controller(
+        use_cache=use_cache,
+        cache_db_file=cache_db_file,
+        persistent=persistent,
+        coalescer=http_lib.RequestCoalescer(ttl=0),
+        memory_cache=http_lib.MemoryCacheTier(max_entries=0),
+        retry_policy=http_lib.RetryPolicy(max_retries=0),
+    )
+
+
+def bench_cold(
+    url: str, requests: int, cache_db_file: str, use_cache: bool
+) -> list[float]:
+    """Build & close a controller for every request."""
+    timings: list[float] = []
+
+    for i in range(requests):
+        ## Unique query, so the cache (if enabled) never answers
+        request = httpx.Request("GET", url, params={"n": f"cold-{i}"})
+
+        start = time.perf_counter()
+        with _controller(cache_db_file, use_cache, persistent=False) as http:
+            http.send_request(request)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def bench_warm(
+    url: str, requests: int, cache_db_file: str, use_cache: bool
+) -> list[float]:
+    """Reuse one persistent controller for every request."""
+    timings: list[float] = []
+    http = _controller(cache_db_file, use_cache, persistent=True)
+
+    try:
+        for i in range(requests):
+            request = httpx.Request("GET", url, params={"n": f"warm-{i}"})
+
+            start = time.perf_counter()
+            http.send_request(request)
+            timings.append(time.perf_counter() - start)
+    finally:
+        http.close()
+
+    return timings
+
+
+def _summary(label: str, timings: list[float]) -> str:
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+
+    return f"{label:<6} mean {statistics.mean(ms):8.2f}ms  median {statistics.median(ms):8.2f}ms  p95 {p95:8.2f}ms"
+
+
+def main():
+    args = parse_args()
+
+    server: ThreadingHTTPServer | None = None
+    url: str | None = args.url
+
+    if url is None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/v1/current.json"
+
+    cache_db_file: str = f"{tempfile.mkdtemp()}/hishel.sqlite3"
+
+    try:
+        cold = bench_cold(url, args.requests, cache_db_file, args.use_cache)
+        warm = bench_warm(url, args.requests, cache_db_file, args.use_cache)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    print(f"URL: {url}")
+    print(f"Requests per run: {args.requests} [cache: {args.use_cache}]")
+    print(_summary("Cold", cold))
+    print(_summary("Warm", warm))
+    print(f"Speedup (mean): {statistics.mean(cold) / statistics.mean(warm):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,16 @@ import typing as t
 
 from weatherapi_collector import (
     client as weatherapi_client,
+    collect,
     db_client,
 )
-from weatherapi_collector.config import WEATHERAPI_SETTINGS, APSCHEDULER_SETTINGS
+from weatherapi_collector.config import (
+    APSCHEDULER_SETTINGS,
+    RETENTION_SETTINGS,
+    WEATHERAPI_SETTINGS,
+)
 from weatherapi_collector.db_init import initialize_database
-from weatherapi_collector.depends import get_db_engine
+from weatherapi_collector.depends import dispose_db_engines, get_db_engine
 from weatherapi_collector.schedules.apscheduler_lib import (
     default_cron_schedule,
     start_scheduler,
@@ -19,10 +24,14 @@ from weatherapi_collector.schedules.schedule_lib import (
 )
 
 from loguru import logger as log
+from shared.depends import close_httpx_controller
 from shared.domain.weatherapi.weather import CurrentWeatherJSONIn, ForecastJSONIn
 from shared.setup import setup_loguru_logging
 import sqlalchemy as sa
 
+## Days of forecast requested per location
+FORECAST_DAYS: int = 1
+
 
 def collect_current_weather(location_name: str | None = None) -> dict:
     return weatherapi_client.get_current_weather(location=location_name)
@@ -65,6 +74,7 @@ def start_schedule_lib_schedules(
     weatherapi_jobs_schedule_minutes_list: list[str] = [],
     data_jobs_minutes_schedule: list[str] = [],
     cleanup_jobs_minutes_schedule: list[str] = [],
+    retention_job_time: str | None = None,
 ):
 
     ## Initialize database engine
@@ -75,8 +85,13 @@ def start_schedule_lib_schedules(
     log.debug(
         f"Start scheduler: {run_schedule}, save to DB: {save_to_db}, DB echo: {db_echo}"
     )
-    location_name: str = WEATHERAPI_SETTINGS.get("LOCATION_NAME")
-    forecast_days: int = 1
+    location_names: list[str] = collect.get_location_names()
+    location_name: str = (
+        location_names[0]
+        if location_names
+        else WEATHERAPI_SETTINGS.get("LOCATION_NAME")
+    )
+    forecast_days: int = FORECAST_DAYS
 
     if run_schedule:
         start_weatherapi_scheduled_collection(
@@ -88,7 +103,17 @@ def start_schedule_lib_schedules(
             weatherapi_jobs_minutes_schedule=weatherapi_jobs_schedule_minutes_list,
             data_jobs_minutes_schedule=data_jobs_minutes_schedule,
             cleanup_jobs_minutes_schedule=cleanup_jobs_minutes_schedule,
+            retention_job_time=retention_job_time,
             db_engine=db_engine,
+            location_names=location_names,
+        )
+
+    elif len(location_names) > 1:
+        collect.collect_locations_sync(
+            location_names=location_names,
+            forecast_days=forecast_days,
+            save_to_db=save_to_db,
+            db_echo=db_echo,
         )
 
     else:
@@ -135,8 +160,13 @@ def start_apscheduler_lib_schedules(
     db_echo: bool = False,
     save_to_db: bool = False,
 ):
-    location_name: str = WEATHERAPI_SETTINGS.get("LOCATION_NAME")
-    forecast_days: int = 1
+    location_names: list[str] = collect.get_location_names()
+    location_name: str = (
+        location_names[0]
+        if location_names
+        else WEATHERAPI_SETTINGS.get("LOCATION_NAME")
+    )
+    forecast_days: int = FORECAST_DAYS
 
     if run_schedule:
         start_scheduler(
@@ -146,6 +176,15 @@ def start_apscheduler_lib_schedules(
             forecast_days=forecast_days,
             save_to_db=save_to_db,
             db_echo=db_echo,
+            location_names=location_names,
+        )
+
+    elif len(location_names) > 1:
+        collect.collect_locations_sync(
+            location_names=location_names,
+            forecast_days=forecast_days,
+            save_to_db=save_to_db,
+            db_echo=db_echo,
         )
 
     else:
@@ -271,8 +310,21 @@ def main():
         "cleanup_jobs": APSCHEDULER_SETTINGS.get(
             "CLEANUP_JOBS_SCHEDULE", "*/5 * * * *"
         ),
+        ## Retention job only runs when [retention] enabled = true
+        "retention_jobs": (
+            RETENTION_SETTINGS.get("SCHEDULE", "30 3 * * *")
+            if RETENTION_SETTINGS.get("ENABLED", False)
+            else None
+        ),
     }
 
+    ## Time of day (HH:MM) schedule_lib runs the retention job, if enabled
+    SCHEDULE_LIB_RETENTION_JOB_TIME: str | None = (
+        RETENTION_SETTINGS.get("SCHEDULE_LIB_TIME", "03:30")
+        if RETENTION_SETTINGS.get("ENABLED", False)
+        else None
+    )
+
     ############################
     # Start Selected Scheduler #
     ############################
@@ -286,6 +338,7 @@ def main():
                 weatherapi_jobs_schedule_minutes_list=SCHEDULE_LIB_WEATHERAPI_JOBS_SCHEDULE_MINUTES_LIST,
                 data_jobs_minutes_schedule=SCHEDULE_LIB_DATA_JOBS_SCHEDULE_MINUTES_LIST,
                 cleanup_jobs_minutes_schedule=SCHEDULE_LIB_CLEANUP_JOBS_SCHEDULE_MINUTES_LIST,
+                retention_job_time=SCHEDULE_LIB_RETENTION_JOB_TIME,
             )
         case "apscheduler_lib":
             start_apscheduler_lib_schedules(
@@ -307,3 +360,6 @@ if __name__ == "__main__":
     except Exception as exc:
         log.error(f"({type(exc)}) Failed to run WeatherAPI collector: {exc}")
         exit(1)
+    finally:
+        dispose_db_engines()
+        close_httpx_controller()
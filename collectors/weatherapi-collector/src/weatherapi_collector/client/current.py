@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import time
-
 from shared import http_lib
 from weatherapi_collector.config import WEATHERAPI_SETTINGS
 from weatherapi_collector.convert.methods import (
@@ -18,11 +16,12 @@ from . import requests
 import hishel
 import httpx
 from loguru import logger as log
+from shared.depends import get_async_httpx_controller
 import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as so
 
-__all__ = ["get_current_weather"]
+__all__ = ["get_current_weather", "get_current_weather_async"]
 
 
 def get_current_weather(
@@ -31,6 +30,7 @@ def get_current_weather(
     include_aqi: bool = True,
     headers: dict | None = None,
     use_cache: bool = False,
+    http_controller: http_lib.HttpxController | None = None,
     retry: bool = True,
     max_retries: int = 3,
     retry_sleep: int = 5,
@@ -46,10 +46,13 @@ def get_current_weather(
         include_aqi (bool, optional): Whether to include the air quality index. Defaults to True.
         headers (dict | None, optional): The headers to use. Defaults to None.
         use_cache (bool, optional): Whether to use the cache. Defaults to False.
+        http_controller (HttpxController | None, optional): A long-lived controller to send the request with,
+            i.e. `shared.depends.get_shared_httpx_controller()`. When `None`, a controller is built
+            (& closed) for this call, using `use_cache`. Defaults to None.
         retry (bool, optional): Whether to retry the request. Defaults to True.
         max_retries (int, optional): The maximum number of retries to make. Defaults to 3.
-        retry_sleep (int, optional): The number of seconds to sleep between retries. Defaults to 5.
-        retry_stagger (int, optional): The number of seconds to stagger the retries. Defaults to 3.
+        retry_sleep (int, optional): Backoff ceiling, in seconds, for the first retry. Doubles each retry, with jitter. Defaults to 5.
+        retry_stagger (int, optional): Unused, kept for compatibility. Retries back off exponentially instead.
         save_to_db (bool, optional): Whether to save the current weather to the database. Defaults to False.
         db_engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
         db_echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
@@ -73,41 +76,25 @@ def get_current_weather(
 
     log.info(f"Requesting current weather in location '{location}'")
 
-    with http_lib.get_http_controller(use_cache=use_cache) as http:
+    retry_policy = http_lib.RetryPolicy(
+        max_retries=max_retries if retry else 0, backoff_base=retry_sleep
+    )
+
+    if http_controller is None:
+        http_controller = http_lib.get_http_controller(use_cache=use_cache)
+
+    with http_controller as http:
         try:
-            res: httpx.Response = http.client.send(current_weather_request)
+            res: httpx.Response = http.send_request(
+                current_weather_request, retry_policy=retry_policy
+            )
             res.raise_for_status()
-        except httpx.ReadTimeout as timeout:
+        except httpx.TimeoutException as timeout:
             log.warning(
                 f"({type(timeout)}) Operation timed out while requesting current weather."
             )
 
-            if not retry:
-                raise timeout
-            else:
-                log.info(f"Retrying {max_retries} time(s)")
-                current_attempt = 0
-                _sleep = retry_sleep
-
-                while current_attempt < max_retries:
-                    if current_attempt > 0:
-                        _sleep += retry_stagger
-
-                    log.info(f"[Retry {current_attempt}/{max_retries}]")
-
-                    try:
-                        res: httpx.Response = http.client.send(current_weather_request)
-                        break
-                    except httpx.ReadTimeout as timeout_2:
-                        log.warning(
-                            f"ReadTimeout on attempt [{current_attempt}/{max_retries}]"
-                        )
-
-                        current_attempt += 1
-
-                        time.sleep(retry_sleep)
-
-                        continue
+            raise timeout
 
     log.debug(f"Response: [{res.status_code}: {res.reason_phrase}]")
 
@@ -191,3 +178,77 @@ def get_current_weather(
             )
 
     return decoded
+
+
+async def get_current_weather_async(
+    location: str = WEATHERAPI_SETTINGS.get("LOCATION_NAME"),
+    api_key: str = WEATHERAPI_SETTINGS.get("API_KEY"),
+    include_aqi: bool = True,
+    headers: dict | None = None,
+    http_controller: http_lib.AsyncHttpxController | None = None,
+    retry: bool = True,
+    max_retries: int = 3,
+    retry_sleep: int = 5,
+) -> dict | None:
+    """Get the current weather for a location without blocking the event loop.
+
+    Description:
+        Sends the request through an `AsyncHttpxController`. Pass the long-lived, shared
+        controller (`shared.depends.get_async_httpx_controller()`) so many locations can
+        be requested concurrently over one connection pool. Saving the response is left
+        to the caller.
+
+    Params:
+        location (str, optional): The location to get the current weather for. Defaults to location_name.
+        api_key (str, optional): The API key to use. Defaults to api_key.
+        include_aqi (bool, optional): Whether to include the air quality index. Defaults to True.
+        headers (dict | None, optional): The headers to use. Defaults to None.
+        http_controller (AsyncHttpxController | None, optional): The controller to send the request with.
+            Defaults to the process-wide shared controller.
+        retry (bool, optional): Whether to retry timeouts & 429/5xx responses. Defaults to True.
+        max_retries (int, optional): The maximum number of retries to make. Defaults to 3.
+        retry_sleep (int, optional): Backoff ceiling, in seconds, for the first retry. Doubles each retry, with jitter. Defaults to 5.
+
+    Returns:
+        dict | None: The current weather for the location, or `None` on an error response.
+
+    Raises:
+        httpx.TimeoutException: If the request still times out after all retries.
+
+    """
+    if api_key is None or api_key == "":
+        raise ValueError("WeatherAPI key is None or empty.")
+
+    if not location or location == "":
+        raise ValueError("Location name is required")
+
+    if http_controller is None:
+        http_controller = get_async_httpx_controller()
+
+    _request: httpx.Request = requests.return_current_weather_request(
+        api_key=api_key, location=location, include_aqi=include_aqi, headers=headers
+    )
+
+    log.info(f"Requesting current weather for location '{location}'")
+
+    res: httpx.Response = await http_controller.send_request(
+        _request,
+        retry_policy=http_lib.RetryPolicy(
+            max_retries=max_retries if retry else 0, backoff_base=retry_sleep
+        ),
+    )
+
+    log.debug(f"Response: [{res.status_code}: {res.reason_phrase}]")
+
+    if res.status_code in http_lib.constants.SUCCESS_CODES:
+        log.info("Success requesting current weather")
+
+        return http_lib.decode_response(response=res)
+    elif res.status_code in http_lib.constants.ALL_ERROR_CODES:
+        log.warning(f"Error: [{res.status_code}: {res.reason_phrase}]: {res.text}")
+    else:
+        log.error(
+            f"Unhandled error code: [{res.status_code}: {res.reason_phrase}]: {res.text}"
+        )
+
+    return None
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import time
-
 from shared import http_lib
 from weatherapi_collector.config import WEATHERAPI_SETTINGS
 from weatherapi_collector.convert import weather_forecast_dict_to_schema
@@ -12,9 +10,10 @@ from . import requests
 
 import httpx
 from loguru import logger as log
+from shared.depends import get_async_httpx_controller
 import sqlalchemy as sa
 
-__all__ = ["get_weather_forecast"]
+__all__ = ["get_weather_forecast", "get_weather_forecast_async"]
 
 
 def get_weather_forecast(
@@ -25,6 +24,7 @@ def get_weather_forecast(
     include_alerts: bool = True,
     headers: dict | None = None,
     use_cache: bool = False,
+    http_controller: http_lib.HttpxController | None = None,
     retry: bool = True,
     max_retries: int = 3,
     retry_sleep: int = 5,
@@ -43,10 +43,13 @@ def get_weather_forecast(
         include_alerts (bool, optional): Whether to include the alerts. Defaults to True.
         headers (dict | None, optional): The headers to use. Defaults to None.
         use_cache (bool, optional): Whether to use the cache. Defaults to False.
+        http_controller (HttpxController | None, optional): A long-lived controller to send the request with,
+            i.e. `shared.depends.get_shared_httpx_controller()`. When `None`, a controller is built
+            (& closed) for this call, using `use_cache`. Defaults to None.
         retry (bool, optional): Whether to retry the request. Defaults to True.
         max_retries (int, optional): The maximum number of retries to make. Defaults to 3.
-        retry_sleep (int, optional): The number of seconds to sleep between retries. Defaults to 5.
-        retry_stagger (int, optional): The number of seconds to stagger the retries. Defaults to 3.
+        retry_sleep (int, optional): Backoff ceiling, in seconds, for the first retry. Doubles each retry, with jitter. Defaults to 5.
+        retry_stagger (int, optional): Unused, kept for compatibility. Retries back off exponentially instead.
         save_to_db (bool, optional): Whether to save the forecast to the database. Defaults to False.
         db_engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
         db_echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
@@ -69,45 +72,30 @@ def get_weather_forecast(
         api_key=api_key,
         location=location,
         include_aqi=include_aqi,
+        include_alerts=include_alerts,
         headers=headers,
     )
 
     log.info(f"Requesting weather forecast for location: {location}")
 
-    with http_lib.get_http_controller(use_cache=use_cache) as http:
+    retry_policy = http_lib.RetryPolicy(
+        max_retries=max_retries if retry else 0, backoff_base=retry_sleep
+    )
+
+    if http_controller is None:
+        http_controller = http_lib.get_http_controller(use_cache=use_cache)
+
+    with http_controller as http:
         try:
-            res: httpx.Response = http.client.send(weather_forecast_request)
-        except httpx.ReadTimeout as timeout:
+            res: httpx.Response = http.send_request(
+                weather_forecast_request, retry_policy=retry_policy
+            )
+        except httpx.TimeoutException as timeout:
             log.warning(
                 f"({type(timeout)}) Operation timed out while requesting weather forecast."
             )
 
-            if not retry:
-                raise timeout
-            else:
-                log.info(f"Retrying {max_retries} time(s)")
-                current_attempt = 0
-                _sleep = retry_sleep
-
-                while current_attempt < max_retries:
-                    if current_attempt > 0:
-                        _sleep += retry_stagger
-
-                    log.info(f"[Retry {current_attempt}/{max_retries}]")
-
-                    try:
-                        res: httpx.Response = http.client.send(weather_forecast_request)
-                        break
-                    except httpx.ReadTimeout as timeout_2:
-                        log.warning(
-                            f"ReadTimeout on attempt [{current_attempt}/{max_retries}]"
-                        )
-
-                        current_attempt += 1
-
-                        time.sleep(retry_sleep)
-
-                        continue
+            raise timeout
 
     log.debug(f"Response: [{res.status_code}: {res.reason_phrase}]")
 
@@ -165,3 +153,86 @@ def get_weather_forecast(
     # )
 
     return decoded
+
+
+async def get_weather_forecast_async(
+    location: str = WEATHERAPI_SETTINGS.get("LOCATION_NAME"),
+    days: int = 1,
+    api_key: str = WEATHERAPI_SETTINGS.get("API_KEY"),
+    include_aqi: bool = True,
+    include_alerts: bool = True,
+    headers: dict | None = None,
+    http_controller: http_lib.AsyncHttpxController | None = None,
+    retry: bool = True,
+    max_retries: int = 3,
+    retry_sleep: int = 5,
+) -> dict | None:
+    """Get the weather forecast for a location without blocking the event loop.
+
+    Description:
+        Sends the request through an `AsyncHttpxController`. Pass the long-lived, shared
+        controller (`shared.depends.get_async_httpx_controller()`) so many locations can
+        be requested concurrently over one connection pool. Saving the response is left
+        to the caller.
+
+    Params:
+        location (str, optional): The location to get the weather forecast for. Defaults to location_name.
+        days (int, optional): The number of days to get the weather forecast for. Defaults to 1.
+        api_key (str, optional): The API key to use. Defaults to api_key.
+        include_aqi (bool, optional): Whether to include the air quality index. Defaults to True.
+        include_alerts (bool, optional): Whether to include the alerts. Defaults to True.
+        headers (dict | None, optional): The headers to use. Defaults to None.
+        http_controller (AsyncHttpxController | None, optional): The controller to send the request with.
+            Defaults to the process-wide shared controller.
+        retry (bool, optional): Whether to retry timeouts & 429/5xx responses. Defaults to True.
+        max_retries (int, optional): The maximum number of retries to make. Defaults to 3.
+        retry_sleep (int, optional): Backoff ceiling, in seconds, for the first retry. Doubles each retry, with jitter. Defaults to 5.
+
+    Returns:
+        dict | None: The weather forecast for the location, or `None` on an error response.
+
+    Raises:
+        httpx.TimeoutException: If the request still times out after all retries.
+
+    """
+    if days > 10:
+        log.warning(
+            f"WeatherAPI only allows 10-day forecasts. {days} is too many, setting to 10."
+        )
+        days: int = 10
+
+    if http_controller is None:
+        http_controller = get_async_httpx_controller()
+
+    _request: httpx.Request = requests.return_weather_forecast_request(
+        days=days,
+        api_key=api_key,
+        location=location,
+        include_aqi=include_aqi,
+        include_alerts=include_alerts,
+        headers=headers,
+    )
+
+    log.info(f"Requesting weather forecast for location '{location}'")
+
+    res: httpx.Response = await http_controller.send_request(
+        _request,
+        retry_policy=http_lib.RetryPolicy(
+            max_retries=max_retries if retry else 0, backoff_base=retry_sleep
+        ),
+    )
+
+    log.debug(f"Response: [{res.status_code}: {res.reason_phrase}]")
+
+    if res.status_code in http_lib.constants.SUCCESS_CODES:
+        log.info("Success requesting weather forecast")
+
+        return http_lib.decode_response(response=res)
+    elif res.status_code in http_lib.constants.ALL_ERROR_CODES:
+        log.warning(f"Error: [{res.status_code}: {res.reason_phrase}]: {res.text}")
+    else:
+        log.error(
+            f"Unhandled error code: [{res.status_code}: {res.reason_phrase}]: {res.text}"
+        )
+
+    return None
@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+from .fanout import *
+from .locations import *
@@ -0,0 +1,204 @@
+"""Concurrent collection of current weather & forecasts for many locations.
+
+Description:
+    Every location is requested on one event loop through a shared `AsyncHttpxController`.
+    An `asyncio.Semaphore` bounds how many locations are in flight at once, and a token
+    bucket spaces requests out so a long location list does not burst past the API's
+    rate limit. The responses collected in one run are saved in a single transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing as t
+
+from shared import http_lib
+from weatherapi_collector import (
+    client as weatherapi_client,
+    db_client,
+)
+from weatherapi_collector.config import WEATHERAPI_SETTINGS
+
+from loguru import logger as log
+from shared.depends import get_async_httpx_controller
+
+__all__ = [
+    "collect_locations",
+    "collect_locations_sync",
+]
+
+
+async def _collect_location(
+    location_name: str,
+    api_key: str,
+    forecast_days: int,
+    semaphore: asyncio.Semaphore,
+    throttle: http_lib.TokenBucket | None,
+    http_controller: http_lib.AsyncHttpxController,
+) -> dict[str, t.Any]:
+    result: dict[str, t.Any] = {
+        "location": location_name,
+        "current_weather": None,
+        "weather_forecast": None,
+        "errors": [],
+    }
+
+    async with semaphore:
+        try:
+            if throttle is not None:
+                await throttle.acquire_async()
+            result[
+                "current_weather"
+            ] = await weatherapi_client.get_current_weather_async(
+                location=location_name,
+                api_key=api_key,
+                http_controller=http_controller,
+            )
+        except Exception as exc:
+            log.error(
+                f"({type(exc)}) Failed to request current weather for location '{location_name}': {exc}"
+            )
+            result["errors"].append(exc)
+
+        try:
+            if throttle is not None:
+                await throttle.acquire_async()
+            result[
+                "weather_forecast"
+            ] = await weatherapi_client.get_weather_forecast_async(
+                location=location_name,
+                days=forecast_days,
+                api_key=api_key,
+                http_controller=http_controller,
+            )
+        except Exception as exc:
+            log.error(
+                f"({type(exc)}) Failed to request weather forecast for location '{location_name}': {exc}"
+            )
+            result["errors"].append(exc)
+
+    return result
+
+
+async def collect_locations(
+    location_names: list[str],
+    api_key: str = WEATHERAPI_SETTINGS.get("API_KEY"),
+    forecast_days: int = 1,
+    max_concurrency: int | None = None,
+    requests_per_second: float | None = None,
+    save_to_db: bool = False,
+    db_echo: bool = False,
+    http_controller: http_lib.AsyncHttpxController | None = None,
+) -> list[dict[str, t.Any]]:
+    """Request current weather & forecasts for many locations concurrently.
+
+    Params:
+        location_names (list[str]): Locations to collect.
+        api_key (str, optional): The WeatherAPI key. Defaults to `weatherapi.api_key`.
+        forecast_days (int, optional): Number of forecast days to request. Defaults to 1.
+        max_concurrency (int | None, optional): Maximum locations in flight at once.
+            Defaults to `weatherapi.fanout_max_concurrency` (10).
+        requests_per_second (float | None, optional): Maximum requests per second to WeatherAPI.
+            Defaults to `weatherapi.fanout_requests_per_second` (5). `0` disables throttling.
+        save_to_db (bool, optional): Save all responses from this run in one transaction. Defaults to False.
+        db_echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+        http_controller (AsyncHttpxController | None, optional): The controller to send requests with.
+            Defaults to the process-wide shared controller.
+
+    Returns:
+        (list[dict]): One dict per location with `location`, `current_weather`, `weather_forecast`
+            (`None` when the request failed), and `errors`.
+
+    """
+    if not location_names:
+        log.warning("No locations to collect.")
+        return []
+
+    if max_concurrency is None:
+        max_concurrency = int(WEATHERAPI_SETTINGS.get("FANOUT_MAX_CONCURRENCY", 10))
+    if requests_per_second is None:
+        requests_per_second = float(
+            WEATHERAPI_SETTINGS.get("FANOUT_REQUESTS_PER_SECOND", 5)
+        )
+    if http_controller is None:
+        http_controller = get_async_httpx_controller()
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    ## One request at a time, spaced 1/requests_per_second apart
+    throttle: http_lib.TokenBucket | None = (
+        http_lib.TokenBucket(rate=requests_per_second, capacity=1)
+        if requests_per_second
+        else None
+    )
+
+    log.info(
+        f"Collecting weather for {len(location_names)} location(s) [concurrency: {max_concurrency}] [rate: {requests_per_second}/s]"
+    )
+    start: float = time.perf_counter()
+
+    async with http_controller:
+        results: list[dict[str, t.Any]] = await asyncio.gather(
+            *(
+                _collect_location(
+                    location_name=location_name,
+                    api_key=api_key,
+                    forecast_days=forecast_days,
+                    semaphore=semaphore,
+                    throttle=throttle,
+                    http_controller=http_controller,
+                )
+                for location_name in location_names
+            )
+        )
+
+    failed: int = sum(1 for r in results if r["errors"])
+    log.info(
+        f"Collected {len(results) - failed}/{len(results)} location(s) in {time.perf_counter() - start:.2f}s"
+    )
+
+    if http_controller.rate_limiter is not None:
+        log.info(f"Rate limit budget: {http_controller.rate_limiter.metrics()}")
+
+    if save_to_db:
+        try:
+            await asyncio.to_thread(
+                db_client.save_collected_responses,
+                [r["current_weather"] for r in results],
+                [r["weather_forecast"] for r in results],
+                db_echo,
+            )
+        except Exception as exc:
+            log.error(f"({type(exc)}) Failed saving collected responses: {exc}")
+            raise
+
+    return results
+
+
+def collect_locations_sync(
+    location_names: list[str],
+    api_key: str = WEATHERAPI_SETTINGS.get("API_KEY"),
+    forecast_days: int = 1,
+    max_concurrency: int | None = None,
+    requests_per_second: float | None = None,
+    save_to_db: bool = False,
+    db_echo: bool = False,
+) -> list[dict[str, t.Any]]:
+    """Run `collect_locations()` from synchronous code, i.e. schedule_lib jobs.
+
+    Description:
+        Each call runs a new event loop, so it uses its own short-lived controller instead
+        of the process-wide one (an httpx.AsyncClient cannot be shared across loops).
+    """
+    return asyncio.run(
+        collect_locations(
+            location_names=location_names,
+            api_key=api_key,
+            forecast_days=forecast_days,
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second,
+            save_to_db=save_to_db,
+            db_echo=db_echo,
+            http_controller=http_lib.get_async_http_controller(use_cache=False),
+        )
+    )
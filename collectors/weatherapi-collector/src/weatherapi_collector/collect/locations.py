@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from weatherapi_collector.config import WEATHERAPI_SETTINGS
+
+from loguru import logger as log
+
+__all__ = ["get_location_names", "load_locations_file"]
+
+
+def load_locations_file(path: str | Path) -> list[str]:
+    """Read location names from a text file, one per line.
+
+    Description:
+        Blank lines and lines starting with `#` are skipped.
+
+    Params:
+        path (str | Path): Path to the locations file.
+
+    Returns:
+        (list[str]): The location names in file order.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+
+    """
+    path: Path = Path(str(path))
+
+    if not path.exists():
+        raise FileNotFoundError(f"Locations file not found: {path}")
+
+    with open(path, "r") as f:
+        lines: list[str] = [line.strip() for line in f.readlines()]
+
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def get_location_names(settings=WEATHERAPI_SETTINGS) -> list[str]:
+    """Return the configured list of locations to collect.
+
+    Description:
+        Locations are merged, in order, from `weatherapi.location_names`, then the file at
+        `weatherapi.locations_file`. If neither is set, falls back to the single
+        `weatherapi.location_name`. Duplicates are dropped, keeping the first occurrence.
+
+    Params:
+        settings (Dynaconf | dict): The `[weatherapi]` settings. Defaults to `WEATHERAPI_SETTINGS`.
+
+    Returns:
+        (list[str]): Location names to collect.
+
+    """
+    location_names: list[str] = list(settings.get("LOCATION_NAMES", None) or [])
+
+    locations_file: str | None = settings.get("LOCATIONS_FILE", None)
+    if locations_file:
+        try:
+            location_names += load_locations_file(locations_file)
+        except Exception as exc:
+            log.error(
+                f"({type(exc)}) Error reading locations file '{locations_file}'. Details: {exc}"
+            )
+            raise
+
+    if not location_names and settings.get("LOCATION_NAME", None):
+        location_names = [settings.get("LOCATION_NAME")]
+
+    ## Drop duplicates, keeping order
+    return list(dict.fromkeys(name.strip() for name in location_names if name))
@@ -12,6 +12,7 @@ __all__ = [
     "TEMPORAL_SETTINGS",
     "API_SERVER_SETTINGS",
     "APSCHEDULER_SETTINGS",
+    "RETENTION_SETTINGS",
 ]
 
 
@@ -50,5 +51,8 @@ TEMPORAL_SETTINGS = SETTINGS.get("temporal", {})
 ## Extract central API server settings from settings object
 API_SERVER_SETTINGS = SETTINGS.get("api_server", {})
 
+## Extract retention policy settings from settings object
+RETENTION_SETTINGS = SETTINGS.get("retention", {})
+
 ## Load APScheduler cron strings
 APSCHEDULER_SETTINGS = SETTINGS.get("weatherapi.apscheduler")
@@ -2,5 +2,7 @@ from __future__ import annotations
 
 from .__methods import *
 from .base import Base
+from .batch import *
 from .current_weather import *
 from .forecast import *
+from .vacuum import *
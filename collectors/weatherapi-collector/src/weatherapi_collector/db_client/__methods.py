@@ -15,9 +15,33 @@ __all__ = [
     "get_db_uri",
     "get_db_engine",
     "get_session_pool",
+    "get_cached_session_pool",
+    "get_db_pool_opts",
 ]
 
 
+def get_db_pool_opts() -> dict[str, t.Any]:
+    """Return connection pool options set in the database settings.
+
+    Description:
+        Reads `db_pool_size`, `db_max_overflow`, `db_pool_pre_ping` and `db_pool_recycle`
+        from the `[database]` settings. Unset options are omitted, so the dialect's
+        default pool behavior is used.
+
+    Returns:
+        (dict[str, Any]): Pool options to pass to `get_db_engine()`.
+
+    """
+    pool_opts: dict[str, t.Any] = {
+        "pool_size": DB_SETTINGS.get("DB_POOL_SIZE", default=None),
+        "max_overflow": DB_SETTINGS.get("DB_MAX_OVERFLOW", default=None),
+        "pool_pre_ping": DB_SETTINGS.get("DB_POOL_PRE_PING", default=None),
+        "pool_recycle": DB_SETTINGS.get("DB_POOL_RECYCLE", default=None),
+    }
+
+    return {k: v for k, v in pool_opts.items() if v is not None}
+
+
 def get_db_uri(
     drivername: str,
     database: str,
@@ -57,12 +81,18 @@ def get_db_uri(
         return db_uri
 
 
-def get_db_engine(db_uri: sa.URL, echo: bool = False) -> sa.Engine:
-    """Construct a SQLAlchemy `Engine` for a database connection.
+def get_db_engine(db_uri: sa.URL, echo: bool = False, **pool_opts: t.Any) -> sa.Engine:
+    """Return a shared SQLAlchemy `Engine` for a database connection.
+
+    Description:
+        Engines are cached in the process-wide `shared.db` engine registry, keyed by
+        URL, echo & pool options. Repeated calls with the same inputs reuse the same
+        engine and connection pool.
 
     Params:
         db_uri (sa.URL): A SQLAlchemy `URL` for a database connection.
         echo (bool): Echo SQL statements to the console.
+        pool_opts (Any): Optional pool options, i.e. `pool_size`, `pool_pre_ping`.
 
     Returns:
         (sa.Engine): A SQLAlchemy `Engine`
@@ -74,7 +104,7 @@ def get_db_engine(db_uri: sa.URL, echo: bool = False) -> sa.Engine:
     if not isinstance(db_uri, sa.URL):
         raise TypeError("db_uri must be a SQLAlchemy URL object")
 
-    engine: sa.Engine = db.get_engine(url=db_uri, echo=echo)
+    engine: sa.Engine = db.get_cached_engine(url=db_uri, echo=echo, **pool_opts)
 
     return engine
 
@@ -100,3 +130,30 @@ def get_session_pool(
     session: so.sessionmaker[so.Session] = db.get_session_pool(engine=engine)
 
     return session
+
+
+def get_cached_session_pool(
+    db_uri: sa.URL, echo: bool = False, **pool_opts: t.Any
+) -> so.sessionmaker[so.Session]:
+    """Return a shared SQLAlchemy `Session` pool for a database connection.
+
+    Params:
+        db_uri (sa.URL): A SQLAlchemy `URL` for a database connection.
+        echo (bool): Echo SQL statements to the console.
+        pool_opts (Any): Optional pool options, i.e. `pool_size`, `pool_pre_ping`.
+
+    Returns:
+        (so.sessionmaker[so.Session]): A SQLAlchemy `Session` pool bound to the shared engine
+
+    """
+    if db_uri is None:
+        raise ValueError("db_uri must be provided")
+
+    if not isinstance(db_uri, sa.URL):
+        raise TypeError("db_uri must be a SQLAlchemy URL object")
+
+    session_pool: so.sessionmaker[so.Session] = db.get_cached_session_pool(
+        url=db_uri, echo=echo, **pool_opts
+    )
+
+    return session_pool
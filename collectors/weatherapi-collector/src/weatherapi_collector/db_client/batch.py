@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from weatherapi_collector.db_client.current_weather import _get_session_pool
+from weatherapi_collector.domain import (
+    CurrentWeatherJSONCollectorModel,
+    ForecastJSONCollectorModel,
+)
+
+from loguru import logger as log
+
+__all__ = ["save_collected_responses"]
+
+
+def save_collected_responses(
+    current_weather_responses: list[dict] | None = None,
+    forecast_responses: list[dict] | None = None,
+    echo: bool = False,
+) -> tuple[int, int]:
+    """Save the responses collected in one scheduler tick in a single transaction.
+
+    Description:
+        All current weather & forecast responses are added to one session and committed
+        together. If the commit fails, the whole batch is rolled back.
+
+    Params:
+        current_weather_responses (list[dict] | None): Decoded WeatherAPI current weather responses.
+        forecast_responses (list[dict] | None): Decoded WeatherAPI forecast responses.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        (tuple[int, int]): The number of current weather & forecast responses saved.
+
+    Raises:
+        Exception: If the batch cannot be saved, the transaction is rolled back and the exception is re-raised.
+
+    """
+    current_weather_models: list[CurrentWeatherJSONCollectorModel] = [
+        CurrentWeatherJSONCollectorModel(current_weather_json=r)
+        for r in current_weather_responses or []
+        if r
+    ]
+    forecast_models: list[ForecastJSONCollectorModel] = [
+        ForecastJSONCollectorModel(forecast_json=r)
+        for r in forecast_responses or []
+        if r
+    ]
+
+    if not current_weather_models and not forecast_models:
+        log.debug("No collected responses to save.")
+        return 0, 0
+
+    SessionLocal = _get_session_pool(echo=echo)
+
+    with SessionLocal() as session:
+        try:
+            session.add_all(current_weather_models)
+            session.add_all(forecast_models)
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            log.error(
+                f"({type(exc)}) Error saving batch of {len(current_weather_models)} current weather & {len(forecast_models)} forecast responses. Details: {exc}"
+            )
+            raise
+
+    log.info(
+        f"Saved {len(current_weather_models)} current weather & {len(forecast_models)} forecast responses in one transaction."
+    )
+
+    return len(current_weather_models), len(forecast_models)
@@ -5,9 +5,14 @@ import typing as t
 
 from weatherapi_collector.config import DB_SETTINGS
 from weatherapi_collector.db_client.__methods import (
+    get_cached_session_pool,
     get_db_engine,
+    get_db_pool_opts,
     get_db_uri,
-    get_session_pool,
+)
+from weatherapi_collector.db_client.vacuum import (
+    apply_response_retention,
+    vacuum_responses,
 )
 from weatherapi_collector.domain import (
     CurrentWeatherJSONCollectorIn,
@@ -21,6 +26,7 @@ from weatherapi_collector.domain import (
 )
 
 from loguru import logger as log
+from shared.db.retention import RetentionPolicy
 import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as so
@@ -29,22 +35,23 @@ __all__ = [
     "save_current_weather_response",
     "count_current_weather_responses",
     "get_all_current_weather_responses",
+    "iter_current_weather_responses",
     "set_current_weather_response_retention",
+    "get_retained_current_weather_responses",
+    "set_current_weather_responses_retention",
     "vacuum_current_weather_json_responses",
+    "apply_current_weather_json_retention",
 ]
 
 
-def _get_engine(echo: bool = False) -> sa.Engine:
-    """Get a SQLAlchemy engine using the default DB settings.
-
-    Params:
-        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+def _get_default_db_uri() -> sa.URL:
+    """Build a SQLAlchemy URL from the default DB settings.
 
     Returns:
-        sa.Engine: A SQLAlchemy engine.
+        sa.URL: A SQLAlchemy URL.
 
     Raises:
-        Exception: If there is an error creating the engine, an `Exception` is raised.
+        Exception: If there is an error constructing the URL, an `Exception` is raised.
 
     """
     try:
@@ -62,8 +69,26 @@ def _get_engine(echo: bool = False) -> sa.Engine:
 
         raise exc
 
+    return db_uri
+
+
+def _get_engine(echo: bool = False) -> sa.Engine:
+    """Get the shared SQLAlchemy engine for the default DB settings.
+
+    Params:
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        sa.Engine: A SQLAlchemy engine.
+
+    Raises:
+        Exception: If there is an error creating the engine, an `Exception` is raised.
+
+    """
+    db_uri = _get_default_db_uri()
+
     try:
-        engine = get_db_engine(db_uri=db_uri, echo=echo)
+        engine = get_db_engine(db_uri=db_uri, echo=echo, **get_db_pool_opts())
     except Exception as exc:
         msg = f"({type(exc)}) Error creating database engine. Details: {exc}"
         log.error(msg)
@@ -74,7 +99,11 @@ def _get_engine(echo: bool = False) -> sa.Engine:
 
 
 def _get_session_pool(echo: bool = False) -> so.sessionmaker[so.Session]:
-    """Get a SQLAlchemy session pool using the provided engine.
+    """Get the shared SQLAlchemy session pool for the default DB settings.
+
+    Description:
+        The session pool & its engine are cached process-wide, so repeated calls reuse
+        the same connection pool instead of building a new engine per call.
 
     Params:
         echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
@@ -86,10 +115,12 @@ def _get_session_pool(echo: bool = False) -> so.sessionmaker[so.Session]:
         Exception: If there is an error creating the session pool, an `Exception` is raised.
 
     """
-    _engine = _get_engine(echo=echo)
+    db_uri = _get_default_db_uri()
 
     try:
-        session_pool = get_session_pool(_engine)
+        session_pool = get_cached_session_pool(
+            db_uri=db_uri, echo=echo, **get_db_pool_opts()
+        )
     except Exception as exc:
         msg = f"({type(exc)}) Error creating database session pool. Details: {exc}"
         log.error(msg)
@@ -173,11 +204,14 @@ def save_current_weather_response(
         raise exc
 
 
-def count_current_weather_responses(echo: bool = False):
+def count_current_weather_responses(
+    echo: bool = False, retain: bool | None = None
+) -> int:
     """Return a count of the number of rows in the current weather table.
 
     Params:
         echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+        retain (bool | None, optional): Only count rows with this retain flag. Defaults to None (all rows).
 
     Returns:
         int: The count of the number of rows in the current weather table.
@@ -191,16 +225,23 @@ def count_current_weather_responses(echo: bool = False):
     with SessionLocal() as session:
         repo = CurrentWeatherJSONCollectorRepository(session=session)
 
-        return repo.count()
+        if retain is None:
+            return repo.count()
+
+        return repo.count(where=CurrentWeatherJSONCollectorModel.retain.is_(retain))
 
 
 def get_all_current_weather_responses(
     echo: bool = False,
+    defer_json: bool = False,
+    retain: bool | None = None,
 ) -> list[CurrentWeatherJSONCollectorOut]:
     """Get all current weather entries from the database.
 
     Params:
         echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+        defer_json (bool, optional): Do not load the JSON column. Accessing it after the session closes raises an error. Defaults to False.
+        retain (bool | None, optional): Only return entries with this retain flag. Defaults to None (all entries).
 
     Returns:
         list[CurrentWeatherOut]: A list of all current weather entries in the database.
@@ -214,12 +255,60 @@ def get_all_current_weather_responses(
     with SessionLocal() as session:
         repo = CurrentWeatherJSONCollectorRepository(session=session)
 
-        all_models = repo.list() or []
+        all_models = (
+            repo.list(
+                where=(
+                    CurrentWeatherJSONCollectorModel.retain.is_(retain)
+                    if retain is not None
+                    else None
+                ),
+                defer_json=defer_json,
+            )
+            or []
+        )
         log.debug(f"Found {len(all_models)} current weather entries in the database.")
 
     return all_models
 
 
+def iter_current_weather_responses(
+    batch_size: int = 500,
+    retain: bool | None = None,
+    defer_json: bool = False,
+    echo: bool = False,
+) -> t.Iterator[list[CurrentWeatherJSONCollectorModel]]:
+    """Yield current weather entries in batches, ordered by ID, without loading the whole table.
+
+    Description:
+        Use instead of `get_all_*()` for full-table scans. See `BaseRepository.iter_batches()`.
+        The session stays open until the generator is exhausted or closed.
+
+    Params:
+        batch_size (int, optional): Entries per batch. Defaults to 500.
+        retain (bool | None, optional): Only return entries with this retain flag. Defaults to None (all entries).
+        defer_json (bool, optional): Do not load the JSON column. Defaults to False.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        Iterator[list[CurrentWeatherJSONCollectorModel]]: Batches of up to `batch_size` entries.
+
+    """
+    SessionLocal = _get_session_pool(echo=echo)
+
+    with SessionLocal() as session:
+        repo = CurrentWeatherJSONCollectorRepository(session=session)
+
+        yield from repo.iter_batches(
+            batch_size=batch_size,
+            where=(
+                CurrentWeatherJSONCollectorModel.retain.is_(retain)
+                if retain is not None
+                else None
+            ),
+            defer_json=defer_json,
+        )
+
+
 def set_current_weather_response_retention(
     item_id: int,
     retain: bool,
@@ -230,77 +319,168 @@ def set_current_weather_response_retention(
     with SessionLocal() as session:
         repo = CurrentWeatherJSONCollectorRepository(session=session)
 
-        existing_model: CurrentWeatherJSONCollectorModel | None = repo.get(item_id)
-        if not existing_model:
+        ## Only read the flag, not the JSON payload
+        existing: sa.Row | None = repo.get_columns(item_id, "retain")
+        if not existing:
             raise ValueError(f"Current weather entry with ID {item_id} not found.")
 
         log.debug(
-            f"Found current weather entry ID {item_id} with retain={existing_model.retain}."
+            f"Found current weather entry ID {item_id} with retain={existing.retain}."
         )
 
-        if existing_model.retain == retain:
+        if existing.retain == retain:
             log.info(
                 f"Current weather entry with ID {item_id} already has retain={retain}. No update needed."
             )
             return True
 
-        # existing_model.retain = retain
-        repo.update(obj=existing_model, data={"retain": retain})
+        repo.update_many([item_id], {"retain": retain})
 
         log.debug(f"Updated current weather entry ID {item_id} to retain={retain}.")
 
         return True
 
 
-def vacuum_current_weather_json_responses(echo: bool = False):
-    """Remove records that are marked retain=False from the database.
+def get_retained_current_weather_responses(
+    limit: int = 100,
+    after_id: int = 0,
+    echo: bool = False,
+) -> list[CurrentWeatherJSONCollectorModel]:
+    """Get a batch of current weather entries still marked retain=True, ordered by ID.
+
+    Description:
+        Pass the ID of the last entry in the previous batch as `after_id` to page through
+        the backlog without re-reading entries that were already handled.
 
     Params:
-        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False
+        limit (int, optional): Maximum number of entries to return. Defaults to 100.
+        after_id (int, optional): Only return entries with an ID greater than this. Defaults to 0.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        list[CurrentWeatherJSONCollectorModel]: Up to `limit` retained current weather entries.
+
     """
     SessionLocal = _get_session_pool(echo=echo)
 
-    _deleted = []
-    _errored = []
-
     with SessionLocal() as session:
         repo = CurrentWeatherJSONCollectorRepository(session=session)
 
-        all_current_weather_items: list[CurrentWeatherJSONCollectorModel] = repo.list() or []
+        return list(
+            repo.list(
+                where=CurrentWeatherJSONCollectorModel.retain.is_(True),
+                after_id=after_id,
+                limit=limit,
+            )
+        )
 
-        if not all_current_weather_items:
-            log.warning("No current weather items found in database, skipping vacuum.")
-            return
 
-        log.debug(
-            f"Reviewing [{len(all_current_weather_items)}] current weather items for deletion."
+def set_current_weather_responses_retention(
+    item_ids: list[int],
+    retain: bool,
+    echo: bool = False,
+) -> int:
+    """Set the retain flag for many current weather entries in a single UPDATE.
+
+    Params:
+        item_ids (list[int]): IDs of the entries to update.
+        retain (bool): The new value for the retain flag.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        int: The number of rows updated.
+
+    Raises:
+        Exception: If the update fails, the transaction is rolled back and the exception is re-raised.
+
+    """
+    if not item_ids:
+        return 0
+
+    SessionLocal = _get_session_pool(echo=echo)
+
+    stmt = (
+        sa.update(CurrentWeatherJSONCollectorModel)
+        .where(
+            CurrentWeatherJSONCollectorModel.id.in_(item_ids),
+            CurrentWeatherJSONCollectorModel.retain.is_not(retain),
         )
+        .values(retain=retain)
+    )
 
-        for item in all_current_weather_items:
-            if not item.retain:
-                log.info(
-                    f"Deleting current weather item ID {item.id} (retain={item.retain})."
-                )
+    with SessionLocal() as session:
+        try:
+            result = session.execute(stmt)
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            log.error(
+                f"({type(exc)}) Error setting retain={retain} on {len(item_ids)} current weather entries. Details: {exc}"
+            )
+            raise
 
-                try:
-                    repo.delete(item)
+    log.debug(f"Set retain={retain} on {result.rowcount} current weather entries.")
 
-                    _deleted.append(item.id)
-                except Exception as exc:
-                    log.error(
-                        f"({type(exc)}) Error deleting current weather item ID {item.id}. Details: {exc}"
-                    )
+    return result.rowcount
 
-                    _errored.append(item.id)
-                    continue
 
-            else:
-                log.debug(
-                    f"Retaining current weather item ID {item.id} (retain={item.retain})."
-                )
+def vacuum_current_weather_json_responses(
+    echo: bool = False,
+    older_than_days: float | None = None,
+    chunk_size: int | None = None,
+) -> int:
+    """Remove records that are marked retain=False from the database.
+
+    Description:
+        Deletes in chunks with set-based `DELETE` statements; rows & their JSON are never
+        loaded. See `vacuum_responses()`.
+
+    Params:
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False
+        older_than_days (float | None, optional): Only delete rows older than this many days.
+            Defaults to `database.vacuum_older_than_days` (no cutoff when unset).
+        chunk_size (int | None, optional): Rows deleted per statement & commit. Defaults to
+            `database.vacuum_chunk_size` (1000).
 
-    log.info(
-        f"Vacuum complete. Deleted {_deleted} ({len(_deleted)} items). Errors deleting ({len(_errored)} items)."
+    Returns:
+        int: The number of rows deleted.
+
+    """
+    SessionLocal = _get_session_pool(echo=echo)
+
+    return vacuum_responses(
+        session_pool=SessionLocal,
+        repository=CurrentWeatherJSONCollectorRepository,
+        label="current weather",
+        older_than_days=older_than_days,
+        chunk_size=chunk_size,
     )
 
-    return _deleted
+
+def apply_current_weather_json_retention(
+    echo: bool = False,
+    policy: RetentionPolicy | None = None,
+) -> dict[str, int]:
+    """Apply the `[retention]` policy to current weather responses.
+
+    Description:
+        Keeps every response for `raw_days`, then one per `downsample_interval` per location,
+        and deletes responses older than `drop_after_days`. See `apply_response_retention()`.
+
+    Params:
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False
+        policy (RetentionPolicy | None, optional): Override the configured policy.
+
+    Returns:
+        dict[str, int]: Counts of rows `downsampled` & `dropped`, and `partitions_dropped`.
+
+    """
+    SessionLocal = _get_session_pool(echo=echo)
+
+    return apply_response_retention(
+        session_pool=SessionLocal,
+        model=CurrentWeatherJSONCollectorModel,
+        json_column="current_weather_json",
+        label="current weather",
+        policy=policy,
+    )
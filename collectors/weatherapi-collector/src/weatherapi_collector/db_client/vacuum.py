@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import datetime as dt
+import time
+import typing as t
+
+from weatherapi_collector.config import DB_SETTINGS, RETENTION_SETTINGS
+
+from loguru import logger as log
+from shared.db.base import BaseRepository
+from shared.db.retention import RetentionPolicy, RetentionTarget, apply_retention
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+__all__ = ["vacuum_responses", "get_retention_policy", "apply_response_retention"]
+
+
+def vacuum_responses(
+    session_pool: so.sessionmaker[so.Session],
+    repository: t.Type[BaseRepository],
+    label: str,
+    older_than_days: float | None = None,
+    chunk_size: int | None = None,
+) -> int:
+    """Delete rows marked retain=False from a response table, without loading them.
+
+    Description:
+        Issues chunked `DELETE ... WHERE retain = false [AND created_at < cutoff]` statements,
+        committing after each chunk. Only primary keys are selected, so JSON payloads are never
+        read into memory, and each transaction stays short.
+
+    Params:
+        session_pool (so.sessionmaker[so.Session]): Session pool for the collector database.
+        repository (type[BaseRepository]): Repository class for the response table, i.e. `CurrentWeatherJSONCollectorRepository`.
+        label (str): Name of the responses, used in log messages.
+        older_than_days (float | None, optional): Only delete rows created more than this many days ago.
+            Defaults to `database.vacuum_older_than_days` (no cutoff when unset).
+        chunk_size (int | None, optional): Rows deleted per statement & commit. Defaults to
+            `database.vacuum_chunk_size` (1000).
+
+    Returns:
+        int: The number of rows deleted.
+
+    Raises:
+        Exception: If a delete fails, the current chunk is rolled back and the exception is re-raised.
+
+    """
+    if older_than_days is None:
+        older_than_days = DB_SETTINGS.get("VACUUM_OLDER_THAN_DAYS", None)
+    if chunk_size is None:
+        chunk_size = int(DB_SETTINGS.get("VACUUM_CHUNK_SIZE", 1000))
+
+    with session_pool() as session:
+        repo: BaseRepository = repository(session=session)
+        model = repo.model
+
+        predicates: list[sa.ColumnElement[bool]] = [model.retain.is_(False)]
+        if older_than_days is not None:
+            ## created_at is written with naive UTC timestamps
+            cutoff: dt.datetime = dt.datetime.utcnow() - dt.timedelta(
+                days=float(older_than_days)
+            )
+            predicates.append(model.created_at < cutoff)
+
+        start: float = time.perf_counter()
+
+        try:
+            deleted: int = repo.delete_where(*predicates, chunk_size=chunk_size)
+        except Exception as exc:
+            log.error(
+                f"({type(exc)}) Error vacuuming {label} responses. Details: {exc}"
+            )
+
+            raise
+
+    elapsed: float = time.perf_counter() - start
+    rate: float = deleted / elapsed if elapsed > 0 else 0.0
+
+    log.info(
+        f"Vacuum complete. Deleted {deleted} {label} response(s) in {elapsed:.2f}s ({rate:.0f} rows/s)."
+    )
+
+    return deleted
+
+
+def get_retention_policy() -> RetentionPolicy:
+    """Return the retention policy configured in `[retention]` settings."""
+    return RetentionPolicy.from_settings(RETENTION_SETTINGS)
+
+
+def apply_response_retention(
+    session_pool: so.sessionmaker[so.Session],
+    model: t.Type,
+    json_column: str,
+    label: str,
+    policy: RetentionPolicy | None = None,
+) -> dict[str, int]:
+    """Apply a retention policy to a response table.
+
+    Description:
+        Responses are downsampled per location, using the location name in the response JSON.
+        Rows still marked retain=True have not been forwarded to the API server yet, and are
+        never pruned; rows marked retain=False that are newer than `raw_days` are left to the vacuum job.
+
+    Params:
+        session_pool (so.sessionmaker[so.Session]): Session pool for the collector database.
+        model (type): The response model, i.e. `CurrentWeatherJSONCollectorModel`.
+        json_column (str): Name of the model's JSON column, i.e. `current_weather_json`.
+        label (str): Name of the responses, used in log messages.
+        policy (RetentionPolicy | None, optional): The policy to apply. Defaults to `get_retention_policy()`.
+
+    Returns:
+        dict[str, int]: Counts of rows `downsampled` & `dropped`, and `partitions_dropped`.
+
+    Raises:
+        Exception: If applying the policy fails, the exception is logged & re-raised.
+
+    """
+    if policy is None:
+        policy = get_retention_policy()
+
+    target: RetentionTarget = RetentionTarget(
+        model=model,
+        label=f"{label} responses",
+        partition_by=[getattr(model, json_column)["location"]["name"].as_string()],
+        ## created_at is written with naive UTC timestamps
+        now=dt.datetime.utcnow,
+    )
+
+    try:
+        return apply_retention(session_pool=session_pool, target=target, policy=policy)
+    except Exception as exc:
+        log.error(
+            f"({type(exc)}) Error applying retention policy to {label} responses. Details: {exc}"
+        )
+
+        raise
@@ -7,11 +7,12 @@ log = logging.getLogger(__name__)
 
 from shared import db
 from weatherapi_collector.config import DB_SETTINGS
+from weatherapi_collector.db_client.__methods import get_db_pool_opts
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
-__all__ = ["get_db_uri", "get_db_engine", "get_session_pool"]
+__all__ = ["get_db_uri", "get_db_engine", "get_session_pool", "dispose_db_engines"]
 
 
 def get_db_uri(
@@ -53,34 +54,88 @@ def get_db_uri(
         return db_uri
 
 
-def get_db_engine(db_uri: sa.URL = get_db_uri(), echo: bool = False) -> sa.Engine:
-    """Construct a SQLAlchemy `Engine` for a database connection.
+def get_db_engine(
+    db_uri: sa.URL | None = None, echo: bool = False, **pool_opts: t.Any
+) -> sa.Engine:
+    """Return the shared SQLAlchemy `Engine` for a database connection.
+
+    Description:
+        Engines come from the process-wide `shared.db` engine registry, so every caller
+        using the same URL, echo & pool options shares one connection pool. Call
+        `dispose_db_engines()` on shutdown to close pooled connections.
 
     Params:
-        db_uri (sa.URL): A SQLAlchemy `URL` for a database connection.
+        db_uri (sa.URL | None): A SQLAlchemy `URL` for a database connection. Defaults to the configured database.
         echo (bool): Echo SQL statements to the console.
+        pool_opts (Any): Optional pool options. Defaults to the `db_pool_*` database settings.
 
     Returns:
         (sa.Engine): A SQLAlchemy `Engine`
 
     """
-    engine: sa.Engine = db.get_engine(url=db_uri, echo=echo)
+    if db_uri is None:
+        db_uri = get_db_uri()
+
+    if not pool_opts:
+        pool_opts = get_db_pool_opts()
+
+    engine: sa.Engine = db.get_cached_engine(url=db_uri, echo=echo, **pool_opts)
 
     return engine
 
 
 def get_session_pool(
-    engine: sa.Engine = get_db_engine(),
+    engine: sa.Engine | None = None,
+    db_uri: sa.URL | None = None,
+    echo: bool = False,
+    **pool_opts: t.Any,
 ) -> so.sessionmaker[so.Session]:
-    """Construct a SQLAlchemy `Session` pool for a database connection.
+    """Return the shared SQLAlchemy `Session` pool for a database connection.
+
+    Description:
+        Without an `engine`, session pools come from the process-wide `shared.db` registry,
+        bound to the same cached engine `get_db_engine()` returns for these options, so
+        repeated calls reuse one `sessionmaker`. A pool for an explicit `engine` is built
+        on each call.
 
     Params:
-        engine (sa.Engine): A SQLAlchemy `Engine` for a database connection.
+        engine (sa.Engine | None): A SQLAlchemy `Engine` for a database connection. Defaults to the shared engine.
+        db_uri (sa.URL | None): A SQLAlchemy `URL` for a database connection. Defaults to the configured database.
+        echo (bool): Echo SQL statements to the console.
+        pool_opts (Any): Optional pool options. Defaults to the `db_pool_*` database settings.
 
     Returns:
         (so.sessionmaker[so.Session]): A SQLAlchemy `Session` pool
 
     """
-    session: so.sessionmaker[so.Session] = db.get_session_pool(engine=engine)
+    if engine is not None:
+        return db.get_session_pool(engine=engine)
+
+    if db_uri is None:
+        db_uri = get_db_uri()
+
+    if not pool_opts:
+        pool_opts = get_db_pool_opts()
+
+    session_pool: so.sessionmaker[so.Session] = db.get_cached_session_pool(
+        url=db_uri, echo=echo, **pool_opts
+    )
+
+    return session_pool
+
+
+def dispose_db_engines() -> int:
+    """Dispose all shared database engines, closing pooled connections.
+
+    Description:
+        Call once when the collector shuts down (scheduler exit, CLI run complete).
+        Engines are rebuilt on the next call to `get_db_engine()`.
+
+    Returns:
+        (int): The number of engines disposed.
+
+    """
+    disposed: int = db.dispose_cached_engines()
+    log.debug(f"Disposed {disposed} database engine(s)")
 
-    return session
+    return disposed
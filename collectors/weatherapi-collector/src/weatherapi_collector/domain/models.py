@@ -17,6 +17,12 @@ __all__ = [
 
 class CurrentWeatherJSONCollectorModel(Base):
     __tablename__ = "current_weather_response"
+    ## Vacuum & retention filter on retain, then age
+    __table_args__ = (
+        sa.Index(
+            "ix_current_weather_response_retain_created_at", "retain", "created_at"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     created_at: Mapped[dt.datetime] = mapped_column(
@@ -30,6 +36,10 @@ class CurrentWeatherJSONCollectorModel(Base):
 
 class ForecastJSONCollectorModel(Base):
     __tablename__ = "forecast_response"
+    ## Vacuum & retention filter on retain, then age
+    __table_args__ = (
+        sa.Index("ix_forecast_response_retain_created_at", "retain", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     created_at: Mapped[dt.datetime] = mapped_column(
@@ -43,6 +53,10 @@ class ForecastJSONCollectorModel(Base):
 
 class LocationJSONCollectorModel(Base):
     __tablename__ = "location_response"
+    ## Vacuum & retention filter on retain, then age
+    __table_args__ = (
+        sa.Index("ix_location_response_retain_created_at", "retain", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     created_at: Mapped[dt.datetime] = mapped_column(
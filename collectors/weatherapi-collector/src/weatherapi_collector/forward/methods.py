@@ -0,0 +1,231 @@
+"""Forward stored collector responses to the API server in batches.
+
+Description:
+    Responses are read from the collector database in ID order, `batch_size` at a time,
+    and each batch is sent in a single POST to the API server's bulk endpoint. Every
+    payload the server acknowledges (saved, or already stored) is flipped to
+    `retain=False` with one UPDATE per batch. Payloads that fail stay `retain=True` and
+    are picked up again on the next run.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from weatherapi_collector import db_client
+from weatherapi_collector.config import API_SERVER_SETTINGS
+from weatherapi_collector.domain import (
+    CurrentWeatherJSONCollectorModel,
+    CurrentWeatherJSONCollectorOut,
+    ForecastJSONCollectorModel,
+    ForecastJSONCollectorOut,
+)
+
+import httpx
+from loguru import logger as log
+from shared.depends import get_shared_httpx_controller
+from shared.domain.collectors.payloads import WeatherCollectorBulkPayloadOut
+from shared.http_lib import HttpxController
+
+__all__ = [
+    "get_post_batch_size",
+    "build_collector_payload",
+    "post_payload_batch",
+    "forward_current_weather_batches",
+    "forward_forecast_batches",
+]
+
+## Default number of responses sent per bulk POST
+DEFAULT_POST_BATCH_SIZE: int = 100
+
+
+def get_post_batch_size() -> int:
+    """Return the configured bulk POST batch size (`api_server.post_batch_size`)."""
+    return int(API_SERVER_SETTINGS.get("post_batch_size", DEFAULT_POST_BATCH_SIZE))
+
+
+def build_collector_payload(
+    label: str,
+    model: t.Union[CurrentWeatherJSONCollectorModel, ForecastJSONCollectorModel],
+) -> dict:
+    """Build the API server's collector payload body for a stored response.
+
+    Params:
+        label (str): The payload label, `current` or `forecast`.
+        model (CurrentWeatherJSONCollectorModel | ForecastJSONCollectorModel): The stored response.
+
+    Returns:
+        (dict): A `WeatherCollectorPayloadIn`-shaped dict.
+
+    Raises:
+        ValueError: When `label` is not a known payload label.
+
+    """
+    match label:
+        case "current":
+            output_schema = CurrentWeatherJSONCollectorOut(
+                current_weather_json=model.current_weather_json,
+                id=model.id,
+                created_at=model.created_at,
+                retain=model.retain,
+            )
+        case "forecast":
+            output_schema = ForecastJSONCollectorOut(
+                forecast_json=model.forecast_json,
+                id=model.id,
+                created_at=model.created_at,
+                retain=model.retain,
+            )
+        case _:
+            raise ValueError(f"Unknown payload label: {label}")
+
+    return {
+        "source": "weatherapi",
+        "label": label,
+        "data": output_schema.model_dump(exclude={"id", "created_at", "retain"}),
+    }
+
+
+def post_payload_batch(
+    http: HttpxController,
+    label: str,
+    models: list[t.Union[CurrentWeatherJSONCollectorModel, ForecastJSONCollectorModel]],
+) -> list[int]:
+    """POST a batch of stored responses to the API server's bulk endpoint.
+
+    Params:
+        http (HttpxController): An open HTTP controller.
+        label (str): The payload label, `current` or `forecast`.
+        models (list): The stored responses to send.
+
+    Returns:
+        (list[int]): IDs of the responses the server acknowledged.
+
+    Raises:
+        httpx.HTTPError: When the request fails or the server returns an error status.
+
+    """
+    url = f"{API_SERVER_SETTINGS.base_url}/api/v1/collectors/weather/bulk"
+    body: list[dict] = [build_collector_payload(label=label, model=m) for m in models]
+
+    req: httpx.Request = httpx.Request("POST", url=url, json=body)
+
+    res: httpx.Response = http.send_request(req)
+    res.raise_for_status()
+
+    bulk_res: WeatherCollectorBulkPayloadOut = (
+        WeatherCollectorBulkPayloadOut.model_validate(res.json())
+    )
+
+    for result in bulk_res.results:
+        if not result.acknowledged:
+            log.warning(
+                f"API server rejected {label} response ID {models[result.index].id}: [{result.status_code}] {result.detail}"
+            )
+
+    return [models[r.index].id for r in bulk_res.results if r.acknowledged]
+
+
+def _forward_batches(
+    label: str,
+    get_batch: t.Callable[..., list],
+    set_retention: t.Callable[..., int],
+    http_controller: HttpxController | None = None,
+    batch_size: int | None = None,
+    echo: bool = False,
+) -> tuple[int, int]:
+    batch_size = batch_size or get_post_batch_size()
+    http_controller = http_controller or get_shared_httpx_controller()
+
+    after_id: int = 0
+    sent: int = 0
+    acknowledged: int = 0
+
+    with http_controller as http:
+        while True:
+            batch = get_batch(limit=batch_size, after_id=after_id, echo=echo)
+            if not batch:
+                break
+
+            ## Advance past this batch even if some payloads fail, they're retried next run
+            after_id = batch[-1].id
+            sent += len(batch)
+
+            try:
+                acked_ids: list[int] = post_payload_batch(
+                    http=http, label=label, models=batch
+                )
+            except Exception as exc:
+                log.error(
+                    f"({type(exc)}) Error POSTing batch of {len(batch)} {label} responses to API server, stopping. Details: {exc}"
+                )
+                break
+
+            try:
+                set_retention(item_ids=acked_ids, retain=False, echo=echo)
+            except Exception as exc:
+                log.error(
+                    f"({type(exc)}) Error updating retain flag for {len(acked_ids)} {label} responses. Details: {exc}"
+                )
+                break
+
+            acknowledged += len(acked_ids)
+            log.debug(
+                f"Batch up to ID {after_id}: {len(acked_ids)}/{len(batch)} {label} responses acknowledged"
+            )
+
+    log.info(f"POSTed {acknowledged}/{sent} {label} weather readings successfully.")
+
+    return acknowledged, sent
+
+
+def forward_current_weather_batches(
+    http_controller: HttpxController | None = None,
+    batch_size: int | None = None,
+    echo: bool = False,
+) -> tuple[int, int]:
+    """Forward all retained current weather responses to the API server in batches.
+
+    Params:
+        http_controller (HttpxController, optional): Controller to send requests with. Defaults to `get_shared_httpx_controller()`.
+        batch_size (int, optional): Responses per POST. Defaults to `api_server.post_batch_size`.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        (tuple[int, int]): The number of responses acknowledged, and the number sent.
+
+    """
+    return _forward_batches(
+        label="current",
+        get_batch=db_client.get_retained_current_weather_responses,
+        set_retention=db_client.set_current_weather_responses_retention,
+        http_controller=http_controller,
+        batch_size=batch_size,
+        echo=echo,
+    )
+
+
+def forward_forecast_batches(
+    http_controller: HttpxController | None = None,
+    batch_size: int | None = None,
+    echo: bool = False,
+) -> tuple[int, int]:
+    """Forward all retained weather forecast responses to the API server in batches.
+
+    Params:
+        http_controller (HttpxController, optional): Controller to send requests with. Defaults to `get_shared_httpx_controller()`.
+        batch_size (int, optional): Responses per POST. Defaults to `api_server.post_batch_size`.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        (tuple[int, int]): The number of responses acknowledged, and the number sent.
+
+    """
+    return _forward_batches(
+        label="forecast",
+        get_batch=db_client.get_retained_forecast_responses,
+        set_retention=db_client.set_weather_forecast_responses_retention,
+        http_controller=http_controller,
+        batch_size=batch_size,
+        echo=echo,
+    )
@@ -6,7 +6,11 @@ from weatherapi_collector import db_client
 
 from loguru import logger as log
 
-__all__ = ["job_vacuum_current_weather_json_responses"]
+__all__ = [
+    "job_vacuum_current_weather_json_responses",
+    "job_vacuum_forecast_weather_json_responses",
+    "job_apply_retention_policy",
+]
 
 
 async def job_vacuum_current_weather_json_responses(db_echo: bool = False) -> None:
@@ -31,3 +35,17 @@ async def job_vacuum_forecast_weather_json_responses(db_echo: bool = False) -> N
         log.info(f"Vacuumed {deleted_rows} rows")
     except Exception as e:
         log.error(f"Error during vacuuming: {e}")
+
+
+async def job_apply_retention_policy(db_echo: bool = False) -> None:
+    log.info("[APScheduler] Applying retention policy to weather JSON responses")
+
+    for label, apply_retention in (
+        ("current weather", db_client.apply_current_weather_json_retention),
+        ("forecast", db_client.apply_forecast_weather_json_retention),
+    ):
+        try:
+            results = await asyncio.to_thread(apply_retention, db_echo)
+            log.info(f"Applied retention policy to {label} responses: {results}")
+        except Exception as e:
+            log.error(f"Error applying retention policy to {label} responses: {e}")
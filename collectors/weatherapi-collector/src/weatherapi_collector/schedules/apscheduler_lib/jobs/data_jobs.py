@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 
-from weatherapi_collector import db_client
+from weatherapi_collector import db_client, forward
 from weatherapi_collector.config import API_SERVER_SETTINGS
 from weatherapi_collector.domain import (
     CurrentWeatherJSONCollectorModel,
@@ -13,14 +13,17 @@ from weatherapi_collector.domain import (
 
 import httpx
 from loguru import logger as log
-from shared.depends import get_httpx_controller
+from shared.depends import get_shared_httpx_controller
 
 __all__ = ["job_post_weather_readings"]
 
 
 async def _post_current_weather(db_echo: bool = False):
-    all_current_weather_models: list[CurrentWeatherJSONCollectorModel] = (
-        await asyncio.to_thread(db_client.get_all_current_weather_responses, db_echo)
+    ## Only responses not yet forwarded
+    all_current_weather_models: list[
+        CurrentWeatherJSONCollectorModel
+    ] = await asyncio.to_thread(
+        db_client.get_all_current_weather_responses, db_echo, retain=True
     )
 
     log.info(
@@ -30,12 +33,11 @@ async def _post_current_weather(db_echo: bool = False):
     log.info(
         f"POSTing current weather readings to API server at {API_SERVER_SETTINGS.base_url}/api/v1/collectors/weather"
     )
-    http_controller = get_httpx_controller()
+    http_controller = get_shared_httpx_controller()
 
     POST_successes = []
 
     with http_controller as http:
-
         for m in all_current_weather_models:
             log.debug(f"Processing model ID {m.id}")
             output_schema = CurrentWeatherJSONCollectorOut(
@@ -110,7 +112,7 @@ async def _post_current_weather(db_echo: bool = False):
 
 async def _post_forecast_weather(db_echo: bool = False):
     forecast_models: list[ForecastJSONCollectorModel] = await asyncio.to_thread(
-        db_client.get_all_forecast_responses, db_echo
+        db_client.get_all_forecast_responses, db_echo, retain=True
     )
 
     log.info(f"Retrieved {len(forecast_models)} weather forecast response models")
@@ -118,12 +120,11 @@ async def _post_forecast_weather(db_echo: bool = False):
     log.info(
         f"POSTing weather forecast readings to API server at {API_SERVER_SETTINGS.base_url}/api/v1/collectors/weather"
     )
-    http_controller = get_httpx_controller()
+    http_controller = get_shared_httpx_controller()
 
     POST_successes = []
 
     with http_controller as http:
-
         for m in forecast_models:
             log.debug(f"Processing model ID {m.id}")
             output_schema = ForecastJSONCollectorOut(
@@ -194,6 +195,22 @@ async def _post_forecast_weather(db_echo: bool = False):
 async def job_post_weather_readings(db_echo: bool = False):
     log.info("[APScheduler] POSTing weather readings to API server")
 
+    ## Send readings in batches to the bulk endpoint
+    if API_SERVER_SETTINGS.get("bulk_post", True):
+        try:
+            await asyncio.to_thread(
+                forward.forward_current_weather_batches, echo=db_echo
+            )
+        except Exception as e:
+            log.error(f"Error POSTing current weather readings: {e}")
+
+        try:
+            await asyncio.to_thread(forward.forward_forecast_batches, echo=db_echo)
+        except Exception as e:
+            log.error(f"Error POSTing forecast weather readings: {e}")
+
+        return
+
     ## Send current weather readings
     try:
         await _post_current_weather(db_echo)
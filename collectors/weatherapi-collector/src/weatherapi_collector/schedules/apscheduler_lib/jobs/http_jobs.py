@@ -4,25 +4,32 @@ import asyncio
 
 from weatherapi_collector import (
     client as weatherapi_client,
+    collect,
     db_client,
 )
-from weatherapi_collector.depends import get_db_engine
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger as log
+from shared.depends import get_async_httpx_controller
 
-__all__ = ["job_weatherapi_current_weather", "job_weatherapi_weather_forecast"]
+__all__ = [
+    "job_weatherapi_current_weather",
+    "job_weatherapi_weather_forecast",
+    "job_weatherapi_collect_locations",
+]
 
 
 async def job_weatherapi_current_weather(
     location_name: str, api_key: str, save_to_db: bool = False, db_echo: bool = False
 ):
     log.info(f"[APScheduler] Collect current weather for {location_name}")
-    data = await asyncio.to_thread(
-        weatherapi_client.get_current_weather, location_name, api_key, db_echo
+    ## Reuse the process-wide async client instead of building one per run
+    data = await weatherapi_client.get_current_weather_async(
+        location=location_name,
+        api_key=api_key,
+        http_controller=get_async_httpx_controller(),
     )
-    if save_to_db:
-        engine = get_db_engine()
+    if save_to_db and data:
         await asyncio.to_thread(db_client.save_current_weather_response, data, db_echo)
 
 
@@ -34,13 +41,31 @@ async def job_weatherapi_weather_forecast(
     db_echo: bool = False,
 ):
     log.info(f"[APScheduler] Collect forecast for {location_name}")
-    result = await asyncio.to_thread(
-        weatherapi_client.get_weather_forecast,
-        location_name,
-        forecast_days,
-        api_key,
-        db_echo=db_echo,
+    result = await weatherapi_client.get_weather_forecast_async(
+        location=location_name,
+        days=forecast_days,
+        api_key=api_key,
+        http_controller=get_async_httpx_controller(),
     )
-    if save_to_db:
-        engine = get_db_engine()
+    if save_to_db and result:
         await asyncio.to_thread(db_client.save_forecast, result, db_echo)
+
+
+async def job_weatherapi_collect_locations(
+    location_names: list[str],
+    api_key: str,
+    forecast_days: int = 1,
+    save_to_db: bool = False,
+    db_echo: bool = False,
+):
+    log.info(
+        f"[APScheduler] Collect current weather & forecast for {len(location_names)} location(s)"
+    )
+    await collect.collect_locations(
+        location_names=location_names,
+        api_key=api_key,
+        forecast_days=forecast_days,
+        save_to_db=save_to_db,
+        db_echo=db_echo,
+        http_controller=get_async_httpx_controller(),
+    )
@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 import typing as t
 
+from weatherapi_collector.depends import dispose_db_engines
 from weatherapi_collector.schedules.apscheduler_lib.jobs.cleanup_jobs import (
+    job_apply_retention_policy,
     job_vacuum_current_weather_json_responses,
     job_vacuum_forecast_weather_json_responses,
 )
@@ -11,6 +13,7 @@ from weatherapi_collector.schedules.apscheduler_lib.jobs.data_jobs import (
     job_post_weather_readings,
 )
 from weatherapi_collector.schedules.apscheduler_lib.jobs.http_jobs import (
+    job_weatherapi_collect_locations,
     job_weatherapi_current_weather,
     job_weatherapi_weather_forecast,
 )
@@ -18,6 +21,7 @@ from weatherapi_collector.schedules.apscheduler_lib.jobs.http_jobs import (
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from loguru import logger as log
+from shared.depends import close_async_httpx_controller, close_httpx_controller
 
 __all__ = [
     "setup_schedule",
@@ -49,6 +53,7 @@ def setup_schedule(
     save_to_db: bool = False,
     db_echo: bool = False,
     cron_schedules: t.Optional[dict[str, t.Any]] = None,
+    location_names: t.Optional[list[str]] = None,
 ):
     scheduler = AsyncIOScheduler()
 
@@ -71,18 +76,30 @@ def setup_schedule(
     cleanup_trigger = make_trigger(_cleanup_jobs_schedule)
 
     # Add jobs
-    scheduler.add_job(
-        job_weatherapi_current_weather,
-        trigger=weather_trigger,
-        args=[location_name, api_key, save_to_db, db_echo],
-        id="weatherapi_current_weather",
-    )
-    scheduler.add_job(
-        job_weatherapi_weather_forecast,
-        trigger=weather_trigger,
-        args=[location_name, api_key, forecast_days, save_to_db, db_echo],
-        id="weatherapi_forecast",
-    )
+    if location_names and len(location_names) > 1:
+        ## Fan out over all locations in one job per tick
+        scheduler.add_job(
+            job_weatherapi_collect_locations,
+            trigger=weather_trigger,
+            args=[location_names, api_key, forecast_days, save_to_db, db_echo],
+            id="weatherapi_collect_locations",
+        )
+    else:
+        if location_names:
+            location_name = location_names[0]
+
+        scheduler.add_job(
+            job_weatherapi_current_weather,
+            trigger=weather_trigger,
+            args=[location_name, api_key, save_to_db, db_echo],
+            id="weatherapi_current_weather",
+        )
+        scheduler.add_job(
+            job_weatherapi_weather_forecast,
+            trigger=weather_trigger,
+            args=[location_name, api_key, forecast_days, save_to_db, db_echo],
+            id="weatherapi_forecast",
+        )
     scheduler.add_job(
         job_post_weather_readings,
         trigger=data_trigger,
@@ -102,6 +119,15 @@ def setup_schedule(
         id="weatherapi_forecast_vacuum",
     )
 
+    _retention_jobs_schedule = cron_schedules.get("retention_jobs")
+    if _retention_jobs_schedule:
+        scheduler.add_job(
+            job_apply_retention_policy,
+            trigger=make_trigger(_retention_jobs_schedule),
+            args=[db_echo],
+            id="weatherapi_retention_policy",
+        )
+
     return scheduler
 
 
@@ -112,6 +138,7 @@ async def _start_scheduler(
     forecast_days=1,
     save_to_db=False,
     db_echo: bool = False,
+    location_names: t.Optional[list[str]] = None,
 ):
     scheduler = setup_schedule(
         location_name=location_name,
@@ -120,6 +147,7 @@ async def _start_scheduler(
         save_to_db=save_to_db,
         db_echo=db_echo,
         cron_schedules=schedules_dict,
+        location_names=location_names,
     )
 
     scheduler.start()
@@ -135,6 +163,13 @@ async def _start_scheduler(
         pass
     except Exception as e:
         log.error(f"Scheduler stopped due to error: {e}")
+    finally:
+        scheduler.shutdown(wait=False)
+        ## Close the shared async HTTP client & its connection pool
+        await close_async_httpx_controller()
+        close_httpx_controller()
+        ## Close pooled database connections held by the shared engines
+        dispose_db_engines()
 
 
 def start_scheduler(
@@ -144,6 +179,7 @@ def start_scheduler(
     forecast_days=1,
     save_to_db=False,
     db_echo: bool = False,
+    location_names: t.Optional[list[str]] = None,
 ):
     log.debug(f"APScheduler schedules: {schedules_dict}")
 
@@ -156,6 +192,7 @@ def start_scheduler(
                 forecast_days,
                 save_to_db,
                 db_echo=db_echo,
+                location_names=location_names,
             )
         )
     except KeyboardInterrupt:
@@ -14,13 +14,14 @@ from loguru import logger as log
 
 __all__ = [
     "job_vacuum_current_weather_json_responses",
+    "job_apply_retention_policy",
 ]
 
 
-def job_vacuum_current_weather_json_responses(echo: bool = False) -> dict[str, bool]:
+def job_vacuum_current_weather_json_responses(echo: bool = False) -> dict[str, dict]:
     log.info("Vacuuming current weather JSON responses from the DB")
 
-    job_results = {"current_weather_json_responses": {"success": False, "deleted": []}}
+    job_results = {"current_weather_json_responses": {"success": False, "deleted": 0}}
 
     try:
         deleted = db_client.vacuum_current_weather_json_responses(echo=echo)
@@ -35,3 +36,31 @@ def job_vacuum_current_weather_json_responses(echo: bool = False) -> dict[str, b
         raise
 
     return job_results
+
+
+def job_apply_retention_policy(echo: bool = False) -> dict[str, dict]:
+    log.info("Applying retention policy to weather JSON responses in the DB")
+
+    job_results = {
+        "current_weather_json_responses": {"success": False, "results": {}},
+        "forecast_json_responses": {"success": False, "results": {}},
+    }
+
+    for key, apply_retention in (
+        (
+            "current_weather_json_responses",
+            db_client.apply_current_weather_json_retention,
+        ),
+        ("forecast_json_responses", db_client.apply_forecast_weather_json_retention),
+    ):
+        try:
+            results = apply_retention(echo=echo)
+            log.info(f"Retention policy applied to {key}: {results}")
+
+            job_results[key]["success"] = True
+            job_results[key]["results"] = results
+        except Exception as exc:
+            log.error(f"Error applying retention policy to {key}: {exc}")
+            raise
+
+    return job_results
@@ -5,6 +5,7 @@ import typing as t
 from weatherapi_collector import (
     client as weatherapi_client,
     db_client,
+    forward,
 )
 from weatherapi_collector.config import API_SERVER_SETTINGS
 from weatherapi_collector.depends import get_db_engine
@@ -21,18 +22,27 @@ from weatherapi_collector.domain import (
 
 import httpx
 from loguru import logger as log
-from shared.depends import get_httpx_controller
+from shared.depends import get_shared_httpx_controller
 import sqlalchemy as sa
 
 __all__ = ["job_post_weather_readings"]
 
 
 def job_post_weather_readings(echo: bool = False):
+    ## Send readings in batches to the bulk endpoint
+    if API_SERVER_SETTINGS.get("bulk_post", True):
+        try:
+            forward.forward_current_weather_batches(echo=echo)
+        except Exception as exc:
+            log.error(f"Error POSTing current weather readings: {exc}")
+
+        return
+
     log.info(f"Retrieving all WeatherAPI current weather responses from the DB")
 
     try:
         all_current_weather_models: list[CurrentWeatherJSONCollectorModel] = (
-            db_client.get_all_current_weather_responses(echo=echo)
+            db_client.get_all_current_weather_responses(echo=echo, retain=True)
         )
     except Exception as exc:
         log.error(f"Error retrieving current weather responses from DB: {exc}")
@@ -45,12 +55,11 @@ def job_post_weather_readings(echo: bool = False):
     log.info(
         f"POSTing current weather readings to API server at {API_SERVER_SETTINGS.base_url}/api/v1/collectors/weather"
     )
-    http_controller = get_httpx_controller()
+    http_controller = get_shared_httpx_controller()
 
     POST_successes = []
 
     with http_controller as http:
-
         for m in all_current_weather_models:
             log.debug(f"Processing model ID {m.id}")
             output_schema = CurrentWeatherJSONCollectorOut(
@@ -4,11 +4,13 @@ import typing as t
 
 from weatherapi_collector import (
     client as weatherapi_client,
+    collect,
     db_client,
 )
 from weatherapi_collector.depends import get_db_engine
 
 from loguru import logger as log
+from shared.depends import get_shared_httpx_controller
 from shared.domain.weatherapi.weather import (
     CurrentWeatherJSONIn,
     CurrentWeatherJSONModel,
@@ -17,7 +19,11 @@ from shared.domain.weatherapi.weather import (
 )
 import sqlalchemy as sa
 
-__all__ = ["job_weatherapi_current_weather", "job_weatherapi_weather_forecast"]
+__all__ = [
+    "job_weatherapi_current_weather",
+    "job_weatherapi_weather_forecast",
+    "job_weatherapi_collect_locations",
+]
 
 
 def job_weatherapi_current_weather(
@@ -37,6 +43,7 @@ def job_weatherapi_current_weather(
         result = weatherapi_client.get_current_weather(
             location=location_name,
             api_key=api_key,
+            http_controller=get_shared_httpx_controller(),
         )
         log.info(f"Collected current weather for location '{location_name}'")
     except Exception as exc:
@@ -78,6 +85,7 @@ def job_weatherapi_weather_forecast(
             location=location_name,
             api_key=api_key,
             days=forecast_days,
+            http_controller=get_shared_httpx_controller(),
         )
         log.info(f"Collected weather forecast for location '{location_name}'")
     except Exception as exc:
@@ -95,3 +103,29 @@ def job_weatherapi_weather_forecast(
         except Exception as exc:
             log.error(f"Failed saving forecast response JSON to database: {exc}")
             raise
+
+
+def job_weatherapi_collect_locations(
+    location_names: list[str],
+    api_key: str,
+    forecast_days: int = 1,
+    save_to_db: bool = False,
+    db_echo: bool = False,
+):
+    log.info(
+        f"[Scheduled Job] Collect current weather & forecast for {len(location_names)} location(s) from WeatherAPI"
+    )
+
+    try:
+        collect.collect_locations_sync(
+            location_names=location_names,
+            api_key=api_key,
+            forecast_days=forecast_days,
+            save_to_db=save_to_db,
+            db_echo=db_echo,
+        )
+    except Exception as exc:
+        log.error(
+            f"({type(exc)}) Error running scheduled job to collect weather for {len(location_names)} location(s) from WeatherAPI: {exc}"
+        )
+        raise
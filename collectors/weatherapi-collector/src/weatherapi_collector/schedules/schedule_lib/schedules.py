@@ -7,17 +7,20 @@ from weatherapi_collector import (
     client as weatherapi_client,
     db_client,
 )
-from weatherapi_collector.depends import get_db_engine
+from weatherapi_collector.depends import dispose_db_engines, get_db_engine
 
 from .jobs import (
+    job_apply_retention_policy,
     job_post_weather_readings,
     job_vacuum_current_weather_json_responses,
+    job_weatherapi_collect_locations,
     job_weatherapi_current_weather,
     job_weatherapi_weather_forecast,
 )
 
 from loguru import logger as log
 import schedule
+from shared.depends import close_httpx_controller
 from shared.domain.weatherapi.weather import (
     CurrentWeatherJSONIn,
     CurrentWeatherJSONModel,
@@ -37,7 +40,25 @@ def add_weatherapi_schedules(
     save_to_db: bool = False,
     db_echo: bool = False,
     db_engine: t.Optional[sa.Engine] = None,
+    location_names: t.Optional[list[str]] = None,
 ):
+    if location_names and len(location_names) > 1:
+        for minute in minutes_schedule:
+            ## Fan out over all locations in one job per tick
+            schedule.every().hour.at(f":{minute}").do(
+                job_weatherapi_collect_locations,
+                location_names=location_names,
+                api_key=api_key,
+                forecast_days=forecast_days,
+                save_to_db=save_to_db,
+                db_echo=db_echo,
+            )
+
+        return
+
+    if location_names:
+        location_name = location_names[0]
+
     for minute in minutes_schedule:
         ## Current weather
         schedule.every().hour.at(f":{minute}").do(
@@ -74,12 +95,19 @@ def add_data_schedules(
 def add_cleanup_schedules(
     db_echo: bool = False,
     minutes_schedule: list[str] = ["00"],
+    retention_job_time: str | None = None,
 ):
     for minute in minutes_schedule:
         schedule.every().hour.at(f":{minute}").do(
             job_vacuum_current_weather_json_responses, echo=db_echo
         )
 
+    ## Retention scans whole tables, run it once a day
+    if retention_job_time:
+        schedule.every().day.at(retention_job_time).do(
+            job_apply_retention_policy, echo=db_echo
+        )
+
 
 def start_weatherapi_scheduled_collection(
     location_name: str,
@@ -104,6 +132,8 @@ def start_weatherapi_scheduled_collection(
         "55",
     ],
     db_engine: t.Optional[sa.Engine] = None,
+    location_names: t.Optional[list[str]] = None,
+    retention_job_time: t.Optional[str] = None,
 ):
     add_weatherapi_schedules(
         location_name=location_name,
@@ -113,6 +143,7 @@ def start_weatherapi_scheduled_collection(
         db_echo=db_echo,
         db_engine=db_engine,
         minutes_schedule=weatherapi_jobs_minutes_schedule,
+        location_names=location_names,
     )
 
     add_data_schedules(db_echo=db_echo, minutes_schedule=data_jobs_minutes_schedule)
@@ -120,6 +151,7 @@ def start_weatherapi_scheduled_collection(
     add_cleanup_schedules(
         db_echo=db_echo,
         minutes_schedule=cleanup_jobs_minutes_schedule,
+        retention_job_time=retention_job_time,
     )
 
     log.info(f"Starting scheduler loop")
@@ -130,7 +162,8 @@ def start_weatherapi_scheduled_collection(
 [ Job schedules (in minutes) ]
   - WeatherAPI jobs (request weather): {weatherapi_jobs_minutes_schedule}
   - Data jobs (POST weather readings): {data_jobs_minutes_schedule}
-  - Cleanup jobs (vacuum db): {cleanup_jobs_minutes_schedule}"""
+  - Cleanup jobs (vacuum db): {cleanup_jobs_minutes_schedule}
+  - Retention job (daily): {retention_job_time or "disabled"}"""
     )
 
     try:
@@ -142,3 +175,8 @@ def start_weatherapi_scheduled_collection(
     except Exception as exc:
         log.error(f"Failed to run scheduled collection loop: {exc}")
         raise
+    finally:
+        ## Close pooled database connections held by the shared engines
+        dispose_db_engines()
+        ## Close the shared HTTP client & its keep-alive connections
+        close_httpx_controller()
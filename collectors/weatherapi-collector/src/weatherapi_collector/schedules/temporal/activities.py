@@ -3,6 +3,7 @@ from __future__ import annotations
 from weatherapi_collector.client import get_current_weather, get_weather_forecast
 
 from loguru import logger as log
+from shared.depends import get_shared_httpx_controller
 from temporalio import activity
 
 __all__ = [
@@ -13,13 +14,22 @@ __all__ = [
 
 @activity.defn
 def poll_current_weather(api_key: str, location: str) -> dict:
-    result: dict = get_current_weather(api_key=api_key, location=location)
+    result: dict = get_current_weather(
+        api_key=api_key,
+        location=location,
+        http_controller=get_shared_httpx_controller(),
+    )
 
     return result
 
 
 @activity.defn
 def poll_weather_forecast(api_key: str, location: str, days: int = 1):
-    result: dict = get_weather_forecast(api_key=api_key, location=location, days=days)
+    result: dict = get_weather_forecast(
+        api_key=api_key,
+        location=location,
+        days=days,
+        http_controller=get_shared_httpx_controller(),
+    )
 
     return result
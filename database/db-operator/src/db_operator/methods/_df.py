@@ -1,25 +1,432 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import typing as t
+
 from db_operator.config import DB_SETTINGS, LOGGING_SETTINGS
 from db_operator.depends import db_depends
 from db_operator.utils import db_utils
 
-import pandas as pd
+import fastparquet
 from loguru import logger as log
+import pandas as pd
+from shared.db import GUID, Base, StrList
 import sqlalchemy as sa
 
-
 __all__ = [
-    "read_db_table_into_df"
+    "read_db_table_into_df",
+    "get_db_table",
+    "get_table_dtypes",
+    "iter_db_table_chunks",
+    "export_db_table",
+]
+
+## Rows fetched & converted to a DataFrame at a time
+DEFAULT_CHUNKSIZE: int = 10_000
+
+## Filters pushed to SQL: a SQL expression, raw SQL text, or a sequence of expressions (combined with AND)
+WhereArg = t.Union[
+    sa.ColumnElement[bool], str, t.Sequence[sa.ColumnElement[bool]], None
 ]
 
 
-def read_db_table_into_df(table_name: str, engine: sa.Engine | None = None) -> pd.DataFrame:
+def get_db_table(table_name: str, engine: sa.Engine) -> sa.Table:
+    """Return a table's SQLAlchemy `Table`.
+
+    Description:
+        Tables of the project's models are taken from `shared.db.Base.metadata`, so custom column types
+        (`GUID`, `StrList`, JSON) are known. Other tables are reflected from the database.
+
+    Params:
+        table_name (str): Name of the table.
+        engine (sqlalchemy.Engine): Engine connected to the database holding the table.
+
+    Returns:
+        (sqlalchemy.Table): The table.
+
+    """
+    ## Register every model's table in Base.metadata
+    import shared.domain.weatherapi  # noqa: F401
+
+    if table_name in Base.metadata.tables:
+        return Base.metadata.tables[table_name]
+
+    return sa.Table(table_name, sa.MetaData(), autoload_with=engine)
+
+
+def get_table_dtypes(
+    table: sa.Table,
+    columns: t.Sequence[str] | None = None,
+    float_dtype: str = "float64",
+) -> dict[str, str]:
+    """Map a table's column types to compact pandas dtypes.
+
+    Description:
+        Integers become nullable `Int64`, NUMERIC & floats `float_dtype`, booleans nullable `boolean`, and
+        datetimes `datetime64`. Text, `GUID`, JSON & `StrList` columns become `string`; JSON & `StrList`
+        values are JSON-encoded, so chunks can be written to CSV or Parquet as-is.
+
+    Params:
+        table (sqlalchemy.Table): The table.
+        columns (Sequence[str] | None): Only map these columns. Defaults to every column.
+        float_dtype (str): Dtype of NUMERIC & float columns, i.e. "float32" to halve their memory.
+
+    Returns:
+        (dict[str, str]): Pandas dtype per column name.
+
+    """
+    dtypes: dict[str, str] = {}
+
+    for column in _columns(table, columns):
+        col_type: sa.types.TypeEngine = column.type
+
+        if isinstance(col_type, sa.Boolean):
+            dtypes[column.name] = "boolean"
+        elif isinstance(col_type, sa.Integer):
+            dtypes[column.name] = "Int64"
+        elif isinstance(col_type, sa.Numeric):
+            dtypes[column.name] = float_dtype
+        elif isinstance(col_type, sa.DateTime):
+            dtypes[column.name] = (
+                "datetime64[us, UTC]" if col_type.timezone else "datetime64[us]"
+            )
+        elif isinstance(col_type, sa.Date):
+            dtypes[column.name] = "datetime64[s]"
+        else:
+            dtypes[column.name] = "string"
+
+    return dtypes
+
+
+def _columns(table: sa.Table, columns: t.Sequence[str] | None) -> list[sa.Column]:
+    if columns is None:
+        return list(table.columns)
+
+    unknown: list[str] = [name for name in columns if name not in table.columns]
+    if unknown:
+        raise ValueError(f"Table '{table.name}' has no column(s): {unknown}")
+
+    return [table.columns[name] for name in columns]
+
+
+def _select_column(column: sa.Column) -> sa.ColumnElement:
+    ## Cast NUMERIC to float in SQL, so the driver never builds Decimals
+    if isinstance(column.type, sa.Numeric) and not isinstance(column.type, sa.Integer):
+        return sa.cast(column, sa.Float).label(column.name)
+
+    return column
+
+
+def _encoder(column: sa.Column) -> t.Callable[[t.Any], t.Any] | None:
+    """Return a function converting a column's values to strings, or None if they need no conversion."""
+    if isinstance(column.type, (sa.JSON, StrList)):
+        return lambda value: json.dumps(value) if value is not None else None
+    if isinstance(column.type, GUID):
+        return lambda value: str(value) if value is not None else None
+
+    return None
+
+
+def _predicates(where: WhereArg) -> list[sa.ColumnElement[bool]]:
+    if where is None:
+        return []
+    if isinstance(where, str):
+        return [sa.text(where)]
+    if isinstance(where, sa.ColumnElement):
+        return [where]
+
+    return list(where)
+
+
+def _to_df(
+    rows: t.Sequence[sa.Row], columns: list[sa.Column], dtypes: dict[str, str]
+) -> pd.DataFrame:
+    """Build a chunk's DataFrame, encoding JSON/GUID/StrList values & applying the column dtypes."""
+    data: dict[str, list] = {}
+
+    for i, column in enumerate(columns):
+        values: list = [row[i] for row in rows]
+
+        encode = _encoder(column)
+        if encode is not None:
+            values = [encode(value) for value in values]
+
+        data[column.name] = values
+
+    df: pd.DataFrame = pd.DataFrame(data, columns=[column.name for column in columns])
+
+    for name, dtype in dtypes.items():
+        if dtype.startswith("datetime64"):
+            ## Naive values of timezone-aware columns (i.e. from SQLite) are treated as UTC
+            df[name] = pd.to_datetime(df[name], utc="UTC" in dtype).astype(dtype)
+        else:
+            df[name] = df[name].astype(dtype)
+
+    return df
+
+
+def _empty_df(
+    table_name: str,
+    engine: sa.Engine,
+    columns: t.Sequence[str] | None,
+    float_dtype: str,
+) -> pd.DataFrame:
+    """Return an empty DataFrame with the selected columns & their dtypes."""
+    table: sa.Table = get_db_table(table_name, engine)
+    selected: list[sa.Column] = _columns(table, columns)
+
+    return _to_df(
+        [], selected, get_table_dtypes(table, [c.name for c in selected], float_dtype)
+    )
+
+
+def _write_chunk(
+    df: pd.DataFrame,
+    path: Path,
+    file_format: str,
+    compression: str | None,
+    append: bool,
+) -> None:
+    """Write a chunk to a new file, or append it to the file."""
+    if file_format == "csv":
+        df.to_csv(path, mode="a" if append else "w", header=not append, index=False)
+    else:
+        fastparquet.write(
+            str(path),
+            df,
+            compression=compression.upper() if compression else None,
+            append=append,
+            write_index=False,
+        )
+
+
+def iter_db_table_chunks(
+    table_name: str,
+    engine: sa.Engine | None = None,
+    columns: t.Sequence[str] | None = None,
+    where: WhereArg = None,
+    filters: dict[str, t.Any] | None = None,
+    order_by: str | None = None,
+    limit: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    float_dtype: str = "float64",
+) -> t.Iterator[pd.DataFrame]:
+    """Stream a table from the database as DataFrame chunks.
+
+    Description:
+        Rows are read with a server-side cursor where the driver supports one, so at most one chunk is held
+        in memory. Column selection & filters are part of the SQL query. Every chunk has the dtypes from
+        `get_table_dtypes()`, so chunks can be concatenated or appended to a file.
+
+    Usage:
+        for df in iter_db_table_chunks("weatherapi_current_weather", columns=["location_id", "temp_c"], filters={"location_id": 1}):
+            ...
+
+    Params:
+        table_name (str): Name of the table.
+        engine (sqlalchemy.Engine | None): Engine to use. Defaults to the configured database.
+        columns (Sequence[str] | None): Columns to read. Defaults to every column.
+        where (ColumnElement[bool] | str | Sequence[ColumnElement[bool]] | None): Row filter(s), as SQL expressions or raw SQL text.
+        filters (dict[str, Any] | None): Equality filters per column name. List, tuple & set values match any of their items.
+        order_by (str | None): Column to order rows by. Defaults to the primary key, if the table has one.
+        limit (int | None): Read at most this many rows.
+        chunksize (int): Rows per DataFrame chunk.
+        float_dtype (str): Dtype of NUMERIC & float columns, i.e. "float32".
+
+    Returns:
+        (Iterator[pandas.DataFrame]): DataFrame chunks. A table without matching rows yields nothing.
+
+    Raises:
+        ValueError: If a column does not exist, or `chunksize` is less than 1.
+
+    """
+    if chunksize <= 0:
+        raise ValueError(f"chunksize must be greater than 0, got {chunksize}")
     if engine is None:
-        engine = db_depends.get_engine()
+        engine = db_depends.return_engine()
+
+    table: sa.Table = get_db_table(table_name, engine)
+    selected: list[sa.Column] = _columns(table, columns)
+    dtypes: dict[str, str] = get_table_dtypes(
+        table, columns=[c.name for c in selected], float_dtype=float_dtype
+    )
+
+    stmt = sa.select(*(_select_column(column) for column in selected)).where(
+        *_predicates(where)
+    )
+
+    for name, value in (filters or {}).items():
+        column: sa.Column = _columns(table, [name])[0]
+        stmt = stmt.where(
+            column.in_(value)
+            if isinstance(value, (list, tuple, set))
+            else column == value
+        )
+
+    if order_by is not None:
+        stmt = stmt.order_by(_columns(table, [order_by])[0])
+    elif len(table.primary_key.columns):
+        stmt = stmt.order_by(*table.primary_key.columns)
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
 
     try:
-        df: pd.DataFrame = pd.read_sql_table(table_name, con=engine)
-        
-        return df
+        with engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=chunksize
+            ).execute(stmt)
+
+            for rows in result.partitions():
+                yield _to_df(rows, selected, dtypes)
+    except Exception as exc:
+        log.error(f"Failed to read table '{table_name}' in chunks ({type(exc)}): {exc}")
+        raise
+
+
+def export_db_table(
+    table_name: str,
+    path: str | Path,
+    file_format: t.Literal["csv", "parquet"] | None = None,
+    engine: sa.Engine | None = None,
+    columns: t.Sequence[str] | None = None,
+    where: WhereArg = None,
+    filters: dict[str, t.Any] | None = None,
+    order_by: str | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    float_dtype: str = "float64",
+    compression: str | None = "zstd",
+) -> int:
+    """Export a table to a CSV or Parquet file, one chunk at a time.
+
+    Description:
+        Each chunk from `iter_db_table_chunks()` is appended to the file, so the full table is never held in
+        memory. Parquet files are written with fastparquet, one row group per chunk.
+
+    Params:
+        table_name (str): Name of the table.
+        path (str | Path): File to write. An existing file is overwritten.
+        file_format (str | None): "csv" or "parquet". Defaults to the file's extension.
+        engine (sqlalchemy.Engine | None): Engine to use. Defaults to the configured database.
+        columns (Sequence[str] | None): Columns to export. Defaults to every column.
+        where (ColumnElement[bool] | str | Sequence[ColumnElement[bool]] | None): Row filter(s), as SQL expressions or raw SQL text.
+        filters (dict[str, Any] | None): Equality filters per column name.
+        order_by (str | None): Column to order rows by. Defaults to the primary key.
+        chunksize (int): Rows read & written at a time.
+        float_dtype (str): Dtype of NUMERIC & float columns, i.e. "float32".
+        compression (str | None): Parquet compression codec, i.e. "zstd" or "snappy". CSV files are not compressed.
+
+    Returns:
+        (int): Number of rows exported.
+
+    Raises:
+        ValueError: If the file format is not supported.
+
+    """
+    path = Path(path)
+    if file_format is None:
+        file_format = path.suffix.lstrip(".").lower()
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(
+            f"Unsupported export format '{file_format}'. Use 'csv' or 'parquet'."
+        )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    if engine is None:
+        engine = db_depends.return_engine()
+
+    rows: int = 0
+
+    try:
+        for df in iter_db_table_chunks(
+            table_name,
+            engine=engine,
+            columns=columns,
+            where=where,
+            filters=filters,
+            order_by=order_by,
+            chunksize=chunksize,
+            float_dtype=float_dtype,
+        ):
+            _write_chunk(df, path, file_format, compression, append=rows > 0)
+
+            rows += len(df)
+            log.debug(f"Exported {rows} row(s) of '{table_name}' to {path}")
+
+        if rows == 0:
+            ## Write the header/schema, so an empty export is still a valid file
+            _write_chunk(
+                _empty_df(table_name, engine, columns, float_dtype),
+                path,
+                file_format,
+                compression,
+                append=False,
+            )
+    except Exception as exc:
+        log.error(
+            f"Failed to export table '{table_name}' to {path} ({type(exc)}): {exc}"
+        )
+        raise
+
+    log.info(f"Exported {rows} row(s) of '{table_name}' to {path}")
+
+    return rows
+
+
+def read_db_table_into_df(
+    table_name: str,
+    engine: sa.Engine | None = None,
+    columns: t.Sequence[str] | None = None,
+    where: WhereArg = None,
+    filters: dict[str, t.Any] | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    float_dtype: str = "float64",
+) -> pd.DataFrame:
+    """Read a table (or the selected columns & rows of it) into one DataFrame.
+
+    Description:
+        Rows are read in chunks with `iter_db_table_chunks()` & concatenated, so the DataFrame has compact
+        dtypes instead of object columns. To process a large table without holding all of it, iterate the
+        chunks instead.
+
+    Params:
+        table_name (str): Name of the table.
+        engine (sqlalchemy.Engine | None): Engine to use. Defaults to the configured database.
+        columns (Sequence[str] | None): Columns to read. Defaults to every column.
+        where (ColumnElement[bool] | str | Sequence[ColumnElement[bool]] | None): Row filter(s).
+        filters (dict[str, Any] | None): Equality filters per column name.
+        chunksize (int): Rows read at a time.
+        float_dtype (str): Dtype of NUMERIC & float columns, i.e. "float32".
+
+    Returns:
+        (pandas.DataFrame): The table's rows.
+
+    """
+    if engine is None:
+        engine = db_depends.return_engine()
+
+    try:
+        chunks: list[pd.DataFrame] = list(
+            iter_db_table_chunks(
+                table_name,
+                engine=engine,
+                columns=columns,
+                where=where,
+                filters=filters,
+                chunksize=chunksize,
+                float_dtype=float_dtype,
+            )
+        )
+
+        if not chunks:
+            return _empty_df(table_name, engine, columns, float_dtype)
+
+        return pd.concat(chunks, ignore_index=True)
     except Exception as exc:
-        log.error(f"Failed to read table '{table_name}' into DataFrame ({type(exc)}): {exc}")
+        log.error(
+            f"Failed to read table '{table_name}' into DataFrame ({type(exc)}): {exc}"
+        )
         raise
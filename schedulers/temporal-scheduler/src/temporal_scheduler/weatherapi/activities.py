@@ -1,19 +1,23 @@
-from shared.depends.http import get_httpx_controller
-import time
+from __future__ import annotations
 
-from temporalio import activity
-from loguru import logger as log
 import httpx
+from loguru import logger as log
+from shared.depends.http import get_shared_httpx_controller
+from shared.http_lib import RetryPolicy
+from temporalio import activity
 
 __all__ = [
     "poll_current_weather",
     "poll_weather_forecast",
 ]
 
+## Retry timeouts & 429/5xx responses up to 5 times, backing off from 5s
+RETRY_POLICY = RetryPolicy(max_retries=5, backoff_base=5)
+
 
 @activity.defn
 def poll_current_weather(api_key: str, location: str) -> dict:
-    http_controller = get_httpx_controller()
+    http_controller = get_shared_httpx_controller()
 
     url = "https://api.weatherapi.com/v1/current.json"
 
@@ -27,37 +31,14 @@ def poll_current_weather(api_key: str, location: str) -> dict:
 
     try:
         with http_controller as http:
-            res = http.send_request(req)
+            res = http.send_request(req, retry_policy=RETRY_POLICY)
             res.raise_for_status()
-    except httpx.ReadTimeout as timeout:
+    except httpx.TimeoutException as timeout:
         log.warning(
             f"({type(timeout)}) Operation timed out while requesting current weather."
         )
 
-        log.info(f"Retrying 5 time(s)")
-        current_attempt = 0
-        retry_sleep = 5
-        _sleep = 3
-        retry_stagger = 3
-        max_retries = 5
-
-        while current_attempt < max_retries:
-            if current_attempt > 0:
-                _sleep += retry_stagger
-
-            log.info(f"[Retry {current_attempt}/{max_retries}]")
-
-            try:
-                res: httpx.Response = http.client.send(req)
-                break
-            except httpx.ReadTimeout as timeout_2:
-                log.warning(f"ReadTimeout on attempt [{current_attempt}/{max_retries}]")
-
-                current_attempt += 1
-
-                time.sleep(retry_sleep)
-
-                continue
+        raise timeout
 
     result = res.json()
 
@@ -66,7 +47,7 @@ def poll_current_weather(api_key: str, location: str) -> dict:
 
 @activity.defn
 def poll_weather_forecast(api_key: str, location: str, days: int = 1):
-    http_controller = get_httpx_controller()
+    http_controller = get_shared_httpx_controller()
 
     url = "https://api.weatherapi.com/v1/forecast.json"
 
@@ -82,37 +63,14 @@ def poll_weather_forecast(api_key: str, location: str, days: int = 1):
 
     try:
         with http_controller as http:
-            res = http.send_request(req)
+            res = http.send_request(req, retry_policy=RETRY_POLICY)
             res.raise_for_status()
-    except httpx.ReadTimeout as timeout:
+    except httpx.TimeoutException as timeout:
         log.warning(
-            f"({type(timeout)}) Operation timed out while requesting current weather."
+            f"({type(timeout)}) Operation timed out while requesting weather forecast."
         )
 
-        log.info(f"Retrying 5 time(s)")
-        current_attempt = 0
-        retry_sleep = 5
-        _sleep = 3
-        retry_stagger = 3
-        max_retries = 5
-
-        while current_attempt < max_retries:
-            if current_attempt > 0:
-                _sleep += retry_stagger
-
-            log.info(f"[Retry {current_attempt}/{max_retries}]")
-
-            try:
-                res: httpx.Response = http.client.send(req)
-                break
-            except httpx.ReadTimeout as timeout_2:
-                log.warning(f"ReadTimeout on attempt [{current_attempt}/{max_retries}]")
-
-                current_attempt += 1
-
-                time.sleep(retry_sleep)
-
-                continue
+        raise timeout
 
     result = res.json()
 
@@ -0,0 +1,35 @@
+"""Retention indexes
+
+Revision ID: 5d2e8c7a4f61
+Revises: f6ad5167bb7c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e8c7a4f61"
+down_revision: Union[str, Sequence[str], None] = "f6ad5167bb7c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES: tuple[str, ...] = ("weatherapi_current_json", "weatherapi_forecast_json")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_created_at", table, ["created_at"], if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_created_at", table_name=table, if_exists=True)
@@ -0,0 +1,61 @@
+"""Location (name, region, country) unique key
+
+Revision ID: 9c3f1a6e2b47
+Revises: 5d2e8c7a4f61
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3f1a6e2b47"
+down_revision: Union[str, Sequence[str], None] = "5d2e8c7a4f61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE: str = "weatherapi_location"
+OLD_CONSTRAINT: str = "_name_country_uc"
+NEW_CONSTRAINT: str = "_name_region_country_uc"
+
+
+def _unique_constraints() -> set[str] | None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(TABLE):
+        return None
+
+    return {uc["name"] for uc in inspector.get_unique_constraints(TABLE)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing: set[str] | None = _unique_constraints()
+    if existing is None:
+        ## Table is created by create_all, with the new constraint
+        return
+
+    ## Batch mode, so SQLite recreates the table
+    with op.batch_alter_table(TABLE) as batch_op:
+        if OLD_CONSTRAINT in existing:
+            batch_op.drop_constraint(OLD_CONSTRAINT, type_="unique")
+        if NEW_CONSTRAINT not in existing:
+            batch_op.create_unique_constraint(
+                NEW_CONSTRAINT, ["name", "region", "country"]
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing: set[str] | None = _unique_constraints()
+    if existing is None:
+        return
+
+    with op.batch_alter_table(TABLE) as batch_op:
+        if NEW_CONSTRAINT in existing:
+            batch_op.drop_constraint(NEW_CONSTRAINT, type_="unique")
+        if OLD_CONSTRAINT not in existing:
+            batch_op.create_unique_constraint(OLD_CONSTRAINT, ["name", "country"])
@@ -0,0 +1,190 @@
+"""Forecast day, hour & astro tables
+
+Revision ID: 7e41c2d9a853
+Revises: 2b8e5f0c7d13
+Create Date: 2026-10-18 15:00:00.000000
+
+LocationModel.forecast_weather_entries is an ORM relationship over
+weatherapi_forecast_day.location_id; it needs no schema change of its own.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7e41c2d9a853"
+down_revision: Union[str, Sequence[str], None] = "2b8e5f0c7d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ## Skip tables the app already created with create_all
+    if not _has_table("weatherapi_forecast_day"):
+        op.create_table(
+            "weatherapi_forecast_day",
+            sa.Column("id", sa.INTEGER(), autoincrement=True, nullable=False),
+            sa.Column("date", sa.Date(), nullable=False),
+            sa.Column("date_epoch", sa.INTEGER(), nullable=False),
+            sa.Column("maxtemp_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("maxtemp_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("mintemp_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("mintemp_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("avgtemp_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("avgtemp_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("maxwind_mph", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("maxwind_kph", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column(
+                "totalprecip_mm", sa.NUMERIC(precision=12, scale=2), nullable=True
+            ),
+            sa.Column(
+                "totalprecip_in", sa.NUMERIC(precision=12, scale=2), nullable=True
+            ),
+            sa.Column("totalsnow_cm", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("avgvis_km", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("avgvis_miles", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("avghumidity", sa.INTEGER(), nullable=True),
+            sa.Column("daily_will_it_rain", sa.INTEGER(), nullable=True),
+            sa.Column("daily_chance_of_rain", sa.INTEGER(), nullable=True),
+            sa.Column("daily_will_it_snow", sa.INTEGER(), nullable=True),
+            sa.Column("daily_chance_of_snow", sa.INTEGER(), nullable=True),
+            sa.Column("uv", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("condition_text", sa.TEXT(), nullable=True),
+            sa.Column("condition_icon", sa.TEXT(), nullable=True),
+            sa.Column("condition_code", sa.INTEGER(), nullable=True),
+            sa.Column("location_id", sa.INTEGER(), nullable=False),
+            sa.Column("forecast_json_id", sa.INTEGER(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["forecast_json_id"],
+                ["weatherapi_forecast_json.id"],
+                ondelete="SET NULL",
+            ),
+            sa.ForeignKeyConstraint(["location_id"], ["weatherapi_location.id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("id"),
+            sa.UniqueConstraint(
+                "location_id", "date_epoch", name="_forecast_day_location_date_uc"
+            ),
+        )
+        op.create_index(
+            "ix_weatherapi_forecast_day_location_date",
+            "weatherapi_forecast_day",
+            ["location_id", "date"],
+            unique=False,
+        )
+
+    if not _has_table("weatherapi_forecast_hour"):
+        op.create_table(
+            "weatherapi_forecast_hour",
+            sa.Column("id", sa.INTEGER(), autoincrement=True, nullable=False),
+            sa.Column("time_epoch", sa.INTEGER(), nullable=False),
+            sa.Column("time", sa.TEXT(), nullable=False),
+            sa.Column("temp_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("temp_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("is_day", sa.INTEGER(), nullable=True),
+            sa.Column("condition_text", sa.TEXT(), nullable=True),
+            sa.Column("condition_icon", sa.TEXT(), nullable=True),
+            sa.Column("condition_code", sa.INTEGER(), nullable=True),
+            sa.Column("wind_mph", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("wind_kph", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("wind_degree", sa.INTEGER(), nullable=True),
+            sa.Column("wind_dir", sa.TEXT(), nullable=True),
+            sa.Column("pressure_mb", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("pressure_in", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("precip_mm", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("precip_in", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("snow_cm", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("humidity", sa.INTEGER(), nullable=True),
+            sa.Column("cloud", sa.INTEGER(), nullable=True),
+            sa.Column("feelslike_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("feelslike_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("windchill_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("windchill_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("heatindex_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("heatindex_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("dewpoint_c", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("dewpoint_f", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("will_it_rain", sa.INTEGER(), nullable=True),
+            sa.Column("chance_of_rain", sa.INTEGER(), nullable=True),
+            sa.Column("will_it_snow", sa.INTEGER(), nullable=True),
+            sa.Column("chance_of_snow", sa.INTEGER(), nullable=True),
+            sa.Column("vis_km", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("vis_miles", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("gust_mph", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("gust_kph", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("uv", sa.NUMERIC(precision=12, scale=2), nullable=True),
+            sa.Column("location_id", sa.INTEGER(), nullable=False),
+            sa.Column("forecast_day_id", sa.INTEGER(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["forecast_day_id"], ["weatherapi_forecast_day.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(["location_id"], ["weatherapi_location.id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("id"),
+            sa.UniqueConstraint(
+                "location_id", "time_epoch", name="_forecast_hour_location_time_uc"
+            ),
+        )
+        op.create_index(
+            "ix_weatherapi_forecast_hour_forecast_day_id",
+            "weatherapi_forecast_hour",
+            ["forecast_day_id"],
+            unique=False,
+        )
+
+    if not _has_table("weatherapi_forecast_astro"):
+        op.create_table(
+            "weatherapi_forecast_astro",
+            sa.Column("id", sa.INTEGER(), autoincrement=True, nullable=False),
+            sa.Column("date", sa.Date(), nullable=False),
+            sa.Column("sunrise", sa.TEXT(), nullable=True),
+            sa.Column("sunset", sa.TEXT(), nullable=True),
+            sa.Column("moonrise", sa.TEXT(), nullable=True),
+            sa.Column("moonset", sa.TEXT(), nullable=True),
+            sa.Column("moon_phase", sa.TEXT(), nullable=True),
+            sa.Column(
+                "moon_illumination", sa.NUMERIC(precision=12, scale=2), nullable=True
+            ),
+            sa.Column("is_moon_up", sa.INTEGER(), nullable=True),
+            sa.Column("is_sun_up", sa.INTEGER(), nullable=True),
+            sa.Column("location_id", sa.INTEGER(), nullable=False),
+            sa.Column("forecast_day_id", sa.INTEGER(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["forecast_day_id"], ["weatherapi_forecast_day.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint(["location_id"], ["weatherapi_location.id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("forecast_day_id"),
+            sa.UniqueConstraint("id"),
+            sa.UniqueConstraint(
+                "location_id", "date", name="_forecast_astro_location_date_uc"
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table("weatherapi_forecast_astro"):
+        op.drop_table("weatherapi_forecast_astro")
+
+    if _has_table("weatherapi_forecast_hour"):
+        op.drop_index(
+            "ix_weatherapi_forecast_hour_forecast_day_id",
+            table_name="weatherapi_forecast_hour",
+        )
+        op.drop_table("weatherapi_forecast_hour")
+
+    if _has_table("weatherapi_forecast_day"):
+        op.drop_index(
+            "ix_weatherapi_forecast_day_location_date",
+            table_name="weatherapi_forecast_day",
+        )
+        op.drop_table("weatherapi_forecast_day")
@@ -0,0 +1,76 @@
+"""Apply the `[retention]` policy to the raw WeatherAPI JSON tables.
+
+Usage:
+    python scripts/db/apply_retention.py [--raw-days 30] [--downsample-interval hour] [--drop-after-days 365]
+
+Options override `[retention]` settings. Run it from cron/systemd, i.e. once a day.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from api_server.db.retention import apply_retention_policies, get_retention_policy
+from loguru import logger as log
+from shared.setup import setup_loguru_logging
+
+DOWNSAMPLE_INTERVALS: list[str] = ["hour", "day"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Apply the retention policy to raw JSON tables."
+    )
+    parser.add_argument(
+        "--raw-days",
+        type=float,
+        default=None,
+        help="Keep every row newer than this many days.",
+    )
+    parser.add_argument(
+        "--downsample-interval",
+        type=str,
+        choices=DOWNSAMPLE_INTERVALS,
+        default=None,
+        help="Keep one row per interval per location for rows older than --raw-days.",
+    )
+    parser.add_argument(
+        "--drop-after-days",
+        type=float,
+        default=None,
+        help="Delete rows older than this many days.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Rows deleted per statement & commit.",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    overrides = {
+        "raw_days": args.raw_days,
+        "downsample_interval": args.downsample_interval,
+        "drop_after_days": args.drop_after_days,
+        "chunk_size": args.chunk_size,
+    }
+    policy = get_retention_policy().model_copy(
+        update={k: v for k, v in overrides.items() if v is not None}
+    )
+    log.info(f"Applying retention policy: {policy.model_dump()}")
+
+    results = apply_retention_policies(policy=policy)
+
+    for table_name, counts in results.items():
+        log.info(f"{table_name}: {counts}")
+
+
+if __name__ == "__main__":
+    setup_loguru_logging()
+
+    main()
@@ -0,0 +1,72 @@
+"""Archive new weather readings & raw WeatherAPI JSON to date-partitioned Parquet files.
+
+Usage:
+    python scripts/db/archive_tables.py [--archive-dir /data/archive] [--older-than-days 1]
+
+Options override `[archive]` settings. Each run appends the rows added since the last run, so
+schedule it with cron/systemd ahead of scripts/db/apply_retention.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from api_server.db.archive import archive_tables, get_archive_config
+from loguru import logger as log
+from shared.setup import setup_loguru_logging
+
+## Options that override `[archive]` settings when given
+OVERRIDE_OPTIONS: tuple[str, ...] = (
+    "archive_dir",
+    "older_than_days",
+    "chunk_size",
+    "compression",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Archive weather tables to Parquet.")
+    parser.add_argument(
+        "--archive-dir", type=str, default=None, help="Root directory of the archive."
+    )
+    parser.add_argument(
+        "--older-than-days",
+        type=float,
+        default=None,
+        help="Only archive rows older than this many days.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Rows read from the database per query.",
+    )
+    parser.add_argument(
+        "--compression",
+        type=str,
+        default=None,
+        help="Parquet compression codec, i.e. zstd or snappy.",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    overrides = {option: getattr(args, option) for option in OVERRIDE_OPTIONS}
+    config = get_archive_config().model_copy(
+        update={k: v for k, v in overrides.items() if v is not None}
+    )
+    log.info(f"Archiving tables: {config.model_dump()}")
+
+    results = archive_tables(config=config)
+
+    for table_name, counts in results.items():
+        log.info(f"{table_name}: {counts}")
+
+
+if __name__ == "__main__":
+    setup_loguru_logging()
+
+    main()
@@ -0,0 +1,114 @@
+"""Parse stored raw forecast responses into the normalized forecast tables.
+
+Usage:
+    python scripts/db/backfill_forecast_tables.py [--batch-size 200]
+
+New forecasts are normalized when they are received. Run this once to fill the
+`weatherapi_forecast_day`, `weatherapi_forecast_hour` & `weatherapi_forecast_astro`
+tables from responses saved before that. Responses are replayed oldest first, so
+the newest forecast for each day wins.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from api_server.db import engine
+from loguru import logger as log
+from shared.domain.weatherapi.location import LocationRepository
+from shared.domain.weatherapi.weather import (
+    ForecastDayRepository,
+    ForecastJSONRepository,
+    parse_forecast_days,
+)
+from shared.setup import setup_loguru_logging
+from sqlalchemy.orm import sessionmaker
+
+DEFAULT_BATCH_SIZE: int = 200
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Backfill the normalized forecast tables."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Raw responses read per batch.",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    session_pool = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    totals: dict[str, int] = {
+        "responses": 0,
+        "skipped": 0,
+        "days": 0,
+        "hours": 0,
+        "astro": 0,
+    }
+
+    with session_pool() as read_session, session_pool() as write_session:
+        forecast_days_repo = ForecastDayRepository(write_session)
+        location_repo = LocationRepository(write_session)
+        location_ids: dict[tuple, int | None] = {}
+
+        for batch in ForecastJSONRepository(read_session).iter_batches(args.batch_size):
+            for forecast_json_model in batch:
+                ## Forecasts are stored as received, wrapped in a "forecast_json" key
+                forecast_json: dict = (forecast_json_model.forecast_json or {}).get(
+                    "forecast_json"
+                ) or {}
+                location: dict = forecast_json.get("location") or {}
+
+                key: tuple = (
+                    location.get("name"),
+                    location.get("region"),
+                    location.get("country"),
+                )
+                if key not in location_ids:
+                    location_ids[key] = location_repo.get_id_by_name_region_country(
+                        *key
+                    )
+
+                location_id: int | None = location_ids[key]
+                if location_id is None:
+                    log.warning(
+                        f"No location for forecast response {forecast_json_model.id}, skipping"
+                    )
+                    totals["skipped"] += 1
+                    continue
+
+                try:
+                    forecast_days = parse_forecast_days(forecast_json)
+                except Exception as exc:
+                    log.warning(
+                        f"Could not parse forecast response {forecast_json_model.id}: {exc}"
+                    )
+                    totals["skipped"] += 1
+                    continue
+
+                counts = forecast_days_repo.save_forecast_days(
+                    location_id=location_id,
+                    forecast_days=forecast_days,
+                    forecast_json_id=forecast_json_model.id,
+                )
+
+                totals["responses"] += 1
+                for key, value in counts.items():
+                    totals[key] += value
+
+            log.info(f"Backfilled {totals['responses']} forecast response(s) so far")
+
+    log.info(f"Backfill complete: {totals}")
+
+
+if __name__ == "__main__":
+    setup_loguru_logging()
+
+    main()
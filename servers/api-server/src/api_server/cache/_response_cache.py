@@ -0,0 +1,369 @@
+"""Response cache & ETags for the read endpoints.
+
+Description:
+    Cached responses are keyed by the request's path & query parameters, plus the current
+    "generation" of the data they read: a counter per scope (`location:<id>`, or `all` for
+    endpoints spanning every location) that the ingest path bumps after saving a payload.
+    Bumping a generation invalidates every cached response of its scope at once, since later
+    requests look up a new key, and old entries age out of the LRU or expire.
+
+    The key is also the response's `ETag`. A request whose `If-None-Match` matches the current
+    key gets a 304 from the generation lookup alone, without touching the database.
+
+    Two backends:
+        - "memory": an in-process LRU. Each worker process has its own cache & generations, so
+          use it with a single worker (`[uvicorn] workers = 1`).
+        - "redis": shared by every worker, i.e. with the `containers/api-server/overlays/redis.yml`
+          overlay. Needs the `redis` extra. If Redis is unreachable, requests bypass the cache.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import secrets
+import threading
+import time
+import typing as t
+import uuid
+
+from api_server.config import CACHE_SETTINGS
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from loguru import logger as log
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+__all__ = [
+    "CACHE_ENABLED",
+    "ALL_SCOPE",
+    "ResponseCacheBackend",
+    "MemoryResponseCache",
+    "RedisResponseCache",
+    "get_response_cache",
+    "close_response_cache",
+    "cached_json_response",
+    "invalidate_locations",
+    "location_scope",
+]
+
+## Serve read endpoints from the response cache, set by `[cache] enabled`
+CACHE_ENABLED: bool = bool(CACHE_SETTINGS.get("ENABLED", False))
+
+## Scope bumped by every ingest, for endpoints spanning all locations
+ALL_SCOPE: str = "all"
+
+_RESPONSE_CACHE: "ResponseCacheBackend | None" = None
+_RESPONSE_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
+def location_scope(location_id: int) -> str:
+    """Return the cache scope of one location's data."""
+    return f"location:{location_id}"
+
+
+class ResponseCacheBackend(t.Protocol):
+    """Storage for cached response bodies & scope generations."""
+
+    async def generation(self, scope: str) -> str | None:
+        """Return the scope's current generation, or None if the backend is unavailable."""
+        ...
+
+    async def bump(self, scopes: t.Iterable[str]) -> None:
+        """Start a new generation of each scope."""
+        ...
+
+    async def get(self, key: str) -> bytes | None:
+        """Return a cached response body."""
+        ...
+
+    async def set(self, key: str, body: bytes) -> None:
+        """Cache a response body."""
+        ...
+
+    async def close(self) -> None:
+        """Release the backend's connections."""
+        ...
+
+
+class MemoryResponseCache:
+    """In-process LRU of response bodies, with per-scope generation counters.
+
+    Description:
+        Generations start with a random token, so ETags handed out before a restart never match
+        the new process's responses.
+
+    Params:
+        ttl (int): (default: 300) Seconds a cached body lives.
+        max_entries (int): (default: 1024) Evict least recently used bodies above this count.
+    """
+
+    def __init__(self, ttl: int = 300, max_entries: int = 1024) -> None:
+        self.ttl: int = ttl
+        self.max_entries: int = max_entries
+
+        self._lock: threading.Lock = threading.Lock()
+        self._token: str = uuid.uuid4().hex[:8]
+        self._generations: dict[str, int] = {}
+        ## key -> (expires_at, body)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def metrics(self) -> dict[str, int]:
+        """Return hit/miss counters & current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    async def generation(self, scope: str) -> str | None:
+        with self._lock:
+            return f"{self._token}:{self._generations.get(scope, 0)}"
+
+    async def bump(self, scopes: t.Iterable[str]) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    async def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[1]
+
+    async def set(self, key: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, body)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisResponseCache:
+    """Response bodies & generations stored in Redis, shared by every worker.
+
+    Description:
+        Generations are `INCR` counters, bodies are strings with a TTL. Redis errors are logged and
+        treated as a cache miss (or, for generations, as no cache), so the API keeps serving from
+        the database while Redis is down.
+
+    Params:
+        url (str): Redis URL, i.e. `redis://redis:6379/0`.
+        ttl (int): (default: 300) Seconds a cached body lives.
+        key_prefix (str): (default: "theweather:api:") Prefix of every key.
+    """
+
+    def __init__(
+        self, url: str, ttl: int = 300, key_prefix: str = "theweather:api:"
+    ) -> None:
+        if aioredis is None:
+            raise RuntimeError(
+                "The redis response cache requires the redis package. Install it with: uv sync --extra redis"
+            )
+
+        self.ttl: int = ttl
+        self.key_prefix: str = key_prefix
+        self.client: "aioredis.Redis" = aioredis.Redis.from_url(url)
+
+    async def generation(self, scope: str) -> str | None:
+        key: str = f"{self.key_prefix}gen:{scope}"
+
+        try:
+            value: bytes | None = await self.client.get(key)
+
+            if value is None:
+                ## Start from a random counter, so ETags from before a Redis flush never match again
+                await self.client.set(key, secrets.randbelow(2**62), nx=True)
+                value = await self.client.get(key)
+        except Exception as exc:
+            log.warning(
+                f"({type(exc)}) Redis unavailable, bypassing response cache. Details: {exc}"
+            )
+            return None
+
+        return value.decode()
+
+    async def bump(self, scopes: t.Iterable[str]) -> None:
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for scope in scopes:
+                    pipe.incr(f"{self.key_prefix}gen:{scope}")
+                await pipe.execute()
+        except Exception as exc:
+            ## Cached responses of these scopes stay served until their TTL expires
+            log.error(
+                f"({type(exc)}) Error invalidating response cache in Redis. Details: {exc}"
+            )
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self.client.get(f"{self.key_prefix}resp:{key}")
+        except Exception as exc:
+            log.warning(
+                f"({type(exc)}) Error reading response cache from Redis. Details: {exc}"
+            )
+            return None
+
+    async def set(self, key: str, body: bytes) -> None:
+        try:
+            await self.client.set(f"{self.key_prefix}resp:{key}", body, ex=self.ttl)
+        except Exception as exc:
+            log.warning(
+                f"({type(exc)}) Error writing response cache to Redis. Details: {exc}"
+            )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def get_response_cache() -> ResponseCacheBackend | None:
+    """Return the app's response cache, creating it on first use, or None when `[cache] enabled` is false."""
+    global _RESPONSE_CACHE
+
+    if not CACHE_ENABLED:
+        return None
+
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is None:
+            backend: str = CACHE_SETTINGS.get("BACKEND", "memory")
+            ttl: int = int(CACHE_SETTINGS.get("TTL", 300))
+
+            log.info(f"Creating response cache [backend: {backend}] [ttl: {ttl}s]")
+
+            match backend:
+                case "memory":
+                    _RESPONSE_CACHE = MemoryResponseCache(
+                        ttl=ttl,
+                        max_entries=int(CACHE_SETTINGS.get("MAX_ENTRIES", 1024)),
+                    )
+                case "redis":
+                    _RESPONSE_CACHE = RedisResponseCache(
+                        url=CACHE_SETTINGS.get("REDIS_URL", "redis://localhost:6379/0"),
+                        ttl=ttl,
+                        key_prefix=CACHE_SETTINGS.get("KEY_PREFIX", "theweather:api:"),
+                    )
+                case _:
+                    raise ValueError(
+                        f"Unknown response cache backend '{backend}'. Use 'memory' or 'redis'."
+                    )
+
+        return _RESPONSE_CACHE
+
+
+async def close_response_cache() -> None:
+    """Close the response cache, if it was created."""
+    global _RESPONSE_CACHE
+
+    with _RESPONSE_CACHE_LOCK:
+        cache, _RESPONSE_CACHE = _RESPONSE_CACHE, None
+
+    if cache is not None:
+        await cache.close()
+
+
+async def invalidate_locations(location_ids: t.Iterable[int | None]) -> None:
+    """Invalidate cached responses over the given locations, and over all locations.
+
+    Params:
+        location_ids (Iterable[int | None]): IDs of locations whose data changed. None values are skipped.
+
+    """
+    cache: ResponseCacheBackend | None = get_response_cache()
+    if cache is None:
+        return
+
+    scopes: set[str] = {location_scope(i) for i in location_ids if i is not None}
+    if scopes:
+        await cache.bump([*sorted(scopes), ALL_SCOPE])
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    ## Weak comparison, as for GET requests
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+async def cached_json_response(
+    request: Request,
+    scope: str,
+    compute: t.Callable[[], t.Awaitable[t.Any]],
+) -> Response:
+    """Serve a JSON response from the cache, or compute & cache it.
+
+    Description:
+        Responses carry an `ETag` and `Cache-Control: no-cache`, so clients revalidate each time and get
+        a 304 while the scope's data is unchanged. `X-Cache` is "HIT" or "MISS". With the cache disabled
+        (or Redis unavailable), `compute` runs for every request and no ETag is sent.
+
+    Params:
+        request (Request): The request; its path & query parameters are part of the key.
+        scope (str): Scope of the data the response reads, i.e. `location_scope(location_id)`.
+        compute (Callable[[], Awaitable[Any]]): Returns the JSON-serializable response content.
+
+    Returns:
+        (Response): A 200 JSON response, or an empty 304.
+
+    """
+    cache: ResponseCacheBackend | None = get_response_cache()
+    generation: str | None = (
+        await cache.generation(scope) if cache is not None else None
+    )
+
+    if generation is None:
+        return JSONResponse(content=await compute())
+
+    query: str = "&".join(
+        f"{k}={v}" for k, v in sorted(request.query_params.multi_items())
+    )
+    key: str = hashlib.sha256(
+        f"{request.url.path}?{query}|{scope}={generation}".encode()
+    ).hexdigest()[:32]
+    etag: str = f'"{key}"'
+    headers: dict[str, str] = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body: bytes | None = await cache.get(key)
+    if body is not None:
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={**headers, "X-Cache": "HIT"},
+        )
+
+    response: JSONResponse = JSONResponse(
+        content=await compute(), headers={**headers, "X-Cache": "MISS"}
+    )
+    await cache.set(key, response.body)
+
+    return response
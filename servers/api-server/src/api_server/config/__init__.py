@@ -1,7 +1,12 @@
+from __future__ import annotations
+
 from ._settings import (
-    SETTINGS,
+    ARCHIVE_SETTINGS,
+    CACHE_SETTINGS,
     DB_SETTINGS,
     FASTAPI_SETTINGS,
     LOGGING_SETTINGS,
+    RETENTION_SETTINGS,
+    SETTINGS,
     UVICORN_SETTINGS,
 )
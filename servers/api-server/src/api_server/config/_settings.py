@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import typing as t
 from pathlib import Path
+import typing as t
 
 from shared.config import SHARED_CONFIG_DIR
 
@@ -14,6 +14,9 @@ __all__ = [
     "DB_SETTINGS",
     "FASTAPI_SETTINGS",
     "UVICORN_SETTINGS",
+    "RETENTION_SETTINGS",
+    "ARCHIVE_SETTINGS",
+    "CACHE_SETTINGS",
 ]
 
 
@@ -51,3 +54,12 @@ FASTAPI_SETTINGS = SETTINGS.get("fastapi", {})
 
 ## Extract Uvicorn settings from settings object
 UVICORN_SETTINGS = SETTINGS.get("uvicorn", {})
+
+## Extract retention policy settings from settings object
+RETENTION_SETTINGS = SETTINGS.get("retention", {})
+
+## Extract Parquet archive settings from settings object
+ARCHIVE_SETTINGS = SETTINGS.get("archive", {})
+
+## Extract read endpoint response cache settings from settings object
+CACHE_SETTINGS = SETTINGS.get("cache", {})
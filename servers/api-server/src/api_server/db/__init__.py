@@ -1 +1,4 @@
+from __future__ import annotations
+
+from ._async_db import *
 from ._db import *
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import typing as t
+
+from api_server.config import DB_SETTINGS
+from api_server.db._db import DATABASE_URL, SessionLocal
+from fastapi.concurrency import run_in_threadpool
+from loguru import logger as log
+from shared.db import get_async_db_uri, get_async_engine, get_async_session_pool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+__all__ = [
+    "ASYNC_DB_ENABLED",
+    "get_async_db_engine",
+    "get_async_session_local",
+    "dispose_async_db_engine",
+    "run_with_session",
+    "run_in_session",
+]
+
+## Return type of a function run with run_with_session()
+T = t.TypeVar("T")
+
+## Serve database requests with the async engine, set by `[database] db_async`
+ASYNC_DB_ENABLED: bool = bool(DB_SETTINGS.get("DB_ASYNC", False))
+
+_ASYNC_ENGINE: AsyncEngine | None = None
+_ASYNC_SESSION_LOCAL: async_sessionmaker[AsyncSession] | None = None
+_ASYNC_ENGINE_LOCK: threading.Lock = threading.Lock()
+
+
+def get_async_db_engine() -> AsyncEngine:
+    """Return the app's async engine, creating it on first use.
+
+    Description:
+        The URL is the sync `DATABASE_URL` with its driver swapped for an async one, or for
+        `[database] db_async_drivername` when set (i.e. `postgresql+psycopg`).
+    """
+    global _ASYNC_ENGINE
+
+    with _ASYNC_ENGINE_LOCK:
+        if _ASYNC_ENGINE is None:
+            url = get_async_db_uri(
+                DATABASE_URL, drivername=DB_SETTINGS.get("DB_ASYNC_DRIVERNAME") or None
+            )
+            log.info(f"Creating async database engine [driver: {url.drivername}]")
+
+            _ASYNC_ENGINE = get_async_engine(
+                url=url, echo=DB_SETTINGS.get("DB_ECHO", False)
+            )
+
+        return _ASYNC_ENGINE
+
+
+def get_async_session_local() -> async_sessionmaker[AsyncSession]:
+    """Return the app's async session pool."""
+    global _ASYNC_SESSION_LOCAL
+
+    engine: AsyncEngine = get_async_db_engine()
+
+    with _ASYNC_ENGINE_LOCK:
+        if _ASYNC_SESSION_LOCAL is None:
+            _ASYNC_SESSION_LOCAL = get_async_session_pool(engine)
+
+        return _ASYNC_SESSION_LOCAL
+
+
+async def dispose_async_db_engine() -> None:
+    """Close the async engine's pooled connections, if it was created."""
+    global _ASYNC_ENGINE, _ASYNC_SESSION_LOCAL
+
+    with _ASYNC_ENGINE_LOCK:
+        engine, _ASYNC_ENGINE, _ASYNC_SESSION_LOCAL = _ASYNC_ENGINE, None, None
+
+    if engine is not None:
+        await engine.dispose()
+
+
+async def run_with_session(
+    db: Session | AsyncSession, fn: t.Callable[[Session], T]
+) -> T:
+    """Run sync database code with either kind of session, without blocking the event loop.
+
+    Description:
+        With an `AsyncSession`, `fn` runs through `run_sync()` on the async connection. With a sync
+        `Session`, it runs in the threadpool, as a sync route would.
+
+    Params:
+        db (Session | AsyncSession): The request's session, from `get_db_session()`.
+        fn (Callable[[Session], T]): Called with a sync session.
+
+    Returns:
+        (T): The return value of `fn`.
+
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn)
+
+    return await run_in_threadpool(fn, db)
+
+
+async def run_in_session(fn: t.Callable[[Session], T]) -> T:
+    """Run sync database code in a new session, closed when `fn` returns.
+
+    Description:
+        For work outside a request's session, i.e. each batch of a streamed response, which is sent
+        after the request's dependencies have closed their session. Uses the async engine when
+        `[database] db_async` is enabled, otherwise a sync session in the threadpool.
+
+    Params:
+        fn (Callable[[Session], T]): Called with a sync session.
+
+    Returns:
+        (T): The return value of `fn`.
+
+    """
+    if ASYNC_DB_ENABLED:
+        async with get_async_session_local()() as db:
+            return await db.run_sync(fn)
+
+    def _run() -> T:
+        with SessionLocal.session_factory() as db:
+            return fn(db)
+
+    return await run_in_threadpool(_run)
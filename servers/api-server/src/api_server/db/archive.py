@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import datetime as dt
+
+from api_server.config import ARCHIVE_SETTINGS
+from api_server.db._db import engine
+from loguru import logger as log
+from shared.db import ArchiveConfig, ArchiveTarget, archive_table
+from shared.domain.weatherapi.location.models import LocationModel
+from shared.domain.weatherapi.weather.current.models import (
+    CurrentWeatherJSONModel,
+    CurrentWeatherModel,
+)
+from shared.domain.weatherapi.weather.forecast.models import ForecastJSONModel
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+
+__all__ = ["get_archive_config", "get_archive_targets", "archive_tables"]
+
+## Location fields a row's archive partition is named by
+LOCATION_FIELDS: tuple[str, ...] = ("name", "region", "country")
+
+
+def get_archive_config() -> ArchiveConfig:
+    """Return the archive config from `[archive]` settings."""
+    return ArchiveConfig.from_settings(ARCHIVE_SETTINGS)
+
+
+def get_archive_targets() -> list[ArchiveTarget]:
+    """Return the tables archived to Parquet.
+
+    Every table is partitioned by the location's name, region & country, so a location's readings
+    and raw responses share a `location=` directory name. Readings are partitioned by
+    `last_updated_epoch`; raw responses by `created_at`, which is written with local timestamps
+    (`datetime.now`).
+    """
+    return [
+        ArchiveTarget(
+            model=CurrentWeatherModel,
+            label="current weather",
+            timestamp_column="last_updated_epoch",
+            location_by=[
+                sa.select(getattr(LocationModel, field))
+                .where(LocationModel.id == CurrentWeatherModel.location_id)
+                .scalar_subquery()
+                for field in LOCATION_FIELDS
+            ],
+        ),
+        ArchiveTarget(
+            model=CurrentWeatherJSONModel,
+            label="current weather JSON",
+            location_by=[
+                CurrentWeatherJSONModel.current_weather_json["location"][
+                    field
+                ].as_string()
+                for field in LOCATION_FIELDS
+            ],
+            now=dt.datetime.now,
+        ),
+        ArchiveTarget(
+            model=ForecastJSONModel,
+            label="forecast JSON",
+            ## Forecasts are stored as received, wrapped in a "forecast_json" key
+            location_by=[
+                ForecastJSONModel.forecast_json["forecast_json"]["location"][
+                    field
+                ].as_string()
+                for field in LOCATION_FIELDS
+            ],
+            now=dt.datetime.now,
+        ),
+    ]
+
+
+def archive_tables(config: ArchiveConfig | None = None) -> dict[str, dict]:
+    """Archive new rows of every archived table to Parquet.
+
+    Params:
+        config (ArchiveConfig | None): Override the configured archive settings.
+
+    Returns:
+        (dict[str, dict]): Results of `archive_table()`, keyed by table name.
+
+    Raises:
+        (Exception): If archiving a table fails, the exception is logged & re-raised.
+
+    """
+    if config is None:
+        config = get_archive_config()
+
+    session_pool = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    results: dict[str, dict] = {}
+
+    for target in get_archive_targets():
+        try:
+            results[target.table_name] = archive_table(
+                session_pool=session_pool, target=target, config=config
+            )
+        except Exception as exc:
+            msg = f"({type(exc)}) Error archiving {target.label}. Details: {exc}"
+            log.error(msg)
+
+            raise
+
+    return results
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import datetime as dt
+
+from api_server.config import RETENTION_SETTINGS
+from api_server.db._db import engine
+from loguru import logger as log
+from shared.db import RetentionPolicy, RetentionTarget, apply_retention
+from shared.domain.weatherapi.weather.current.models import CurrentWeatherJSONModel
+from shared.domain.weatherapi.weather.forecast.models import ForecastJSONModel
+from sqlalchemy.orm import sessionmaker
+
+__all__ = ["get_retention_policy", "get_retention_targets", "apply_retention_policies"]
+
+
+def get_retention_policy() -> RetentionPolicy:
+    """Return the retention policy configured in `[retention]` settings."""
+    return RetentionPolicy.from_settings(RETENTION_SETTINGS)
+
+
+def get_retention_targets() -> list[RetentionTarget]:
+    """Return the raw JSON tables retention applies to.
+
+    Rows are downsampled per location, using the location name in the response JSON.
+    `created_at` is written with local timestamps (`datetime.now`).
+    """
+    return [
+        RetentionTarget(
+            model=CurrentWeatherJSONModel,
+            label="current weather JSON",
+            partition_by=[
+                CurrentWeatherJSONModel.current_weather_json["location"][
+                    "name"
+                ].as_string()
+            ],
+            now=dt.datetime.now,
+        ),
+        RetentionTarget(
+            model=ForecastJSONModel,
+            label="forecast JSON",
+            ## Forecasts are stored as received, wrapped in a "forecast_json" key
+            partition_by=[
+                ForecastJSONModel.forecast_json["forecast_json"]["location"][
+                    "name"
+                ].as_string()
+            ],
+            now=dt.datetime.now,
+        ),
+    ]
+
+
+def apply_retention_policies(
+    policy: RetentionPolicy | None = None,
+) -> dict[str, dict[str, int]]:
+    """Apply the retention policy to every raw JSON table.
+
+    Params:
+        policy (RetentionPolicy | None): Override the configured policy.
+
+    Returns:
+        (dict[str, dict[str, int]]): Results of `apply_retention()`, keyed by table name.
+
+    Raises:
+        (Exception): If applying the policy to a table fails, the exception is logged & re-raised.
+
+    """
+    if policy is None:
+        policy = get_retention_policy()
+
+    session_pool = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    results: dict[str, dict[str, int]] = {}
+
+    for target in get_retention_targets():
+        try:
+            results[target.table_name] = apply_retention(
+                session_pool=session_pool, target=target, policy=policy
+            )
+        except Exception as exc:
+            msg = f"({type(exc)}) Error applying retention policy to {target.label}. Details: {exc}"
+            log.error(msg)
+
+            raise
+
+    return results
@@ -1,9 +1,13 @@
+from __future__ import annotations
+
+import typing as t
+
+from api_server.db import ASYNC_DB_ENABLED, SessionLocal, get_async_session_local
 from loguru import logger as log
-from api_server.db import SessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-
-__all__ = ["get_db"]
+__all__ = ["get_db", "get_async_db", "get_db_session"]
 
 
 def get_db():
@@ -16,3 +20,34 @@ def get_db():
         raise
     finally:
         db.close()
+
+
+async def get_async_db() -> t.AsyncIterator[AsyncSession]:
+    async with get_async_session_local()() as db:
+        try:
+            yield db
+        except Exception as exc:
+            log.error(f"Failed during database transaction ({type(exc)}): {exc}")
+            raise
+
+
+async def get_db_session() -> t.AsyncIterator[Session | AsyncSession]:
+    """Yield an async session when `[database] db_async` is enabled, otherwise a sync session.
+
+    Use with `api_server.db.run_with_session()`, which runs sync database code on either.
+    """
+    if ASYNC_DB_ENABLED:
+        async for db in get_async_db():
+            yield db
+    else:
+        ## Not SessionLocal(): its scoped (thread-local) session would be shared by every
+        ## request, since this dependency always runs on the event loop's thread
+        db: Session = SessionLocal.session_factory()
+
+        try:
+            yield db
+        except Exception as exc:
+            log.error(f"Failed during database transaction ({type(exc)}): {exc}")
+            raise
+        finally:
+            db.close()
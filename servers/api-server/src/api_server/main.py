@@ -1,12 +1,13 @@
+from __future__ import annotations
+
 from contextlib import asynccontextmanager
 
-from api_server.routers import health
-from api_server.routers import api_router
+from api_server.cache import close_response_cache
 from api_server.config import FASTAPI_SETTINGS
-from api_server.db import engine
-from shared.db import create_base_metadata, Base
-
+from api_server.db import ASYNC_DB_ENABLED, dispose_async_db_engine, engine
+from api_server.routers import api_router, health
 from fastapi import FastAPI
+from shared.db import Base, create_base_metadata
 
 __all__ = ["app"]
 
@@ -16,6 +17,11 @@ async def lifespan(app: FastAPI):
     create_base_metadata(base=Base, engine=engine)
     yield
 
+    if ASYNC_DB_ENABLED:
+        await dispose_async_db_engine()
+
+    await close_response_cache()
+
 
 app = FastAPI(
     lifespan=lifespan,
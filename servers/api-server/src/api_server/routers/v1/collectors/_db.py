@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import typing as t
 
+from loguru import logger as log
 from shared.domain.weatherapi.location import (
     LocationIn,
     LocationModel,
@@ -7,26 +10,36 @@ from shared.domain.weatherapi.location import (
 )
 from shared.domain.weatherapi.weather import (
     CurrentWeatherIn,
-    CurrentWeatherModel,
-    CurrentWeatherRepository,
-    CurrentWeatherJSONModel,
     CurrentWeatherJSONIn,
+    CurrentWeatherJSONModel,
     CurrentWeatherJSONRepository,
-    ForecastJSONModel,
+    CurrentWeatherModel,
+    CurrentWeatherRepository,
+    ForecastDayEntryIn,
+    ForecastDayRepository,
     ForecastJSONIn,
+    ForecastJSONModel,
     ForecastJSONOut,
     ForecastJSONRepository,
+    WeatherAlertIn,
+    WeatherAlertRepository,
+    parse_forecast_days,
+    parse_weather_alerts,
 )
-
-from loguru import logger as log
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-__all__ = ["save_weatherapi_current_weather"]
+__all__ = [
+    "save_weatherapi_current_weather",
+    "save_weatherapi_weather_forecast",
+    "save_weatherapi_current_weather_async",
+    "save_weatherapi_weather_forecast_async",
+]
 
 
 def save_weatherapi_current_weather(
     data: dict, session: Session
-) -> dict[str, t.Union[LocationModel, CurrentWeatherModel, CurrentWeatherJSONModel]]:
+) -> dict[str, t.Union[CurrentWeatherJSONModel, int]]:
     """Save WeatherAPI collector payload data to database.
 
     Params:
@@ -34,7 +47,8 @@ def save_weatherapi_current_weather(
         session (Session): SQLAlchemy database session.
 
     Returns:
-        dict[str, t.Union[LocationModel, CurrentWeatherModel, CurrentWeatherJSONModel]]: Dictionary of models from database.
+        dict[str, t.Union[CurrentWeatherJSONModel, int]]: The raw JSON model from database, and the current weather & location IDs.
+
     """
     ## Raw JSON response schema
     try:
@@ -53,10 +67,6 @@ def save_weatherapi_current_weather(
     ## Current weather schema
     current_weather = CurrentWeatherIn.model_validate(_data["current"])
 
-    ## Build DB models
-    location_model: LocationModel = LocationModel(**location.model_dump())
-    current_weather_model = current_weather.to_orm()
-
     ## Initialize repositories
     current_weather_json_repo = CurrentWeatherJSONRepository(session)
     location_repo = LocationRepository(session)
@@ -75,69 +85,58 @@ def save_weatherapi_current_weather(
         log.error(f"Unhandled exception saving current weather JSON: {exc}")
         raise
 
-    ## Check if Location exists, else save
+    ## Resolve the location ID (cached in-process), saving the location if it is new
     try:
-        db_location = location_repo.get_by_name_country_and_region(
-            location_model.name,
-            location_model.region,
-            location_model.country,
-        )
-        if not db_location:
-            db_location = location_repo.save(location_model)
-        log.debug(f"Using location id: {db_location.id}")
+        location_id: int = location_repo.resolve_id(location)
+        log.debug(f"Using location id: {location_id}")
     except Exception as exc:
         log.error(f"Error saving location: {exc}")
         raise
 
-    ## Check if current weather already exists for last_updated_epoch, skip insert if so
-    existing_weather = current_weather_repo.get_by_last_updated_epoch(
-        current_weather.last_updated_epoch
+    ## Upsert on (location_id, last_updated_epoch); a repeated observation updates the existing row
+    weather_data = current_weather.model_dump(exclude={"condition", "air_quality"})
+    weather_data["location_id"] = location_id
+    condition_data = current_weather.condition.model_dump()
+    air_qual_data = (
+        current_weather.air_quality.model_dump() if current_weather.air_quality else {}
     )
-    if existing_weather:
-        log.info(
-            f"Current weather with last_updated_epoch {current_weather.last_updated_epoch} already exists, skipping insert"
-        )
-        db_current_weather = existing_weather
-    else:
-        ## Set the location_id in weather_data dict
-        weather_data = current_weather.model_dump(exclude={"condition", "air_quality"})
-        weather_data["location_id"] = db_location.id
-        condition_data = current_weather.condition.model_dump()
-        air_qual_data = (
-            current_weather.air_quality.model_dump()
-            if current_weather.air_quality
-            else {}
-        )
 
-        try:
-            db_current_weather = current_weather_repo.create_with_related(
-                weather_data=weather_data,
-                condition_data=condition_data,
-                air_quality_data=air_qual_data,
-            )
-            log.debug(f"Saved current weather with id {db_current_weather.id}")
-        except Exception as exc:
-            log.error(f"Error saving current weather: {exc}")
-            raise
+    try:
+        current_weather_id: int = current_weather_repo.upsert_with_related(
+            weather_data=weather_data,
+            condition_data=condition_data,
+            air_quality_data=air_qual_data,
+        )
+        log.debug(f"Saved current weather with id {current_weather_id}")
+    except Exception as exc:
+        log.error(f"Error saving current weather: {exc}")
+        raise
 
     return {
-        "current_weather": db_current_weather,
+        "current_weather_id": current_weather_id,
         "current_weather_json": db_current_weather_json,
-        "location": db_location,
+        "location_id": location_id,
     }
 
 
 def save_weatherapi_weather_forecast(
     data: dict, session: Session
-) -> dict[str, t.Union[LocationModel, ForecastJSONModel]]:
+) -> dict[str, t.Union[ForecastJSONModel, dict, int]]:
     """Save WeatherAPI forecast collector payload data to database.
 
     Params:
         data (dict): JSON payload data (WeatherAPI response) from collector.
         session (Session): SQLAlchemy database session.
 
+    Description:
+        Besides the raw JSON, the response's forecast days are parsed into the normalized
+        `weatherapi_forecast_day`, `weatherapi_forecast_hour` & `weatherapi_forecast_astro` tables,
+        and its alerts (if any) into `weatherapi_weather_alert`.
+
     Returns:
-        dict[str, t.Union[LocationModel, ForecastJSONModel]]: Dictionary of models from database.
+        dict[str, t.Union[ForecastJSONModel, dict, int]]: Dictionary of models from database, the location ID,
+            counts of normalized rows saved under `forecast_rows`, and the number of new alerts under `alerts_saved`.
+
     """
     ## Raw JSON response schema
     raw_json = ForecastJSONIn(forecast_json=data)
@@ -148,9 +147,6 @@ def save_weatherapi_weather_forecast(
     ## Location schema
     location = LocationIn.model_validate(_data["location"])
 
-    ## Build DB models
-    location_model: LocationModel = LocationModel(**location.model_dump())
-
     ## Initialize repositories
     forecast_json_repo = ForecastJSONRepository(session)
     location_repo = LocationRepository(session)
@@ -168,21 +164,98 @@ def save_weatherapi_weather_forecast(
         log.error(f"Unhandled exception saving forecast weather JSON: {exc}")
         raise
 
-    ## Check if Location exists, else save
+    ## Resolve the location ID (cached in-process), saving the location if it is new
     try:
-        db_location = location_repo.get_by_name_country_and_region(
-            location_model.name,
-            location_model.region,
-            location_model.country,
-        )
-        if not db_location:
-            db_location = location_repo.save(location_model)
-        log.debug(f"Using location id: {db_location.id}")
+        location_id: int = location_repo.resolve_id(location)
+        log.debug(f"Using location id: {location_id}")
     except Exception as exc:
         log.error(f"Error saving location: {exc}")
         raise
 
+    ## Parse forecast days into the normalized tables
+    try:
+        forecast_days: list[ForecastDayEntryIn] = parse_forecast_days(_data)
+    except Exception as exc:
+        log.error(
+            f"({type(exc)}) Error parsing forecast days, only raw JSON was saved: {exc}"
+        )
+        forecast_days = []
+
+    try:
+        forecast_rows: dict[str, int] = ForecastDayRepository(
+            session
+        ).save_forecast_days(
+            location_id=location_id,
+            forecast_days=forecast_days,
+            forecast_json_id=db_forecast_json.id,
+        )
+        log.debug(f"Saved normalized forecast rows: {forecast_rows}")
+    except Exception as exc:
+        log.error(f"Error saving normalized forecast: {exc}")
+        raise
+
+    ## Save alerts not already stored for the location
+    try:
+        alerts: list[WeatherAlertIn] = parse_weather_alerts(_data)
+    except Exception as exc:
+        log.error(f"({type(exc)}) Error parsing weather alerts, skipping alerts: {exc}")
+        alerts = []
+
+    try:
+        alerts_saved: int = WeatherAlertRepository(session).save_alerts(
+            location_id=location_id,
+            alerts=alerts,
+            forecast_json_id=db_forecast_json.id,
+        )
+        log.debug(f"Saved {alerts_saved} new weather alert(s)")
+    except Exception as exc:
+        log.error(f"Error saving weather alerts: {exc}")
+        raise
+
     return {
         "forecast_json": db_forecast_json,
-        "location": db_location,
+        "location_id": location_id,
+        "forecast_rows": forecast_rows,
+        "alerts_saved": alerts_saved,
     }
+
+
+async def save_weatherapi_current_weather_async(
+    data: dict, session: AsyncSession
+) -> dict[str, t.Union[CurrentWeatherJSONModel, int]]:
+    """Async version of `save_weatherapi_current_weather()`, for an `AsyncSession`.
+
+    Params:
+        data (dict): JSON payload data (WeatherAPI response) from collector.
+        session (AsyncSession): SQLAlchemy async database session.
+
+    Returns:
+        dict[str, t.Union[CurrentWeatherJSONModel, int]]: The raw JSON model from database, and the current weather & location IDs.
+
+    """
+    return await session.run_sync(
+        lambda sync_session: save_weatherapi_current_weather(
+            data=data, session=sync_session
+        )
+    )
+
+
+async def save_weatherapi_weather_forecast_async(
+    data: dict, session: AsyncSession
+) -> dict[str, t.Union[ForecastJSONModel, dict, int]]:
+    """Async version of `save_weatherapi_weather_forecast()`, for an `AsyncSession`.
+
+    Params:
+        data (dict): JSON payload data (WeatherAPI response) from collector.
+        session (AsyncSession): SQLAlchemy async database session.
+
+    Returns:
+        dict[str, t.Union[ForecastJSONModel, dict, int]]: Dictionary of models from database, the location ID,
+            counts of normalized rows saved under `forecast_rows`, and the number of new alerts under `alerts_saved`.
+
+    """
+    return await session.run_sync(
+        lambda sync_session: save_weatherapi_weather_forecast(
+            data=data, session=sync_session
+        )
+    )
@@ -1,12 +1,33 @@
-import typing as t
+from __future__ import annotations
+
 import json
+import typing as t
 
-from shared.domain.collectors.payloads import WeatherCollectorPayloadIn
+from api_server.cache import invalidate_locations
+from api_server.db import run_with_session
+from api_server.depends import get_db_session
+from api_server.routers.v1.collectors._db import (
+    save_weatherapi_current_weather,
+    save_weatherapi_weather_forecast,
+)
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
+from loguru import logger as log
+from shared.domain.collectors.payloads import (
+    WeatherCollectorBulkPayloadOut,
+    WeatherCollectorPayloadIn,
+    WeatherCollectorPayloadResult,
+)
+from shared.domain.weatherapi.location import (
+    LocationIn,
+    LocationModel,
+    LocationRepository,
+)
 from shared.domain.weatherapi.weather import (
+    CurrentWeatherIn,
     CurrentWeatherJSONIn,
     CurrentWeatherJSONModel,
     CurrentWeatherJSONRepository,
-    CurrentWeatherIn,
     CurrentWeatherModel,
     CurrentWeatherRepository,
     ForecastJSONIn,
@@ -14,23 +35,9 @@ from shared.domain.weatherapi.weather import (
     ForecastJSONOut,
     ForecastJSONRepository,
 )
-from shared.domain.weatherapi.location import (
-    LocationIn,
-    LocationModel,
-    LocationRepository,
-)
-from api_server.depends import get_db
-from api_server.routers.v1.collectors._db import (
-    save_weatherapi_current_weather,
-    save_weatherapi_weather_forecast,
-)
-
-from loguru import logger as log
-from fastapi import APIRouter, status, HTTPException, Depends
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
 import sqlalchemy.exc as sa_exc
-
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 __all__ = ["router"]
 
@@ -42,8 +49,25 @@ def collectors_status():
     return {"status": "Collectors endpoint online"}
 
 
-@router.post("/weather", status_code=status.HTTP_201_CREATED)
-def receive_weather(payload: WeatherCollectorPayloadIn, db: Session = Depends(get_db)):
+## Upper bound on payloads accepted by a single bulk request
+MAX_BULK_PAYLOADS: int = 1000
+
+
+def _save_collector_payload(payload: WeatherCollectorPayloadIn, db: Session) -> dict:
+    """Validate & save a single collector payload.
+
+    Params:
+        payload (WeatherCollectorPayloadIn): The payload received from a collector.
+        db (Session): SQLAlchemy database session.
+
+    Returns:
+        (dict): Response content with the IDs of the saved entities.
+
+    Raises:
+        (HTTPException): 400 on an invalid source/label/payload, 409 if the data already
+            exists, 500 on database errors.
+
+    """
     log.info(f"Received: [source: {payload.source}] | [label: {payload.label}]")
 
     match payload.source:
@@ -59,8 +83,7 @@ def receive_weather(payload: WeatherCollectorPayloadIn, db: Session = Depends(ge
                         db_models: dict[
                             str,
                             t.Union[
-                                LocationModel,
-                                CurrentWeatherModel,
+                                int,
                                 CurrentWeatherJSONModel,
                             ],
                         ] = save_weatherapi_current_weather(
@@ -90,20 +113,15 @@ def receive_weather(payload: WeatherCollectorPayloadIn, db: Session = Depends(ge
                         )
 
                     ## Extract models from db save function return
-                    db_current_weather = db_models["current_weather"]
                     db_current_weather_json = db_models["current_weather_json"]
-                    db_location = db_models["location"]
-
-                    return JSONResponse(
-                        content={
-                            "success": True,
-                            "message": "Weather data saved to database.",
-                            "location_id": db_location.id,
-                            "current_weather_id": db_current_weather.id,
-                            "current_weather_json_id": db_current_weather_json.id,
-                        },
-                        status_code=status.HTTP_201_CREATED,
-                    )
+
+                    return {
+                        "success": True,
+                        "message": "Weather data saved to database.",
+                        "location_id": db_models["location_id"],
+                        "current_weather_id": db_models["current_weather_id"],
+                        "current_weather_json_id": db_current_weather_json.id,
+                    }
 
                 ## Forecast weather data
                 case "forecast":
@@ -124,7 +142,7 @@ def receive_weather(payload: WeatherCollectorPayloadIn, db: Session = Depends(ge
                         db_models: dict[
                             str,
                             t.Union[
-                                LocationModel,
+                                int,
                                 ForecastJSONModel,
                             ],
                         ] = save_weatherapi_weather_forecast(
@@ -155,17 +173,13 @@ def receive_weather(payload: WeatherCollectorPayloadIn, db: Session = Depends(ge
 
                     ## Extract models from db save function return
                     db_weather_forecast_json = db_models["forecast_json"]
-                    db_location = db_models["location"]
-
-                    return JSONResponse(
-                        content={
-                            "success": True,
-                            "message": "Weather data saved to database.",
-                            "location_id": db_location.id,
-                            "weather_forecast_json": db_weather_forecast_json.id,
-                        },
-                        status_code=status.HTTP_201_CREATED,
-                    )
+
+                    return {
+                        "success": True,
+                        "message": "Weather data saved to database.",
+                        "location_id": db_models["location_id"],
+                        "weather_forecast_json": db_weather_forecast_json.id,
+                    }
 
                 ## Invalid collector data label
                 case _:
@@ -176,3 +190,111 @@ def receive_weather(payload: WeatherCollectorPayloadIn, db: Session = Depends(ge
         case _:
             log.error(f"Invalid source: {payload.source}")
             raise HTTPException(status_code=400, detail="Invalid source")
+
+
+@router.post("/weather", status_code=status.HTTP_201_CREATED)
+async def receive_weather(
+    payload: WeatherCollectorPayloadIn,
+    db: Session | AsyncSession = Depends(get_db_session),
+):
+    content: dict = await run_with_session(
+        db, lambda session: _save_collector_payload(payload=payload, db=session)
+    )
+    ## New readings make cached read responses of the location stale
+    await invalidate_locations([content.get("location_id")])
+
+    return JSONResponse(content=content, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/weather/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=WeatherCollectorBulkPayloadOut,
+)
+async def receive_weather_bulk(
+    payloads: list[WeatherCollectorPayloadIn],
+    db: Session | AsyncSession = Depends(get_db_session),
+):
+    """Save a batch of collector payloads in one request.
+
+    Description:
+        Each payload is saved exactly as if it were POSTed to `/weather`. A failing payload
+        does not fail the batch; its status code is reported in `results` (matched to the
+        request by `index`) so the collector can retry only the payloads that were not
+        acknowledged. A 409 counts as acknowledged, the data is already stored.
+    """
+    if len(payloads) > MAX_BULK_PAYLOADS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk request exceeds {MAX_BULK_PAYLOADS} payloads.",
+        )
+
+    log.info(f"Received bulk request with {len(payloads)} payload(s)")
+
+    bulk_result: WeatherCollectorBulkPayloadOut = await run_with_session(
+        db, lambda session: _save_collector_payloads(payloads=payloads, db=session)
+    )
+    await invalidate_locations(
+        [
+            result.detail.get("location_id")
+            for result in bulk_result.results
+            if result.status_code == status.HTTP_201_CREATED
+            and isinstance(result.detail, dict)
+        ]
+    )
+
+    return bulk_result
+
+
+def _save_collector_payloads(
+    payloads: list[WeatherCollectorPayloadIn], db: Session
+) -> WeatherCollectorBulkPayloadOut:
+    """Save collector payloads one by one, collecting a result for each."""
+    results: list[WeatherCollectorPayloadResult] = []
+
+    for index, payload in enumerate(payloads):
+        try:
+            content: dict = _save_collector_payload(payload=payload, db=db)
+            results.append(
+                WeatherCollectorPayloadResult(
+                    index=index, status_code=status.HTTP_201_CREATED, detail=content
+                )
+            )
+        except HTTPException as http_exc:
+            ## Clear the failed transaction so the next payload can be saved
+            db.rollback()
+            results.append(
+                WeatherCollectorPayloadResult(
+                    index=index,
+                    status_code=http_exc.status_code,
+                    detail=http_exc.detail,
+                )
+            )
+        except Exception as exc:
+            log.error(f"({type(exc)}) Unhandled error saving payload {index}: {exc}")
+            db.rollback()
+            results.append(
+                WeatherCollectorPayloadResult(
+                    index=index,
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Unhandled error occurred while saving data.",
+                )
+            )
+
+    saved: int = sum(1 for r in results if r.status_code == status.HTTP_201_CREATED)
+    duplicates: int = sum(
+        1 for r in results if r.status_code == status.HTTP_409_CONFLICT
+    )
+    failed: int = len(results) - saved - duplicates
+
+    log.info(
+        f"Bulk request complete. [saved: {saved}] [duplicates: {duplicates}] [failed: {failed}]"
+    )
+
+    return WeatherCollectorBulkPayloadOut(
+        success=failed == 0,
+        saved=saved,
+        duplicates=duplicates,
+        failed=failed,
+        results=results,
+    )
@@ -1,12 +1,15 @@
-from api_server.routers.v1.collectors import router
+from __future__ import annotations
 
+from api_server.routers.v1.collectors import router as collectors_router
+from api_server.routers.v1.weather import router as weather_router
 from fastapi import APIRouter
 
 __all__ = ["api_v1_router"]
 
 api_v1_router = APIRouter(prefix="/v1")
 
-api_v1_router.include_router(router)
+api_v1_router.include_router(collectors_router)
+api_v1_router.include_router(weather_router)
 
 
 @api_v1_router.get("/status")
@@ -0,0 +1,315 @@
+"""Read endpoints over stored current weather readings.
+
+Description:
+    Time-range slices & hourly/daily aggregates of a location's readings, and each location's latest
+    reading. Pages are keyset-paginated on `last_updated_epoch` (or the aggregate bucket), which the
+    (location_id, last_updated_epoch) unique index covers; pass a response's `next_cursor` back as
+    `cursor` to get the next page. Large ranges can be streamed as NDJSON instead of paged.
+
+    Paged & aggregate responses are cached (see `api_server.cache`) and carry an `ETag`; send it back
+    as `If-None-Match` to get a 304 while the location has no new readings.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime as dt
+import json
+import typing as t
+
+from api_server.cache import ALL_SCOPE, cached_json_response, location_scope
+from api_server.db import run_in_session, run_with_session
+from api_server.depends import get_db_session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from loguru import logger as log
+from shared.domain.weatherapi.weather import (
+    AGGREGATE_INTERVALS,
+    MEASUREMENT_COLUMNS,
+    READING_COLUMNS,
+    CurrentWeatherRepository,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/weather", tags=["weather"])
+
+## Readings per page
+DEFAULT_PAGE_SIZE: int = 100
+MAX_PAGE_SIZE: int = 1000
+## Aggregate buckets per page
+DEFAULT_BUCKET_PAGE_SIZE: int = 500
+MAX_BUCKET_PAGE_SIZE: int = 5000
+## Readings fetched per query while streaming NDJSON
+STREAM_BATCH_SIZE: int = 1000
+
+
+def _encode_cursor(kind: str, value: int) -> str:
+    return base64.urlsafe_b64encode(f"{kind}:{value}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str | None, kind: str) -> int | None:
+    """Return the epoch in a cursor, or raise a 400 if it is not a cursor of this kind."""
+    if not cursor:
+        return None
+
+    try:
+        decoded: str = base64.urlsafe_b64decode(
+            cursor + "=" * (-len(cursor) % 4)
+        ).decode()
+        cursor_kind, value = decoded.rsplit(":", 1)
+
+        if cursor_kind != kind:
+            raise ValueError(f"cursor is for '{cursor_kind}', not '{kind}'")
+
+        return int(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        log.warning(f"Invalid cursor '{cursor}': {exc}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def _to_epoch(value: dt.datetime | None) -> int | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        ## Naive times are UTC, like last_updated_epoch
+        value = value.replace(tzinfo=dt.timezone.utc)
+
+    return int(value.timestamp())
+
+
+def _split(values: list[str] | None) -> list[str] | None:
+    """Accept both repeated (`?columns=a&columns=b`) & comma-separated (`?columns=a,b`) list parameters."""
+    if not values:
+        return None
+
+    return [
+        item.strip() for value in values for item in value.split(",") if item.strip()
+    ]
+
+
+def _run_query(fn: t.Callable[[], list[dict]]) -> list[dict]:
+    """Run a repository query, turning invalid columns/metrics/intervals into a 400."""
+    try:
+        return fn()
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+async def _run_query_async(fn: t.Callable[[Session], list[dict]]) -> list[dict]:
+    """Run a repository query in a new session, turning invalid columns into a 400."""
+    try:
+        return await run_in_session(fn)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.get("/status", status_code=status.HTTP_200_OK)
+def weather_status():
+    return {"status": "Weather endpoint online"}
+
+
+@router.get("/current/latest", status_code=status.HTTP_200_OK)
+async def get_latest_current_weather(
+    request: Request,
+    location_id: list[int] | None = Query(
+        default=None, description="Only these locations. Repeat for several."
+    ),
+    columns: list[str] | None = Query(
+        default=None, description=f"Columns to return: {', '.join(READING_COLUMNS)}"
+    ),
+    db: Session | AsyncSession = Depends(get_db_session),
+):
+    """Return the most recent reading of each location."""
+
+    async def _compute() -> dict:
+        items: list[dict] = await run_with_session(
+            db,
+            lambda session: _run_query(
+                lambda: CurrentWeatherRepository(session).latest_readings(
+                    location_ids=location_id, columns=_split(columns)
+                )
+            ),
+        )
+
+        return {"items": items}
+
+    return await cached_json_response(request, ALL_SCOPE, _compute)
+
+
+@router.get("/current/{location_id}/readings", status_code=status.HTTP_200_OK)
+async def get_current_weather_readings(
+    request: Request,
+    location_id: int,
+    start: dt.datetime | None = Query(
+        default=None,
+        description="Readings at or after this time (ISO 8601 or epoch seconds, UTC).",
+    ),
+    end: dt.datetime | None = Query(
+        default=None,
+        description="Readings before this time (ISO 8601 or epoch seconds, UTC).",
+    ),
+    order: t.Literal["asc", "desc"] = "asc",
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page."
+    ),
+    columns: list[str] | None = Query(
+        default=None, description=f"Columns to return: {', '.join(READING_COLUMNS)}"
+    ),
+    db: Session | AsyncSession = Depends(get_db_session),
+):
+    """Return a page of a location's readings in a time range.
+
+    Response: `items` (readings ordered by `last_updated_epoch`) & `next_cursor` (`null` on the last page).
+    """
+    cursor_kind: str = f"readings-{order}"
+    after_epoch: int | None = _decode_cursor(cursor, cursor_kind)
+
+    async def _compute() -> dict:
+        items: list[dict] = await run_with_session(
+            db,
+            lambda session: _run_query(
+                lambda: CurrentWeatherRepository(session).list_readings(
+                    location_id=location_id,
+                    start_epoch=_to_epoch(start),
+                    end_epoch=_to_epoch(end),
+                    after_epoch=after_epoch,
+                    limit=limit,
+                    descending=order == "desc",
+                    columns=_split(columns),
+                )
+            ),
+        )
+
+        next_cursor: str | None = (
+            _encode_cursor(cursor_kind, items[-1]["last_updated_epoch"])
+            if len(items) == limit
+            else None
+        )
+
+        return {"items": items, "next_cursor": next_cursor}
+
+    return await cached_json_response(request, location_scope(location_id), _compute)
+
+
+@router.get("/current/{location_id}/readings/stream", status_code=status.HTTP_200_OK)
+async def stream_current_weather_readings(
+    location_id: int,
+    start: dt.datetime | None = Query(
+        default=None,
+        description="Readings at or after this time (ISO 8601 or epoch seconds, UTC).",
+    ),
+    end: dt.datetime | None = Query(
+        default=None,
+        description="Readings before this time (ISO 8601 or epoch seconds, UTC).",
+    ),
+    order: t.Literal["asc", "desc"] = "asc",
+    columns: list[str] | None = Query(
+        default=None, description=f"Columns to return: {', '.join(READING_COLUMNS)}"
+    ),
+):
+    """Stream every reading of a location in a time range, as newline-delimited JSON.
+
+    Description:
+        Readings are read in keyset-paginated batches, each in its own short session, so a long stream
+        holds neither a database connection nor the whole range in memory.
+    """
+    start_epoch: int | None = _to_epoch(start)
+    end_epoch: int | None = _to_epoch(end)
+    selected: list[str] | None = _split(columns)
+
+    def _batch(after_epoch: int | None) -> t.Callable[[Session], list[dict]]:
+        return lambda session: CurrentWeatherRepository(session).list_readings(
+            location_id=location_id,
+            start_epoch=start_epoch,
+            end_epoch=end_epoch,
+            after_epoch=after_epoch,
+            limit=STREAM_BATCH_SIZE,
+            descending=order == "desc",
+            columns=selected,
+        )
+
+    ## Read the first batch before the response starts, so invalid columns are a 400, not a broken stream
+    first: list[dict] = await _run_query_async(_batch(None))
+
+    async def _lines() -> t.AsyncIterator[str]:
+        batch: list[dict] = first
+
+        while batch:
+            yield "".join(json.dumps(row) + "\n" for row in batch)
+
+            if len(batch) < STREAM_BATCH_SIZE:
+                return
+
+            batch = await run_in_session(_batch(batch[-1]["last_updated_epoch"]))
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
+@router.get("/current/{location_id}/aggregates", status_code=status.HTTP_200_OK)
+async def get_current_weather_aggregates(
+    request: Request,
+    location_id: int,
+    interval: t.Literal["hour", "day"] = "hour",
+    start: dt.datetime | None = Query(
+        default=None,
+        description="Readings at or after this time (ISO 8601 or epoch seconds, UTC).",
+    ),
+    end: dt.datetime | None = Query(
+        default=None,
+        description="Readings before this time (ISO 8601 or epoch seconds, UTC).",
+    ),
+    metrics: list[str] | None = Query(
+        default=None,
+        description=f"Measurements to aggregate: {', '.join(MEASUREMENT_COLUMNS)}",
+    ),
+    limit: int = Query(default=DEFAULT_BUCKET_PAGE_SIZE, ge=1, le=MAX_BUCKET_PAGE_SIZE),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page."
+    ),
+    db: Session | AsyncSession = Depends(get_db_session),
+):
+    """Return hourly or daily min, max & average of a location's measurements, computed in SQL.
+
+    Response: `interval`, `items` (one per UTC bucket with readings: `bucket_epoch`, `count`, and
+    `<metric>_min`, `<metric>_max` & `<metric>_avg`) & `next_cursor` (`null` on the last page).
+    """
+    cursor_kind: str = f"aggregates-{interval}"
+    after_bucket: int | None = _decode_cursor(cursor, cursor_kind)
+
+    async def _compute() -> dict:
+        items: list[dict] = await run_with_session(
+            db,
+            lambda session: _run_query(
+                lambda: CurrentWeatherRepository(session).aggregate_readings(
+                    location_id=location_id,
+                    interval=interval,
+                    metrics=_split(metrics),
+                    start_epoch=_to_epoch(start),
+                    end_epoch=_to_epoch(end),
+                    after_bucket=after_bucket,
+                    limit=limit,
+                )
+            ),
+        )
+
+        next_cursor: str | None = (
+            _encode_cursor(cursor_kind, items[-1]["bucket_epoch"])
+            if len(items) == limit
+            else None
+        )
+
+        return {
+            "interval": interval,
+            "interval_seconds": AGGREGATE_INTERVALS[interval],
+            "items": items,
+            "next_cursor": next_cursor,
+        }
+
+    return await cached_json_response(request, location_scope(location_id), _compute)
@@ -13,6 +13,7 @@ from shared.db.base import Base
 from shared.domain.weatherapi.location.models import *
 from shared.domain.weatherapi.weather.current.models import *
 from shared.domain.weatherapi.weather.forecast.models import *
+from shared.domain.weatherapi.weather.weather_alerts.models import *
 from shared.db import get_db_uri
 from shared.config import SHARED_SETTINGS
 
@@ -54,6 +55,7 @@ if DB_URI:
 else:
     raise Exception("DATABASE_URL not found in Dynaconf settings")
 
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -92,9 +94,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+        context.configure(connection=connection, target_metadata=target_metadata)
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,46 @@
+"""Retention indexes
+
+Revision ID: 4042e22acab1
+Revises: 3a5b138bbaac
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4042e22acab1"
+down_revision: Union[str, Sequence[str], None] = "3a5b138bbaac"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES: tuple[str, ...] = ("weatherapi_current_json", "weatherapi_forecast_json")
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ## Tables are created by the app with create_all, index those that already exist
+    for table in TABLES:
+        if not _has_table(table):
+            continue
+
+        op.create_index(
+            f"ix_{table}_created_at", table, ["created_at"], if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        if not _has_table(table):
+            continue
+
+        op.drop_index(f"ix_{table}_created_at", table_name=table, if_exists=True)
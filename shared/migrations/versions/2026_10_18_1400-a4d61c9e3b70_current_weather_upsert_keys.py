@@ -0,0 +1,103 @@
+"""Current weather upsert keys
+
+Revision ID: a4d61c9e3b70
+Revises: e27b4d9c1f08
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d61c9e3b70"
+down_revision: Union[str, Sequence[str], None] = "e27b4d9c1f08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+WEATHER_TABLE: str = "weatherapi_current_weather"
+OLD_COLUMNS: list[str] = ["last_updated_epoch"]
+NEW_CONSTRAINT: str = "_current_weather_location_epoch_uc"
+NEW_COLUMNS: list[str] = ["location_id", "last_updated_epoch"]
+
+## (table, constraint) of the one-to-one children, upserted on weather_id
+CHILD_CONSTRAINTS: tuple[tuple[str, str], ...] = (
+    ("weatherapi_current_condition", "_current_condition_weather_uc"),
+    ("weatherapi_air_quality", "_air_quality_weather_uc"),
+)
+
+## SQLite reflects unnamed constraints without a name; batch mode names them with this convention
+NAMING_CONVENTION: dict[str, str] = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+
+
+def _unique_constraints(table: str) -> list[dict] | None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+
+    return inspector.get_unique_constraints(table)
+
+
+def _constraint_name(
+    constraints: list[dict], table: str, columns: list[str]
+) -> str | None:
+    for uc in constraints:
+        if uc["column_names"] == columns:
+            return uc["name"] or f"uq_{table}_{columns[0]}"
+
+    return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    constraints: list[dict] | None = _unique_constraints(WEATHER_TABLE)
+    if constraints is None:
+        ## Tables are created by create_all, with the new constraints
+        return
+
+    old_name: str | None = _constraint_name(constraints, WEATHER_TABLE, OLD_COLUMNS)
+    with op.batch_alter_table(
+        WEATHER_TABLE, naming_convention=NAMING_CONVENTION
+    ) as batch_op:
+        if old_name is not None:
+            batch_op.drop_constraint(old_name, type_="unique")
+        if _constraint_name(constraints, WEATHER_TABLE, NEW_COLUMNS) is None:
+            batch_op.create_unique_constraint(NEW_CONSTRAINT, NEW_COLUMNS)
+
+    for table, name in CHILD_CONSTRAINTS:
+        child_constraints: list[dict] | None = _unique_constraints(table)
+        if child_constraints is None or _constraint_name(
+            child_constraints, table, ["weather_id"]
+        ):
+            continue
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_unique_constraint(name, ["weather_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    constraints: list[dict] | None = _unique_constraints(WEATHER_TABLE)
+    if constraints is None:
+        return
+
+    for table, name in CHILD_CONSTRAINTS:
+        child_constraints: list[dict] | None = _unique_constraints(table)
+        if child_constraints is None or not _constraint_name(
+            child_constraints, table, ["weather_id"]
+        ):
+            continue
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(name, type_="unique")
+
+    with op.batch_alter_table(WEATHER_TABLE) as batch_op:
+        if _constraint_name(constraints, WEATHER_TABLE, NEW_COLUMNS) is not None:
+            batch_op.drop_constraint(NEW_CONSTRAINT, type_="unique")
+        if _constraint_name(constraints, WEATHER_TABLE, OLD_COLUMNS) is None:
+            batch_op.create_unique_constraint(
+                f"{WEATHER_TABLE}_last_updated_epoch_key", OLD_COLUMNS
+            )
@@ -0,0 +1,77 @@
+"""Weather alert table
+
+Revision ID: e5a7c3f10b84
+Revises: c83f5a1d6e29
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c3f10b84"
+down_revision: Union[str, Sequence[str], None] = "c83f5a1d6e29"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ## Skip tables the app already created with create_all
+    if not _has_table("weatherapi_weather_alert"):
+        op.create_table(
+            "weatherapi_weather_alert",
+            sa.Column("id", sa.INTEGER(), autoincrement=True, nullable=False),
+            sa.Column("content_hash", sa.String(length=64), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("headline", sa.TEXT(), nullable=True),
+            sa.Column("msgtype", sa.TEXT(), nullable=True),
+            sa.Column("severity", sa.TEXT(), nullable=True),
+            sa.Column("urgency", sa.TEXT(), nullable=True),
+            sa.Column("areas", sa.TEXT(), nullable=True),
+            sa.Column("category", sa.TEXT(), nullable=True),
+            sa.Column("certainty", sa.TEXT(), nullable=True),
+            sa.Column("event", sa.TEXT(), nullable=True),
+            sa.Column("note", sa.TEXT(), nullable=True),
+            sa.Column("effective", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("expires", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("description", sa.TEXT(), nullable=True),
+            sa.Column("instruction", sa.TEXT(), nullable=True),
+            sa.Column("location_id", sa.INTEGER(), nullable=False),
+            sa.Column("forecast_json_id", sa.INTEGER(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["forecast_json_id"],
+                ["weatherapi_forecast_json.id"],
+                ondelete="SET NULL",
+            ),
+            sa.ForeignKeyConstraint(["location_id"], ["weatherapi_location.id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("id"),
+            sa.UniqueConstraint(
+                "location_id", "content_hash", name="_weather_alert_location_hash_uc"
+            ),
+        )
+        op.create_index(
+            "ix_weatherapi_weather_alert_location_expires_effective",
+            "weatherapi_weather_alert",
+            ["location_id", "expires", "effective"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table("weatherapi_weather_alert"):
+        op.drop_index(
+            "ix_weatherapi_weather_alert_location_expires_effective",
+            table_name="weatherapi_weather_alert",
+        )
+        op.drop_table("weatherapi_weather_alert")
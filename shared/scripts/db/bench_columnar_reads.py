@@ -0,0 +1,200 @@
+"""Benchmark reading a location's current weather through the ORM vs. the columnar path.
+
+Usage:
+    python scripts/db/bench_columnar_reads.py [--rows 50000] [--runs 5] [--db-file /path/to/db.sqlite3]
+
+Without `--db-file`, a throwaway SQLite database is filled with synthetic readings for one location.
+"ORM" loads `CurrentWeatherModel` objects (with their `Decimal` measurements) and builds a DataFrame
+from them, as analytics code did before the columnar path. "Arrays" & "DF" read the same rows
+with `read_current_weather_arrays()` & `read_current_weather_df()`. Peak memory is measured with
+tracemalloc, in a separate run so it does not skew the timings.
+"""
+
+from __future__ import annotations
+
+import argparse
+from decimal import Decimal
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+from shared.db import Base
+from shared.domain.weatherapi.location import LocationModel
+from shared.domain.weatherapi.weather.current import (
+    MEASUREMENT_COLUMNS,
+    CurrentWeatherModel,
+    read_current_weather_arrays,
+    read_current_weather_df,
+)
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+DEFAULT_ROWS: int = 50_000
+DEFAULT_RUNS: int = 5
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Columnar vs. ORM current weather read benchmark."
+    )
+    parser.add_argument(
+        "--rows", type=int, default=DEFAULT_ROWS, help="Synthetic readings to insert."
+    )
+    parser.add_argument(
+        "--runs", type=int, default=DEFAULT_RUNS, help="Timed runs per read path."
+    )
+    parser.add_argument(
+        "--db-file",
+        type=str,
+        default=None,
+        help="Existing SQLite database to read. Defaults to a temporary one with synthetic data.",
+    )
+    parser.add_argument(
+        "--location-id",
+        type=int,
+        default=1,
+        help="Location to read, when using --db-file.",
+    )
+
+    return parser.parse_args()
+
+
+def fill_synthetic(engine: sa.Engine, rows: int) -> int:
+    """Create the tables & insert `rows` readings, 15 minutes apart, for one location."""
+    Base.metadata.create_all(engine)
+    rng = random.Random(42)
+
+    with so.Session(engine) as session:
+        location = LocationModel(
+            name="Benchmark",
+            region="Synthetic",
+            country="Nowhere",
+            lat=Decimal("0.0"),
+            lon=Decimal("0.0"),
+            tz_id="UTC",
+            localtime_epoch=0,
+            localtime="",
+        )
+        session.add(location)
+        session.flush()
+
+        start_epoch: int = 1_700_000_000
+        batch: list[dict] = []
+        for i in range(rows):
+            reading: dict = {
+                c: Decimal(f"{rng.uniform(0, 100):.2f}") for c in MEASUREMENT_COLUMNS
+            }
+            reading.update(
+                location_id=location.id,
+                last_updated_epoch=start_epoch + i * 900,
+                last_updated="",
+                wind_dir="N",
+            )
+            batch.append(reading)
+
+            if len(batch) == 5_000:
+                session.execute(sa.insert(CurrentWeatherModel), batch)
+                batch.clear()
+        if batch:
+            session.execute(sa.insert(CurrentWeatherModel), batch)
+
+        session.commit()
+
+        return location.id
+
+
+def read_orm(session: so.Session, location_id: int) -> pd.DataFrame:
+    """Load ORM objects, then build a DataFrame from their attributes."""
+    readings: list[CurrentWeatherModel] = (
+        session.query(CurrentWeatherModel)
+        .filter(CurrentWeatherModel.location_id == location_id)
+        .order_by(CurrentWeatherModel.last_updated_epoch)
+        .all()
+    )
+
+    return pd.DataFrame(
+        [
+            {c: getattr(r, c) for c in ("last_updated_epoch", *MEASUREMENT_COLUMNS)}
+            for r in readings
+        ]
+    )
+
+
+def read_arrays(session: so.Session, location_id: int):
+    return read_current_weather_arrays(session, location_id)
+
+
+def read_df(session: so.Session, location_id: int):
+    return read_current_weather_df(session, location_id)
+
+
+def bench(
+    engine: sa.Engine, fn, location_id: int, runs: int
+) -> tuple[list[float], int, int]:
+    """Time `fn` over `runs` fresh sessions, then measure its peak memory in one more run."""
+    timings: list[float] = []
+    n_rows: int = 0
+
+    for _ in range(runs):
+        with so.Session(engine) as session:
+            start = time.perf_counter()
+            result = fn(session, location_id)
+            timings.append(time.perf_counter() - start)
+
+        n_rows = (
+            len(result)
+            if not isinstance(result, dict)
+            else len(result["last_updated_epoch"])
+        )
+        del result
+
+    with so.Session(engine) as session:
+        tracemalloc.start()
+        result = fn(session, location_id)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+
+    return timings, peak, n_rows
+
+
+def _summary(label: str, timings: list[float], peak: int) -> str:
+    ms = [t * 1000 for t in timings]
+
+    return f"{label:<7} mean {statistics.mean(ms):9.2f}ms  median {statistics.median(ms):9.2f}ms  peak {peak / 2**20:8.2f}MiB"
+
+
+def main():
+    args = parse_args()
+
+    if args.db_file:
+        engine = sa.create_engine(f"sqlite+pysqlite:///{args.db_file}")
+        location_id: int = args.location_id
+    else:
+        engine = sa.create_engine(
+            f"sqlite+pysqlite:///{tempfile.mkdtemp()}/bench.sqlite3"
+        )
+        location_id = fill_synthetic(engine, args.rows)
+
+    results: dict[str, tuple[list[float], int, int]] = {
+        label: bench(engine, fn, location_id, args.runs)
+        for label, fn in (("ORM", read_orm), ("Arrays", read_arrays), ("DF", read_df))
+    }
+    engine.dispose()
+
+    print(f"Database: {engine.url}")
+    print(f"Rows read: {results['ORM'][2]} [runs: {args.runs}]")
+    for label, (timings, peak, _) in results.items():
+        print(_summary(label, timings, peak))
+
+    orm_mean: float = statistics.mean(results["ORM"][0])
+    print(
+        f"Speedup vs ORM (mean): arrays {orm_mean / statistics.mean(results['Arrays'][0]):.2f}x, df {orm_mean / statistics.mean(results['DF'][0]):.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
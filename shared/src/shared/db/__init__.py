@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from . import *
 from .__methods import *
+from .archive import *
+from .async_session import *
 from .base import *
+from .registry import *
+from .retention import *
 from .types import *
+from .upsert import *
 from .utils import *
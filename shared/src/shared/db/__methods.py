@@ -103,7 +103,47 @@ def get_engine(
     hide_parameters: bool = False,
     echo: bool = False,
     query_cache_size: int = 500,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_pre_ping: bool | None = None,
+    pool_recycle: int | None = None,
 ) -> sa.Engine:
+    """Create a SQLAlchemy `Engine`.
+
+    Description:
+        Every call builds a new engine & connection pool. Long-running apps should use
+        `shared.db.get_cached_engine()` instead, which returns a shared engine per
+        URL/echo/pool options.
+
+    Params:
+        pool (sqlalchemy.Pool | None): An existing connection pool to use.
+        url (sqlalchemy.URL): The database URL.
+        logging_name (str | None): Name used in the engine's log output.
+        execution_options (dict | None): Default execution options for all connections.
+        hide_parameters (bool): Hide SQL parameters in log output & error messages.
+        echo (bool): Echo SQL statements to the console.
+        query_cache_size (int): Size of the compiled SQL statement cache.
+        pool_size (int | None): Number of connections to keep open in the pool.
+        max_overflow (int | None): Number of connections allowed above `pool_size`.
+        pool_pre_ping (bool | None): Test connections for liveness when checked out.
+        pool_recycle (int | None): Recycle connections older than this many seconds.
+
+    Returns:
+        (sqlalchemy.Engine): A SQLAlchemy `Engine`.
+
+    """
+    ## Only pass pool options that were set, leaving the dialect's defaults otherwise
+    pool_opts: dict = {
+        k: v
+        for k, v in {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_pre_ping": pool_pre_ping,
+            "pool_recycle": pool_recycle,
+        }.items()
+        if v is not None
+    }
+
     engine = sa.create_engine(
         pool=pool,
         logging_name=logging_name,
@@ -112,6 +152,7 @@ def get_engine(
         echo=echo,
         hide_parameters=hide_parameters,
         query_cache_size=query_cache_size,
+        **pool_opts,
     )
 
     return engine
@@ -0,0 +1,496 @@
+"""Archive table rows to date-partitioned Parquet files, i.e. old readings & raw WeatherAPI JSON.
+
+Description:
+    An `ArchiveTarget` says which table to archive: the model, the timestamp column rows are
+    partitioned by, and the expressions that name a row's location. `archive_table()` streams the
+    table in keyset-paginated chunks and writes Hive-style partitions:
+
+        <archive_dir>/<table>/location=<slug>/year=<YYYY>/month=<MM>/part-<run>-<n>.parquet
+
+    Files are compressed with zstd by default. Each table has a `_manifest.json` listing its files
+    (partition, row count, ID & timestamp ranges), and the highest archived ID. Runs are incremental:
+    only rows above the manifest's `last_id` are read, so every run archives a contiguous range of IDs.
+
+    Rows are only read, never deleted; pruning the database is left to retention (see `retention.py`).
+    Rows updated in place after they were archived are not archived again.
+
+    Column types are mapped to Arrow types: integers to int64, NUMERIC & floats to float64 (cast in
+    SQL, so no Decimals are built), JSON to JSON-encoded strings, and dates & timestamps to their Arrow
+    equivalents.
+
+    pyarrow is required. Install it with the `analytics` extra of the shared package.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import datetime as dt
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import typing as t
+
+log = logging.getLogger(__name__)
+
+from .base import BaseRepository
+
+from pydantic import BaseModel, Field
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+__all__ = [
+    "ArchiveConfig",
+    "ArchiveTarget",
+    "archive_table",
+    "read_archive_manifest",
+    "location_partition",
+    "MANIFEST_FILENAME",
+]
+
+## Name of the manifest file in each table's archive directory
+MANIFEST_FILENAME: str = "_manifest.json"
+## Manifest format version, bumped on incompatible changes
+MANIFEST_VERSION: int = 1
+
+
+class ArchiveConfig(BaseModel):
+    """Where & how to write archive files.
+
+    Attributes:
+        archive_dir (str): Root directory of the archive. Each table gets a subdirectory.
+        older_than_days (float): Only archive rows older than this many days.
+        chunk_size (int): Rows read from the database per query.
+        row_group_size (int): Rows buffered before a Parquet row group is written. Also bounds the rows
+            buffered across all partitions.
+        compression (str): Parquet compression codec, i.e. "zstd" or "snappy".
+        compression_level (int | None): Codec compression level. `None` uses the codec's default.
+        max_open_files (int): Partition files kept open at once. When exceeded, the least recently
+            written file is closed, and later rows for its partition start a new file.
+
+    """
+
+    archive_dir: str
+    older_than_days: float = Field(default=0, ge=0)
+    chunk_size: int = Field(default=5000, gt=0)
+    row_group_size: int = Field(default=50_000, gt=0)
+    compression: str = "zstd"
+    compression_level: int | None = None
+    max_open_files: int = Field(default=64, gt=0)
+
+    @classmethod
+    def from_settings(cls, settings: t.Mapping[str, t.Any]) -> "ArchiveConfig":
+        """Build a config from a Dynaconf settings section, i.e. `[archive]`."""
+        defaults: dict[str, t.Any] = {
+            name: field.default
+            for name, field in cls.model_fields.items()
+            if name != "archive_dir"
+        }
+
+        return cls(
+            archive_dir=settings.get("ARCHIVE_DIR", ".archive"),
+            **{
+                name: settings.get(name.upper(), default)
+                for name, default in defaults.items()
+            },
+        )
+
+
+class ArchiveTarget:
+    """A table archived by `archive_table()`.
+
+    Params:
+        model (type): The SQLAlchemy model. Must have a single-column primary key.
+        label (str | None): Name used in log messages. Defaults to the table name.
+        timestamp_column (str): (default: "created_at") Column rows are partitioned by year & month, and
+            aged by. Either a datetime, or an integer of epoch seconds (UTC).
+        location_by (Sequence[sa.ColumnElement] | None): Expressions naming a row's location, joined
+            into the `location=` partition, i.e. a location name extracted from the JSON payload.
+            Rows without a location go to `location=unknown`.
+        columns (Sequence[str] | None): Column names to archive. Defaults to every column of the table.
+        now (Callable[[], datetime]): (default: `datetime.utcnow`) Clock matching how a datetime
+            timestamp column is written.
+    """
+
+    def __init__(
+        self,
+        model: t.Type,
+        label: str | None = None,
+        timestamp_column: str = "created_at",
+        location_by: t.Sequence[sa.ColumnElement] | None = None,
+        columns: t.Sequence[str] | None = None,
+        now: t.Callable[[], dt.datetime] = dt.datetime.utcnow,
+    ) -> None:
+        self.model: t.Type = model
+        self.label: str = label or model.__tablename__
+        self.timestamp_column: sa.Column = model.__table__.c[timestamp_column]
+        self.location_by: list[sa.ColumnElement] = list(location_by or [])
+        self.columns: list[sa.Column] = (
+            [model.__table__.c[name] for name in columns]
+            if columns is not None
+            else list(model.__table__.columns)
+        )
+        self.now: t.Callable[[], dt.datetime] = now
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def epoch_timestamps(self) -> bool:
+        """`True` if the timestamp column holds epoch seconds instead of datetimes."""
+        return isinstance(self.timestamp_column.type, sa.Integer)
+
+    def cutoff(self, older_than_days: float) -> dt.datetime | int:
+        """Return the timestamp rows must be older than to be archived, in the column's format."""
+        if self.epoch_timestamps:
+            now_epoch: float = dt.datetime.now(dt.timezone.utc).timestamp()
+
+            return int(now_epoch - older_than_days * 86400)
+
+        return self.now() - dt.timedelta(days=older_than_days)
+
+
+def _arrow_type(column: sa.Column) -> "pa.DataType":
+    """Return the Arrow type a column is archived as."""
+    col_type: sa.types.TypeEngine = column.type
+
+    if isinstance(col_type, sa.Boolean):
+        return pa.bool_()
+    elif isinstance(col_type, sa.Integer):
+        return pa.int64()
+    elif isinstance(col_type, sa.Numeric):
+        return pa.float64()
+    elif isinstance(col_type, sa.DateTime):
+        return pa.timestamp("us", tz="UTC" if col_type.timezone else None)
+    elif isinstance(col_type, sa.Date):
+        return pa.date32()
+
+    return pa.string()
+
+
+def _select_column(column: sa.Column) -> sa.ColumnElement:
+    """Return the expression a column is selected with; NUMERIC is cast to float in SQL."""
+    if isinstance(column.type, sa.Numeric) and not isinstance(column.type, sa.Integer):
+        return sa.cast(column, sa.Float).label(column.name)
+
+    return column
+
+
+def location_partition(values: t.Sequence[t.Any]) -> str:
+    """Return the `location=` partition value for a row, i.e. `london-city-of-london-greater-london-united-kingdom`."""
+    parts: list[str] = [
+        re.sub(r"[^a-z0-9]+", "-", str(value).lower()).strip("-")
+        for value in values
+        if value is not None and str(value).strip()
+    ]
+    slug: str = "-".join(part for part in parts if part)
+
+    return slug or "unknown"
+
+
+def _year_month(value: t.Any, epoch: bool) -> tuple[str, str]:
+    if value is None:
+        return "unknown", "unknown"
+    if epoch:
+        value = dt.datetime.fromtimestamp(int(value), tz=dt.timezone.utc)
+
+    return f"{value.year:04d}", f"{value.month:02d}"
+
+
+def read_archive_manifest(archive_dir: str | Path, table_name: str) -> dict:
+    """Return a table's archive manifest, or an empty one if the table was never archived.
+
+    Params:
+        archive_dir (str | Path): Root directory of the archive.
+        table_name (str): The archived table.
+
+    Returns:
+        (dict): The manifest: `table`, `version`, `last_id`, `updated_at` & `files`.
+
+    """
+    manifest_file: Path = Path(archive_dir) / table_name / MANIFEST_FILENAME
+
+    if not manifest_file.exists():
+        return {
+            "table": table_name,
+            "version": MANIFEST_VERSION,
+            "last_id": None,
+            "updated_at": None,
+            "files": [],
+        }
+
+    with open(manifest_file, "r") as f:
+        return json.load(f)
+
+
+def _write_manifest(table_dir: Path, manifest: dict) -> None:
+    """Replace a manifest atomically, so readers never see a partial file."""
+    tmp_file: Path = table_dir / f"{MANIFEST_FILENAME}.tmp"
+
+    with open(tmp_file, "w") as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+    os.replace(tmp_file, table_dir / MANIFEST_FILENAME)
+
+
+class _PartitionFile:
+    """An open Parquet file of one partition, written under a temporary name until the run succeeds."""
+
+    def __init__(self, path: Path, schema: "pa.Schema", config: ArchiveConfig) -> None:
+        self.path: Path = path
+        self.tmp_path: Path = path.with_name(f"{path.name}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.writer: "pq.ParquetWriter" = pq.ParquetWriter(
+            self.tmp_path,
+            schema,
+            compression=config.compression,
+            compression_level=config.compression_level,
+        )
+        self.rows: int = 0
+        self.min_id: t.Any = None
+        self.max_id: t.Any = None
+        self.min_timestamp: t.Any = None
+        self.max_timestamp: t.Any = None
+
+    def write(self, table: "pa.Table", ids: list, timestamps: list) -> None:
+        self.writer.write_table(table)
+        self.rows += table.num_rows
+
+        self.min_id = ids[0] if self.min_id is None else self.min_id
+        self.max_id = ids[-1]
+
+        present: list = [ts for ts in timestamps if ts is not None]
+        if present:
+            low, high = min(present), max(present)
+            self.min_timestamp = (
+                low if self.min_timestamp is None else min(self.min_timestamp, low)
+            )
+            self.max_timestamp = (
+                high if self.max_timestamp is None else max(self.max_timestamp, high)
+            )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def archive_table(
+    session_pool: so.sessionmaker[so.Session],
+    target: ArchiveTarget,
+    config: ArchiveConfig,
+) -> dict[str, t.Any]:
+    """Archive a table's new rows to Parquet files & update its manifest.
+
+    Description:
+        Reads rows with an ID above the manifest's `last_id`, up to (not including) the first row
+        newer than `config.older_than_days`. Rows are buffered per (location, year, month) partition
+        and written in row groups of `config.row_group_size`. Each partition touched by a run gets a
+        new part file. Files are renamed into place & added to the manifest only once every row has
+        been written, so a failed run leaves the archive as it was.
+
+    Params:
+        session_pool (so.sessionmaker[so.Session]): Session pool for the database holding the table.
+        target (ArchiveTarget): The table to archive.
+        config (ArchiveConfig): Where & how to write the files.
+
+    Returns:
+        (dict[str, Any]): Counts of `rows` & `files` written, and the manifest's new `last_id`.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+        (Exception): If reading or writing fails, partial files are removed and the exception is re-raised.
+
+    """
+    if pa is None:
+        raise RuntimeError(
+            "Archiving requires the pyarrow package. Install it with: pip install theweather-shared[analytics]"
+        )
+
+    table_dir: Path = Path(config.archive_dir) / target.table_name
+    manifest: dict = read_archive_manifest(config.archive_dir, target.table_name)
+    last_id: t.Any = manifest["last_id"]
+
+    schema: pa.Schema = pa.schema(
+        [pa.field(column.name, _arrow_type(column)) for column in target.columns]
+    )
+    json_columns: list[str] = [
+        column.name for column in target.columns if isinstance(column.type, sa.JSON)
+    ]
+    names: list[str] = [column.name for column in target.columns]
+
+    run_id: str = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    files_opened: int = 0
+    open_files: OrderedDict[tuple, _PartitionFile] = OrderedDict()
+    closed_files: list[tuple[tuple, _PartitionFile]] = []
+    ## Rows waiting to be written, per partition: [ids], [timestamps], {column: [values]}
+    buffers: dict[tuple, tuple[list, list, dict[str, list]]] = {}
+    buffered: int = 0
+    rows_read: int = 0
+
+    def _flush(key: tuple) -> None:
+        nonlocal buffered, files_opened
+
+        ids, timestamps, values = buffers.pop(key)
+        buffered -= len(ids)
+
+        part: _PartitionFile | None = open_files.pop(key, None)
+        if part is None:
+            if len(open_files) >= config.max_open_files:
+                oldest_key, oldest = open_files.popitem(last=False)
+                oldest.close()
+                closed_files.append((oldest_key, oldest))
+
+            files_opened += 1
+            location, year, month = key
+            part = _PartitionFile(
+                table_dir
+                / f"location={location}"
+                / f"year={year}"
+                / f"month={month}"
+                / f"part-{run_id}-{files_opened:04d}.parquet",
+                schema=schema,
+                config=config,
+            )
+
+        ## Most recently written last
+        open_files[key] = part
+        part.write(pa.Table.from_pydict(values, schema=schema), ids, timestamps)
+
+    with session_pool() as session:
+        pk_column: sa.Column = BaseRepository(
+            session=session, model=target.model
+        )._pk_column()
+        pk_index: int = names.index(pk_column.name)
+        ts_index: int = names.index(target.timestamp_column.name)
+
+        ## Stop below the first new row that is too recent, so the archived IDs stay contiguous
+        pending_stmt = sa.select(sa.func.min(pk_column)).where(
+            target.timestamp_column >= target.cutoff(config.older_than_days)
+        )
+        if last_id is not None:
+            pending_stmt = pending_stmt.where(pk_column > last_id)
+        first_pending: t.Any = session.execute(pending_stmt).scalar()
+
+        base_stmt = (
+            sa.select(
+                *(_select_column(column) for column in target.columns),
+                *(
+                    expr.label(f"_location_{i}")
+                    for i, expr in enumerate(target.location_by)
+                ),
+            )
+            .order_by(pk_column)
+            .limit(config.chunk_size)
+        )
+        if first_pending is not None:
+            base_stmt = base_stmt.where(pk_column < first_pending)
+
+        after_id: t.Any = last_id
+
+        try:
+            while True:
+                stmt = (
+                    base_stmt
+                    if after_id is None
+                    else base_stmt.where(pk_column > after_id)
+                )
+                rows = session.execute(stmt).all()
+                if not rows:
+                    break
+
+                for row in rows:
+                    key: tuple = (
+                        location_partition(row[len(names) :]),
+                        *_year_month(row[ts_index], target.epoch_timestamps),
+                    )
+
+                    if key not in buffers:
+                        buffers[key] = ([], [], {name: [] for name in names})
+                    ids, timestamps, values = buffers[key]
+
+                    ids.append(row[pk_index])
+                    timestamps.append(row[ts_index])
+                    for name, value in zip(names, row):
+                        values[name].append(
+                            json.dumps(value)
+                            if name in json_columns and value is not None
+                            else value
+                        )
+
+                    buffered += 1
+                    if len(ids) >= config.row_group_size:
+                        _flush(key)
+
+                ## Bound memory across partitions by writing the largest buffer
+                while buffered > config.row_group_size:
+                    _flush(max(buffers, key=lambda k: len(buffers[k][0])))
+
+                rows_read += len(rows)
+                after_id = rows[-1][pk_index]
+
+                if len(rows) < config.chunk_size:
+                    break
+
+            for key in list(buffers):
+                _flush(key)
+            for key, part in open_files.items():
+                part.close()
+                closed_files.append((key, part))
+            open_files.clear()
+        except Exception as exc:
+            msg = f"({type(exc)}) Error archiving {target.label}, removing partial files. Details: {exc}"
+            log.error(msg)
+
+            for part in [*open_files.values(), *(part for _, part in closed_files)]:
+                try:
+                    part.close()
+                except Exception:
+                    pass
+                part.tmp_path.unlink(missing_ok=True)
+
+            raise
+
+    created_at: str = dt.datetime.now(dt.timezone.utc).isoformat()
+    for (location, year, month), part in closed_files:
+        os.replace(part.tmp_path, part.path)
+
+        manifest["files"].append(
+            {
+                "path": part.path.relative_to(table_dir).as_posix(),
+                "location": location,
+                "year": year,
+                "month": month,
+                "rows": part.rows,
+                "bytes": part.path.stat().st_size,
+                "min_id": part.min_id,
+                "max_id": part.max_id,
+                "min_timestamp": part.min_timestamp,
+                "max_timestamp": part.max_timestamp,
+                "compression": config.compression,
+                "created_at": created_at,
+            }
+        )
+
+    if rows_read:
+        table_dir.mkdir(parents=True, exist_ok=True)
+        manifest.update(last_id=after_id, updated_at=created_at)
+        _write_manifest(table_dir, manifest)
+
+    log.info(
+        f"Archived {rows_read} row(s) of {target.label} to {len(closed_files)} file(s) in {table_dir}"
+    )
+
+    return {
+        "rows": rows_read,
+        "files": len(closed_files),
+        "last_id": manifest["last_id"],
+    }
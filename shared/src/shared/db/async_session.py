@@ -0,0 +1,199 @@
+"""Async engines & sessions, and an async facade over the sync repositories.
+
+Description:
+    The async path uses SQLAlchemy's asyncio extension with an async DBAPI driver
+    (`asyncpg`, `aiosqlite` or `aiomysql`), so waiting on the database does not hold a thread.
+
+    Repositories are written against a sync `Session`. Rather than keeping a second copy of
+    every query, `AsyncRepository` runs repository methods through `AsyncSession.run_sync()`,
+    which drives the same ORM code over the async connection.
+
+"""
+
+from __future__ import annotations
+
+import logging
+import typing as t
+
+log = logging.getLogger(__name__)
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+import sqlalchemy.orm as so
+
+__all__ = [
+    "ASYNC_DRIVERNAMES",
+    "get_async_db_uri",
+    "get_async_engine",
+    "get_async_session_pool",
+    "AsyncRepository",
+]
+
+## Async driver for each database backend
+ASYNC_DRIVERNAMES: dict[str, str] = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "mariadb": "mariadb+aiomysql",
+}
+
+## Repository type wrapped by an AsyncRepository
+R = t.TypeVar("R")
+## Return type of a repository call
+T = t.TypeVar("T")
+
+
+def get_async_db_uri(url: sa.URL, drivername: str | None = None) -> sa.URL:
+    """Return a copy of a database URL that uses an async driver.
+
+    Params:
+        url (sqlalchemy.URL): A database URL, i.e. for `postgresql+psycopg2`.
+        drivername (str | None): Async drivername to use, i.e. `postgresql+psycopg`. Defaults to the
+            backend's driver in `ASYNC_DRIVERNAMES`.
+
+    Returns:
+        (sqlalchemy.URL): The URL with the async drivername.
+
+    Raises:
+        ValueError: If no async driver is known for the URL's backend.
+
+    """
+    if isinstance(url, str):
+        url = sa.make_url(url)
+
+    if drivername is None:
+        backend: str = url.get_backend_name()
+
+        if backend not in ASYNC_DRIVERNAMES:
+            raise ValueError(
+                f"No async driver known for database backend '{backend}'. Set an async drivername explicitly."
+            )
+
+        drivername = ASYNC_DRIVERNAMES[backend]
+
+    return url.set(drivername=drivername)
+
+
+def get_async_engine(
+    url: sa.URL,
+    echo: bool = False,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_pre_ping: bool | None = None,
+    pool_recycle: int | None = None,
+) -> AsyncEngine:
+    """Create a SQLAlchemy `AsyncEngine`.
+
+    Description:
+        The async driver is imported when the engine is created, so it only needs to be
+        installed when the async path is used.
+
+    Params:
+        url (sqlalchemy.URL): The database URL, with an async drivername. See `get_async_db_uri()`.
+        echo (bool): Echo SQL statements to the console.
+        pool_size (int | None): Number of connections to keep open in the pool.
+        max_overflow (int | None): Number of connections allowed above `pool_size`.
+        pool_pre_ping (bool | None): Test connections for liveness when checked out.
+        pool_recycle (int | None): Recycle connections older than this many seconds.
+
+    Returns:
+        (AsyncEngine): A SQLAlchemy `AsyncEngine`.
+
+    Raises:
+        ModuleNotFoundError: If the async driver is not installed.
+
+    """
+    pool_opts: dict = {
+        k: v
+        for k, v in {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_pre_ping": pool_pre_ping,
+            "pool_recycle": pool_recycle,
+        }.items()
+        if v is not None
+    }
+
+    try:
+        return create_async_engine(url, echo=echo, **pool_opts)
+    except ModuleNotFoundError as exc:
+        msg = f"({type(exc)}) Async database driver for '{url.drivername}' is not installed. Details: {exc}"
+        log.error(msg)
+
+        raise
+
+
+def get_async_session_pool(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Return an async session pool.
+
+    Description:
+        Sessions do not expire objects on commit, so attributes of returned models can be read
+        after the transaction without another (awaited) query.
+
+    Params:
+        engine (AsyncEngine): The engine to use for database connections.
+
+    Returns:
+        (async_sessionmaker[AsyncSession]): A session pool for database connections.
+
+    """
+    if not isinstance(engine, AsyncEngine):
+        raise TypeError(
+            f"engine must be of type AsyncEngine. Got type: ({type(engine)})"
+        )
+
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+class AsyncRepository(t.Generic[R]):
+    """Async facade over a sync repository.
+
+    Description:
+        Every public method of the wrapped repository can be awaited. Calls run through
+        `AsyncSession.run_sync()`, so the repository's sync queries go over the async connection.
+        Generator methods like `iter_batches()` are not supported; use `run()` to consume them
+        inside the session instead.
+
+    Usage:
+        locations = AsyncRepository(async_session, LocationRepository)
+        location_id = await locations.resolve_id(location_in)
+
+        ## Several calls on one sync repository
+        rows = await locations.run(lambda repo: [repo.get(i) for i in ids])
+
+    Params:
+        session (AsyncSession): The async database session.
+        repository (type[R]): The sync repository class, i.e. `LocationRepository`.
+
+    """
+
+    def __init__(self, session: AsyncSession, repository: t.Type[R]) -> None:
+        self.session: AsyncSession = session
+        self.repository: t.Type[R] = repository
+
+    async def run(self, fn: t.Callable[[R], T]) -> T:
+        """Call `fn` with a sync repository bound to this session, & return its result."""
+        return await self.session.run_sync(
+            lambda sync_session: fn(self.repository(sync_session))
+        )
+
+    def __getattr__(self, name: str) -> t.Callable[..., t.Awaitable[t.Any]]:
+        ## Attributes set in __init__ are never looked up here, unless __init__ has not run yet
+        if name in ("session", "repository") or name.startswith("_"):
+            raise AttributeError(name)
+        if not callable(getattr(self.repository, name, None)):
+            raise AttributeError(
+                f"{self.repository.__name__} has no public method '{name}'"
+            )
+
+        async def _call(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            return await self.run(lambda repo: getattr(repo, name)(*args, **kwargs))
+
+        _call.__name__ = name
+
+        return _call
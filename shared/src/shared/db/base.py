@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import logging
 import typing as t
 
+log = logging.getLogger(__name__)
+
 import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as so
@@ -11,6 +14,14 @@ __all__ = ["Base", "BaseRepository"]
 ## Generic type representing an instance of a class
 T = t.TypeVar("T")
 
+## Rows per statement/commit for the bulk methods
+DEFAULT_CHUNK_SIZE: int = 500
+
+## A column given by attribute name, or as a column expression
+ColumnArg = t.Union[str, sa.ColumnElement]
+## One predicate, or several combined with AND
+WhereArg = t.Union[sa.ColumnElement[bool], t.Sequence[sa.ColumnElement[bool]], None]
+
 
 class Base(so.DeclarativeBase):
     pass
@@ -22,6 +33,16 @@ class BaseRepository(t.Generic[T]):
     Usage:
         When creating a new repository class, inherit from this BaseRepository.
         The new class will have sessions for create(), get(), update(), delete(), and list().
+
+        For many rows at once, use create_many(), update_many() & delete_where(). They issue
+        one statement & one commit per chunk of rows instead of one per object.
+
+        When only some columns are needed, use list_columns(), list_ids() & get_columns(), or
+        list(defer_json=True), so large JSON columns are not read from the database.
+        list(), list_columns() & list_ids() page by primary key with `after_id` & `limit`.
+
+        To scan a whole table, iterate over iter_batches() instead of calling list(). Memory use
+        stays bounded by the batch size, however large the table is.
     """
 
     def __init__(self, session: so.Session, model: t.Type[T]):
@@ -52,9 +73,463 @@ class BaseRepository(t.Generic[T]):
 
         self.session.commit()
 
-    def list(self) -> list[T]:
-        return self.session.execute(sa.select(self.model)).scalars().all()
+    def list(
+        self,
+        where: WhereArg = None,
+        defer: t.Iterable[str] | None = None,
+        defer_json: bool = False,
+        after_id: t.Any = None,
+        limit: int | None = None,
+    ) -> list[T]:
+        """List entities, optionally filtered, paged by primary key & without large columns.
+
+        Params:
+            where (ColumnElement[bool] | Sequence[ColumnElement[bool]] | None): Filter predicate(s), combined with AND.
+            defer (Iterable[str] | None): Attribute names not loaded with the query. They are loaded
+                on first access while the session is open.
+            defer_json (bool): (default: False) Defer every JSON column of the model.
+            after_id (Any | None): Only return entities with a primary key greater than this (keyset pagination).
+            limit (int | None): Maximum entities to return.
+
+        Returns:
+            (list[T]): The entities. Ordered by primary key when `after_id` or `limit` is set.
+
+        """
+        deferred: set[str] = set(defer or [])
+        if defer_json:
+            deferred.update(self._json_column_keys())
+
+        stmt = self._paged(sa.select(self.model), where, after_id, limit)
+        if deferred:
+            stmt = stmt.options(
+                *(so.defer(getattr(self.model, key)) for key in sorted(deferred))
+            )
+
+        return self.session.execute(stmt).scalars().all()
+
+    def list_columns(
+        self,
+        *columns: ColumnArg,
+        where: WhereArg = None,
+        after_id: t.Any = None,
+        limit: int | None = None,
+    ) -> list[sa.Row]:
+        """Select only some columns, without building entities.
+
+        Usage:
+            repo.list_columns("id", "created_at", where=Model.retain.is_(True), limit=1000)
+
+        Params:
+            *columns (str | ColumnElement): Attribute names or column expressions to select.
+            where (ColumnElement[bool] | Sequence[ColumnElement[bool]] | None): Filter predicate(s), combined with AND.
+            after_id (Any | None): Only return rows with a primary key greater than this (keyset pagination).
+            limit (int | None): Maximum rows to return.
+
+        Returns:
+            (list[sa.Row]): Rows with the selected columns, ordered by primary key.
+
+        """
+        if not columns:
+            raise ValueError("list_columns() requires at least one column")
+
+        stmt = sa.select(*self._columns(columns))
+        stmt = self._paged(stmt, where, after_id, limit, order=True)
+
+        return self.session.execute(stmt).all()
+
+    def list_ids(
+        self,
+        where: WhereArg = None,
+        after_id: t.Any = None,
+        limit: int | None = None,
+    ) -> list[t.Any]:
+        """Return primary keys of matching rows, ordered, without loading any other column."""
+        stmt = self._paged(
+            sa.select(self._pk_column()), where, after_id, limit, order=True
+        )
+
+        return self.session.execute(stmt).scalars().all()
+
+    def get_columns(self, id: t.Any, *columns: ColumnArg) -> t.Optional[sa.Row]:
+        """Return some columns of one row by primary key, or `None` if it does not exist."""
+        if not columns:
+            raise ValueError("get_columns() requires at least one column")
+
+        stmt = sa.select(*self._columns(columns)).where(self._pk_column() == id)
+
+        return self.session.execute(stmt).first()
+
+    def iter_batches(
+        self,
+        batch_size: int = DEFAULT_CHUNK_SIZE,
+        where: WhereArg = None,
+        order_by: ColumnArg | None = None,
+        defer: t.Iterable[str] | None = None,
+        defer_json: bool = False,
+    ) -> t.Iterator[list[T]]:
+        """Yield matching entities in batches, holding at most one batch in memory.
+
+        Description:
+            Each batch is a keyset-paginated query (`WHERE (order_by, pk) > (last seen) ORDER BY
+            order_by, pk LIMIT batch_size`), so the LIMIT bounds memory to one batch. Unlike OFFSET
+            paging, every query costs the same, and rows inserted or deleted during the scan do not
+            shift later batches.
+
+            Entities from earlier batches are not kept by the repository. They stay in the session
+            only while the caller holds a reference to them.
+
+        Usage:
+            for batch in repo.iter_batches(1000, where=Model.retain.is_(True)):
+                forward(batch)
+
+        Params:
+            batch_size (int): (default: 500) Entities per batch.
+            where (ColumnElement[bool] | Sequence[ColumnElement[bool]] | None): Filter predicate(s), combined with AND.
+            order_by (str | ColumnElement | None): Mapped column to scan in (ascending), i.e. `"created_at"`.
+                The primary key breaks ties. Defaults to the primary key. The column should be indexed & not NULL.
+            defer (Iterable[str] | None): Attribute names not loaded with the query.
+            defer_json (bool): (default: False) Defer every JSON column of the model.
+
+        Returns:
+            (Iterator[list[T]]): Non-empty batches of entities.
+
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be greater than 0, got {batch_size}")
+
+        pk_column: sa.Column = self._pk_column()
+        order_column: sa.ColumnElement | None = (
+            self._columns([order_by])[0] if order_by is not None else None
+        )
+        if order_column is not None and order_column.compare(pk_column):
+            order_column = None
+
+        deferred: set[str] = set(defer or [])
+        if defer_json:
+            deferred.update(self._json_column_keys())
+
+        base_stmt = sa.select(self.model).where(*self._predicates(where))
+        if deferred:
+            base_stmt = base_stmt.options(
+                *(so.defer(getattr(self.model, key)) for key in sorted(deferred))
+            )
+        base_stmt = (
+            base_stmt.order_by(pk_column)
+            if order_column is None
+            else base_stmt.order_by(order_column, pk_column)
+        )
+        base_stmt = base_stmt.limit(batch_size)
+
+        last: tuple | None = None
+
+        while True:
+            stmt = base_stmt
+            if last is not None:
+                stmt = stmt.where(
+                    pk_column > last[-1]
+                    if order_column is None
+                    else sa.tuple_(order_column, pk_column) > sa.tuple_(*last)
+                )
+
+            batch: list[T] = self.session.execute(stmt).scalars().all()
+            if not batch:
+                return
+
+            tail: T = batch[-1]
+            last = (
+                (getattr(tail, pk_column.key),)
+                if order_column is None
+                else (getattr(tail, order_column.key), getattr(tail, pk_column.key))
+            )
+
+            yield batch
+
+            if len(batch) < batch_size:
+                return
+
+    def count(self, where: WhereArg = None) -> int:
+        """Return the count of entities in the table, optionally filtered."""
+        stmt = (
+            sa.select(sa.func.count())
+            .select_from(self.model)
+            .where(*self._predicates(where))
+        )
+
+        return self.session.execute(stmt).scalar_one()
+
+    @staticmethod
+    def _predicates(where: WhereArg) -> list[sa.ColumnElement[bool]]:
+        if where is None:
+            return []
+        if isinstance(where, sa.ColumnElement):
+            return [where]
+
+        return list(where)
+
+    def _columns(self, columns: t.Iterable[ColumnArg]) -> list[sa.ColumnElement]:
+        return [
+            getattr(self.model, column) if isinstance(column, str) else column
+            for column in columns
+        ]
+
+    def _json_column_keys(self) -> list[str]:
+        """Return attribute names of the model's JSON columns."""
+        mapper: so.Mapper = sa.inspect(self.model)
+
+        return [
+            attr.key
+            for attr in mapper.column_attrs
+            if any(isinstance(col.type, sa.JSON) for col in attr.columns)
+        ]
+
+    def _paged(
+        self,
+        stmt: sa.Select,
+        where: WhereArg,
+        after_id: t.Any,
+        limit: int | None,
+        order: bool = False,
+    ) -> sa.Select:
+        """Apply filters & keyset pagination by primary key to a SELECT."""
+        stmt = stmt.where(*self._predicates(where))
+
+        if order or after_id is not None or limit is not None:
+            pk_column: sa.Column = self._pk_column()
+            stmt = stmt.order_by(pk_column)
+
+            if after_id is not None:
+                stmt = stmt.where(pk_column > after_id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return stmt
+
+    def _pk_column(self) -> sa.Column:
+        """Return the model's (single-column) primary key."""
+        pk_columns = sa.inspect(self.model).primary_key
+        if len(pk_columns) != 1:
+            raise ValueError(
+                f"Bulk operations require a single-column primary key, {self.model.__name__} has {len(pk_columns)}."
+            )
+
+        return pk_columns[0]
+
+    def _to_row(self, obj: T | dict) -> dict:
+        """Return the column values of a model instance (or a dict, unchanged)."""
+        if isinstance(obj, dict):
+            return obj
+
+        mapper: so.Mapper = sa.inspect(self.model)
+
+        return {
+            attr.key: obj.__dict__[attr.key]
+            for attr in mapper.column_attrs
+            if attr.key in obj.__dict__
+        }
+
+    def create_many(
+        self,
+        objs: t.Iterable[T | dict],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        commit: bool = True,
+    ) -> list[t.Any]:
+        """Insert many rows with one multi-row INSERT & one commit per chunk.
+
+        Description:
+            Uses an ORM bulk INSERT, which SQLAlchemy sends as batched `INSERT ... VALUES (...), (...)`
+            statements. On backends that support it (PostgreSQL, SQLite >= 3.35), primary keys come back
+            through `RETURNING` in the same round trip. Otherwise, rows are flushed through the session
+            to get their keys.
+
+            Only column values are inserted; related objects on model instances are ignored. Use
+            `create()` for objects with relationships that must be saved too.
+
+        Params:
+            objs (Iterable[T | dict]): Model instances or dicts of column values.
+            chunk_size (int): (default: 500) Rows per INSERT statement & commit.
+            commit (bool): (default: True) Commit after each chunk. With `False`, rows are only flushed,
+                so the caller can insert them in the same transaction as other changes & commit once.
+
+        Returns:
+            (list): The primary keys of the inserted rows, in input order.
+
+        Raises:
+            (Exception): If an INSERT fails, the transaction is rolled back and the exception is
+                re-raised. Chunks committed before the failure are kept.
+
+        """
+        pk_column: sa.Column = self._pk_column()
+        dialect = self.session.get_bind().dialect
+        use_returning: bool = bool(
+            getattr(dialect, "insert_executemany_returning", False)
+        )
+
+        ids: list[t.Any] = []
+        chunk: list[dict] = []
+
+        def _flush_chunk() -> None:
+            try:
+                if use_returning:
+                    result = self.session.execute(
+                        sa.insert(self.model).returning(
+                            pk_column, sort_by_parameter_order=True
+                        ),
+                        chunk,
+                    )
+                    ids.extend(result.scalars().all())
+                else:
+                    models: list[T] = [self.model(**row) for row in chunk]
+                    self.session.add_all(models)
+                    self.session.flush()
+                    ids.extend(getattr(m, pk_column.key) for m in models)
+
+                if commit:
+                    self.session.commit()
+            except Exception as exc:
+                self.session.rollback()
+                log.error(
+                    f"({type(exc)}) Error bulk inserting {len(chunk)} {self.model.__name__} row(s). Details: {exc}"
+                )
+
+                raise
+
+        for obj in objs:
+            chunk.append(self._to_row(obj))
+
+            if len(chunk) >= chunk_size:
+                _flush_chunk()
+                chunk = []
+
+        if chunk:
+            _flush_chunk()
+
+        return ids
+
+    def update_many(
+        self,
+        ids: t.Iterable[t.Any],
+        values: dict,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Set the same column values on many rows, with one UPDATE & one commit per chunk of IDs.
+
+        Params:
+            ids (Iterable): Primary keys of the rows to update.
+            values (dict): Column values to set, i.e. `{"retain": False}`.
+            chunk_size (int): (default: 500) IDs per UPDATE statement & commit.
+
+        Returns:
+            (int): The number of rows updated.
+
+        Raises:
+            (Exception): If an UPDATE fails, the current chunk is rolled back and the exception is re-raised.
+
+        """
+        pk_column: sa.Column = self._pk_column()
+        ids = list(ids)
+        updated: int = 0
+
+        for i in range(0, len(ids), chunk_size):
+            chunk = ids[i : i + chunk_size]
+            stmt = (
+                sa.update(self.model)
+                .where(pk_column.in_(chunk))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+            try:
+                result = self.session.execute(stmt)
+                self.session.commit()
+            except Exception as exc:
+                self.session.rollback()
+                log.error(
+                    f"({type(exc)}) Error updating {len(chunk)} {self.model.__name__} row(s). Details: {exc}"
+                )
+
+                raise
+
+            updated += result.rowcount
+
+        return updated
+
+    def delete_where(
+        self,
+        *predicates: sa.ColumnElement[bool],
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Delete every row matching the predicates, without loading them.
+
+        Description:
+            With a `chunk_size`, rows are deleted in batches of primary keys, committing after each
+            batch, so a large delete does not hold one long transaction & lock. With
+            `chunk_size=None`, a single `DELETE ... WHERE` is issued.
+
+        Usage:
+            repo.delete_where(Model.retain.is_(False), Model.created_at < cutoff)
+
+        Params:
+            *predicates (sa.ColumnElement[bool]): SQL expressions combined with AND. With no predicates,
+                every row is deleted.
+            chunk_size (int | None): (default: 500) Rows per DELETE & commit. `None` deletes in one statement.
+
+        Returns:
+            (int): The number of rows deleted.
+
+        Raises:
+            (Exception): If a DELETE fails, the current chunk is rolled back and the exception is re-raised.
+
+        """
+        if not chunk_size:
+            stmt = (
+                sa.delete(self.model)
+                .where(*predicates)
+                .execution_options(synchronize_session=False)
+            )
+
+            try:
+                result = self.session.execute(stmt)
+                self.session.commit()
+            except Exception as exc:
+                self.session.rollback()
+                log.error(
+                    f"({type(exc)}) Error deleting {self.model.__name__} rows. Details: {exc}"
+                )
+
+                raise
+
+            return result.rowcount
+
+        pk_column: sa.Column = self._pk_column()
+        select_chunk = (
+            sa.select(pk_column)
+            .where(*predicates)
+            .order_by(pk_column)
+            .limit(chunk_size)
+        )
+        deleted: int = 0
+
+        while True:
+            try:
+                chunk = self.session.execute(select_chunk).scalars().all()
+                if not chunk:
+                    break
+
+                result = self.session.execute(
+                    sa.delete(self.model)
+                    .where(pk_column.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                self.session.commit()
+            except Exception as exc:
+                self.session.rollback()
+                log.error(
+                    f"({type(exc)}) Error deleting {self.model.__name__} rows. Details: {exc}"
+                )
+
+                raise
+
+            deleted += result.rowcount
 
-    def count(self) -> int:
-        """Return the count of entities in the table."""
-        return self.session.query(self.model).count()
\ No newline at end of file
+        return deleted
@@ -0,0 +1,201 @@
+"""Process-wide cache of SQLAlchemy engines & session factories.
+
+Description:
+    Building a `sqlalchemy.Engine` creates a new connection pool and re-runs dialect
+    initialization on first connect. Apps that call `get_engine()` for every
+    operation pay that cost on every call, and never reuse pooled connections.
+
+    The registry below keeps one `Engine` (and one `sessionmaker`) per unique
+    combination of URL, echo flag, & pool options. Callers ask the registry for an
+    engine instead of building their own, and call `dispose_cached_engines()` once
+    on shutdown to close all pooled connections.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+
+log = logging.getLogger(__name__)
+
+from .__methods import get_engine, get_session_pool
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+__all__ = [
+    "EngineRegistry",
+    "ENGINE_REGISTRY",
+    "get_cached_engine",
+    "get_cached_session_pool",
+    "dispose_cached_engines",
+]
+
+## Registry key: (rendered URL, echo, sorted pool options)
+EngineKey = tuple[str, bool, tuple[tuple[str, t.Any], ...]]
+
+
+class EngineRegistry:
+    """Thread-safe cache of SQLAlchemy engines & session pools.
+
+    Description:
+        Engines are keyed by their URL (including password, so 2 users on the same host
+        do not share a pool), the `echo` flag, and any pool options passed to `get_engine()`.
+        The first call for a key builds the engine, subsequent calls return the same object.
+
+    Usage:
+        engine = registry.get_engine(url=db_uri, echo=False)
+        SessionLocal = registry.get_session_pool(url=db_uri, echo=False)
+
+        ## On application shutdown
+        registry.dispose_all()
+    """
+
+    def __init__(self) -> None:
+        self._engines: dict[EngineKey, sa.Engine] = {}
+        self._session_pools: dict[EngineKey, so.sessionmaker[so.Session]] = {}
+        self._lock: threading.RLock = threading.RLock()
+
+    @staticmethod
+    def make_key(url: sa.URL, echo: bool = False, **pool_opts: t.Any) -> EngineKey:
+        """Build a hashable registry key from engine options."""
+        if url is None:
+            raise ValueError("url cannot be None")
+
+        if isinstance(url, str):
+            url = sa.make_url(url)
+
+        ## Drop unset options so get_engine(url) and get_engine(url, pool_size=None) share a key
+        _opts = tuple(sorted((k, v) for k, v in pool_opts.items() if v is not None))
+
+        return (url.render_as_string(hide_password=False), bool(echo), _opts)
+
+    def get_engine(
+        self, url: sa.URL, echo: bool = False, **pool_opts: t.Any
+    ) -> sa.Engine:
+        """Return the cached engine for the given options, creating it on first use.
+
+        Params:
+            url (sqlalchemy.URL): The database URL.
+            echo (bool): Echo SQL statements to the console.
+            pool_opts (Any): Pool options passed through to `shared.db.get_engine()`,
+                i.e. `pool_size`, `max_overflow`, `pool_pre_ping`, `pool_recycle`.
+
+        Returns:
+            (sqlalchemy.Engine): A shared SQLAlchemy `Engine`.
+
+        """
+        key: EngineKey = self.make_key(url, echo, **pool_opts)
+
+        with self._lock:
+            engine: sa.Engine | None = self._engines.get(key)
+
+            if engine is None:
+                log.debug(f"Creating cached engine for {sa.make_url(key[0])!r}")
+                engine = get_engine(url=url, echo=echo, **pool_opts)
+                self._engines[key] = engine
+
+            return engine
+
+    def get_session_pool(
+        self, url: sa.URL, echo: bool = False, **pool_opts: t.Any
+    ) -> so.sessionmaker[so.Session]:
+        """Return the cached session pool bound to the cached engine for the given options.
+
+        Params:
+            url (sqlalchemy.URL): The database URL.
+            echo (bool): Echo SQL statements to the console.
+            pool_opts (Any): Pool options passed through to `shared.db.get_engine()`.
+
+        Returns:
+            (sqlalchemy.orm.sessionmaker): A shared SQLAlchemy `Session` pool.
+
+        """
+        key: EngineKey = self.make_key(url, echo, **pool_opts)
+
+        with self._lock:
+            session_pool: so.sessionmaker[so.Session] | None = self._session_pools.get(
+                key
+            )
+
+            if session_pool is None:
+                engine: sa.Engine = self.get_engine(url=url, echo=echo, **pool_opts)
+                session_pool = get_session_pool(engine=engine)
+                self._session_pools[key] = session_pool
+
+            return session_pool
+
+    def dispose_all(self) -> int:
+        """Dispose every cached engine & clear the registry.
+
+        Returns:
+            (int): The number of engines disposed.
+
+        """
+        with self._lock:
+            engines: list[sa.Engine] = list(self._engines.values())
+
+            self._engines.clear()
+            self._session_pools.clear()
+
+        for engine in engines:
+            try:
+                engine.dispose()
+            except Exception as exc:
+                log.error(
+                    f"({type(exc)}) Error disposing engine for {engine.url!r}. Details: {exc}"
+                )
+
+        log.debug(f"Disposed {len(engines)} cached engine(s)")
+
+        return len(engines)
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+
+## Default process-wide registry
+ENGINE_REGISTRY: EngineRegistry = EngineRegistry()
+
+
+def get_cached_engine(url: sa.URL, echo: bool = False, **pool_opts: t.Any) -> sa.Engine:
+    """Return a shared engine from the process-wide registry.
+
+    Params:
+        url (sqlalchemy.URL): The database URL.
+        echo (bool): Echo SQL statements to the console.
+        pool_opts (Any): Pool options, i.e. `pool_size`, `max_overflow`, `pool_pre_ping`, `pool_recycle`.
+
+    Returns:
+        (sqlalchemy.Engine): A shared SQLAlchemy `Engine`.
+
+    """
+    return ENGINE_REGISTRY.get_engine(url=url, echo=echo, **pool_opts)
+
+
+def get_cached_session_pool(
+    url: sa.URL, echo: bool = False, **pool_opts: t.Any
+) -> so.sessionmaker[so.Session]:
+    """Return a shared session pool from the process-wide registry.
+
+    Params:
+        url (sqlalchemy.URL): The database URL.
+        echo (bool): Echo SQL statements to the console.
+        pool_opts (Any): Pool options, i.e. `pool_size`, `max_overflow`, `pool_pre_ping`, `pool_recycle`.
+
+    Returns:
+        (sqlalchemy.orm.sessionmaker): A shared SQLAlchemy `Session` pool.
+
+    """
+    return ENGINE_REGISTRY.get_session_pool(url=url, echo=echo, **pool_opts)
+
+
+def dispose_cached_engines() -> int:
+    """Dispose all engines in the process-wide registry. Call once on shutdown.
+
+    Returns:
+        (int): The number of engines disposed.
+
+    """
+    return ENGINE_REGISTRY.dispose_all()
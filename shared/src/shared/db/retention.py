@@ -0,0 +1,363 @@
+"""Declarative retention for append-only tables, i.e. raw WeatherAPI JSON responses.
+
+Description:
+    A `RetentionPolicy` describes how long rows are kept:
+
+        - rows newer than `raw_days` are never touched.
+        - rows older than `raw_days` are downsampled to one row per `downsample_interval`
+          ("hour" or "day") per partition (i.e. per location).
+        - rows older than `drop_after_days` are deleted.
+
+    A `RetentionTarget` says which table a policy applies to: the model, its timestamp
+    column, and the columns rows are grouped by when downsampling. `apply_retention()`
+    applies a policy to a target with keyset-paginated scans over small columns (never
+    the JSON payloads) and chunked deletes.
+
+    On PostgreSQL, a table created with `PARTITION BY RANGE (created_at)` can be pruned by
+    dropping whole monthly partitions instead of deleting rows. `apply_retention()` does this
+    when `partition_monthly` is enabled and the table is partitioned, and creates upcoming
+    monthly partitions ahead of time. Converting an existing table to a partitioned table is a
+    one-off migration; see `monthly_partition_name()` for the naming scheme used.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import re
+import time
+import typing as t
+
+log = logging.getLogger(__name__)
+
+from .base import DEFAULT_CHUNK_SIZE, BaseRepository
+
+from pydantic import BaseModel, Field
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+__all__ = [
+    "RetentionPolicy",
+    "RetentionTarget",
+    "apply_retention",
+    "monthly_partition_name",
+    "is_partitioned",
+    "ensure_monthly_partitions",
+    "drop_monthly_partitions",
+]
+
+## Supported downsample intervals
+DOWNSAMPLE_INTERVALS: tuple[str, ...] = ("hour", "day")
+
+
+class RetentionPolicy(BaseModel):
+    """How long to keep rows, and how to thin them out before dropping them.
+
+    Attributes:
+        raw_days (float | None): Keep every row newer than this many days. `None` disables downsampling.
+        downsample_interval (str | None): Keep one row per "hour" or "day" (per partition) for rows
+            older than `raw_days`. `None` disables downsampling.
+        drop_after_days (float | None): Delete rows older than this many days. `None` keeps rows forever.
+        partition_monthly (bool): On PostgreSQL, drop whole monthly partitions older than
+            `drop_after_days` when the table is partitioned.
+        chunk_size (int): Rows scanned/deleted per statement & commit.
+
+    """
+
+    raw_days: float | None = Field(default=None, ge=0)
+    downsample_interval: t.Literal["hour", "day"] | None = None
+    drop_after_days: float | None = Field(default=None, ge=0)
+    partition_monthly: bool = False
+    chunk_size: int = Field(default=DEFAULT_CHUNK_SIZE, gt=0)
+
+    @classmethod
+    def from_settings(cls, settings: t.Mapping[str, t.Any]) -> "RetentionPolicy":
+        """Build a policy from a Dynaconf settings section, i.e. `[retention]`."""
+        return cls(
+            raw_days=settings.get("RAW_DAYS", None),
+            downsample_interval=settings.get("DOWNSAMPLE_INTERVAL", None),
+            drop_after_days=settings.get("DROP_AFTER_DAYS", None),
+            partition_monthly=settings.get("PARTITION_MONTHLY", False),
+            chunk_size=settings.get("CHUNK_SIZE", DEFAULT_CHUNK_SIZE),
+        )
+
+
+class RetentionTarget:
+    """A table a RetentionPolicy is applied to.
+
+    Params:
+        model (type): The SQLAlchemy model. Must have a single-column primary key.
+        label (str | None): Name used in log messages. Defaults to the table name.
+        timestamp_column (str): (default: "created_at") The column rows are aged by.
+        partition_by (Sequence[sa.ColumnElement] | None): Expressions rows are grouped by when
+            downsampling, i.e. a location name extracted from the JSON payload.
+        respect_retain (bool): (default: True) If the model has a `retain` column, only rows with
+            `retain = false` are ever deleted.
+        now (Callable[[], datetime]): (default: `datetime.utcnow`) Clock matching how the timestamp
+            column is written.
+    """
+
+    def __init__(
+        self,
+        model: t.Type,
+        label: str | None = None,
+        timestamp_column: str = "created_at",
+        partition_by: t.Sequence[sa.ColumnElement] | None = None,
+        respect_retain: bool = True,
+        now: t.Callable[[], dt.datetime] = dt.datetime.utcnow,
+    ) -> None:
+        self.model: t.Type = model
+        self.label: str = label or model.__tablename__
+        self.timestamp_column: sa.Column = getattr(model, timestamp_column)
+        self.partition_by: list[sa.ColumnElement] = list(partition_by or [])
+        self.respect_retain: bool = respect_retain
+        self.now: t.Callable[[], dt.datetime] = now
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__
+
+    def deletable(self) -> list[sa.ColumnElement[bool]]:
+        """Predicates every deleted row must match."""
+        if self.respect_retain and hasattr(self.model, "retain"):
+            return [self.model.retain.is_(False)]
+
+        return []
+
+
+def _bucket(value: dt.datetime, interval: str) -> dt.datetime:
+    if interval == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _downsample(
+    session: so.Session,
+    target: RetentionTarget,
+    policy: RetentionPolicy,
+    older_than: dt.datetime,
+    newer_than: dt.datetime | None,
+) -> int:
+    """Delete all but the first row per (partition, interval) in the given age window."""
+    repo: BaseRepository = BaseRepository(session=session, model=target.model)
+    pk_column: sa.Column = repo._pk_column()
+
+    predicates: list[sa.ColumnElement[bool]] = [
+        target.timestamp_column < older_than,
+        *target.deletable(),
+    ]
+    if newer_than is not None:
+        predicates.append(target.timestamp_column >= newer_than)
+
+    ## (partition values, bucket) already represented by a kept row
+    kept: set[tuple] = set()
+    deleted: int = 0
+    after_id: t.Any = None
+
+    while True:
+        stmt = (
+            sa.select(pk_column, target.timestamp_column, *target.partition_by)
+            .where(*predicates)
+            .order_by(pk_column)
+            .limit(policy.chunk_size)
+        )
+        if after_id is not None:
+            stmt = stmt.where(pk_column > after_id)
+
+        rows = session.execute(stmt).all()
+        if not rows:
+            break
+
+        after_id = rows[-1][0]
+        drop_ids: list[t.Any] = []
+
+        for row_id, timestamp, *partition in rows:
+            key: tuple = (
+                tuple(partition),
+                _bucket(timestamp, policy.downsample_interval),
+            )
+
+            if key in kept:
+                drop_ids.append(row_id)
+            else:
+                kept.add(key)
+
+        if drop_ids:
+            deleted += repo.delete_where(pk_column.in_(drop_ids), chunk_size=None)
+
+    return deleted
+
+
+def apply_retention(
+    session_pool: so.sessionmaker[so.Session],
+    target: RetentionTarget,
+    policy: RetentionPolicy,
+) -> dict[str, int]:
+    """Apply a retention policy to a table.
+
+    Params:
+        session_pool (so.sessionmaker[so.Session]): Session pool for the database holding the table.
+        target (RetentionTarget): The table to prune.
+        policy (RetentionPolicy): The retention policy.
+
+    Returns:
+        (dict[str, int]): Counts of rows `downsampled` & `dropped`, and `partitions_dropped`.
+
+    Raises:
+        (Exception): If a delete fails, the current chunk is rolled back and the exception is re-raised.
+
+    """
+    now: dt.datetime = target.now()
+    drop_cutoff: dt.datetime | None = (
+        now - dt.timedelta(days=policy.drop_after_days)
+        if policy.drop_after_days is not None
+        else None
+    )
+
+    results: dict[str, int] = {"downsampled": 0, "dropped": 0, "partitions_dropped": 0}
+    start: float = time.perf_counter()
+
+    with session_pool() as session:
+        engine: sa.Engine = session.get_bind()
+
+        if (
+            policy.partition_monthly
+            and engine.dialect.name == "postgresql"
+            and is_partitioned(engine, target.table_name)
+        ):
+            ensure_monthly_partitions(engine, target.table_name)
+
+            ## Partitions can only be dropped whole when every row in them is deletable
+            if drop_cutoff is not None and not target.deletable():
+                dropped_partitions: list[str] = drop_monthly_partitions(
+                    engine, target.table_name, before=drop_cutoff
+                )
+                results["partitions_dropped"] = len(dropped_partitions)
+
+        if drop_cutoff is not None:
+            repo: BaseRepository = BaseRepository(session=session, model=target.model)
+            results["dropped"] = repo.delete_where(
+                target.timestamp_column < drop_cutoff,
+                *target.deletable(),
+                chunk_size=policy.chunk_size,
+            )
+
+        if policy.raw_days is not None and policy.downsample_interval is not None:
+            results["downsampled"] = _downsample(
+                session=session,
+                target=target,
+                policy=policy,
+                older_than=now - dt.timedelta(days=policy.raw_days),
+                newer_than=drop_cutoff,
+            )
+
+    elapsed: float = time.perf_counter() - start
+    log.info(
+        f"Retention applied to {target.label} in {elapsed:.2f}s: {results['downsampled']} row(s) downsampled, {results['dropped']} row(s) dropped, {results['partitions_dropped']} partition(s) dropped."
+    )
+
+    return results
+
+
+def monthly_partition_name(table_name: str, month: dt.date) -> str:
+    """Return the name of a table's partition for a month, i.e. `weatherapi_current_json_p202501`."""
+    return f"{table_name}_p{month.year:04d}{month.month:02d}"
+
+
+def _add_months(month: dt.date, months: int) -> dt.date:
+    index: int = month.year * 12 + (month.month - 1) + months
+
+    return dt.date(index // 12, index % 12 + 1, 1)
+
+
+def is_partitioned(engine: sa.Engine, table_name: str) -> bool:
+    """Return `True` if a PostgreSQL table is partitioned."""
+    if engine.dialect.name != "postgresql":
+        return False
+
+    stmt = sa.text(
+        "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :table_name"
+    )
+
+    with engine.connect() as conn:
+        return conn.execute(stmt, {"table_name": table_name}).first() is not None
+
+
+def ensure_monthly_partitions(
+    engine: sa.Engine, table_name: str, months_ahead: int = 2
+) -> list[str]:
+    """Create the current & next `months_ahead` monthly partitions of a PostgreSQL table.
+
+    Params:
+        engine (sa.Engine): A PostgreSQL engine.
+        table_name (str): A table created with `PARTITION BY RANGE (<timestamp column>)`.
+        months_ahead (int): (default: 2) Number of future months to create partitions for.
+
+    Returns:
+        (list[str]): Names of the partitions (existing or created).
+
+    """
+    this_month: dt.date = dt.date.today().replace(day=1)
+    names: list[str] = []
+
+    with engine.begin() as conn:
+        for offset in range(months_ahead + 1):
+            month: dt.date = _add_months(this_month, offset)
+            name: str = monthly_partition_name(table_name, month)
+
+            conn.execute(
+                sa.text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table_name}" '
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+                )
+            )
+            names.append(name)
+
+    return names
+
+
+def drop_monthly_partitions(
+    engine: sa.Engine, table_name: str, before: dt.datetime
+) -> list[str]:
+    """Detach & drop monthly partitions that only hold rows older than `before`.
+
+    Params:
+        engine (sa.Engine): A PostgreSQL engine.
+        table_name (str): The partitioned table.
+        before (datetime): Drop partitions whose whole month ends on or before this time.
+
+    Returns:
+        (list[str]): Names of the dropped partitions.
+
+    """
+    pattern: re.Pattern = re.compile(rf"^{re.escape(table_name)}_p(\d{{4}})(\d{{2}})$")
+    stmt = sa.text(
+        "SELECT child.relname FROM pg_inherits i "
+        "JOIN pg_class parent ON parent.oid = i.inhparent "
+        "JOIN pg_class child ON child.oid = i.inhrelid "
+        "WHERE parent.relname = :table_name"
+    )
+
+    dropped: list[str] = []
+
+    with engine.begin() as conn:
+        for (name,) in conn.execute(stmt, {"table_name": table_name}).all():
+            match = pattern.match(name)
+            if match is None:
+                continue
+
+            month_end: dt.date = _add_months(
+                dt.date(int(match.group(1)), int(match.group(2)), 1), 1
+            )
+            if month_end > before.date():
+                continue
+
+            log.info(f"Dropping partition {name} of {table_name}")
+            conn.execute(
+                sa.text(f'ALTER TABLE "{table_name}" DETACH PARTITION "{name}"')
+            )
+            conn.execute(sa.text(f'DROP TABLE "{name}"'))
+            dropped.append(name)
+
+    return dropped
@@ -0,0 +1,178 @@
+"""Dialect-aware `INSERT ... ON CONFLICT` statements.
+
+Description:
+    PostgreSQL & SQLite spell conflict handling as `ON CONFLICT (...) DO NOTHING`, MySQL/MariaDB
+    as `ON DUPLICATE KEY UPDATE`. These helpers build the right statement for the session's
+    dialect, so repositories can insert (or update) rows idempotently without a SELECT first.
+
+"""
+
+from __future__ import annotations
+
+import logging
+import typing as t
+
+log = logging.getLogger(__name__)
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+import sqlalchemy.orm as so
+
+__all__ = [
+    "dialect_insert",
+    "insert_do_nothing",
+    "upsert",
+    "execute_upsert",
+    "supports_insert_returning",
+]
+
+
+def dialect_insert(dialect: sa.Dialect, model: t.Any) -> sa.Insert:
+    """Return an INSERT construct for the dialect, with its conflict-handling methods.
+
+    Params:
+        dialect (sa.Dialect): The dialect, i.e. `session.get_bind().dialect`.
+        model (Any): The model or table to insert into.
+
+    Returns:
+        (sa.Insert): A PostgreSQL, SQLite or MySQL INSERT, or a generic INSERT for other dialects.
+
+    """
+    if dialect.name == "postgresql":
+        return postgresql.insert(model)
+    elif dialect.name == "sqlite":
+        return sqlite.insert(model)
+    elif dialect.name in ("mysql", "mariadb"):
+        return mysql.insert(model)
+    else:
+        return sa.insert(model)
+
+
+def supports_insert_returning(dialect: sa.Dialect) -> bool:
+    """Return True if the dialect supports `INSERT ... RETURNING` (PostgreSQL, SQLite >= 3.35, MariaDB >= 10.5)."""
+    return bool(getattr(dialect, "insert_returning", False))
+
+
+def insert_do_nothing(
+    dialect: sa.Dialect,
+    model: t.Any,
+    conflict_columns: t.Sequence[str],
+) -> sa.Insert:
+    """Return an INSERT that silently skips rows conflicting with a unique key.
+
+    Description:
+        On MySQL/MariaDB there is no `DO NOTHING`; the primary key is set to itself on a
+        duplicate key (`id = id`), which changes nothing. Other dialects get a plain INSERT, which raises
+        `IntegrityError` on a conflict.
+
+    Params:
+        dialect (sa.Dialect): The dialect, i.e. `session.get_bind().dialect`.
+        model (Any): The model to insert into.
+        conflict_columns (Sequence[str]): Columns of the unique key to check for conflicts.
+
+    Returns:
+        (sa.Insert): The INSERT statement. Add `.values()` (or pass rows to `execute()`) & `.returning()`.
+
+    """
+    stmt = dialect_insert(dialect, model)
+
+    if dialect.name in ("postgresql", "sqlite"):
+        return stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+    elif dialect.name in ("mysql", "mariadb"):
+        pk: sa.Column = list(sa.inspect(model).primary_key)[0]
+
+        return stmt.on_duplicate_key_update({pk.name: pk})
+
+    log.warning(
+        f"No conflict handling for dialect '{dialect.name}', duplicate rows will raise IntegrityError"
+    )
+
+    return stmt
+
+
+def upsert(
+    dialect: sa.Dialect,
+    model: t.Any,
+    conflict_columns: t.Sequence[str],
+    update_columns: t.Sequence[str],
+) -> sa.Insert:
+    """Return an INSERT that updates the existing row when it conflicts with a unique key.
+
+    Description:
+        PostgreSQL & SQLite use `ON CONFLICT (...) DO UPDATE`, MySQL/MariaDB `ON DUPLICATE KEY UPDATE`.
+        On MySQL the primary key is also set to `LAST_INSERT_ID(id)`, so the cursor's `lastrowid`
+        is the ID of the updated row, just as it is for an inserted one.
+
+    Params:
+        dialect (sa.Dialect): The dialect, i.e. `session.get_bind().dialect`.
+        model (Any): The model to insert into.
+        conflict_columns (Sequence[str]): Columns of the unique key to check for conflicts.
+        update_columns (Sequence[str]): Columns overwritten with the new values on a conflict.
+
+    Returns:
+        (sa.Insert): The INSERT statement. Add `.values()` & `.returning()`.
+
+    """
+    stmt = dialect_insert(dialect, model)
+    pk: sa.Column = list(sa.inspect(model).primary_key)[0]
+
+    if dialect.name in ("postgresql", "sqlite"):
+        set_: dict = {c: stmt.excluded[c] for c in update_columns}
+        if not set_:
+            ## DO UPDATE needs a SET clause; a no-op one still returns the existing row
+            set_ = {conflict_columns[0]: stmt.excluded[conflict_columns[0]]}
+
+        return stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns), set_=set_
+        )
+    elif dialect.name in ("mysql", "mariadb"):
+        set_ = {c: stmt.inserted[c] for c in update_columns}
+        set_[pk.name] = sa.func.last_insert_id(pk)
+
+        return stmt.on_duplicate_key_update(set_)
+
+    log.warning(
+        f"No conflict handling for dialect '{dialect.name}', duplicate rows will raise IntegrityError"
+    )
+
+    return stmt
+
+
+def execute_upsert(
+    session: so.Session,
+    model: t.Any,
+    values: dict,
+    conflict_columns: t.Sequence[str],
+    update_columns: t.Sequence[str] | None = None,
+) -> t.Any:
+    """Insert or update one row with a single statement, and return its primary key.
+
+    Description:
+        Does not commit, so several upserts can share one transaction.
+
+    Params:
+        session (so.Session): The database session.
+        model (Any): The model to insert into.
+        values (dict): Column values of the row.
+        conflict_columns (Sequence[str]): Columns of the unique key to check for conflicts.
+        update_columns (Sequence[str] | None): Columns overwritten on a conflict. Defaults to
+            every column in `values` except the primary key & `conflict_columns`.
+
+    Returns:
+        (Any): The primary key of the inserted or updated row.
+
+    """
+    dialect: sa.Dialect = session.get_bind().dialect
+    pk: sa.Column = list(sa.inspect(model).primary_key)[0]
+
+    if update_columns is None:
+        update_columns = [
+            c for c in values if c != pk.name and c not in conflict_columns
+        ]
+
+    stmt = upsert(dialect, model, conflict_columns, update_columns).values(**values)
+
+    if supports_insert_returning(dialect):
+        return session.execute(stmt.returning(pk)).scalar_one()
+
+    return session.execute(stmt).lastrowid
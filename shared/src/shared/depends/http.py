@@ -1,16 +1,38 @@
 from __future__ import annotations
 
-from shared.http_lib import HttpxController
+import threading
+
+from shared.http_lib import (
+    AsyncHttpxController,
+    HttpxController,
+    get_memory_cache_tier,
+    get_rate_limiter,
+    get_request_coalescer,
+    get_retry_policy,
+)
 from shared.http_lib.config import HTTP_SETTINGS
 
-__all__ = ["get_httpx_controller"]
+__all__ = [
+    "get_httpx_controller",
+    "get_shared_httpx_controller",
+    "close_httpx_controller",
+    "get_async_httpx_controller",
+    "close_async_httpx_controller",
+]
+
+## Process-wide sync controller, shared by every job thread
+_HTTPX_CONTROLLER: HttpxController | None = None
+_HTTPX_CONTROLLER_LOCK: threading.Lock = threading.Lock()
+## Process-wide async controller, shared by every job on the event loop
+_ASYNC_HTTPX_CONTROLLER: AsyncHttpxController | None = None
 
 
 def get_httpx_controller(
     cacheable_methods: list[str] = ["GET", "HEAD"],
     cacheable_status_codes: list[int] = [200, 201, 202, 301, 308],
     follow_redirects: bool = True,
-):
+    persistent: bool = False,
+) -> HttpxController:
     return HttpxController(
         follow_redirects=follow_redirects,
         cacheable_methods=cacheable_methods,
@@ -21,4 +43,92 @@ def get_httpx_controller(
         cache_file_dir=HTTP_SETTINGS.get("CACHE_FILE_DIR"),
         cache_db_file=HTTP_SETTINGS.get("CACHE_DB_FILE"),
         check_ttl_every=HTTP_SETTINGS.get("CACHE_CHECK_TTL_EVERY"),
+        max_connections=HTTP_SETTINGS.get("MAX_CONNECTIONS", 100),
+        max_keepalive_connections=HTTP_SETTINGS.get("MAX_KEEPALIVE_CONNECTIONS", 20),
+        keepalive_expiry=HTTP_SETTINGS.get("KEEPALIVE_EXPIRY", 5.0),
+        timeout=HTTP_SETTINGS.get("TIMEOUT", None),
+        persistent=persistent,
+        rate_limiter=get_rate_limiter(),
+        retry_policy=get_retry_policy(),
+        coalescer=get_request_coalescer(),
+        memory_cache=get_memory_cache_tier(),
     )
+
+
+def get_shared_httpx_controller() -> HttpxController:
+    """Return the process-wide, persistent HttpxController.
+
+    Description:
+        The first call builds the controller from `HTTP_SETTINGS`; later calls (from any thread)
+        return the same object, so scheduled jobs reuse one cache storage & keep-alive connection
+        pool instead of rebuilding them on every poll. The client is opened lazily on first use.
+        Call `close_httpx_controller()` on shutdown.
+    """
+    global _HTTPX_CONTROLLER
+
+    with _HTTPX_CONTROLLER_LOCK:
+        if _HTTPX_CONTROLLER is None:
+            _HTTPX_CONTROLLER = get_httpx_controller(persistent=True)
+
+        return _HTTPX_CONTROLLER
+
+
+def close_httpx_controller() -> None:
+    """Close the process-wide HttpxController, if one was created."""
+    global _HTTPX_CONTROLLER
+
+    with _HTTPX_CONTROLLER_LOCK:
+        if _HTTPX_CONTROLLER is not None:
+            _HTTPX_CONTROLLER.close()
+            _HTTPX_CONTROLLER = None
+
+
+def get_async_httpx_controller(
+    cacheable_methods: list[str] = ["GET", "HEAD"],
+    cacheable_status_codes: list[int] = [200, 201, 202, 301, 308],
+    follow_redirects: bool = True,
+) -> AsyncHttpxController:
+    """Return the process-wide, persistent AsyncHttpxController.
+
+    Description:
+        The first call builds the controller from `HTTP_SETTINGS`; later calls return the same
+        object so all jobs share one connection pool. Arguments only apply to the first call.
+        Call `close_async_httpx_controller()` on shutdown.
+    """
+    global _ASYNC_HTTPX_CONTROLLER
+
+    if _ASYNC_HTTPX_CONTROLLER is None:
+        _ASYNC_HTTPX_CONTROLLER = AsyncHttpxController(
+            follow_redirects=follow_redirects,
+            cacheable_methods=cacheable_methods,
+            cacheable_status_codes=cacheable_status_codes,
+            use_cache=HTTP_SETTINGS.get("USE_CACHE"),
+            cache_type=HTTP_SETTINGS.get("CACHE_TYPE"),
+            cache_ttl=HTTP_SETTINGS.get("CACHE_TTL"),
+            cache_file_dir=HTTP_SETTINGS.get("CACHE_FILE_DIR"),
+            cache_db_file=HTTP_SETTINGS.get("CACHE_DB_FILE"),
+            check_ttl_every=HTTP_SETTINGS.get("CACHE_CHECK_TTL_EVERY"),
+            max_connections=HTTP_SETTINGS.get("MAX_CONNECTIONS", 100),
+            max_keepalive_connections=HTTP_SETTINGS.get(
+                "MAX_KEEPALIVE_CONNECTIONS", 20
+            ),
+            keepalive_expiry=HTTP_SETTINGS.get("KEEPALIVE_EXPIRY", 5.0),
+            http2=HTTP_SETTINGS.get("HTTP2", False),
+            timeout=HTTP_SETTINGS.get("TIMEOUT", None),
+            persistent=True,
+            rate_limiter=get_rate_limiter(),
+            retry_policy=get_retry_policy(),
+            coalescer=get_request_coalescer(),
+            memory_cache=get_memory_cache_tier(),
+        )
+
+    return _ASYNC_HTTPX_CONTROLLER
+
+
+async def close_async_httpx_controller() -> None:
+    """Close the process-wide AsyncHttpxController, if one was created."""
+    global _ASYNC_HTTPX_CONTROLLER
+
+    if _ASYNC_HTTPX_CONTROLLER is not None:
+        await _ASYNC_HTTPX_CONTROLLER.aclose()
+        _ASYNC_HTTPX_CONTROLLER = None
@@ -4,7 +4,12 @@ import typing as t
 
 from pydantic import BaseModel, Field
 
-__all__ = ["WeatherCollectorPayloadIn", "WeatherCollectorPayloadOut"]
+__all__ = [
+    "WeatherCollectorPayloadIn",
+    "WeatherCollectorPayloadOut",
+    "WeatherCollectorPayloadResult",
+    "WeatherCollectorBulkPayloadOut",
+]
 
 
 class WeatherCollectorPayloadIn(BaseModel):
@@ -24,3 +29,30 @@ class WeatherCollectorPayloadOut(WeatherCollectorPayloadIn):
 
     class Config:
         from_attributes = True
+
+
+class WeatherCollectorPayloadResult(BaseModel):
+    index: int = Field(
+        ..., description="Position of the payload in the submitted bulk request"
+    )
+    status_code: int = Field(
+        ..., description="HTTP status the payload would have received if POSTed alone"
+    )
+    detail: t.Any | None = Field(
+        default=None, description="Saved entity IDs on success, error detail otherwise"
+    )
+
+    @property
+    def acknowledged(self) -> bool:
+        """Payload is stored on the server (created now, or already existed)."""
+        return self.status_code in (201, 409)
+
+
+class WeatherCollectorBulkPayloadOut(BaseModel):
+    success: bool = Field(..., description="True when every payload was acknowledged")
+    saved: int = Field(default=0, description="Number of payloads saved")
+    duplicates: int = Field(
+        default=0, description="Number of payloads that already existed"
+    )
+    failed: int = Field(default=0, description="Number of payloads that failed")
+    results: list[WeatherCollectorPayloadResult] = Field(default_factory=list)
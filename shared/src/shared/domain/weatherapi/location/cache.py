@@ -0,0 +1,148 @@
+"""In-process cache of location IDs, keyed by name, region & country.
+
+Description:
+    Every collector payload names its location, and the set of locations almost never changes,
+    so resolving a location to its ID is cached to skip the location SELECTs on the ingest path.
+    Entries are only added after the location row is committed, and are dropped when a location
+    is inserted, updated or deleted through `LocationRepository`.
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import unicodedata
+
+from loguru import logger as log
+
+__all__ = [
+    "location_cache_key",
+    "LocationIdCache",
+    "get_location_id_cache",
+]
+
+## Locations kept in the process-wide cache
+DEFAULT_MAX_ENTRIES: int = 1024
+
+_LOCATION_ID_CACHE: "LocationIdCache | None" = None
+_LOCATION_ID_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
+def _normalize(value: str | None) -> str:
+    if value is None:
+        return ""
+
+    return " ".join(unicodedata.normalize("NFC", value).split())
+
+
+def location_cache_key(
+    name: str | None, region: str | None, country: str | None
+) -> tuple[str, str, str]:
+    """Build a cache key for a location.
+
+    Description:
+        Values are Unicode-normalized & whitespace-collapsed. Case is kept, matching the
+        case-sensitive unique index on (name, region, country).
+
+    Params:
+        name (str | None): The name of the location.
+        region (str | None): The region/state of the location.
+        country (str | None): The country of the location.
+
+    Returns:
+        (tuple[str, str, str]): The normalized `(name, region, country)`.
+
+    """
+    return (_normalize(name), _normalize(region), _normalize(country))
+
+
+class LocationIdCache:
+    """Thread-safe, bounded LRU cache of location IDs.
+
+    Params:
+        max_entries (int): (default: 1024) Maximum cached locations; least recently used are dropped first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries: int = max_entries
+
+        self._lock: threading.Lock = threading.Lock()
+        self._ids: OrderedDict[tuple[str, str, str], int] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def metrics(self) -> dict[str, int]:
+        """Return counts of cache hits, misses & cached locations."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "cached": len(self._ids)}
+
+    def get(
+        self, name: str | None, region: str | None, country: str | None
+    ) -> int | None:
+        """Return the cached ID of a location, or `None` on a miss."""
+        key: tuple[str, str, str] = location_cache_key(name, region, country)
+
+        with self._lock:
+            location_id: int | None = self._ids.get(key)
+            if location_id is None:
+                self.misses += 1
+                return None
+
+            self._ids.move_to_end(key)
+            self.hits += 1
+
+            return location_id
+
+    def put(
+        self,
+        name: str | None,
+        region: str | None,
+        country: str | None,
+        location_id: int,
+    ) -> None:
+        """Cache a location's ID. Only call this once the location row is committed."""
+        if self.max_entries <= 0:
+            return
+
+        key: tuple[str, str, str] = location_cache_key(name, region, country)
+
+        with self._lock:
+            self._ids[key] = location_id
+            self._ids.move_to_end(key)
+
+            while len(self._ids) > self.max_entries:
+                self._ids.popitem(last=False)
+
+    def invalidate(
+        self, name: str | None, region: str | None, country: str | None
+    ) -> None:
+        """Drop a location from the cache."""
+        with self._lock:
+            self._ids.pop(location_cache_key(name, region, country), None)
+
+    def invalidate_id(self, location_id: int) -> None:
+        """Drop every cache entry pointing at a location ID."""
+        with self._lock:
+            for key in [k for k, v in self._ids.items() if v == location_id]:
+                del self._ids[key]
+
+    def clear(self) -> None:
+        """Drop all cached locations."""
+        with self._lock:
+            self._ids.clear()
+
+
+def get_location_id_cache() -> LocationIdCache:
+    """Return the process-wide LocationIdCache."""
+    global _LOCATION_ID_CACHE
+
+    with _LOCATION_ID_CACHE_LOCK:
+        if _LOCATION_ID_CACHE is None:
+            log.debug(
+                f"Initializing location ID cache [max_entries: {DEFAULT_MAX_ENTRIES}]"
+            )
+            _LOCATION_ID_CACHE = LocationIdCache(max_entries=DEFAULT_MAX_ENTRIES)
+
+        return _LOCATION_ID_CACHE
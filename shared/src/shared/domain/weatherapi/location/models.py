@@ -52,7 +52,12 @@ class LocationModel(Base):
     """
 
     __tablename__ = "weatherapi_location"
-    __table_args__ = (sa.UniqueConstraint("name", "country", name="_name_country_uc"),)
+    ## Locations are resolved by (name, region, country); see LocationRepository.resolve_id()
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "name", "region", "country", name="_name_region_country_uc"
+        ),
+    )
 
     id: so.Mapped[annotated.INT_PK]
 
@@ -71,6 +76,6 @@ class LocationModel(Base):
     )
 
     # Relationship to ForecastDayModel
-    # forecast_weather_entries: so.Mapped[list["ForecastDayModel"]] = so.relationship(
-    #     "ForecastDayModel", back_populates="location", cascade="all, delete-orphan"
-    # )
+    forecast_weather_entries: so.Mapped[list["ForecastDayModel"]] = so.relationship(
+        "ForecastDayModel", back_populates="location", cascade="all, delete-orphan"
+    )
@@ -3,8 +3,11 @@ from __future__ import annotations
 import typing as t
 
 from shared.db.base import BaseRepository
+from shared.db.upsert import insert_do_nothing, supports_insert_returning
 
+from .cache import LocationIdCache, get_location_id_cache
 from .models import LocationModel
+from .schemas import LocationIn
 
 from loguru import logger as log
 import sqlalchemy as sa
@@ -63,22 +66,23 @@ class LocationRepository(BaseRepository[LocationModel]):
 
     def get_by_country_and_region(
         self, region: str, country: str
-    ) -> LocationModel | None:
-        """Get a location by its country, and region/state.
+    ) -> list[LocationModel]:
+        """Get the locations in a country, and region/state.
 
         Params:
-            region (str): The region/state of the location.
-            country (str): The country of the location.
+            region (str): The region/state of the locations.
+            country (str): The country of the locations.
 
         Returns:
-            (LocationModel): A LocationModel object.
-            (None): None if no location is found matching criteria.
+            (list[LocationModel]): The matching locations, ordered by ID. Empty if none match.
 
         """
+        ## A region can hold many locations; one_or_none() would raise on the second
         return (
             self.session.query(LocationModel)
-            .filter(LocationModel.country == country and LocationModel.region == region)
-            .one_or_none()
+            .filter(LocationModel.country == country, LocationModel.region == region)
+            .order_by(LocationModel.id)
+            .all()
         )
 
     def get_by_name_country_and_region(
@@ -86,6 +90,10 @@ class LocationRepository(BaseRepository[LocationModel]):
     ) -> LocationModel | None:
         """Get a location by its name, country, and region/state.
 
+        Description:
+            Filters on all three columns, matching the (name, region, country) unique key, so at
+            most one location is returned.
+
         Params:
             name (str): The name of the location.
             region (str): The region/state of the location.
@@ -99,13 +107,76 @@ class LocationRepository(BaseRepository[LocationModel]):
         return (
             self.session.query(LocationModel)
             .filter(
-                LocationModel.name == name
-                and LocationModel.country == country
-                and LocationModel.region == region
+                LocationModel.name == name,
+                LocationModel.region == region,
+                LocationModel.country == country,
             )
             .one_or_none()
         )
 
+    def get_id_by_name_region_country(
+        self, name: str, region: str, country: str
+    ) -> int | None:
+        """Get the ID of a location by its name, region/state, and country, without loading the row.
+
+        Params:
+            name (str): The name of the location.
+            region (str): The region/state of the location.
+            country (str): The country of the location.
+
+        Returns:
+            (int): The ID of the location.
+            (None): None if no location is found matching criteria.
+
+        """
+        return self.session.execute(
+            sa.select(LocationModel.id).where(
+                LocationModel.name == name,
+                LocationModel.region == region,
+                LocationModel.country == country,
+            )
+        ).scalar_one_or_none()
+
+    def resolve_id(
+        self, location: LocationIn, cache: LocationIdCache | None = None
+    ) -> int:
+        """Return the ID of a location, saving it first if it does not exist yet.
+
+        Description:
+            IDs are served from the in-process location ID cache when possible, so a known
+            location costs no queries. On a miss the ID is selected, and the location is only
+            inserted (see `insert_or_get_id()`) when it is not found.
+
+        Params:
+            location (LocationIn): The location, i.e. a response's `location` object.
+            cache (LocationIdCache | None): The cache to use. Defaults to `get_location_id_cache()`.
+
+        Returns:
+            (int): The ID of the location.
+
+        Raises:
+            Exception: If the location cannot be saved, an `Exception` is raised.
+
+        """
+        if cache is None:
+            cache = get_location_id_cache()
+
+        location_id: int | None = cache.get(
+            location.name, location.region, location.country
+        )
+        if location_id is not None:
+            return location_id
+
+        location_id = self.get_id_by_name_region_country(
+            location.name, location.region, location.country
+        )
+        if location_id is None:
+            location_id = self.insert_or_get_id(location)
+        else:
+            cache.put(location.name, location.region, location.country, location_id)
+
+        return location_id
+
     def save(self, location: LocationModel) -> LocationModel | None:
         """Save a location to the database.
 
@@ -113,35 +184,94 @@ class LocationRepository(BaseRepository[LocationModel]):
             location (LocationModel): The location to save.
 
         Returns:
-            LocationModel: The saved location.
+            LocationModel: The saved location, or the existing location if it was already saved.
 
         Raises:
             Exception: If location cannot be saved, an `Exception` is raised.
 
         """
         ## Check if location already exists
-        existing_location: LocationModel | None = self.get_by_name_country_and_region(
+        existing_id: int | None = self.get_id_by_name_region_country(
             location.name, location.region, location.country
         )
 
         ## If location already exists, return from database
-        if existing_location:
+        if existing_id is not None:
             log.info(
                 f"Location already exists: {location.name}, {location.region}, {location.country}. Returning from database."
             )
 
-            return self.get_by_name_country_and_region(
-                location.name, location.region, location.country
-            )
+            return self.session.get(LocationModel, existing_id)
 
         ## If location does not exist, save to database
+        return self.session.get(LocationModel, self.insert_or_get_id(location))
+
+    def update(self, obj: LocationModel, data: dict) -> LocationModel:
+        ## The old name/region/country may be cached
+        get_location_id_cache().invalidate_id(obj.id)
+
+        return super().update(obj, data)
+
+    def delete(self, obj: LocationModel) -> None:
+        get_location_id_cache().invalidate_id(obj.id)
+
+        super().delete(obj)
+
+    def insert_or_get_id(self, location: LocationModel | LocationIn) -> int:
+        """Insert a location if it does not exist, and return its ID.
+
+        Description:
+            Uses `INSERT ... ON CONFLICT (name, region, country) DO NOTHING RETURNING id`, so
+            concurrent workers saving the same new location cannot fail on the unique key. The
+            worker whose insert was skipped selects the ID of the row that won.
+
+        Params:
+            location (LocationModel | LocationIn): The location to save.
+
+        Returns:
+            (int): The ID of the new or existing location.
+
+        Raises:
+            Exception: If location cannot be saved, the transaction is rolled back & the exception is re-raised.
+
+        """
+        if isinstance(location, LocationIn):
+            values: dict = location.model_dump()
+        else:
+            values = self._to_row(location)
+            values.pop("id", None)
+
+        cache: LocationIdCache = get_location_id_cache()
+        ## Never serve an ID that was cached before this insert
+        cache.invalidate(values["name"], values["region"], values["country"])
+
+        dialect = self.session.get_bind().dialect
+        stmt = insert_do_nothing(
+            dialect, LocationModel, conflict_columns=("name", "region", "country")
+        ).values(**values)
+
         try:
-            self.session.add(location)
-            self.session.commit()
-            self.session.refresh(location)
+            if supports_insert_returning(dialect):
+                location_id: int | None = self.session.execute(
+                    stmt.returning(LocationModel.id)
+                ).scalar_one_or_none()
+            else:
+                self.session.execute(stmt)
+                location_id = None
 
-            return location
-        except sa_exc.IntegrityError as exc:
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
             msg = f"({type(exc)}) Error saving location. Details: {exc}"
             log.error(msg)
             raise
+
+        if location_id is None:
+            ## The location already existed, or the dialect cannot return the new ID
+            location_id = self.get_id_by_name_region_country(
+                values["name"], values["region"], values["country"]
+            )
+
+        cache.put(values["name"], values["region"], values["country"], location_id)
+
+        return location_id
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .columnar import *
 from .models import *
 from .repository import *
-from .schemas import *
\ No newline at end of file
+from .schemas import *
@@ -0,0 +1,284 @@
+"""Columnar reads of current weather readings, for analytics.
+
+Description:
+    Loading readings through the ORM builds a `CurrentWeatherModel` per row, and a `Decimal` per
+    measurement. The functions below run a Core `SELECT` instead, casting measurements to floats
+    in SQL, and return one array per column as NumPy arrays, a pandas DataFrame or an Arrow table.
+
+    Rows are selected by (location_id, last_updated_epoch), which the table's unique key indexes,
+    so a location's time range is an index range scan.
+
+    numpy is required; pandas & pyarrow only for their respective functions. Install them with
+    the `analytics` extra of the shared package.
+
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import typing as t
+
+from .models import CurrentWeatherModel
+
+from loguru import logger as log
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+__all__ = [
+    "MEASUREMENT_COLUMNS",
+    "select_current_weather_readings",
+    "read_current_weather_arrays",
+    "read_current_weather_df",
+    "read_current_weather_arrow",
+]
+
+## Numeric measurement columns of CurrentWeatherModel, returned as float32 arrays
+MEASUREMENT_COLUMNS: tuple[str, ...] = (
+    "temp_c",
+    "temp_f",
+    "is_day",
+    "wind_mph",
+    "wind_kph",
+    "wind_degree",
+    "pressure_mb",
+    "pressure_in",
+    "precip_mm",
+    "precip_in",
+    "humidity",
+    "cloud",
+    "feelslike_c",
+    "feelslike_f",
+    "windchill_c",
+    "windchill_f",
+    "heatindex_c",
+    "heatindex_f",
+    "dewpoint_c",
+    "dewpoint_f",
+    "vis_km",
+    "uv",
+    "gust_mph",
+    "gust_kph",
+)
+
+## Rows fetched from the cursor at a time while filling the arrays
+FETCH_SIZE: int = 10_000
+
+
+def _require(module: t.Any, name: str) -> None:
+    if module is None:
+        raise RuntimeError(
+            f"Columnar reads require the {name} package. Install it with: pip install theweather-shared[analytics]"
+        )
+
+
+def _to_epoch(value: dt.datetime | int | None) -> int | None:
+    if value is None or isinstance(value, int):
+        return value
+    if value.tzinfo is None:
+        ## Naive datetimes are assumed to be UTC, like last_updated_epoch
+        value = value.replace(tzinfo=dt.timezone.utc)
+
+    return int(value.timestamp())
+
+
+def select_current_weather_readings(
+    location_id: int,
+    start: dt.datetime | int | None = None,
+    end: dt.datetime | int | None = None,
+    columns: t.Sequence[str] | None = None,
+) -> sa.Select:
+    """Build a Core SELECT of a location's readings, with measurements cast to floats.
+
+    Params:
+        location_id (int): The ID of the location.
+        start (datetime | int | None): First reading time to include, as a datetime or epoch seconds.
+        end (datetime | int | None): Readings before this time are included, as a datetime or epoch seconds.
+        columns (Sequence[str] | None): Measurement columns to select. Defaults to `MEASUREMENT_COLUMNS`.
+
+    Returns:
+        (sa.Select): Selects `last_updated_epoch` then each measurement, ordered by time.
+
+    Raises:
+        ValueError: If a column is not a measurement column.
+
+    """
+    if columns is None:
+        columns = MEASUREMENT_COLUMNS
+
+    unknown: list[str] = [c for c in columns if c not in MEASUREMENT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Not measurement columns of CurrentWeatherModel: {unknown}")
+
+    table: sa.Table = CurrentWeatherModel.__table__
+
+    stmt = (
+        sa.select(
+            table.c.last_updated_epoch,
+            ## Cast in SQL so the driver returns floats, never Decimals
+            *(sa.cast(table.c[c], sa.Float).label(c) for c in columns),
+        )
+        .where(table.c.location_id == location_id)
+        .order_by(table.c.last_updated_epoch)
+    )
+
+    start_epoch: int | None = _to_epoch(start)
+    end_epoch: int | None = _to_epoch(end)
+    if start_epoch is not None:
+        stmt = stmt.where(table.c.last_updated_epoch >= start_epoch)
+    if end_epoch is not None:
+        stmt = stmt.where(table.c.last_updated_epoch < end_epoch)
+
+    return stmt
+
+
+def read_current_weather_arrays(
+    session: so.Session | sa.Connection,
+    location_id: int,
+    start: dt.datetime | int | None = None,
+    end: dt.datetime | int | None = None,
+    columns: t.Sequence[str] | None = None,
+) -> dict[str, "np.ndarray"]:
+    """Read a location's readings into one NumPy array per column.
+
+    Params:
+        session (so.Session | sa.Connection): A database session or connection.
+        location_id (int): The ID of the location.
+        start (datetime | int | None): First reading time to include, as a datetime or epoch seconds.
+        end (datetime | int | None): Readings before this time are included, as a datetime or epoch seconds.
+        columns (Sequence[str] | None): Measurement columns to read. Defaults to `MEASUREMENT_COLUMNS`.
+
+    Returns:
+        (dict[str, np.ndarray]): `last_updated_epoch` as int64, and each measurement as float32.
+            Missing values are NaN.
+
+    Raises:
+        RuntimeError: If numpy is not installed.
+
+    """
+    _require(np, "numpy")
+
+    stmt: sa.Select = select_current_weather_readings(
+        location_id=location_id, start=start, end=end, columns=columns
+    )
+    names: list[str] = [c.name for c in stmt.selected_columns]
+
+    chunks: dict[str, list] = {name: [] for name in names}
+
+    try:
+        result = session.execute(stmt.execution_options(yield_per=FETCH_SIZE))
+
+        for rows in result.partitions():
+            for name, values in zip(names, zip(*rows)):
+                chunks[name].append(
+                    np.array(
+                        values,
+                        dtype=np.int64 if name == "last_updated_epoch" else np.float32,
+                    )
+                )
+    except Exception as exc:
+        log.error(
+            f"({type(exc)}) Error reading current weather for location {location_id}. Details: {exc}"
+        )
+
+        raise
+
+    return {
+        name: (
+            np.concatenate(arrays)
+            if arrays
+            else np.empty(
+                0, dtype=np.int64 if name == "last_updated_epoch" else np.float32
+            )
+        )
+        for name, arrays in chunks.items()
+    }
+
+
+def read_current_weather_df(
+    session: so.Session | sa.Connection,
+    location_id: int,
+    start: dt.datetime | int | None = None,
+    end: dt.datetime | int | None = None,
+    columns: t.Sequence[str] | None = None,
+) -> "pd.DataFrame":
+    """Read a location's readings into a pandas DataFrame with float32 columns.
+
+    Params:
+        session (so.Session | sa.Connection): A database session or connection.
+        location_id (int): The ID of the location.
+        start (datetime | int | None): First reading time to include, as a datetime or epoch seconds.
+        end (datetime | int | None): Readings before this time are included, as a datetime or epoch seconds.
+        columns (Sequence[str] | None): Measurement columns to read. Defaults to `MEASUREMENT_COLUMNS`.
+
+    Returns:
+        (pd.DataFrame): One column per measurement, indexed by reading time (UTC `DatetimeIndex` named `time`).
+
+    Raises:
+        RuntimeError: If numpy or pandas is not installed.
+
+    """
+    _require(pd, "pandas")
+
+    arrays: dict[str, np.ndarray] = read_current_weather_arrays(
+        session=session, location_id=location_id, start=start, end=end, columns=columns
+    )
+    index = pd.to_datetime(arrays.pop("last_updated_epoch"), unit="s", utc=True)
+
+    return pd.DataFrame(arrays, index=pd.DatetimeIndex(index, name="time"), copy=False)
+
+
+def read_current_weather_arrow(
+    session: so.Session | sa.Connection,
+    location_id: int,
+    start: dt.datetime | int | None = None,
+    end: dt.datetime | int | None = None,
+    columns: t.Sequence[str] | None = None,
+) -> "pa.Table":
+    """Read a location's readings into an Arrow table.
+
+    Params:
+        session (so.Session | sa.Connection): A database session or connection.
+        location_id (int): The ID of the location.
+        start (datetime | int | None): First reading time to include, as a datetime or epoch seconds.
+        end (datetime | int | None): Readings before this time are included, as a datetime or epoch seconds.
+        columns (Sequence[str] | None): Measurement columns to read. Defaults to `MEASUREMENT_COLUMNS`.
+
+    Returns:
+        (pa.Table): A `time` column (UTC timestamp, seconds), then one float32 column per measurement.
+            Missing values are null.
+
+    Raises:
+        RuntimeError: If numpy or pyarrow is not installed.
+
+    """
+    _require(pa, "pyarrow")
+
+    arrays: dict[str, np.ndarray] = read_current_weather_arrays(
+        session=session, location_id=location_id, start=start, end=end, columns=columns
+    )
+    epochs: np.ndarray = arrays.pop("last_updated_epoch")
+
+    return pa.table(
+        {
+            "time": pa.array(epochs, type=pa.timestamp("s", tz="UTC")),
+            **{
+                name: pa.array(values, type=pa.float32(), from_pandas=True)
+                for name, values in arrays.items()
+            },
+        }
+    )
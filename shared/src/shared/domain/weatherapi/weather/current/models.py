@@ -40,6 +40,8 @@ class CurrentWeatherJSONModel(Base):
         sa.DateTime(timezone=True),
         default=dt.datetime.now,
         nullable=False,
+        ## Retention prunes by age
+        index=True,
     )
 
     ## Raw JSON from a WeatherAPI HTTP request
@@ -88,8 +90,14 @@ class CurrentWeatherModel(Base):
     """
 
     __tablename__ = "weatherapi_current_weather"
-    __table_args__ = (sa.UniqueConstraint("last_updated_epoch"),)
-    # __table_args__ = (sa.UniqueConstraint("last_updated_epoch", name="_last_updated_epoch_uc"),)
+    ## One observation per location per update; the upsert's conflict target
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "location_id",
+            "last_updated_epoch",
+            name="_current_weather_location_epoch_uc",
+        ),
+    )
 
     id: so.Mapped[annotated.INT_PK]
 
@@ -177,6 +185,9 @@ class CurrentWeatherConditionModel(Base):
     """
 
     __tablename__ = "weatherapi_current_condition"
+    __table_args__ = (
+        sa.UniqueConstraint("weather_id", name="_current_condition_weather_uc"),
+    )
 
     id: so.Mapped[annotated.INT_PK]
 
@@ -222,6 +233,9 @@ class CurrentWeatherAirQualityModel(Base):
     """
 
     __tablename__ = "weatherapi_air_quality"
+    __table_args__ = (
+        sa.UniqueConstraint("weather_id", name="_air_quality_weather_uc"),
+    )
 
     id: so.Mapped[annotated.INT_PK]
 
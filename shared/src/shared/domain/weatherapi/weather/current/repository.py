@@ -3,7 +3,9 @@ from __future__ import annotations
 import typing as t
 
 from shared.db.base import BaseRepository
+from shared.db.upsert import execute_upsert
 
+from .columnar import MEASUREMENT_COLUMNS
 from .models import (
     CurrentWeatherAirQualityModel,
     CurrentWeatherConditionModel,
@@ -17,12 +19,26 @@ import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as so
 
 __all__ = [
+    "READING_COLUMNS",
+    "AGGREGATE_INTERVALS",
     "CurrentWeatherRepository",
     "CurrentWeatherJSONRepository",
     "CurrentWeatherConditionRepository",
     "CurrentWeatherAirQualityRepository",
 ]
 
+## Columns of a reading returned by the read queries, measurements as floats
+READING_COLUMNS: tuple[str, ...] = (
+    "location_id",
+    "last_updated_epoch",
+    "last_updated",
+    *MEASUREMENT_COLUMNS,
+    "wind_dir",
+)
+
+## Aggregate bucket widths in seconds. Buckets are aligned to UTC epoch time.
+AGGREGATE_INTERVALS: dict[str, int] = {"hour": 3600, "day": 86400}
+
 
 class CurrentWeatherJSONRepository(BaseRepository):
     def __init__(self, session: so.Session):
@@ -81,6 +97,63 @@ class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
 
         return weather
 
+    def upsert_with_related(
+        self,
+        weather_data: dict,
+        condition_data: dict | None = None,
+        air_quality_data: dict | None = None,
+    ) -> int:
+        """Insert or update a CurrentWeatherModel & its related models, in one transaction.
+
+        Description:
+            The weather row is upserted on its (location_id, last_updated_epoch) key, then the
+            condition & air quality rows on their `weather_id` key. Each is a single
+            `INSERT ... ON CONFLICT DO UPDATE` (`ON DUPLICATE KEY UPDATE` on MySQL), so receiving
+            the same observation twice, even from concurrent workers, updates it instead of failing.
+
+        Params:
+            weather_data (dict): The data for the main weather model, including `location_id`.
+            condition_data (dict | None): The data for the condition model.
+            air_quality_data (dict | None): The data for the air quality model. Skipped when empty,
+                i.e. when the response was requested without air quality.
+
+        Returns:
+            int: The ID of the CurrentWeatherModel.
+
+        Raises:
+            Exception: If an upsert fails, the transaction is rolled back and the exception is re-raised.
+
+        """
+        try:
+            weather_id: int = execute_upsert(
+                self.session,
+                CurrentWeatherModel,
+                values=weather_data,
+                conflict_columns=("location_id", "last_updated_epoch"),
+            )
+
+            for model, data in (
+                (CurrentWeatherConditionModel, condition_data),
+                (CurrentWeatherAirQualityModel, air_quality_data),
+            ):
+                if data:
+                    execute_upsert(
+                        self.session,
+                        model,
+                        values={**data, "weather_id": weather_id},
+                        conflict_columns=("weather_id",),
+                    )
+
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
+            msg = f"({type(exc)}) Error upserting current weather. Details: {exc}"
+            log.error(msg)
+
+            raise
+
+        return weather_id
+
     def update_with_related(
         self,
         weather: CurrentWeatherModel,
@@ -141,14 +214,18 @@ class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
             .one_or_none()
         )
 
-    def get_by_last_updated_epoch(self, last_updated_epoch: int):
+    def get_by_last_updated_epoch(
+        self, last_updated_epoch: int, location_id: int | None = None
+    ):
         """Get a CurrentWeatherModel by its last updated epoch.
 
         Description:
-            This method returns a CurrentWeatherModel by its last updated epoch.
+            This method returns a CurrentWeatherModel by its last updated epoch. Several locations
+            can share an epoch, so pass `location_id` to match the (location_id, last_updated_epoch) key.
 
         Params:
             last_updated_epoch (int): The last updated epoch of the CurrentWeatherModel to retrieve.
+            location_id (int | None): Only match this location. Without it, the lowest ID match is returned.
 
         Returns:
             CurrentWeatherModel: The CurrentWeatherModel with the specified last updated epoch.
@@ -157,11 +234,13 @@ class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
             Exception: If there is an error retrieving the CurrentWeatherModel.
 
         """
-        return (
-            self.session.query(CurrentWeatherModel)
-            .filter(CurrentWeatherModel.last_updated_epoch == last_updated_epoch)
-            .one_or_none()
+        query = self.session.query(CurrentWeatherModel).filter(
+            CurrentWeatherModel.last_updated_epoch == last_updated_epoch
         )
+        if location_id is not None:
+            query = query.filter(CurrentWeatherModel.location_id == location_id)
+
+        return query.order_by(CurrentWeatherModel.id).first()
 
     def get_by_last_updated(self, last_updated: str):
         """Get a CurrentWeatherModel by its last updated.
@@ -185,6 +264,209 @@ class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
             .one_or_none()
         )
 
+    @staticmethod
+    def _reading_columns(columns: t.Sequence[str] | None) -> list[sa.ColumnElement]:
+        """Return selectable reading columns, with measurements cast to floats in SQL."""
+        if columns is None:
+            columns = READING_COLUMNS
+
+        unknown: list[str] = [c for c in columns if c not in READING_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown reading column(s): {unknown}")
+
+        table: sa.Table = CurrentWeatherModel.__table__
+
+        return [
+            sa.cast(table.c[c], sa.Float).label(c)
+            if c in MEASUREMENT_COLUMNS
+            else table.c[c]
+            for c in columns
+        ]
+
+    def list_readings(
+        self,
+        location_id: int,
+        start_epoch: int | None = None,
+        end_epoch: int | None = None,
+        after_epoch: int | None = None,
+        limit: int | None = None,
+        descending: bool = False,
+        columns: t.Sequence[str] | None = None,
+    ) -> list[dict]:
+        """Return a page of a location's readings in a time range, ordered by time.
+
+        Description:
+            Pages are keyset-paginated on `last_updated_epoch`, which is unique per location, so each
+            page is a range scan of the (location_id, last_updated_epoch) index however deep it is.
+
+        Params:
+            location_id (int): The ID of the location.
+            start_epoch (int | None): Only readings at or after this epoch.
+            end_epoch (int | None): Only readings before this epoch.
+            after_epoch (int | None): Only readings after this epoch (before it, when `descending`); the
+                last epoch of the previous page.
+            limit (int | None): Maximum readings to return.
+            descending (bool): Newest readings first.
+            columns (Sequence[str] | None): Columns to return, from `READING_COLUMNS`. Always includes
+                `last_updated_epoch`.
+
+        Returns:
+            (list[dict]): The readings, as dicts of column values.
+
+        Raises:
+            ValueError: If a column is not a reading column.
+
+        """
+        if columns is not None and "last_updated_epoch" not in columns:
+            columns = ["last_updated_epoch", *columns]
+
+        epoch: sa.Column = CurrentWeatherModel.__table__.c.last_updated_epoch
+
+        stmt = sa.select(*self._reading_columns(columns)).where(
+            CurrentWeatherModel.location_id == location_id
+        )
+        if start_epoch is not None:
+            stmt = stmt.where(epoch >= start_epoch)
+        if end_epoch is not None:
+            stmt = stmt.where(epoch < end_epoch)
+        if after_epoch is not None:
+            stmt = stmt.where(
+                epoch < after_epoch if descending else epoch > after_epoch
+            )
+
+        stmt = stmt.order_by(epoch.desc() if descending else epoch)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
+
+    def aggregate_readings(
+        self,
+        location_id: int,
+        interval: str = "hour",
+        metrics: t.Sequence[str] | None = None,
+        start_epoch: int | None = None,
+        end_epoch: int | None = None,
+        after_bucket: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return min, max & average of a location's measurements per hour or day, computed in SQL.
+
+        Description:
+            Readings are grouped into UTC buckets of `last_updated_epoch - last_updated_epoch % width`,
+            scanned from the (location_id, last_updated_epoch) index. Pages are keyset-paginated on
+            the bucket start.
+
+        Params:
+            location_id (int): The ID of the location.
+            interval (str): "hour" or "day".
+            metrics (Sequence[str] | None): Measurements to aggregate. Defaults to `MEASUREMENT_COLUMNS`.
+            start_epoch (int | None): Only readings at or after this epoch.
+            end_epoch (int | None): Only readings before this epoch.
+            after_bucket (int | None): Only buckets after this one; the last bucket of the previous page.
+            limit (int | None): Maximum buckets to return.
+
+        Returns:
+            (list[dict]): One dict per bucket: `bucket_epoch`, `count`, and `<metric>_min`, `<metric>_max`
+                & `<metric>_avg` for each metric.
+
+        Raises:
+            ValueError: If the interval or a metric is unknown.
+
+        """
+        if interval not in AGGREGATE_INTERVALS:
+            raise ValueError(
+                f"Unknown interval '{interval}'. Use one of: {list(AGGREGATE_INTERVALS)}"
+            )
+        if metrics is None:
+            metrics = MEASUREMENT_COLUMNS
+
+        unknown: list[str] = [m for m in metrics if m not in MEASUREMENT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown metric(s): {unknown}")
+
+        width: int = AGGREGATE_INTERVALS[interval]
+        table: sa.Table = CurrentWeatherModel.__table__
+        epoch: sa.Column = table.c.last_updated_epoch
+        bucket = (epoch - epoch % width).label("bucket_epoch")
+
+        aggregates: list[sa.ColumnElement] = []
+        for metric in metrics:
+            value = sa.cast(table.c[metric], sa.Float)
+            aggregates.extend(
+                [
+                    sa.func.min(value).label(f"{metric}_min"),
+                    sa.func.max(value).label(f"{metric}_max"),
+                    sa.cast(sa.func.avg(value), sa.Float).label(f"{metric}_avg"),
+                ]
+            )
+
+        stmt = sa.select(bucket, sa.func.count().label("count"), *aggregates).where(
+            table.c.location_id == location_id
+        )
+        if start_epoch is not None:
+            stmt = stmt.where(epoch >= start_epoch)
+        if end_epoch is not None:
+            stmt = stmt.where(epoch < end_epoch)
+        if after_bucket is not None:
+            ## Filter readings, not groups, so the index range still applies
+            stmt = stmt.where(epoch >= after_bucket + width)
+
+        stmt = stmt.group_by(bucket).order_by(bucket)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
+
+    def latest_readings(
+        self,
+        location_ids: t.Sequence[int] | None = None,
+        columns: t.Sequence[str] | None = None,
+    ) -> list[dict]:
+        """Return the most recent reading of each location.
+
+        Params:
+            location_ids (Sequence[int] | None): Only these locations. Defaults to every location with readings.
+            columns (Sequence[str] | None): Columns to return, from `READING_COLUMNS`. Always includes
+                `location_id` & `last_updated_epoch`.
+
+        Returns:
+            (list[dict]): One reading per location, ordered by location ID.
+
+        Raises:
+            ValueError: If a column is not a reading column.
+
+        """
+        if columns is not None:
+            columns = [
+                *(c for c in ("location_id", "last_updated_epoch") if c not in columns),
+                *columns,
+            ]
+
+        table: sa.Table = CurrentWeatherModel.__table__
+
+        latest = sa.select(
+            table.c.location_id,
+            sa.func.max(table.c.last_updated_epoch).label("max_epoch"),
+        ).group_by(table.c.location_id)
+        if location_ids is not None:
+            latest = latest.where(table.c.location_id.in_(list(location_ids)))
+        latest = latest.subquery()
+
+        stmt = (
+            sa.select(*self._reading_columns(columns))
+            .join(
+                latest,
+                sa.and_(
+                    table.c.location_id == latest.c.location_id,
+                    table.c.last_updated_epoch == latest.c.max_epoch,
+                ),
+            )
+            .order_by(table.c.location_id)
+        )
+
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
+
     def get_with_related(self, id: int):
         """Get a CurrentWeatherModel with related models.
 
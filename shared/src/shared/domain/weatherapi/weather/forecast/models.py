@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import datetime as dt
+from decimal import Decimal
 import typing as t
 
 from shared.db import Base, annotated
+from shared.domain.weatherapi.location import LocationModel
 
 from loguru import logger as log
 import sqlalchemy as sa
@@ -13,6 +15,9 @@ from sqlalchemy.types import JSON
 
 __all__ = [
     "ForecastJSONModel",
+    "ForecastDayModel",
+    "ForecastHourModel",
+    "ForecastAstroModel",
 ]
 
 
@@ -26,6 +31,294 @@ class ForecastJSONModel(Base):
         sa.DateTime(timezone=True),
         default=dt.datetime.now,
         nullable=False,
+        ## Retention prunes by age
+        index=True,
     )
 
     forecast_json: so.Mapped[dict] = so.mapped_column(JSON)
+
+
+class ForecastDayModel(Base):
+    """One day of a weather forecast, parsed from a forecast response's `forecastday` list.
+
+    Description:
+        Each forecast response overwrites the rows for the days it covers, so a (location, date)
+        pair always holds the most recent forecast for that day. Condition fields are flattened
+        into `condition_text`, `condition_icon` & `condition_code`.
+
+    Attributes:
+        id (int): The ID of the forecast day record.
+        location_id (int): The ID of the forecast's location.
+        forecast_json_id (int | None): The ID of the raw forecast response the day was parsed from.
+        date (date): The forecast date, in the location's local time.
+        date_epoch (int): The forecast date as an epoch timestamp.
+        maxtemp_c .. uv: Daily aggregates from the response's `day` object.
+
+    Relationships:
+        location (LocationModel): The forecast's location.
+        hours (list[ForecastHourModel]): Hourly forecasts for the day.
+        astro (ForecastAstroModel): Sun & moon times for the day.
+
+    """
+
+    __tablename__ = "weatherapi_forecast_day"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "location_id", "date_epoch", name="_forecast_day_location_date_uc"
+        ),
+        sa.Index("ix_weatherapi_forecast_day_location_date", "location_id", "date"),
+    )
+
+    id: so.Mapped[annotated.INT_PK]
+
+    date: so.Mapped[dt.date] = so.mapped_column(sa.Date, nullable=False)
+    date_epoch: so.Mapped[int] = so.mapped_column(sa.INTEGER, nullable=False)
+
+    maxtemp_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    maxtemp_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    mintemp_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    mintemp_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    avgtemp_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    avgtemp_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    maxwind_mph: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    maxwind_kph: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    totalprecip_mm: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    totalprecip_in: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    totalsnow_cm: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    avgvis_km: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    avgvis_miles: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    avghumidity: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    daily_will_it_rain: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    daily_chance_of_rain: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    daily_will_it_snow: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    daily_chance_of_snow: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    uv: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    condition_text: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    condition_icon: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    condition_code: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+
+    ## Foreign keys
+
+    location_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("weatherapi_location.id"), nullable=False
+    )
+    ## Raw response the row was parsed from. Kept when the raw response is pruned
+    forecast_json_id: so.Mapped[t.Optional[int]] = so.mapped_column(
+        sa.ForeignKey("weatherapi_forecast_json.id", ondelete="SET NULL")
+    )
+
+    ## Relationships
+
+    location: so.Mapped[LocationModel] = so.relationship(
+        LocationModel, back_populates="forecast_weather_entries"
+    )
+    hours: so.Mapped[list["ForecastHourModel"]] = so.relationship(
+        back_populates="day", cascade="all, delete-orphan", passive_deletes=True
+    )
+    astro: so.Mapped["ForecastAstroModel"] = so.relationship(
+        back_populates="day", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+
+class ForecastHourModel(Base):
+    """One hour of a weather forecast, parsed from a forecast day's `hour` list.
+
+    Attributes:
+        id (int): The ID of the forecast hour record.
+        location_id (int): The ID of the forecast's location (denormalized for index scans).
+        forecast_day_id (int): The ID of the forecast day the hour belongs to.
+        time_epoch (int): The forecast hour as an epoch timestamp.
+        time (str): The forecast hour in the location's local time, i.e. `2025-01-01 13:00`.
+        temp_c .. uv: Hourly values from the response's `hour` objects.
+
+    Relationships:
+        day (ForecastDayModel): The forecast day the hour belongs to.
+
+    """
+
+    __tablename__ = "weatherapi_forecast_hour"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "location_id", "time_epoch", name="_forecast_hour_location_time_uc"
+        ),
+    )
+
+    id: so.Mapped[annotated.INT_PK]
+
+    time_epoch: so.Mapped[int] = so.mapped_column(sa.INTEGER, nullable=False)
+    time: so.Mapped[str] = so.mapped_column(sa.TEXT, nullable=False)
+
+    temp_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    temp_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    is_day: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    condition_text: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    condition_icon: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    condition_code: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    wind_mph: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    wind_kph: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    wind_degree: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    wind_dir: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    pressure_mb: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    pressure_in: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    precip_mm: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    precip_in: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    snow_cm: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    humidity: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    cloud: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    feelslike_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    feelslike_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    windchill_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    windchill_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    heatindex_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    heatindex_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    dewpoint_c: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    dewpoint_f: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    will_it_rain: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    chance_of_rain: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    will_it_snow: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    chance_of_snow: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    vis_km: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    vis_miles: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    gust_mph: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    gust_kph: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    uv: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+
+    ## Foreign keys
+
+    location_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("weatherapi_location.id"), nullable=False
+    )
+    forecast_day_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("weatherapi_forecast_day.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    ## Relationships
+
+    day: so.Mapped["ForecastDayModel"] = so.relationship(back_populates="hours")
+
+
+class ForecastAstroModel(Base):
+    """Sun & moon times for a forecast day, parsed from a forecast day's `astro` object.
+
+    Attributes:
+        id (int): The ID of the forecast astro record.
+        location_id (int): The ID of the forecast's location (denormalized for index scans).
+        forecast_day_id (int): The ID of the forecast day.
+        date (date): The forecast date, in the location's local time.
+        sunrise .. is_sun_up: Values from the response's `astro` object.
+
+    Relationships:
+        day (ForecastDayModel): The forecast day.
+
+    """
+
+    __tablename__ = "weatherapi_forecast_astro"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "location_id", "date", name="_forecast_astro_location_date_uc"
+        ),
+    )
+
+    id: so.Mapped[annotated.INT_PK]
+
+    date: so.Mapped[dt.date] = so.mapped_column(sa.Date, nullable=False)
+
+    sunrise: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    sunset: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    moonrise: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    moonset: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    moon_phase: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    moon_illumination: so.Mapped[t.Optional[Decimal]] = so.mapped_column(
+        sa.NUMERIC(precision=12, scale=2)
+    )
+    is_moon_up: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+    is_sun_up: so.Mapped[t.Optional[int]] = so.mapped_column(sa.INTEGER)
+
+    ## Foreign keys
+
+    location_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("weatherapi_location.id"), nullable=False
+    )
+    forecast_day_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("weatherapi_forecast_day.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+
+    ## Relationships
+
+    day: so.Mapped["ForecastDayModel"] = so.relationship(back_populates="astro")
@@ -1,19 +1,177 @@
 from __future__ import annotations
 
+import datetime as dt
 import typing as t
 
 from shared.db.base import BaseRepository
+from shared.db.upsert import execute_upsert
 
-from .models import ForecastJSONModel
+from .models import (
+    ForecastAstroModel,
+    ForecastDayModel,
+    ForecastHourModel,
+    ForecastJSONModel,
+)
+from .schemas import ForecastDayEntryIn
 
 from loguru import logger as log
 import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as so
 
-__all__ = ["ForecastJSONRepository"]
+__all__ = ["ForecastJSONRepository", "ForecastDayRepository"]
 
 
 class ForecastJSONRepository(BaseRepository):
     def __init__(self, session: so.Session):
         super().__init__(session, ForecastJSONModel)
+
+
+class ForecastDayRepository(BaseRepository[ForecastDayModel]):
+    """Repository for the normalized forecast tables.
+
+    Description:
+        Saves parsed forecast days with their hours & astro data, and runs aggregate
+        queries over them in SQL.
+
+    Attributes:
+        session (so.Session): The database session.
+
+    """
+
+    def __init__(self, session: so.Session):
+        super().__init__(session, ForecastDayModel)
+
+    def save_forecast_days(
+        self,
+        location_id: int,
+        forecast_days: list[ForecastDayEntryIn],
+        forecast_json_id: int | None = None,
+    ) -> dict[str, int]:
+        """Replace a location's stored forecast for the given days, in one transaction.
+
+        Description:
+            Day rows are upserted on their (location, date) key, then the days' stored hours &
+            astro rows are replaced with bulk INSERTs. A newer forecast for a day replaces the
+            older one. The upsert locks each day row until commit, so concurrent forecasts for
+            the same location replace the day one after the other instead of failing on the key.
+
+        Params:
+            location_id (int): The ID of the forecast's location.
+            forecast_days (list[ForecastDayEntryIn]): Parsed forecast days, see `parse_forecast_days()`.
+            forecast_json_id (int | None): The ID of the raw forecast response, if it was saved.
+
+        Returns:
+            (dict[str, int]): Counts of `days` upserted, and `hours` & `astro` rows inserted.
+
+        Raises:
+            (Exception): If saving fails, the transaction is rolled back and the exception is re-raised.
+
+        """
+        if not forecast_days:
+            return {"days": 0, "hours": 0, "astro": 0}
+
+        ## Upsert days in key order, so concurrent saves lock overlapping rows in the same order
+        forecast_days = sorted(forecast_days, key=lambda d: d.date_epoch)
+
+        day_rows: list[dict] = [
+            {
+                **d.day.to_row(),
+                "date": d.date,
+                "date_epoch": d.date_epoch,
+                "location_id": location_id,
+                "forecast_json_id": forecast_json_id,
+            }
+            for d in forecast_days
+        ]
+
+        try:
+            day_ids: list[int] = [
+                execute_upsert(
+                    self.session,
+                    ForecastDayModel,
+                    values=row,
+                    conflict_columns=("location_id", "date_epoch"),
+                )
+                for row in day_rows
+            ]
+
+            ## Drop the hours & astro of the previous forecast for these days
+            for model in (ForecastHourModel, ForecastAstroModel):
+                self.session.execute(
+                    sa.delete(model)
+                    .where(model.forecast_day_id.in_(day_ids))
+                    .execution_options(synchronize_session=False)
+                )
+
+            hour_rows: list[dict] = [
+                {**h.to_row(), "location_id": location_id, "forecast_day_id": day_id}
+                for d, day_id in zip(forecast_days, day_ids)
+                for h in d.hour
+            ]
+            astro_rows: list[dict] = [
+                {
+                    **d.astro.to_row(),
+                    "date": d.date,
+                    "location_id": location_id,
+                    "forecast_day_id": day_id,
+                }
+                for d, day_id in zip(forecast_days, day_ids)
+                if d.astro is not None
+            ]
+
+            if hour_rows:
+                self.session.execute(sa.insert(ForecastHourModel), hour_rows)
+            if astro_rows:
+                self.session.execute(sa.insert(ForecastAstroModel), astro_rows)
+
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
+            log.error(
+                f"({type(exc)}) Error saving {len(forecast_days)} forecast day(s) for location {location_id}. Details: {exc}"
+            )
+
+            raise
+
+        return {"days": len(day_ids), "hours": len(hour_rows), "astro": len(astro_rows)}
+
+    def daily_temperature_extremes(
+        self,
+        location_id: int | None = None,
+        start: dt.date | None = None,
+        end: dt.date | None = None,
+    ) -> list[sa.Row]:
+        """Return min & max hourly forecast temperature per location per day, aggregated in SQL.
+
+        Params:
+            location_id (int | None): Only include this location. Defaults to all locations.
+            start (date | None): First date to include.
+            end (date | None): Last date to include.
+
+        Returns:
+            (list[sa.Row]): Rows of `location_id`, `date`, `mintemp_c` & `maxtemp_c`, ordered by location & date.
+
+        """
+        stmt = (
+            sa.select(
+                ForecastDayModel.location_id,
+                ForecastDayModel.date,
+                sa.func.min(ForecastHourModel.temp_c).label("mintemp_c"),
+                sa.func.max(ForecastHourModel.temp_c).label("maxtemp_c"),
+            )
+            .join(
+                ForecastHourModel,
+                ForecastHourModel.forecast_day_id == ForecastDayModel.id,
+            )
+            .group_by(ForecastDayModel.location_id, ForecastDayModel.date)
+            .order_by(ForecastDayModel.location_id, ForecastDayModel.date)
+        )
+        if location_id is not None:
+            stmt = stmt.where(ForecastDayModel.location_id == location_id)
+        if start is not None:
+            stmt = stmt.where(ForecastDayModel.date >= start)
+        if end is not None:
+            stmt = stmt.where(ForecastDayModel.date <= end)
+
+        return self.session.execute(stmt).all()
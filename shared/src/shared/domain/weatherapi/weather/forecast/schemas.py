@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from decimal import Decimal
 import typing as t
 
 from loguru import logger as log
@@ -9,28 +10,183 @@ from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_valida
 __all__ = [
     "ForecastJSONIn",
     "ForecastJSONOut",
+    "ForecastConditionIn",
+    "ForecastDayIn",
+    "ForecastHourIn",
+    "ForecastAstroIn",
+    "ForecastDayEntryIn",
+    "parse_forecast_days",
 ]
 
+
 class ForecastJSONIn(BaseModel):
     """Weather forecast in JSON format.
-    
+
     Attributes:
         forecast_json (dict): The forecast in JSON format.
-        
+
     """
-    
+
     forecast_json: dict
 
 
 class ForecastJSONOut(ForecastJSONIn):
     """Weather forecast in JSON format, retrieved from database.
-    
+
     Attributes:
         id (int): The ID of the forecast.
         created_at (datetime): The creation date of the forecast.
-        
+
     """
-    
+
     id: int
 
-    created_at: dt.datetime
\ No newline at end of file
+    created_at: dt.datetime
+
+
+class ForecastConditionIn(BaseModel):
+    """Forecast weather condition.
+
+    Attributes:
+        text (str): The text description of the condition.
+        icon (str): The icon representing the condition.
+        code (int): The code representing the condition.
+
+    """
+
+    text: str | None = None
+    icon: str | None = None
+    code: int | None = None
+
+
+class _FlattenConditionMixin:
+    def to_row(self) -> dict:
+        """Return column values for a bulk insert, with the condition flattened into `condition_*` columns."""
+        row: dict = self.model_dump(exclude={"condition"})
+        condition: ForecastConditionIn = self.condition or ForecastConditionIn()
+
+        row["condition_text"] = condition.text
+        row["condition_icon"] = condition.icon
+        row["condition_code"] = condition.code
+
+        return row
+
+
+class ForecastDayIn(_FlattenConditionMixin, BaseModel):
+    """Daily aggregates of a forecast day (the `day` object). Missing values are `None`."""
+
+    maxtemp_c: Decimal | None = None
+    maxtemp_f: Decimal | None = None
+    mintemp_c: Decimal | None = None
+    mintemp_f: Decimal | None = None
+    avgtemp_c: Decimal | None = None
+    avgtemp_f: Decimal | None = None
+    maxwind_mph: Decimal | None = None
+    maxwind_kph: Decimal | None = None
+    totalprecip_mm: Decimal | None = None
+    totalprecip_in: Decimal | None = None
+    totalsnow_cm: Decimal | None = None
+    avgvis_km: Decimal | None = None
+    avgvis_miles: Decimal | None = None
+    avghumidity: int | None = None
+    daily_will_it_rain: int | None = None
+    daily_chance_of_rain: int | None = None
+    daily_will_it_snow: int | None = None
+    daily_chance_of_snow: int | None = None
+    uv: Decimal | None = None
+    condition: ForecastConditionIn | None = None
+
+
+class ForecastHourIn(_FlattenConditionMixin, BaseModel):
+    """One hour of a forecast day (an item of the `hour` list). Missing values are `None`."""
+
+    time_epoch: int
+    time: str
+    temp_c: Decimal | None = None
+    temp_f: Decimal | None = None
+    is_day: int | None = None
+    condition: ForecastConditionIn | None = None
+    wind_mph: Decimal | None = None
+    wind_kph: Decimal | None = None
+    wind_degree: int | None = None
+    wind_dir: str | None = None
+    pressure_mb: Decimal | None = None
+    pressure_in: Decimal | None = None
+    precip_mm: Decimal | None = None
+    precip_in: Decimal | None = None
+    snow_cm: Decimal | None = None
+    humidity: int | None = None
+    cloud: int | None = None
+    feelslike_c: Decimal | None = None
+    feelslike_f: Decimal | None = None
+    windchill_c: Decimal | None = None
+    windchill_f: Decimal | None = None
+    heatindex_c: Decimal | None = None
+    heatindex_f: Decimal | None = None
+    dewpoint_c: Decimal | None = None
+    dewpoint_f: Decimal | None = None
+    will_it_rain: int | None = None
+    chance_of_rain: int | None = None
+    will_it_snow: int | None = None
+    chance_of_snow: int | None = None
+    vis_km: Decimal | None = None
+    vis_miles: Decimal | None = None
+    gust_mph: Decimal | None = None
+    gust_kph: Decimal | None = None
+    uv: Decimal | None = None
+
+
+class ForecastAstroIn(BaseModel):
+    """Sun & moon times of a forecast day (the `astro` object). Missing values are `None`."""
+
+    sunrise: str | None = None
+    sunset: str | None = None
+    moonrise: str | None = None
+    moonset: str | None = None
+    moon_phase: str | None = None
+    moon_illumination: Decimal | None = None
+    is_moon_up: int | None = None
+    is_sun_up: int | None = None
+
+    def to_row(self) -> dict:
+        """Return column values for a bulk insert."""
+        return self.model_dump()
+
+
+class ForecastDayEntryIn(BaseModel):
+    """An item of a forecast response's `forecast.forecastday` list.
+
+    Attributes:
+        date (date): The forecast date, in the location's local time.
+        date_epoch (int): The forecast date as an epoch timestamp.
+        day (ForecastDayIn): Daily aggregates.
+        astro (ForecastAstroIn | None): Sun & moon times.
+        hour (list[ForecastHourIn]): Hourly forecasts.
+
+    """
+
+    date: dt.date
+    date_epoch: int
+    day: ForecastDayIn
+    astro: ForecastAstroIn | None = None
+    hour: list[ForecastHourIn] = Field(default_factory=list)
+
+
+def parse_forecast_days(forecast_json: dict) -> list[ForecastDayEntryIn]:
+    """Parse the `forecast.forecastday` list of a WeatherAPI forecast response.
+
+    Params:
+        forecast_json (dict): A WeatherAPI forecast response.
+
+    Returns:
+        (list[ForecastDayEntryIn]): The forecast days. Empty if the response has no forecast.
+
+    Raises:
+        (ValidationError): If a forecast day is malformed.
+
+    """
+    forecast_days: list[dict] = (forecast_json.get("forecast") or {}).get(
+        "forecastday"
+    ) or []
+
+    return [ForecastDayEntryIn.model_validate(day) for day in forecast_days]
@@ -1,3 +1,5 @@
 from __future__ import annotations
 
-from .schemas import *
\ No newline at end of file
+from .models import *
+from .repository import *
+from .schemas import *
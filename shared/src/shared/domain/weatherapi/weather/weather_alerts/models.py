@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing as t
+
+from shared.db import Base, annotated
+from shared.domain.weatherapi.location import LocationModel
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+__all__ = ["WeatherAlertModel"]
+
+
+class WeatherAlertModel(Base):
+    """A weather alert, parsed from a forecast response's `alerts.alert` list.
+
+    Description:
+        Forecast responses repeat the same alerts until they expire, so alerts are deduplicated
+        by `content_hash`, a SHA-256 of the alert's fields. `effective` & `expires` are stored
+        in UTC.
+
+    Attributes:
+        id (int): The ID of the alert record.
+        location_id (int): The ID of the location the alert was issued for.
+        forecast_json_id (int | None): The ID of the raw forecast response the alert was first seen in.
+        content_hash (str): SHA-256 hex digest of the alert's fields.
+        created_at (datetime): When the alert was first saved.
+        headline .. instruction: Alert fields from the response.
+        effective (datetime | None): When the alert takes effect.
+        expires (datetime | None): When the alert expires.
+
+    Relationships:
+        location (LocationModel): The location the alert was issued for.
+
+    """
+
+    __tablename__ = "weatherapi_weather_alert"
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "location_id", "content_hash", name="_weather_alert_location_hash_uc"
+        ),
+        ## Active alert lookups filter on expires first; most stored alerts have already expired
+        sa.Index(
+            "ix_weatherapi_weather_alert_location_expires_effective",
+            "location_id",
+            "expires",
+            "effective",
+        ),
+    )
+
+    id: so.Mapped[annotated.INT_PK]
+
+    content_hash: so.Mapped[str] = so.mapped_column(sa.String(64), nullable=False)
+    created_at: so.Mapped[dt.datetime] = so.mapped_column(
+        sa.DateTime(timezone=True), default=dt.datetime.now, nullable=False
+    )
+
+    headline: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    msgtype: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    severity: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    urgency: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    areas: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    category: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    certainty: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    event: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    note: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    effective: so.Mapped[t.Optional[dt.datetime]] = so.mapped_column(
+        sa.DateTime(timezone=True)
+    )
+    expires: so.Mapped[t.Optional[dt.datetime]] = so.mapped_column(
+        sa.DateTime(timezone=True)
+    )
+    description: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+    instruction: so.Mapped[t.Optional[str]] = so.mapped_column(sa.TEXT)
+
+    ## Foreign keys
+
+    location_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("weatherapi_location.id"), nullable=False
+    )
+    ## Raw response the alert was parsed from. Kept when the raw response is pruned
+    forecast_json_id: so.Mapped[t.Optional[int]] = so.mapped_column(
+        sa.ForeignKey("weatherapi_forecast_json.id", ondelete="SET NULL")
+    )
+
+    ## Relationships
+
+    location: so.Mapped[LocationModel] = so.relationship(LocationModel)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import datetime as dt
+
+from shared.db.base import BaseRepository
+from shared.db.upsert import insert_do_nothing, supports_insert_returning
+
+from .models import WeatherAlertModel
+from .schemas import WeatherAlertIn
+
+from loguru import logger as log
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+__all__ = ["WeatherAlertRepository"]
+
+
+class WeatherAlertRepository(BaseRepository[WeatherAlertModel]):
+    """Repository for weather alerts.
+
+    Description:
+        Saves alerts parsed from forecast responses with `INSERT ... ON CONFLICT DO NOTHING`,
+        skipping alerts already stored for the location, and looks up a location's active
+        alerts through the (location, expires, effective) index.
+
+    Attributes:
+        session (so.Session): The database session.
+
+    """
+
+    def __init__(self, session: so.Session):
+        super().__init__(session, WeatherAlertModel)
+
+    def save_alerts(
+        self,
+        location_id: int,
+        alerts: list[WeatherAlertIn],
+        forecast_json_id: int | None = None,
+    ) -> int:
+        """Save a location's alerts, skipping any whose content hash is already stored.
+
+        Description:
+            A single INSERT skips rows conflicting with the (location_id, content_hash) key, so
+            concurrent saves of the same alerts do not fail.
+
+        Params:
+            location_id (int): The ID of the location the alerts were issued for.
+            alerts (list[WeatherAlertIn]): Parsed alerts, see `parse_weather_alerts()`.
+            forecast_json_id (int | None): The ID of the raw forecast response, if it was saved.
+
+        Returns:
+            (int): The number of new alerts inserted.
+
+        Raises:
+            (Exception): If saving fails, the transaction is rolled back and the exception is re-raised.
+
+        """
+        if not alerts:
+            return 0
+
+        ## Dedupe within the response too; the same alert can be listed for several areas
+        rows: dict[str, dict] = {}
+        for alert in alerts:
+            row: dict = alert.to_row()
+            rows.setdefault(row["content_hash"], row)
+
+        new_rows: list[dict] = [
+            {**row, "location_id": location_id, "forecast_json_id": forecast_json_id}
+            for row in rows.values()
+        ]
+
+        dialect = self.session.get_bind().dialect
+        stmt = insert_do_nothing(
+            dialect, WeatherAlertModel, conflict_columns=("location_id", "content_hash")
+        ).values(new_rows)
+
+        try:
+            if supports_insert_returning(dialect):
+                ## Only inserted rows are returned
+                inserted: int = len(
+                    self.session.execute(stmt.returning(WeatherAlertModel.id)).all()
+                )
+            else:
+                ## MySQL's rowcount depends on the CLIENT_FOUND_ROWS flag, count the
+                #  alerts already stored in the same transaction instead
+                existing: set[str] = set(
+                    self.session.execute(
+                        sa.select(WeatherAlertModel.content_hash).where(
+                            WeatherAlertModel.location_id == location_id,
+                            WeatherAlertModel.content_hash.in_(rows),
+                        )
+                    ).scalars()
+                )
+                self.session.execute(stmt)
+                inserted = len(rows) - len(existing)
+
+            self.session.commit()
+        except Exception as exc:
+            self.session.rollback()
+            log.error(
+                f"({type(exc)}) Error saving {len(rows)} weather alert(s) for location {location_id}. Details: {exc}"
+            )
+
+            raise
+
+        return inserted
+
+    def get_active_alerts(
+        self, location_id: int, at: dt.datetime | None = None
+    ) -> list[WeatherAlertModel]:
+        """Return a location's alerts in effect at a point in time.
+
+        Description:
+            An alert is active when `effective <= at < expires`. A missing `effective` or
+            `expires` is treated as open-ended.
+
+        Params:
+            location_id (int): The ID of the location.
+            at (datetime | None): The point in time. Naive values are assumed to be UTC. Defaults to now.
+
+        Returns:
+            (list[WeatherAlertModel]): Active alerts, most recently effective first.
+
+        """
+        if at is None:
+            at = dt.datetime.now(dt.timezone.utc)
+        elif at.tzinfo is None:
+            at = at.replace(tzinfo=dt.timezone.utc)
+        else:
+            at = at.astimezone(dt.timezone.utc)
+
+        stmt = (
+            sa.select(WeatherAlertModel)
+            .where(
+                WeatherAlertModel.location_id == location_id,
+                sa.or_(
+                    WeatherAlertModel.expires.is_(None), WeatherAlertModel.expires > at
+                ),
+                sa.or_(
+                    WeatherAlertModel.effective.is_(None),
+                    WeatherAlertModel.effective <= at,
+                ),
+            )
+            .order_by(WeatherAlertModel.effective.desc(), WeatherAlertModel.id.desc())
+        )
+
+        return list(self.session.execute(stmt).scalars().all())
@@ -1,14 +1,43 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+import datetime as dt
+import hashlib
+import json
+
+from pydantic import AliasChoices, BaseModel, Field
 
 __all__ = [
     "WeatherAlertIn",
     "WeatherAlertOut",
     "WeatherAlertsIn",
     "WeatherAlertsOut",
+    "parse_weather_alerts",
 ]
 
+
+def _parse_alert_time(value: str | None) -> dt.datetime | None:
+    """Parse an alert's ISO 8601 `effective`/`expires` string into a UTC datetime.
+
+    Description:
+        Times without an offset are assumed to be UTC. Unparseable values are returned as `None`.
+
+    """
+    if not value:
+        return None
+
+    try:
+        parsed: dt.datetime = dt.datetime.fromisoformat(
+            value.strip().replace("Z", "+00:00")
+        )
+    except ValueError:
+        return None
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=dt.timezone.utc)
+
+    return parsed.astimezone(dt.timezone.utc)
+
+
 class WeatherAlertIn(BaseModel):
     headline: str | None = None
     msgtype: str | None = None
@@ -21,9 +50,33 @@ class WeatherAlertIn(BaseModel):
     note: str | None = None
     effective: str | None = None
     expires: str | None = None
-    description: str | None = None
+    ## WeatherAPI sends the alert body as "desc"
+    description: str | None = Field(
+        default=None, validation_alias=AliasChoices("desc", "description")
+    )
     instruction: str | None = None
 
+    def content_hash(self) -> str:
+        """Return a SHA-256 hex digest of the alert's fields, ignoring surrounding whitespace."""
+        fields: dict = {
+            k: v.strip() if isinstance(v, str) else v
+            for k, v in self.model_dump().items()
+        }
+
+        return hashlib.sha256(
+            json.dumps(fields, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+    def to_row(self) -> dict:
+        """Return column values for a bulk insert, with `effective` & `expires` parsed to UTC datetimes."""
+        row: dict = self.model_dump()
+
+        row["effective"] = _parse_alert_time(self.effective)
+        row["expires"] = _parse_alert_time(self.expires)
+        row["content_hash"] = self.content_hash()
+
+        return row
+
 
 class WeatherAlertOut(WeatherAlertIn):
     id: int
@@ -34,4 +87,22 @@ class WeatherAlertsIn(BaseModel):
 
 
 class WeatherAlertsOut(WeatherAlertsIn):
-    id: int
\ No newline at end of file
+    id: int
+
+
+def parse_weather_alerts(forecast_json: dict) -> list[WeatherAlertIn]:
+    """Parse the `alerts.alert` list of a WeatherAPI forecast response.
+
+    Params:
+        forecast_json (dict): A WeatherAPI forecast response, requested with `alerts=yes`.
+
+    Returns:
+        (list[WeatherAlertIn]): The alerts. Empty if the response has no alerts.
+
+    Raises:
+        (ValidationError): If an alert is malformed.
+
+    """
+    alerts: dict = forecast_json.get("alerts") or {}
+
+    return WeatherAlertsIn.model_validate({"alert": alerts.get("alert") or []}).alert
@@ -2,5 +2,8 @@ from __future__ import annotations
 
 from .cache import *
 from .client import *
+from .coalesce import *
 from .constants import *
 from .controllers import *
+from .ratelimit import *
+from .retry import *
@@ -1,19 +1,44 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+import datetime as dt
+import logging
 from pathlib import Path
 import sqlite3
+import threading
+import time
 import typing as t
 
+log = logging.getLogger(__name__)
+
+from .config import HTTP_SETTINGS
+
 import hishel
 import httpx
 
+try:
+    import anysqlite
+except ImportError:
+    anysqlite = None
+
 __all__ = [
     "get_sqlite_cache_storage",
     "get_file_cache_storage",
     "get_cache_transport",
     "get_cache_controller",
+    "get_async_sqlite_cache_storage",
+    "get_async_file_cache_storage",
+    "get_async_cache_transport",
+    "MemoryCacheTier",
+    "TieredStorage",
+    "AsyncTieredStorage",
+    "get_memory_cache_tier",
 ]
 
+_MEMORY_CACHE_TIER: "MemoryCacheTier | None" = None
+_MEMORY_CACHE_TIER_LOCK: threading.Lock = threading.Lock()
+
+
 def get_sqlite_cache_storage(
     cache_db_path: str = ".cache/http/hishel.sqlite3", ttl=900
 ) -> hishel.SQLiteStorage:
@@ -36,8 +61,11 @@ def get_sqlite_cache_storage(
     if not cache_dir.exists():
         cache_dir.mkdir(parents=True, exist_ok=True)
 
-    ## Get sqlite3 connection to cache database
-    conn: sqlite3.Connection = sqlite3.connect(database=cache_db_path)
+    ## Get sqlite3 connection to cache database. hishel serializes access with its own
+    ## lock, so the connection can be shared by a controller used from many threads
+    conn: sqlite3.Connection = sqlite3.connect(
+        database=cache_db_path, check_same_thread=False
+    )
     ## Create SQLiteStorage object using sqlite3 connection
     storage: hishel.SQLiteStorage = hishel.SQLiteStorage(connection=conn, ttl=ttl)
 
@@ -111,11 +139,9 @@ def get_cache_controller(
 
 
 def get_cache_transport(
-    transport_base: httpx.HTTPTransport = httpx.HTTPTransport(),
-    cache_storage: t.Union[
-        hishel.SQLiteStorage, hishel.FileStorage
-    ] = get_sqlite_cache_storage(),
-    cache_controller: hishel.Controller = get_cache_controller(),
+    transport_base: httpx.BaseTransport | None = None,
+    cache_storage: t.Union[hishel.SQLiteStorage, hishel.FileStorage] | None = None,
+    cache_controller: hishel.Controller | None = None,
 ) -> hishel.CacheTransport:
     """Build & return a hishel.CacheTransport for httpx client.
 
@@ -127,19 +153,396 @@ def get_cache_transport(
         & more.
 
     Params:
-        trasport_base (httpx.HTTPTransport): The base transport object to append a cache storage & controller to.
-        cache_storage (hishel.SQLiteStorage | hishel.FileStorage): The cache storage to use for requests made using a client
-            with this transport mounted.
-        cache_controller (hishel.Controller): The cache controller that handles responses from HTTP requests made using a client
-            with this transport mounted.
+        trasport_base (httpx.BaseTransport | None): The base transport object to append a cache storage & controller to.
+            Defaults to a new `httpx.HTTPTransport()`.
+        cache_storage (hishel.SQLiteStorage | hishel.FileStorage | None): The cache storage to use for requests made using a client
+            with this transport mounted. Defaults to `get_sqlite_cache_storage()`.
+        cache_controller (hishel.Controller | None): The cache controller that handles responses from HTTP requests made using a client
+            with this transport mounted. Defaults to `get_cache_controller()`.
 
     Returns:
         (hishel.CacheTransport): An initialized hishel.CacheTransport HTTP transport.
 
     """
+    ## Build defaults per call; as default arguments they were created (& the cache
+    ## directory written) at import time, and shared by every caller
+    if transport_base is None:
+        transport_base = httpx.HTTPTransport()
+    if cache_storage is None:
+        cache_storage = get_sqlite_cache_storage()
+    if cache_controller is None:
+        cache_controller = get_cache_controller()
+
     ## Build cache transport
     transport: hishel.CacheTransport = hishel.CacheTransport(
         transport=transport_base, storage=cache_storage, controller=cache_controller
     )
 
     return transport
+
+
+async def get_async_sqlite_cache_storage(
+    cache_db_path: str = ".cache/http/hishel.sqlite3", ttl=900
+) -> hishel.AsyncSQLiteStorage:
+    """Get a hishel.AsyncSQLiteStorage cache.
+
+    Description:
+        The async storage needs an `anysqlite` connection, which can only be opened from
+        inside a running event loop, so this function is a coroutine.
+
+    Params:
+        cache_db_path (str): The path where the SQLite database file will be saved.
+        ttl (int): (default: 900) Amount of time, in seconds, for cached items to live.
+
+    Returns:
+        (hishel.AsyncSQLiteStorage): An initialized AsyncSQLiteStorage object.
+
+    Raises:
+        (RuntimeError): When the `anysqlite` package is not installed.
+
+    """
+    if anysqlite is None:
+        raise RuntimeError(
+            "hishel.AsyncSQLiteStorage requires the anysqlite package. Install it with: pip install hishel[sqlite]"
+        )
+
+    ## Ensure database filename ends with a valid SQLite file extension
+    if Path(cache_db_path).suffix not in [".sqlite", ".sqlite3", ".db"]:
+        cache_db_path = f"{cache_db_path}/.sqlite3"
+
+    cache_dir: Path = Path(cache_db_path).parent
+    ## Ensure the cache directory exists
+    if not cache_dir.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    ## Get anysqlite connection to cache database
+    conn: anysqlite.Connection = await anysqlite.connect(
+        cache_db_path, check_same_thread=False
+    )
+    ## Create AsyncSQLiteStorage object using anysqlite connection
+    storage: hishel.AsyncSQLiteStorage = hishel.AsyncSQLiteStorage(
+        connection=conn, ttl=ttl
+    )
+
+    return storage
+
+
+def get_async_file_cache_storage(
+    base_path: str = ".cache/http/hishel", ttl: int = 900, check_ttl_every: float = 60
+) -> hishel.AsyncFileStorage:
+    """Get a hishel.AsyncFileStorage cache.
+
+    Params:
+        base_path (str): The path where file caches will be saved.
+        ttl (int): (default: 900) Amount of time, in seconds, for cached items to live.
+        check_ttl_every (int): (default: 60) Interval in seconds to check cached item ttl.
+
+    Returns:
+        (hishel.AsyncFileStorage): An initialized AsyncFileStorage object.
+
+    """
+    ## Ensure cache directory exists
+    if not Path(base_path).exists():
+        Path(base_path).mkdir(parents=True, exist_ok=True)
+
+    ## Initialize AsyncFileStorage cache
+    storage: hishel.AsyncFileStorage = hishel.AsyncFileStorage(
+        base_path=Path(base_path), ttl=ttl, check_ttl_every=check_ttl_every
+    )
+
+    return storage
+
+
+def get_async_cache_transport(
+    transport_base: httpx.AsyncBaseTransport,
+    cache_storage: t.Union[hishel.AsyncSQLiteStorage, hishel.AsyncFileStorage],
+    cache_controller: hishel.Controller,
+) -> hishel.AsyncCacheTransport:
+    """Build & return a hishel.AsyncCacheTransport for an httpx.AsyncClient.
+
+    Params:
+        transport_base (httpx.AsyncBaseTransport): The base async transport (holding the connection pool)
+            to wrap with a cache storage & controller.
+        cache_storage (hishel.AsyncSQLiteStorage | hishel.AsyncFileStorage): The async cache storage to use.
+        cache_controller (hishel.Controller): The cache controller that handles responses.
+
+    Returns:
+        (hishel.AsyncCacheTransport): An initialized hishel.AsyncCacheTransport HTTP transport.
+
+    """
+    ## Build cache transport
+    transport: hishel.AsyncCacheTransport = hishel.AsyncCacheTransport(
+        transport=transport_base, storage=cache_storage, controller=cache_controller
+    )
+
+    return transport
+
+
+class MemoryCacheTier:
+    """Thread-safe in-process LRU of serialized hishel responses.
+
+    Description:
+        Entries are pickled `(response, request, metadata)` tuples, so the byte limit measures
+        what is actually held in memory. Each entry expires `ttl` seconds after the response
+        was first cached, matching the TTL of the storage behind it.
+
+    Params:
+        max_bytes (int): (default: 32MiB) Evict least recently used entries above this total size.
+        max_entries (int): (default: 512) Evict least recently used entries above this count.
+    """
+
+    def __init__(
+        self, max_bytes: int = 32 * 1024 * 1024, max_entries: int = 512
+    ) -> None:
+        self.max_bytes: int = max_bytes
+        self.max_entries: int = max_entries
+        self.serializer: hishel.PickleSerializer = hishel.PickleSerializer()
+
+        self._lock: threading.Lock = threading.Lock()
+        ## key -> (expires_at, data)
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._bytes: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def metrics(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters & current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _drop(self, key: str) -> None:
+        ## Caller holds self._lock
+        _, data = self._entries.pop(key)
+        self._bytes -= len(data)
+
+    def get(self, key: str) -> tuple | None:
+        """Return the cached `(response, request, metadata)` for `key`, if present & fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, data = entry
+            if expires_at is not None and expires_at < time.time():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return self.serializer.loads(data)
+
+    def put(
+        self, key: str, response, request, metadata, ttl: float | None = None
+    ) -> None:
+        """Cache a response. Entries larger than `max_bytes` are not kept."""
+        data: bytes = self.serializer.dumps(
+            response=response, request=request, metadata=metadata
+        )
+
+        expires_at: float | None = None
+        if ttl is not None:
+            created_at = metadata.get("created_at") if metadata else None
+            expires_at = (created_at.timestamp() if created_at else time.time()) + ttl
+
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+            self._entries[key] = (expires_at, data)
+            self._bytes += len(data)
+
+            while self._entries and (
+                self._bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                oldest: str = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _new_metadata(key: str) -> dict:
+    """Build the metadata hishel attaches to a newly stored response."""
+    return dict(
+        cache_key=key,
+        created_at=dt.datetime.now(dt.timezone.utc),
+        number_of_uses=0,
+    )
+
+
+def _response_cache_key(key) -> str:
+    """Resolve a hishel `remove()` key, which may be a response carrying its cache key."""
+    if isinstance(key, str):
+        return key
+
+    return key.extensions["cache_metadata"]["cache_key"]
+
+
+class TieredStorage(hishel.BaseStorage):
+    """hishel storage serving lookups from a `MemoryCacheTier` before a persistent storage.
+
+    Description:
+        Writes go to both tiers. Reads check memory first and fall back to the backend,
+        copying backend hits into memory. Use-count metadata updates on a memory hit are
+        kept in memory only, so a hit does not cost a disk write.
+
+    Params:
+        backend (hishel.BaseStorage): The persistent storage, i.e. `hishel.SQLiteStorage` or `hishel.FileStorage`.
+        memory (MemoryCacheTier): The in-memory tier. May be shared between storages.
+        ttl (float | None): Lifetime of cached responses. Defaults to the backend's TTL.
+    """
+
+    def __init__(
+        self,
+        backend: hishel.BaseStorage,
+        memory: MemoryCacheTier,
+        ttl: float | None = None,
+    ) -> None:
+        super().__init__(ttl=ttl if ttl is not None else getattr(backend, "_ttl", None))
+
+        self.backend: hishel.BaseStorage = backend
+        self.memory: MemoryCacheTier = memory
+
+    def store(self, key: str, response, request, metadata=None) -> None:
+        metadata = metadata or _new_metadata(key)
+
+        self.backend.store(key, response, request, metadata)
+        self.memory.put(key, response, request, metadata, ttl=self._ttl)
+
+    def remove(self, key) -> None:
+        self.memory.remove(_response_cache_key(key))
+        self.backend.remove(key)
+
+    def update_metadata(self, key: str, response, request, metadata) -> None:
+        if self.memory.contains(key):
+            self.memory.put(key, response, request, metadata, ttl=self._ttl)
+        else:
+            self.backend.update_metadata(key, response, request, metadata)
+
+    def retrieve(self, key: str):
+        stored = self.memory.get(key)
+        if stored is not None:
+            return stored
+
+        stored = self.backend.retrieve(key)
+        if stored is not None:
+            response, request, metadata = stored
+            self.memory.put(key, response, request, metadata, ttl=self._ttl)
+
+        return stored
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+class AsyncTieredStorage(hishel.AsyncBaseStorage):
+    """Async counterpart of `TieredStorage`, backed by an async hishel storage.
+
+    Params:
+        backend (hishel.AsyncBaseStorage): The persistent storage, i.e. `hishel.AsyncSQLiteStorage`.
+        memory (MemoryCacheTier): The in-memory tier. May be shared with sync storages.
+        ttl (float | None): Lifetime of cached responses. Defaults to the backend's TTL.
+    """
+
+    def __init__(
+        self,
+        backend: hishel.AsyncBaseStorage,
+        memory: MemoryCacheTier,
+        ttl: float | None = None,
+    ) -> None:
+        super().__init__(ttl=ttl if ttl is not None else getattr(backend, "_ttl", None))
+
+        self.backend: hishel.AsyncBaseStorage = backend
+        self.memory: MemoryCacheTier = memory
+
+    async def store(self, key: str, response, request, metadata=None) -> None:
+        metadata = metadata or _new_metadata(key)
+
+        await self.backend.store(key, response, request, metadata)
+        self.memory.put(key, response, request, metadata, ttl=self._ttl)
+
+    async def remove(self, key) -> None:
+        self.memory.remove(_response_cache_key(key))
+        await self.backend.remove(key)
+
+    async def update_metadata(self, key: str, response, request, metadata) -> None:
+        if self.memory.contains(key):
+            self.memory.put(key, response, request, metadata, ttl=self._ttl)
+        else:
+            await self.backend.update_metadata(key, response, request, metadata)
+
+    async def retrieve(self, key: str):
+        stored = self.memory.get(key)
+        if stored is not None:
+            return stored
+
+        stored = await self.backend.retrieve(key)
+        if stored is not None:
+            response, request, metadata = stored
+            self.memory.put(key, response, request, metadata, ttl=self._ttl)
+
+        return stored
+
+    async def aclose(self) -> None:
+        await self.backend.aclose()
+
+
+def get_memory_cache_tier() -> MemoryCacheTier | None:
+    """Return the process-wide MemoryCacheTier configured in `[http]` settings.
+
+    Description:
+        Reads `cache_memory_tier` (default: True), `cache_memory_max_bytes` &
+        `cache_memory_max_entries`. Returns `None` when the memory tier is disabled.
+    """
+    global _MEMORY_CACHE_TIER
+
+    if not HTTP_SETTINGS.get("CACHE_MEMORY_TIER", True):
+        return None
+
+    with _MEMORY_CACHE_TIER_LOCK:
+        if _MEMORY_CACHE_TIER is None:
+            _MEMORY_CACHE_TIER = MemoryCacheTier(
+                max_bytes=HTTP_SETTINGS.get("CACHE_MEMORY_MAX_BYTES", 32 * 1024 * 1024),
+                max_entries=HTTP_SETTINGS.get("CACHE_MEMORY_MAX_ENTRIES", 512),
+            )
+
+        return _MEMORY_CACHE_TIER
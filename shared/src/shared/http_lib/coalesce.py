@@ -0,0 +1,307 @@
+"""Request coalescing (single-flight) & a short-lived in-memory response cache.
+
+Description:
+    When several jobs ask for the same resource at the same moment (i.e. the current weather
+    and forecast jobs, Temporal activities & CLI runs all firing on the same cron minute),
+    only one request goes upstream. Concurrent identical requests wait for the in-flight one
+    and receive a copy of its response, and successful responses are kept in memory for a few
+    seconds so requests arriving just after it finishes are answered without a network call
+    or a hishel storage lookup.
+
+    Requests are keyed by method, URL & query params, minus credentials like `key`, so two
+    callers using different API keys still share a response.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+import threading
+import time
+import typing as t
+
+log = logging.getLogger(__name__)
+
+from .config import HTTP_SETTINGS
+
+import httpx
+
+__all__ = [
+    "request_key",
+    "RequestCoalescer",
+    "get_request_coalescer",
+]
+
+## Query params left out of the coalescing key
+EXCLUDED_PARAMS: frozenset[str] = frozenset({"key", "api_key", "apikey", "token"})
+## Only side-effect free requests are coalesced
+COALESCE_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+## Headers describing the wire encoding, which no longer applies to a decoded copy
+_ENCODING_HEADERS: frozenset[str] = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+_COALESCER: "RequestCoalescer | None" = None
+_COALESCER_LOCK: threading.Lock = threading.Lock()
+
+
+def request_key(
+    request: httpx.Request, exclude_params: t.Iterable[str] = EXCLUDED_PARAMS
+) -> str:
+    """Build a normalized key for a request.
+
+    Params:
+        request (httpx.Request): The request to key.
+        exclude_params (Iterable[str]): Query params (case-insensitive) to leave out of the key.
+
+    Returns:
+        (str): `METHOD scheme://host:port/path?sorted&params`.
+
+    """
+    exclude: set[str] = {p.lower() for p in exclude_params}
+    url: httpx.URL = request.url
+
+    params: list[tuple[str, str]] = sorted(
+        (k, v) for k, v in url.params.multi_items() if k.lower() not in exclude
+    )
+    query: str = "&".join(f"{k}={v}" for k, v in params)
+
+    return f"{request.method.upper()} {url.scheme}://{url.host}:{url.port or ''}{url.path}?{query}"
+
+
+def _copy_response(response: httpx.Response, request: httpx.Request) -> httpx.Response:
+    """Return a new, already-read response with the same status, headers & body."""
+    headers: list[tuple[str, str]] = [
+        (k, v)
+        for k, v in response.headers.multi_items()
+        if k.lower() not in _ENCODING_HEADERS
+    ]
+
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=headers,
+        content=response.content,
+        request=request,
+        extensions={
+            "http_version": response.extensions.get("http_version", b"HTTP/1.1")
+        },
+    )
+
+
+class _InFlight:
+    """A request being sent by one thread, waited on by others."""
+
+    def __init__(self) -> None:
+        self.done: threading.Event = threading.Event()
+        self.response: httpx.Response | None = None
+        self.exc: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Thread- & asyncio-safe single-flight layer with a short TTL response cache.
+
+    Params:
+        ttl (float): (default: 5) Seconds a successful response is served from memory. `0` disables the cache.
+        max_entries (int): (default: 256) Maximum cached responses; least recently used are dropped first.
+        exclude_params (Iterable[str] | None): Query params left out of the key. Defaults to API key params.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5,
+        max_entries: int = 256,
+        exclude_params: t.Iterable[str] | None = None,
+    ) -> None:
+        self.ttl: float = ttl
+        self.max_entries: int = max_entries
+        self.exclude_params: frozenset[str] = (
+            frozenset(exclude_params) if exclude_params is not None else EXCLUDED_PARAMS
+        )
+
+        self._lock: threading.Lock = threading.Lock()
+        ## key -> (expires_at, response)
+        self._cache: OrderedDict[str, tuple[float, httpx.Response]] = OrderedDict()
+        self._in_flight: dict[str, _InFlight] = {}
+        ## (loop id, key) -> future resolved with the leader's response
+        self._in_flight_async: dict[tuple[int, str], asyncio.Future] = {}
+
+        self.sent: int = 0
+        self.coalesced: int = 0
+        self.cache_hits: int = 0
+
+    def metrics(self) -> dict[str, int]:
+        """Return counts of upstream sends, coalesced waits & TTL cache hits."""
+        with self._lock:
+            return {
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+                "cache_hits": self.cache_hits,
+                "cached": len(self._cache),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._cache.clear()
+
+    def _cache_get(self, key: str) -> httpx.Response | None:
+        ## Caller holds self._lock
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+
+        return response
+
+    def _cache_put(self, key: str, response: httpx.Response) -> None:
+        if self.ttl <= 0 or not response.is_success:
+            return
+
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, response)
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def send(
+        self,
+        send: t.Callable[[httpx.Request], httpx.Response],
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Send `request` with `send`, sharing the response with identical concurrent requests.
+
+        Params:
+            send (Callable[[httpx.Request], httpx.Response]): Sends the request upstream.
+            request (httpx.Request): The request to send.
+
+        Returns:
+            (httpx.Response): The response, or a copy of the response to an identical request.
+
+        """
+        if request.method.upper() not in COALESCE_METHODS:
+            return send(request)
+
+        key: str = request_key(request, self.exclude_params)
+
+        with self._lock:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return _copy_response(cached, request)
+
+            in_flight: _InFlight | None = self._in_flight.get(key)
+            leader: bool = in_flight is None
+            if leader:
+                in_flight = _InFlight()
+                self._in_flight[key] = in_flight
+                self.sent += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            log.debug(f"Waiting on in-flight request: {key}")
+            in_flight.done.wait()
+
+            if in_flight.exc is not None:
+                raise in_flight.exc
+
+            return _copy_response(in_flight.response, request)
+
+        try:
+            response: httpx.Response = send(request)
+            ## Make sure the body is available to waiting callers
+            response.read()
+            in_flight.response = response
+        except BaseException as exc:
+            in_flight.exc = exc
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.done.set()
+
+        self._cache_put(key, response)
+
+        return response
+
+    async def send_async(
+        self,
+        send: t.Callable[[httpx.Request], t.Awaitable[httpx.Response]],
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Async counterpart of `send()`. Requests are coalesced within one event loop."""
+        if request.method.upper() not in COALESCE_METHODS:
+            return await send(request)
+
+        key: str = request_key(request, self.exclude_params)
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        flight_key: tuple[int, str] = (id(loop), key)
+
+        with self._lock:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return _copy_response(cached, request)
+
+            future: asyncio.Future | None = self._in_flight_async.get(flight_key)
+            leader: bool = future is None
+            if leader:
+                future = loop.create_future()
+                self._in_flight_async[flight_key] = future
+                self.sent += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            log.debug(f"Waiting on in-flight request: {key}")
+            ## shield() so one cancelled waiter does not cancel the shared result
+            response: httpx.Response = await asyncio.shield(future)
+
+            return _copy_response(response, request)
+
+        try:
+            response = await send(request)
+            await response.aread()
+            future.set_result(response)
+        except BaseException as exc:
+            future.set_exception(exc)
+            ## Mark retrieved so an unawaited future does not log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                self._in_flight_async.pop(flight_key, None)
+
+        self._cache_put(key, response)
+
+        return response
+
+
+def get_request_coalescer() -> RequestCoalescer | None:
+    """Return the process-wide RequestCoalescer configured in `[http]` settings.
+
+    Description:
+        Reads `coalesce_requests` (default: True), `coalesce_ttl` & `coalesce_max_entries`.
+        Returns `None` when coalescing is disabled.
+    """
+    global _COALESCER
+
+    if not HTTP_SETTINGS.get("COALESCE_REQUESTS", True):
+        return None
+
+    with _COALESCER_LOCK:
+        if _COALESCER is None:
+            _COALESCER = RequestCoalescer(
+                ttl=HTTP_SETTINGS.get("COALESCE_TTL", 5),
+                max_entries=HTTP_SETTINGS.get("COALESCE_MAX_ENTRIES", 256),
+            )
+
+        return _COALESCER
@@ -1,22 +1,39 @@
 from __future__ import annotations
 
-from contextlib import AbstractContextManager, contextmanager
+import asyncio
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    contextmanager,
+)
+import importlib.util
 import json
 import logging
 from pathlib import Path
+import threading
 import typing as t
 
 log = logging.getLogger(__name__)
 
 from . import cache
+from .coalesce import RequestCoalescer, get_request_coalescer
 from .config import HTTP_SETTINGS
+from .ratelimit import (
+    AsyncRateLimitedTransport,
+    RateLimitedTransport,
+    RateLimiter,
+    get_rate_limiter,
+)
+from .retry import RetryPolicy, get_retry_policy
 
 import hishel
 import httpx
 
 __all__ = [
     "get_http_controller",
+    "get_async_http_controller",
     "HttpxController",
+    "AsyncHttpxController",
     "merge_headers",
 ]
 
@@ -60,6 +77,15 @@ def get_http_controller(
     cacheable_status_codes: list[int] | None = None,
     cache_allow_heuristics: bool = True,
     cache_allow_stale: bool = False,
+    max_connections: int | None = 100,
+    max_keepalive_connections: int | None = 20,
+    keepalive_expiry: float | None = 5.0,
+    timeout: float | None = None,
+    persistent: bool = False,
+    rate_limiter: RateLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    coalescer: RequestCoalescer | None = None,
+    memory_cache: cache.MemoryCacheTier | None = None,
 ) -> HttpxController:
     """Return an initialized HttpxController class object.
 
@@ -90,6 +116,18 @@ def get_http_controller(
         cache_allow_heuristics (bool): (default: True) Use heuristics to match objects in cache, improves performance &
             reliability of caching new objects.
         cache_allow_stale (bool): (default: False) When `True`, allow stale/expired responses from cache.
+        max_connections (int | None): (default: 100) Maximum number of concurrent connections.
+        max_keepalive_connections (int | None): (default: 20) Maximum number of idle connections kept in the pool.
+        keepalive_expiry (float | None): (default: 5.0) Seconds an idle connection is kept in the pool.
+        timeout (float | None): Request timeout in seconds. When `None`, httpx's default timeout is used.
+        persistent (bool): (default: False) Keep the client open until `close()` is called.
+        rate_limiter (RateLimiter | None): Limiter applied to requests sent upstream. Defaults to the
+            process-wide limiter from `[http]` settings, if one is configured.
+        retry_policy (RetryPolicy | None): Retry policy for requests. Defaults to `get_retry_policy()`.
+        coalescer (RequestCoalescer | None): Single-flight layer for requests. Defaults to
+            `get_request_coalescer()`.
+        memory_cache (MemoryCacheTier | None): In-memory tier in front of the cache storage.
+            Defaults to `get_memory_cache_tier()`.
 
     Returns:
         (HttpxController): Initialized HttpxController object to use for requests.
@@ -110,6 +148,23 @@ def get_http_controller(
             cacheable_status_codes=cacheable_status_codes,
             cache_allow_heuristics=cache_allow_heuristics,
             cache_allow_stale=cache_allow_stale,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            timeout=timeout,
+            persistent=persistent,
+            rate_limiter=rate_limiter
+            if rate_limiter is not None
+            else get_rate_limiter(),
+            retry_policy=retry_policy
+            if retry_policy is not None
+            else get_retry_policy(),
+            coalescer=coalescer if coalescer is not None else get_request_coalescer(),
+            memory_cache=(
+                memory_cache
+                if memory_cache is not None
+                else cache.get_memory_cache_tier()
+            ),
         )
 
         return http_ctl
@@ -120,6 +175,110 @@ def get_http_controller(
         raise exc
 
 
+def get_async_http_controller(
+    use_cache: bool = True,
+    force_cache: bool = True,
+    follow_redirects: bool = False,
+    cache_type: str = HTTP_SETTINGS.get("CACHE_TYPE", default="sqlite"),
+    cache_file_dir: str = HTTP_SETTINGS.get(
+        "CACHE_FILE_DIR", default=".cache/http/hishel"
+    ),
+    cache_db_file: str = HTTP_SETTINGS.get(
+        "CACHE_DB_FILE", default=".cache/http/hishel.sqlite3"
+    ),
+    cache_ttl: int | None = HTTP_SETTINGS.get("CACHE_TTL", default=900),
+    check_ttl_every: float | None = HTTP_SETTINGS.get(
+        "CACHE_CHECK_TTL_EVERY", default=60
+    ),
+    cacheable_methods: list[str] | None = None,
+    cacheable_status_codes: list[int] | None = None,
+    cache_allow_heuristics: bool = True,
+    cache_allow_stale: bool = False,
+    max_connections: int | None = HTTP_SETTINGS.get("MAX_CONNECTIONS", default=100),
+    max_keepalive_connections: int | None = HTTP_SETTINGS.get(
+        "MAX_KEEPALIVE_CONNECTIONS", default=20
+    ),
+    keepalive_expiry: float | None = HTTP_SETTINGS.get("KEEPALIVE_EXPIRY", default=5.0),
+    http2: bool = HTTP_SETTINGS.get("HTTP2", default=False),
+    timeout: float | None = HTTP_SETTINGS.get("TIMEOUT", default=None),
+    persistent: bool = False,
+    rate_limiter: RateLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    coalescer: RequestCoalescer | None = None,
+    memory_cache: cache.MemoryCacheTier | None = None,
+) -> AsyncHttpxController:
+    """Return an initialized AsyncHttpxController class object.
+
+    Description:
+        Async counterpart of `get_http_controller()`. Accepts the same cache options, plus
+        connection pool limits, HTTP/2, and a `persistent` flag that keeps the client open
+        between `async with` blocks so it can be shared by many jobs.
+
+    Params:
+        max_connections (int | None): (default: 100) Maximum number of concurrent connections.
+        max_keepalive_connections (int | None): (default: 20) Maximum number of idle connections kept in the pool.
+        keepalive_expiry (float | None): (default: 5.0) Seconds an idle connection is kept in the pool.
+        http2 (bool): (default: False) Enable HTTP/2. Requires the `h2` package (`pip install httpx[http2]`).
+        timeout (float | None): Request timeout in seconds. When `None`, httpx's default timeout is used.
+        persistent (bool): (default: False) When `True`, leaving an `async with` block does not close
+            the client. Call `await controller.aclose()` on shutdown.
+        rate_limiter (RateLimiter | None): Limiter applied to requests sent upstream. Defaults to the
+            process-wide limiter from `[http]` settings, if one is configured.
+        retry_policy (RetryPolicy | None): Retry policy for requests. Defaults to `get_retry_policy()`.
+        coalescer (RequestCoalescer | None): Single-flight layer for requests. Defaults to
+            `get_request_coalescer()`.
+        memory_cache (MemoryCacheTier | None): In-memory tier in front of the cache storage.
+            Defaults to `get_memory_cache_tier()`.
+
+        See `get_http_controller()` for the cache params.
+
+    Returns:
+        (AsyncHttpxController): Initialized AsyncHttpxController object to use for requests.
+
+    """
+    ## Build AsyncHttpxController object
+    try:
+        http_ctl: AsyncHttpxController = AsyncHttpxController(
+            use_cache=use_cache,
+            force_cache=force_cache,
+            follow_redirects=follow_redirects,
+            cache_type=cache_type,
+            cache_file_dir=cache_file_dir,
+            cache_db_file=cache_db_file,
+            cache_ttl=cache_ttl,
+            check_ttl_every=check_ttl_every,
+            cacheable_methods=cacheable_methods,
+            cacheable_status_codes=cacheable_status_codes,
+            cache_allow_heuristics=cache_allow_heuristics,
+            cache_allow_stale=cache_allow_stale,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            timeout=timeout,
+            persistent=persistent,
+            rate_limiter=rate_limiter
+            if rate_limiter is not None
+            else get_rate_limiter(),
+            retry_policy=retry_policy
+            if retry_policy is not None
+            else get_retry_policy(),
+            coalescer=coalescer if coalescer is not None else get_request_coalescer(),
+            memory_cache=(
+                memory_cache
+                if memory_cache is not None
+                else cache.get_memory_cache_tier()
+            ),
+        )
+
+        return http_ctl
+    except Exception as exc:
+        msg = f"({type(exc)}) Error initializing AsyncHttpxController. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+
 def merge_headers(header_dicts: list[t.Union[str, dict]] | None = []) -> dict:
     """Merge multiple header dicts/JSON strings into a single header.
 
@@ -167,6 +326,12 @@ class HttpxController(AbstractContextManager):
         The controller class offers a convenient interface for a number of http_lib backend
         functionality.
 
+        The client, its connection pool & the cache storage are built lazily on first use, then
+        reused until the outermost `with` block exits. With `persistent=True` they stay open until
+        `close()` is called, so one controller can be created at startup & injected into every
+        job, reusing keep-alive connections. Opening & closing are thread-safe, and the
+        underlying httpx.Client may be shared between threads.
+
     Params:
         use_cache (bool): (default: True) When `False`, cache will not be used if it is
             configured for the controller.
@@ -186,6 +351,19 @@ class HttpxController(AbstractContextManager):
         cache_allow_heuristics (bool): (default: True) Use heuristics to match objects in cache, improves performance &
             reliability of caching new objects.
         cache_allow_stale (bool): (default: False) When `True`, allow stale/expired responses from cache.
+        max_connections (int | None): (default: 100) Maximum number of concurrent connections.
+        max_keepalive_connections (int | None): (default: 20) Maximum number of idle connections kept in the pool.
+        keepalive_expiry (float | None): (default: 5.0) Seconds an idle connection is kept in the pool.
+        timeout (float | None): Request timeout in seconds. When `None`, httpx's default timeout is used.
+        persistent (bool): (default: False) Keep the client open after the outermost `with` exits.
+        rate_limiter (RateLimiter | None): When set, requests that miss the cache wait for the limiter
+            before sending, and raise `QuotaExceededError` if the monthly quota is spent.
+        retry_policy (RetryPolicy | None): When set, `send_request()` retries timeouts & retryable
+            responses with exponential backoff.
+        coalescer (RequestCoalescer | None): When set, identical concurrent GET requests share one
+            upstream request, and recent responses are served from memory.
+        memory_cache (MemoryCacheTier | None): When set, the hishel storage is fronted by this
+            in-memory LRU tier.
     """
 
     def __init__(
@@ -211,11 +389,20 @@ class HttpxController(AbstractContextManager):
         cacheable_status_codes: list[int] | None = [200, 201, 202, 301, 308],
         cache_allow_heuristics: bool = True,
         cache_allow_stale: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        timeout: float | None = None,
+        persistent: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        coalescer: RequestCoalescer | None = None,
+        memory_cache: cache.MemoryCacheTier | None = None,
     ) -> None:
         self.use_cache: bool = use_cache
         self.force_cache: bool = force_cache
         self.follow_redirects: bool = follow_redirects
-        self.cache_type: str | None = cache_type.lower()
+        self.cache_type: str | None = cache_type.lower() if cache_type else None
         self.cache_file_dir: str | None = cache_file_dir
         self.cache_db_file: str = cache_db_file
         self.cache_ttl: int | None = cache_ttl
@@ -224,6 +411,15 @@ class HttpxController(AbstractContextManager):
         self.cacheable_status_codes: list[int] | None = cacheable_status_codes
         self.cache_allow_heuristics: bool = cache_allow_heuristics
         self.cache_allow_stale: bool = cache_allow_stale
+        self.max_connections: int | None = max_connections
+        self.max_keepalive_connections: int | None = max_keepalive_connections
+        self.keepalive_expiry: float | None = keepalive_expiry
+        self.timeout: float | None = timeout
+        self.persistent: bool = persistent
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.coalescer: RequestCoalescer | None = coalescer
+        self.memory_cache: cache.MemoryCacheTier | None = memory_cache
 
         ## Placeholder for initialized httpx.Client
         self.client: httpx.Client | None = None
@@ -234,33 +430,66 @@ class HttpxController(AbstractContextManager):
         ## Placeholder for hishel cache transport object
         self.cache_transport: hishel.CacheTransport | None = None
 
+        ## Number of active 'with' blocks, across threads
+        self._depth: int = 0
+        ## Guards client creation/teardown when many threads open the controller at once
+        self._lock: threading.RLock = threading.RLock()
+
         ## Class logger
         self.logger: logging.Logger = log.getChild("HttpxController")
 
-    def __enter__(self) -> t.Self:
-        if self.use_cache:
-            ## If cache is enabled, build cache from class params
-            cache: hishel.SQLiteStorage | hishel.FileStorage | None = self._get_cache()
-            transport: hishel.CacheTransport = self._get_cache_transport()
-            controller: hishel.Controller = self._get_cache_controller()
-        else:
-            ## Set all cache objects to None to disable
-            cache = None
-            transport = None
-            controller = None
+    @property
+    def is_open(self) -> bool:
+        """`True` when the controller has an open client."""
+        return self.client is not None and not self.client.is_closed
+
+    def open(self) -> t.Self:
+        """Build the cache, transport & client if they are not already open."""
+        with self._lock:
+            if self.is_open:
+                return self
+
+            if self.use_cache:
+                ## If cache is enabled, build cache from class params
+                self.cache = self._get_cache()
+                self.cache_controller = self._get_cache_controller()
+                self.cache_transport = self._get_cache_transport()
+            else:
+                ## Set all cache objects to None to disable
+                self.cache = None
+                self.cache_controller = None
+                self.cache_transport = None
+
+            ## Initialize httpx Client
+            self.client = self._get_client()
+
+        return self
+
+    def close(self) -> None:
+        """Close the client, its connection pool, and the cache storage."""
+        with self._lock:
+            if self.client is not None:
+                ## Closing the client closes the mounted transport & its cache storage
+                self.client.close()
 
-        self.cache = cache
-        self.cache_transport = transport
-        self.cache_controller = controller
+            self.client = None
+            self.cache = None
+            self.cache_controller = None
+            self.cache_transport = None
 
-        ## Initialize httpx Client
-        self.client: httpx.Client = self._get_client()
+    def __enter__(self) -> t.Self:
+        with self._lock:
+            self.open()
+            self._depth += 1
 
         return self
 
     def __exit__(self, exc_type, exc_val, traceback) -> t.Literal[False] | None:
-        if self.client:
-            self.client.close()
+        with self._lock:
+            self._depth = max(self._depth - 1, 0)
+
+            if self._depth == 0 and not self.persistent:
+                self.close()
 
         if exc_val:
             msg = f"({exc_type}) {exc_val}"
@@ -296,6 +525,10 @@ class HttpxController(AbstractContextManager):
 
                 return None
 
+        if self.memory_cache is not None:
+            ## Serve repeated lookups from memory before touching the storage
+            return cache.TieredStorage(backend=_cache, memory=self.memory_cache)
+
         return _cache
 
     def _get_cache_controller(self) -> hishel.Controller:
@@ -310,52 +543,420 @@ class HttpxController(AbstractContextManager):
 
         return _controller
 
-    def _get_cache_transport(self) -> hishel.CacheTransport:
-        """Initialize hishel cache transport from class params."""
-        if self.cache is None:
-            cache_storage: hishel.SQLiteStorage | hishel.FileStorage | None = (
-                self._get_cache()
+    def _get_base_transport(self) -> httpx.BaseTransport:
+        """Return the pooled httpx.HTTPTransport built from the connection limits.
+
+        Description:
+            With a rate limiter, the transport is wrapped in a `RateLimitedTransport`. The cache
+            transport sits on top of it, so cache hits are not limited or counted.
+        """
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        transport: httpx.HTTPTransport = httpx.HTTPTransport(limits=limits)
+
+        if self.rate_limiter is not None:
+            return RateLimitedTransport(
+                transport=transport, rate_limiter=self.rate_limiter
             )
-            self.cache = cache_storage
 
-        if self.cache_controller is None:
-            cache_controller: hishel.Controller = self._get_cache_controller()
-            self.cache_controller = cache_controller
+        return transport
+
+    def _get_cache_transport(self) -> hishel.CacheTransport | None:
+        """Initialize hishel cache transport from class params."""
+        if self.cache is None:
+            return None
 
         _transport: hishel.CacheTransport = cache.get_cache_transport(
-            cache_storage=self.cache, cache_controller=self.cache_controller
+            transport_base=self._get_base_transport(),
+            cache_storage=self.cache,
+            cache_controller=self.cache_controller,
         )
 
-        self.cache_transport = _transport
-
         return _transport
 
     def _get_client(self) -> httpx.Client:
         """Return an httpx.Client object initialized from class parameters."""
-        transport: hishel.CacheTransport | None = self.cache_transport
-        client = httpx.Client(
-            transport=transport, follow_redirects=self.follow_redirects
+        transport: hishel.CacheTransport | httpx.HTTPTransport = (
+            self.cache_transport or self._get_base_transport()
         )
 
+        client_kwargs: dict[str, t.Any] = {
+            "transport": transport,
+            "follow_redirects": self.follow_redirects,
+        }
+        if self.timeout is not None:
+            client_kwargs["timeout"] = self.timeout
+
+        client = httpx.Client(**client_kwargs)
+
         return client
 
-    def send_request(self, request: httpx.Request) -> httpx.Response:
-        """Send an httpx.Request either using an existing client (inside 'with' block),
-        or by creating a temporary client (outside 'with').
+    def send_request(
+        self, request: httpx.Request, retry_policy: RetryPolicy | None = None
+    ) -> httpx.Response:
+        """Send an httpx.Request either using the open client (inside 'with' block, or a
+        persistent controller), or by creating a temporary client.
 
         Params:
             request (httpx.Request): The HTTP request to send.
+            retry_policy (RetryPolicy | None): Override the controller's retry policy for this request.
 
         Returns:
             httpx.Response: The HTTP response.
 
         """
-        if self.client is None:
+        if not self.is_open:
             ## Not inside 'with' context: create client temporarily
             with self:
-                response = self.client.send(request)
+                response = self._send(request, retry_policy)
 
             return response
         else:
             ## Inside 'with' context, use existing client
-            return self.client.send(request)
+            return self._send(request, retry_policy)
+
+    def _send(
+        self, request: httpx.Request, retry_policy: RetryPolicy | None = None
+    ) -> httpx.Response:
+        """Send through the coalescer, if one is set."""
+        if self.coalescer is not None:
+            return self.coalescer.send(
+                lambda req: self._send_retrying(req, retry_policy), request
+            )
+
+        return self._send_retrying(request, retry_policy)
+
+    def _send_retrying(
+        self, request: httpx.Request, retry_policy: RetryPolicy | None = None
+    ) -> httpx.Response:
+        """Send through the retry policy, if one is set."""
+        retry_policy = retry_policy or self.retry_policy
+        if retry_policy is not None:
+            return retry_policy.send(self._send_once, request)
+
+        return self._send_once(request)
+
+    def _send_once(self, request: httpx.Request) -> httpx.Response:
+        """Send a single attempt. The rate limiter, if any, is applied by the transport."""
+        return self.client.send(request)
+
+
+class AsyncHttpxController(AbstractAsyncContextManager):
+    """Controller for a long-lived httpx.AsyncClient with optional hishel async cache storage.
+
+    Description:
+        Async counterpart of `HttpxController`. The client, its connection pool, and the cache
+        storage are built once on first use (`open()` or `async with`), then shared by every
+        request sent through the controller, so many coroutines on one event loop can reuse
+        the same pooled (optionally HTTP/2) connections.
+
+        Entering the controller is re-entrant. The client is closed when the outermost
+        `async with` block exits, unless `persistent=True`, in which case it stays open
+        until `aclose()` is called.
+
+    Params:
+        max_connections (int | None): (default: 100) Maximum number of concurrent connections.
+        max_keepalive_connections (int | None): (default: 20) Maximum number of idle connections kept in the pool.
+        keepalive_expiry (float | None): (default: 5.0) Seconds an idle connection is kept in the pool.
+        http2 (bool): (default: False) Enable HTTP/2. Falls back to HTTP/1.1 if the `h2` package is missing.
+        timeout (float | None): Request timeout in seconds. When `None`, httpx's default timeout is used.
+        persistent (bool): (default: False) Keep the client open after the outermost `async with` exits.
+        rate_limiter (RateLimiter | None): When set, requests that miss the cache await the limiter before sending.
+        retry_policy (RetryPolicy | None): When set, `send_request()` retries timeouts & retryable
+            responses with exponential backoff, sleeping on the event loop.
+        coalescer (RequestCoalescer | None): When set, identical concurrent GET requests share one
+            upstream request, and recent responses are served from memory.
+        memory_cache (MemoryCacheTier | None): When set, the hishel storage is fronted by this
+            in-memory LRU tier.
+
+        See `HttpxController` for the cache params.
+    """
+
+    def __init__(
+        self,
+        use_cache: bool = True,
+        force_cache: bool = True,
+        follow_redirects: bool = False,
+        cache_type: str | None = "sqlite",
+        cache_file_dir: str | None = ".cache/http/hishel",
+        cache_db_file: str = ".cache/http/hishel.sqlite3",
+        cache_ttl: int | None = 900,
+        check_ttl_every: float | None = 60,
+        cacheable_methods: list[str] | None = ["GET", "HEAD"],
+        cacheable_status_codes: list[int] | None = [200, 201, 202, 301, 308],
+        cache_allow_heuristics: bool = True,
+        cache_allow_stale: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        timeout: float | None = None,
+        persistent: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        coalescer: RequestCoalescer | None = None,
+        memory_cache: cache.MemoryCacheTier | None = None,
+    ) -> None:
+        self.use_cache: bool = use_cache
+        self.force_cache: bool = force_cache
+        self.follow_redirects: bool = follow_redirects
+        self.cache_type: str | None = cache_type.lower() if cache_type else None
+        self.cache_file_dir: str | None = cache_file_dir
+        self.cache_db_file: str = cache_db_file
+        self.cache_ttl: int | None = cache_ttl
+        self.check_ttl_every: float | None = check_ttl_every
+        self.cacheable_methods: list[str] | None = cacheable_methods
+        self.cacheable_status_codes: list[int] | None = cacheable_status_codes
+        self.cache_allow_heuristics: bool = cache_allow_heuristics
+        self.cache_allow_stale: bool = cache_allow_stale
+        self.max_connections: int | None = max_connections
+        self.max_keepalive_connections: int | None = max_keepalive_connections
+        self.keepalive_expiry: float | None = keepalive_expiry
+        self.http2: bool = http2
+        self.timeout: float | None = timeout
+        self.persistent: bool = persistent
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.retry_policy: RetryPolicy | None = retry_policy
+        self.coalescer: RequestCoalescer | None = coalescer
+        self.memory_cache: cache.MemoryCacheTier | None = memory_cache
+
+        ## Placeholder for initialized httpx.AsyncClient
+        self.client: httpx.AsyncClient | None = None
+        ## Placeholder for hishel async cache storage object
+        self.cache: (
+            t.Union[hishel.AsyncSQLiteStorage, hishel.AsyncFileStorage] | None
+        ) = None
+        ## Placeholder for hishel cache controller object
+        self.cache_controller: hishel.Controller | None = None
+        ## Placeholder for hishel async cache transport object
+        self.cache_transport: hishel.AsyncCacheTransport | None = None
+
+        ## Number of active 'async with' blocks
+        self._depth: int = 0
+        ## Guards client creation/teardown when many coroutines open the controller at once
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+        ## Class logger
+        self.logger: logging.Logger = log.getChild("AsyncHttpxController")
+
+    @property
+    def is_open(self) -> bool:
+        """`True` when the controller has an open client."""
+        return self.client is not None and not self.client.is_closed
+
+    async def open(self) -> t.Self:
+        """Build the cache, transport & client if they are not already open."""
+        async with self._lock:
+            if self.is_open:
+                return self
+
+            if self.use_cache:
+                ## If cache is enabled, build cache from class params
+                self.cache = await self._get_cache()
+                self.cache_controller = self._get_cache_controller()
+                self.cache_transport = self._get_cache_transport()
+            else:
+                ## Set all cache objects to None to disable
+                self.cache = None
+                self.cache_controller = None
+                self.cache_transport = None
+
+            ## Initialize httpx AsyncClient
+            self.client = self._get_client()
+
+        return self
+
+    async def aclose(self) -> None:
+        """Close the client, its connection pool, and the cache storage."""
+        async with self._lock:
+            if self.client is not None:
+                ## Closing the client closes the mounted transport & its cache storage
+                await self.client.aclose()
+
+            self.client = None
+            self.cache = None
+            self.cache_controller = None
+            self.cache_transport = None
+
+    async def __aenter__(self) -> t.Self:
+        await self.open()
+        self._depth += 1
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, traceback) -> t.Literal[False] | None:
+        self._depth = max(self._depth - 1, 0)
+
+        if self._depth == 0 and not self.persistent:
+            await self.aclose()
+
+        if exc_val:
+            msg = f"({exc_type}) {exc_val}"
+            self.logger.error(msg)
+
+            if traceback:
+                self.logger.error(f"Traceback: {traceback}")
+
+            return False
+
+        return
+
+    async def _get_cache(
+        self,
+    ) -> t.Union[hishel.AsyncSQLiteStorage, hishel.AsyncFileStorage] | None:
+        """Initialize hishel async cache storage."""
+        match self.cache_type:
+            case None:
+                return None
+            case "sqlite":
+                ## Get hishel async SQLite storage object
+                _cache: hishel.AsyncSQLiteStorage = (
+                    await cache.get_async_sqlite_cache_storage(
+                        cache_db_path=self.cache_db_file, ttl=self.cache_ttl
+                    )
+                )
+            case "file":
+                ## Get hishel async file storage object
+                _cache: hishel.AsyncFileStorage = cache.get_async_file_cache_storage(
+                    base_path=self.cache_file_dir,
+                    ttl=self.cache_ttl,
+                    check_ttl_every=self.check_ttl_every,
+                )
+            case _:
+                ## Unsupported cache type
+                log.error(f"Unrecognized cache type: {self.cache_type}")
+
+                return None
+
+        if self.memory_cache is not None:
+            ## Serve repeated lookups from memory before touching the storage
+            return cache.AsyncTieredStorage(backend=_cache, memory=self.memory_cache)
+
+        return _cache
+
+    def _get_cache_controller(self) -> hishel.Controller:
+        """Initialize hishel cache controller."""
+        _controller: hishel.Controller = cache.get_cache_controller(
+            force_cache=self.force_cache,
+            cacheable_methods=self.cacheable_methods,
+            cacheable_status_codes=self.cacheable_status_codes,
+            allow_heuristics=self.cache_allow_heuristics,
+            allow_stale=self.cache_allow_stale,
+        )
+
+        return _controller
+
+    def _use_http2(self) -> bool:
+        """Return `True` if HTTP/2 is enabled and the `h2` package is installed."""
+        if not self.http2:
+            return False
+
+        if importlib.util.find_spec("h2") is None:
+            self.logger.warning(
+                "HTTP/2 requested, but the h2 package is not installed. Falling back to HTTP/1.1. Install with: pip install httpx[http2]"
+            )
+
+            return False
+
+        return True
+
+    def _get_base_transport(self) -> httpx.AsyncBaseTransport:
+        """Return the pooled httpx.AsyncHTTPTransport built from the connection limits.
+
+        Description:
+            With a rate limiter, the transport is wrapped in an `AsyncRateLimitedTransport`, below
+            the cache transport.
+        """
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(
+            limits=limits, http2=self._use_http2()
+        )
+
+        if self.rate_limiter is not None:
+            return AsyncRateLimitedTransport(
+                transport=transport, rate_limiter=self.rate_limiter
+            )
+
+        return transport
+
+    def _get_cache_transport(self) -> hishel.AsyncCacheTransport | None:
+        """Initialize hishel async cache transport from class params."""
+        if self.cache is None:
+            return None
+
+        _transport: hishel.AsyncCacheTransport = cache.get_async_cache_transport(
+            transport_base=self._get_base_transport(),
+            cache_storage=self.cache,
+            cache_controller=self.cache_controller,
+        )
+
+        return _transport
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return an httpx.AsyncClient object initialized from class parameters."""
+        transport: hishel.AsyncCacheTransport | httpx.AsyncHTTPTransport = (
+            self.cache_transport or self._get_base_transport()
+        )
+
+        client_kwargs: dict[str, t.Any] = {
+            "transport": transport,
+            "follow_redirects": self.follow_redirects,
+        }
+        if self.timeout is not None:
+            client_kwargs["timeout"] = self.timeout
+
+        client = httpx.AsyncClient(**client_kwargs)
+
+        return client
+
+    async def send_request(
+        self, request: httpx.Request, retry_policy: RetryPolicy | None = None
+    ) -> httpx.Response:
+        """Send an httpx.Request using the shared client, opening it first if needed.
+
+        Params:
+            request (httpx.Request): The HTTP request to send.
+            retry_policy (RetryPolicy | None): Override the controller's retry policy for this request.
+
+        Returns:
+            httpx.Response: The HTTP response.
+
+        """
+        if not self.is_open:
+            ## Not inside 'async with' context: open & close around this request
+            async with self:
+                return await self._send(request, retry_policy)
+
+        return await self._send(request, retry_policy)
+
+    async def _send(
+        self, request: httpx.Request, retry_policy: RetryPolicy | None = None
+    ) -> httpx.Response:
+        """Send through the coalescer, if one is set."""
+        if self.coalescer is not None:
+            return await self.coalescer.send_async(
+                lambda req: self._send_retrying(req, retry_policy), request
+            )
+
+        return await self._send_retrying(request, retry_policy)
+
+    async def _send_retrying(
+        self, request: httpx.Request, retry_policy: RetryPolicy | None = None
+    ) -> httpx.Response:
+        """Send through the retry policy, if one is set."""
+        retry_policy = retry_policy or self.retry_policy
+        if retry_policy is not None:
+            return await retry_policy.send_async(self._send_once, request)
+
+        return await self._send_once(request)
+
+    async def _send_once(self, request: httpx.Request) -> httpx.Response:
+        """Send a single attempt. The rate limiter, if any, is applied by the transport."""
+        return await self.client.send(request)
@@ -0,0 +1,551 @@
+"""Client-side rate limiting & API quota accounting.
+
+Description:
+    `TokenBucket` smooths the request rate to a host (sync & async). `QuotaStore` keeps
+    per-minute & per-month call counters in a SQLite file, so a restart does not reset
+    the month's usage. `RateLimiter` combines both. `HttpxController` /
+    `AsyncHttpxController` wrap their network transport in `RateLimitedTransport` /
+    `AsyncRateLimitedTransport`, below the hishel cache, so only requests that actually
+    leave the process are limited & counted; cache hits are free.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+import typing as t
+
+log = logging.getLogger(__name__)
+
+from .config import HTTP_SETTINGS
+
+import httpx
+
+__all__ = [
+    "QuotaExceededError",
+    "TokenBucket",
+    "QuotaStore",
+    "RateLimiter",
+    "RateLimitedTransport",
+    "AsyncRateLimitedTransport",
+    "get_rate_limiter",
+]
+
+## Hosts limited when `[http] rate_limit_hosts` is unset. Other hosts (i.e. the API server
+#  the collector forwards to) must not spend the WeatherAPI quota.
+DEFAULT_RATE_LIMIT_HOSTS: list[str] = ["api.weatherapi.com"]
+
+## Supported quota windows
+QUOTA_PERIODS: tuple[str, ...] = ("minute", "month")
+
+## Process-wide limiter built from HTTP_SETTINGS
+_RATE_LIMITER: RateLimiter | None = None
+_RATE_LIMITER_LOCK: threading.Lock = threading.Lock()
+
+
+class QuotaExceededError(Exception):
+    """Raised when a request would exceed a quota that does not reset soon (i.e. monthly)."""
+
+    def __init__(self, name: str, period: str, limit: int, resets_at: dt.datetime):
+        self.name: str = name
+        self.period: str = period
+        self.limit: int = limit
+        self.resets_at: dt.datetime = resets_at
+
+        super().__init__(
+            f"Quota '{name}' exhausted for this {period} ({limit} calls). Resets at {resets_at.isoformat()}"
+        )
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Description:
+        The bucket holds up to `capacity` tokens and refills at `rate` tokens per second.
+        Each request takes one token; when the bucket is empty, callers wait for the
+        next token instead of bursting.
+
+    Params:
+        rate (float): Tokens added per second.
+        capacity (float | None): Maximum tokens (burst size). Defaults to `max(1, rate)`.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+
+        self.rate: float = float(rate)
+        self.capacity: float = float(capacity or max(1.0, rate))
+
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now: float = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently in the bucket."""
+        with self._lock:
+            self._refill()
+
+            return self._tokens
+
+    def _reserve(self, tokens: float) -> float:
+        """Take `tokens` now, going into debt if needed. Returns seconds to wait."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take `tokens` if they are available right now, without waiting."""
+        with self._lock:
+            self._refill()
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+
+            return False
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take `tokens`, blocking the thread until they are available.
+
+        Returns:
+            (float): Seconds spent waiting.
+
+        """
+        delay: float = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """Take `tokens`, sleeping on the event loop until they are available.
+
+        Returns:
+            (float): Seconds spent waiting.
+
+        """
+        delay: float = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+
+class QuotaStore:
+    """SQLite-backed call counters per quota name & window.
+
+    Description:
+        Rows are keyed by `(name, period, window)`, where `window` is the UTC minute
+        (`2025-01-31T13:05`) or month (`2025-01`) the call was made in. Old windows are
+        pruned as new ones are written.
+
+    Params:
+        db_file (str): Path to the SQLite database file. Use ":memory:" for a non-persistent store.
+    """
+
+    def __init__(self, db_file: str = ".cache/http/quota.sqlite3") -> None:
+        self.db_file: str = str(db_file)
+
+        if self.db_file != ":memory:":
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            self.db_file, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS quota_usage ("
+            "name TEXT NOT NULL, period TEXT NOT NULL, window TEXT NOT NULL, "
+            "used INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (name, period, window))"
+        )
+
+    @staticmethod
+    def window_for(period: str, now: dt.datetime | None = None) -> str:
+        """Return the window key for `period` at `now` (UTC)."""
+        now = now or dt.datetime.now(dt.timezone.utc)
+
+        match period:
+            case "minute":
+                return now.strftime("%Y-%m-%dT%H:%M")
+            case "month":
+                return now.strftime("%Y-%m")
+            case _:
+                raise ValueError(f"Unsupported quota period: {period}")
+
+    @staticmethod
+    def window_reset(period: str, now: dt.datetime | None = None) -> dt.datetime:
+        """Return when the current window for `period` ends (UTC)."""
+        now = now or dt.datetime.now(dt.timezone.utc)
+
+        match period:
+            case "minute":
+                return now.replace(second=0, microsecond=0) + dt.timedelta(minutes=1)
+            case "month":
+                first: dt.datetime = now.replace(
+                    day=1, hour=0, minute=0, second=0, microsecond=0
+                )
+                return (first + dt.timedelta(days=32)).replace(day=1)
+            case _:
+                raise ValueError(f"Unsupported quota period: {period}")
+
+    def used(self, name: str, period: str) -> int:
+        """Return calls counted for `name` in the current `period` window."""
+        window: str = self.window_for(period)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT used FROM quota_usage WHERE name = ? AND period = ? AND window = ?",
+                (name, period, window),
+            ).fetchone()
+
+        return row[0] if row else 0
+
+    def consume(self, name: str, limits: dict[str, int]) -> str | None:
+        """Count one call against every window in `limits`, if all have budget left.
+
+        Params:
+            name (str): The quota name, i.e. a host.
+            limits (dict[str, int]): Limit per period, i.e. `{"minute": 60, "month": 1000000}`.
+
+        Returns:
+            (str | None): `None` if the call was counted, otherwise the first exhausted period.
+
+        """
+        now: dt.datetime = dt.datetime.now(dt.timezone.utc)
+        windows: dict[str, str] = {p: self.window_for(p, now) for p in limits}
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+
+            try:
+                for period, limit in limits.items():
+                    row = self._conn.execute(
+                        "SELECT used FROM quota_usage WHERE name = ? AND period = ? AND window = ?",
+                        (name, period, windows[period]),
+                    ).fetchone()
+
+                    if row and row[0] >= limit:
+                        self._conn.execute("ROLLBACK")
+                        return period
+
+                for period, window in windows.items():
+                    self._conn.execute(
+                        "INSERT INTO quota_usage (name, period, window, used) VALUES (?, ?, ?, 1) "
+                        "ON CONFLICT (name, period, window) DO UPDATE SET used = used + 1",
+                        (name, period, window),
+                    )
+                    ## Drop counters from previous windows
+                    self._conn.execute(
+                        "DELETE FROM quota_usage WHERE name = ? AND period = ? AND window < ?",
+                        (name, period, window),
+                    )
+
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """Per-host token buckets plus optional persistent per-minute/per-month quotas.
+
+    Description:
+        `acquire(host)` waits for a token from the host's bucket, then counts the call against
+        the quotas. When the minute quota is spent, it waits for the next minute. When the
+        month quota is spent, it raises `QuotaExceededError` rather than sleeping for days.
+
+    Params:
+        requests_per_second (float | None): Steady request rate per host. `None` disables the token bucket.
+        burst (float | None): Bucket capacity. Defaults to `max(1, requests_per_second)`.
+        quota_per_minute (int | None): Calls allowed per UTC minute, per host.
+        quota_per_month (int | None): Calls allowed per UTC calendar month, per host.
+        quota_db_file (str): SQLite file holding quota counters.
+        hosts (list[str] | None): Only limit these hosts. `None` or empty limits every host.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        burst: float | None = None,
+        quota_per_minute: int | None = None,
+        quota_per_month: int | None = None,
+        quota_db_file: str = ".cache/http/quota.sqlite3",
+        hosts: list[str] | None = None,
+    ) -> None:
+        self.requests_per_second: float | None = requests_per_second
+        self.burst: float | None = burst
+        self.hosts: set[str] = {h.lower() for h in hosts or []}
+
+        self.quota_limits: dict[str, int] = {
+            period: int(limit)
+            for period, limit in (
+                ("minute", quota_per_minute),
+                ("month", quota_per_month),
+            )
+            if limit
+        }
+        self.quota_store: QuotaStore | None = (
+            QuotaStore(db_file=quota_db_file) if self.quota_limits else None
+        )
+
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+        ## Counters for metrics()
+        self._requests: dict[str, int] = {}
+        self._waited_seconds: dict[str, float] = {}
+
+    def applies_to(self, host: str) -> bool:
+        """`True` if requests to `host` are limited."""
+        return not self.hosts or host.lower() in self.hosts
+
+    def _get_bucket(self, host: str) -> TokenBucket | None:
+        if not self.requests_per_second:
+            return None
+
+        with self._lock:
+            bucket: TokenBucket | None = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(rate=self.requests_per_second, capacity=self.burst)
+                self._buckets[host] = bucket
+
+            return bucket
+
+    def _record(self, host: str, waited: float) -> None:
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+            self._waited_seconds[host] = self._waited_seconds.get(host, 0.0) + waited
+
+    def _consume_quota(self, host: str) -> float:
+        """Count the call against the quotas. Returns seconds to wait before retrying, 0 if counted."""
+        if self.quota_store is None:
+            return 0.0
+
+        exhausted: str | None = self.quota_store.consume(host, self.quota_limits)
+        if exhausted is None:
+            return 0.0
+
+        resets_at: dt.datetime = QuotaStore.window_reset(exhausted)
+        if exhausted != "minute":
+            raise QuotaExceededError(
+                name=host,
+                period=exhausted,
+                limit=self.quota_limits[exhausted],
+                resets_at=resets_at,
+            )
+
+        log.warning(
+            f"Minute quota for {host} exhausted, waiting until {resets_at.isoformat()}"
+        )
+
+        return max(0.0, (resets_at - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+    def acquire(self, host: str) -> float:
+        """Block until a request to `host` is allowed.
+
+        Returns:
+            (float): Seconds spent waiting.
+
+        Raises:
+            (QuotaExceededError): When the monthly quota for `host` is spent.
+
+        """
+        if not self.applies_to(host):
+            return 0.0
+
+        waited: float = 0.0
+        bucket: TokenBucket | None = self._get_bucket(host)
+
+        while True:
+            if bucket is not None:
+                waited += bucket.acquire()
+
+            delay: float = self._consume_quota(host)
+            if delay <= 0:
+                break
+
+            time.sleep(delay)
+            waited += delay
+
+        self._record(host, waited)
+
+        return waited
+
+    async def acquire_async(self, host: str) -> float:
+        """Wait on the event loop until a request to `host` is allowed.
+
+        Returns:
+            (float): Seconds spent waiting.
+
+        Raises:
+            (QuotaExceededError): When the monthly quota for `host` is spent.
+
+        """
+        if not self.applies_to(host):
+            return 0.0
+
+        waited: float = 0.0
+        bucket: TokenBucket | None = self._get_bucket(host)
+
+        while True:
+            if bucket is not None:
+                waited += await bucket.acquire_async()
+
+            ## The quota store is a SQLite file, keep its writes off the event loop
+            delay: float = (
+                await asyncio.to_thread(self._consume_quota, host)
+                if self.quota_store is not None
+                else 0.0
+            )
+            if delay <= 0:
+                break
+
+            await asyncio.sleep(delay)
+            waited += delay
+
+        self._record(host, waited)
+
+        return waited
+
+    def remaining(self, host: str) -> dict[str, int]:
+        """Return calls left in the current minute/month window for `host`."""
+        if self.quota_store is None:
+            return {}
+
+        return {
+            period: max(0, limit - self.quota_store.used(host, period))
+            for period, limit in self.quota_limits.items()
+        }
+
+    def metrics(self) -> dict[str, t.Any]:
+        """Return a snapshot of request counts, wait time, tokens & remaining quota per host."""
+        with self._lock:
+            hosts: set[str] = set(self._requests) | set(self._buckets)
+            requests: dict[str, int] = dict(self._requests)
+            waited: dict[str, float] = dict(self._waited_seconds)
+            buckets: dict[str, TokenBucket] = dict(self._buckets)
+
+        return {
+            host: {
+                "requests": requests.get(host, 0),
+                "waited_seconds": round(waited.get(host, 0.0), 3),
+                "tokens_available": (
+                    round(buckets[host].available, 3) if host in buckets else None
+                ),
+                "quota_remaining": self.remaining(host),
+            }
+            for host in sorted(hosts)
+        }
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Transport that waits for a `RateLimiter` before passing each request to the wrapped transport.
+
+    Description:
+        Mounted below the hishel cache transport, so responses served from the cache never
+        take a token or count against a quota.
+
+    Params:
+        transport (httpx.BaseTransport): The network transport to send requests with.
+        rate_limiter (RateLimiter): The limiter to wait for.
+    """
+
+    def __init__(
+        self, transport: httpx.BaseTransport, rate_limiter: RateLimiter
+    ) -> None:
+        self.transport: httpx.BaseTransport = transport
+        self.rate_limiter: RateLimiter = rate_limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        ## Wait for the per-host rate limit & count the call against the quota
+        self.rate_limiter.acquire(request.url.host)
+
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `RateLimitedTransport`.
+
+    Params:
+        transport (httpx.AsyncBaseTransport): The network transport to send requests with.
+        rate_limiter (RateLimiter): The limiter to wait for.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, rate_limiter: RateLimiter
+    ) -> None:
+        self.transport: httpx.AsyncBaseTransport = transport
+        self.rate_limiter: RateLimiter = rate_limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        ## Wait for the per-host rate limit & count the call against the quota
+        await self.rate_limiter.acquire_async(request.url.host)
+
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def get_rate_limiter() -> RateLimiter | None:
+    """Return the process-wide RateLimiter configured in `[http]` settings.
+
+    Description:
+        Reads `rate_limit_requests_per_second`, `rate_limit_burst`, `rate_limit_hosts`,
+        `quota_per_minute`, `quota_per_month` & `quota_db_file`. Returns `None` when no rate
+        or quota is configured. Without `rate_limit_hosts`, only `DEFAULT_RATE_LIMIT_HOSTS`
+        (WeatherAPI) are limited.
+    """
+    global _RATE_LIMITER
+
+    requests_per_second = HTTP_SETTINGS.get("RATE_LIMIT_REQUESTS_PER_SECOND", None)
+    quota_per_minute = HTTP_SETTINGS.get("QUOTA_PER_MINUTE", None)
+    quota_per_month = HTTP_SETTINGS.get("QUOTA_PER_MONTH", None)
+
+    if not (requests_per_second or quota_per_minute or quota_per_month):
+        return None
+
+    with _RATE_LIMITER_LOCK:
+        if _RATE_LIMITER is None:
+            _RATE_LIMITER = RateLimiter(
+                requests_per_second=requests_per_second,
+                burst=HTTP_SETTINGS.get("RATE_LIMIT_BURST", None),
+                quota_per_minute=quota_per_minute,
+                quota_per_month=quota_per_month,
+                quota_db_file=HTTP_SETTINGS.get(
+                    "QUOTA_DB_FILE", ".cache/http/quota.sqlite3"
+                ),
+                hosts=HTTP_SETTINGS.get("RATE_LIMIT_HOSTS", None)
+                or DEFAULT_RATE_LIMIT_HOSTS,
+            )
+
+        return _RATE_LIMITER
@@ -0,0 +1,301 @@
+"""Retry policy with exponential backoff, full jitter, and a shared retry budget.
+
+Description:
+    `RetryPolicy` wraps a "send once" callable and retries it on connect/read timeouts and
+    on retryable status codes (429 & 5xx by default). The wait before each retry is a random
+    value between 0 and `min(backoff_max, backoff_base * 2 ** attempt)` ("full jitter"), or the
+    server's `Retry-After`, whichever is longer.
+
+    Every policy draws retries from a `RetryBudget`. Each first attempt adds a fraction of a
+    token to the budget and each retry spends a whole token, so when a host is down the
+    number of retries stays a small fraction of normal traffic instead of multiplying it.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+from email.utils import parsedate_to_datetime
+import logging
+import random
+import threading
+import time
+import typing as t
+
+log = logging.getLogger(__name__)
+
+from .config import HTTP_SETTINGS
+
+import httpx
+
+__all__ = [
+    "RetryBudget",
+    "RetryPolicy",
+    "DEFAULT_RETRY_BUDGET",
+    "get_retry_policy",
+]
+
+## Status codes retried by default
+RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+## Methods retried by default. POST is excluded; it is not idempotent
+RETRY_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+## Exceptions retried by default
+RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.ConnectError,
+    httpx.RemoteProtocolError,
+)
+
+
+class RetryBudget:
+    """Thread-safe token budget limiting retries to a fraction of requests.
+
+    Params:
+        token_ratio (float): (default: 0.2) Tokens added per first attempt, i.e. allow retries for ~20% of requests.
+        max_tokens (float): (default: 10) Budget cap, also the starting balance.
+    """
+
+    def __init__(self, token_ratio: float = 0.2, max_tokens: float = 10) -> None:
+        self.token_ratio: float = token_ratio
+        self.max_tokens: float = max_tokens
+
+        self._tokens: float = max_tokens
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            return self._tokens
+
+    def deposit(self) -> None:
+        """Record a first attempt."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one token for a retry. Returns `False` if the budget is empty."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+
+            return False
+
+
+## Process-wide budget shared by every policy that does not bring its own
+DEFAULT_RETRY_BUDGET: RetryBudget = RetryBudget()
+
+
+class RetryPolicy:
+    """Retry configuration usable by both `HttpxController` & `AsyncHttpxController`.
+
+    Params:
+        max_retries (int): (default: 3) Retries after the first attempt. `0` disables retrying.
+        backoff_base (float): (default: 0.5) Backoff ceiling, in seconds, for the first retry. Doubles each retry.
+        backoff_max (float): (default: 30) Upper bound on the backoff ceiling.
+        retry_status_codes (Iterable[int] | None): Response codes to retry. Defaults to 429, 500, 502, 503, 504.
+        retry_methods (Iterable[str] | None): HTTP methods to retry. Defaults to idempotent methods (not POST/PATCH).
+        respect_retry_after (bool): (default: True) Wait at least the server's `Retry-After`.
+        max_retry_after (float): (default: 120) Give up instead of waiting longer than this for `Retry-After`.
+        budget (RetryBudget | None): Retry budget. Defaults to `DEFAULT_RETRY_BUDGET`.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        retry_status_codes: t.Iterable[int] | None = None,
+        retry_methods: t.Iterable[str] | None = None,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        self.max_retries: int = max(0, int(max_retries))
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.retry_status_codes: frozenset[int] = (
+            frozenset(retry_status_codes)
+            if retry_status_codes is not None
+            else RETRY_STATUS_CODES
+        )
+        self.retry_methods: frozenset[str] = (
+            frozenset(m.upper() for m in retry_methods)
+            if retry_methods is not None
+            else RETRY_METHODS
+        )
+        self.respect_retry_after: bool = respect_retry_after
+        self.max_retry_after: float = max_retry_after
+        self.budget: RetryBudget = budget or DEFAULT_RETRY_BUDGET
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter backoff, in seconds, for retry number `attempt` (0-based)."""
+        ceiling: float = min(self.backoff_max, self.backoff_base * (2**attempt))
+
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> float | None:
+        """Parse a `Retry-After` header (seconds or HTTP-date) into seconds, if present."""
+        value: str | None = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at: dt.datetime = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(0.0, (retry_at - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+    def _is_retryable_request(self, request: httpx.Request) -> bool:
+        return self.max_retries > 0 and request.method.upper() in self.retry_methods
+
+    def _next_delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        response: httpx.Response | None = None,
+        exc: Exception | None = None,
+    ) -> float | None:
+        """Return the delay before the next attempt, or `None` to stop retrying."""
+        if attempt >= self.max_retries:
+            return None
+
+        if exc is not None and not isinstance(exc, RETRY_EXCEPTIONS):
+            return None
+        if response is not None and response.status_code not in self.retry_status_codes:
+            return None
+
+        delay: float = self.backoff(attempt)
+
+        if response is not None and self.respect_retry_after:
+            retry_after: float | None = self.retry_after(response)
+
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    log.warning(
+                        f"Retry-After of {retry_after:.0f}s for {request.url.host} exceeds {self.max_retry_after:.0f}s, not retrying"
+                    )
+                    return None
+
+                delay = max(delay, retry_after)
+
+        if not self.budget.try_withdraw():
+            log.warning(
+                f"Retry budget exhausted, not retrying {request.method} {request.url.host}"
+            )
+            return None
+
+        reason: str = (
+            type(exc).__name__ if exc is not None else str(response.status_code)
+        )
+        log.info(
+            f"Retrying {request.method} {request.url.host} [{attempt + 1}/{self.max_retries}] after {reason} in {delay:.2f}s"
+        )
+
+        return delay
+
+    def send(
+        self,
+        send: t.Callable[[httpx.Request], httpx.Response],
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Send `request` with `send`, retrying according to the policy.
+
+        Params:
+            send (Callable[[httpx.Request], httpx.Response]): Sends the request once.
+            request (httpx.Request): The request to send.
+
+        Returns:
+            (httpx.Response): The last response. It may still have a retryable status if retries ran out.
+
+        Raises:
+            (httpx.HTTPError): The last exception, if retries ran out on a transport error.
+
+        """
+        self.budget.deposit()
+
+        if not self._is_retryable_request(request):
+            return send(request)
+
+        attempt: int = 0
+
+        while True:
+            try:
+                response: httpx.Response = send(request)
+            except Exception as exc:
+                delay: float | None = self._next_delay(request, attempt, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self._next_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    async def send_async(
+        self,
+        send: t.Callable[[httpx.Request], t.Awaitable[httpx.Response]],
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Async counterpart of `send()`. Sleeps on the event loop between attempts."""
+        self.budget.deposit()
+
+        if not self._is_retryable_request(request):
+            return await send(request)
+
+        attempt: int = 0
+
+        while True:
+            try:
+                response: httpx.Response = await send(request)
+            except Exception as exc:
+                delay: float | None = self._next_delay(request, attempt, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self._next_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def get_retry_policy(max_retries: int | None = None) -> RetryPolicy:
+    """Return a RetryPolicy configured from `[http]` settings.
+
+    Description:
+        Reads `retry_max_retries`, `retry_backoff_base`, `retry_backoff_max` &
+        `retry_max_retry_after`. All policies share `DEFAULT_RETRY_BUDGET`.
+
+    Params:
+        max_retries (int | None): Override `retry_max_retries`.
+
+    Returns:
+        (RetryPolicy): A retry policy.
+
+    """
+    return RetryPolicy(
+        max_retries=(
+            max_retries
+            if max_retries is not None
+            else HTTP_SETTINGS.get("RETRY_MAX_RETRIES", 3)
+        ),
+        backoff_base=HTTP_SETTINGS.get("RETRY_BACKOFF_BASE", 0.5),
+        backoff_max=HTTP_SETTINGS.get("RETRY_BACKOFF_MAX", 30),
+        max_retry_after=HTTP_SETTINGS.get("RETRY_MAX_RETRY_AFTER", 120),
+    )
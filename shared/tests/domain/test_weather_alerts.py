@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import copy
+import datetime as dt
+
+from shared.domain.weatherapi.weather import WeatherAlertIn, parse_weather_alerts
+
+## An `alerts` block as returned by /v1/forecast.json?alerts=yes
+_ALERT: dict = {
+    "headline": "Flood Warning issued January 05 at 9:47PM CST until January 07 at 6:15AM CST by NWS",
+    "msgtype": "Alert",
+    "severity": "Moderate",
+    "urgency": "Expected",
+    "areas": "Calhoun; Lafayette; Ouachita; Union",
+    "category": "Met",
+    "certainty": "Likely",
+    "event": "Flood Warning",
+    "note": "Alert for Calhoun; Lafayette; Ouachita; Union (Arkansas) Issued by the National Weather Service",
+    "effective": "2021-01-05T21:47:00-06:00",
+    "expires": "2021-01-07T06:15:00-06:00",
+    "desc": "...The Flood Warning continues for the following rivers in Arkansas...",
+    "instruction": "A Flood Warning means that flooding is imminent or occurring.",
+}
+
+
+def _forecast_json(*alerts: dict) -> dict:
+    return {
+        "location": {"name": "El Dorado", "region": "Arkansas"},
+        "forecast": {"forecastday": []},
+        "alerts": {"alert": list(alerts)},
+    }
+
+
+def test_parse_weather_alerts_reads_desc():
+    alerts: list[WeatherAlertIn] = parse_weather_alerts(_forecast_json(_ALERT))
+
+    assert len(alerts) == 1
+
+    row: dict = alerts[0].to_row()
+
+    assert row["description"] == _ALERT["desc"]
+    assert row["event"] == "Flood Warning"
+    assert row["effective"] == dt.datetime(2021, 1, 6, 3, 47, tzinfo=dt.timezone.utc)
+    assert row["expires"] == dt.datetime(2021, 1, 7, 12, 15, tzinfo=dt.timezone.utc)
+
+
+def test_content_hash_includes_description():
+    other: dict = copy.deepcopy(_ALERT)
+    other["desc"] = "...The Flood Warning is extended for the Ouachita River..."
+
+    alerts: list[WeatherAlertIn] = parse_weather_alerts(_forecast_json(_ALERT, other))
+
+    assert alerts[0].content_hash() != alerts[1].content_hash()
+
+
+def test_parse_weather_alerts_without_alerts():
+    assert parse_weather_alerts({"forecast": {"forecastday": []}}) == []
+    assert parse_weather_alerts({"alerts": {"alert": []}}) == []
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import typing as t
+
+import httpx
+import pytest
+from shared.http_lib import (
+    AsyncHttpxController,
+    HttpxController,
+    MemoryCacheTier,
+    RateLimiter,
+)
+
+_BODY: bytes = b'{"ok": true}'
+
+
+class _CacheableHandler(BaseHTTPRequestHandler):
+    """Answer every GET with a cacheable JSON body, counting the requests received."""
+
+    hits: int = 0
+
+    def do_GET(self) -> None:
+        type(self).hits += 1
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.send_header("Cache-Control", "max-age=300")
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def upstream() -> t.Generator[str, None, None]:
+    _CacheableHandler.hits = 0
+    server: ThreadingHTTPServer = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _CacheableHandler
+    )
+    thread: threading.Thread = threading.Thread(
+        target=server.serve_forever, daemon=True
+    )
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def _rate_limiter() -> RateLimiter:
+    return RateLimiter(
+        requests_per_second=100,
+        quota_per_minute=50,
+        quota_per_month=100,
+        quota_db_file=":memory:",
+        hosts=["127.0.0.1"],
+    )
+
+
+@pytest.mark.parametrize("memory_cache", [False, True])
+def test_cached_get_does_not_consume_quota(upstream, tmp_path, memory_cache):
+    rate_limiter: RateLimiter = _rate_limiter()
+    controller: HttpxController = HttpxController(
+        cache_type="sqlite",
+        cache_db_file=str(tmp_path / "hishel.sqlite3"),
+        rate_limiter=rate_limiter,
+        memory_cache=MemoryCacheTier() if memory_cache else None,
+    )
+
+    with controller:
+        first: httpx.Response = controller.send_request(
+            httpx.Request("GET", f"{upstream}/current")
+        )
+        remaining: dict[str, int] = rate_limiter.remaining("127.0.0.1")
+
+        for _ in range(3):
+            cached: httpx.Response = controller.send_request(
+                httpx.Request("GET", f"{upstream}/current")
+            )
+            assert cached.extensions.get("from_cache") is True
+
+    assert first.status_code == 200
+    assert remaining == {"minute": 49, "month": 99}
+    assert rate_limiter.remaining("127.0.0.1") == remaining
+    assert _CacheableHandler.hits == 1
+
+
+def test_async_cached_get_does_not_consume_quota(upstream, tmp_path):
+    rate_limiter: RateLimiter = _rate_limiter()
+
+    async def _run() -> None:
+        async with AsyncHttpxController(
+            cache_type="sqlite",
+            cache_db_file=str(tmp_path / "hishel.sqlite3"),
+            rate_limiter=rate_limiter,
+        ) as controller:
+            await controller.send_request(httpx.Request("GET", f"{upstream}/current"))
+            remaining: dict[str, int] = rate_limiter.remaining("127.0.0.1")
+
+            cached: httpx.Response = await controller.send_request(
+                httpx.Request("GET", f"{upstream}/current")
+            )
+
+            assert cached.extensions.get("from_cache") is True
+            assert rate_limiter.remaining("127.0.0.1") == remaining
+
+    asyncio.run(_run())
+
+    assert _CacheableHandler.hits == 1
+
+
+def test_unlisted_hosts_are_not_limited(upstream):
+    rate_limiter: RateLimiter = RateLimiter(
+        quota_per_month=100, quota_db_file=":memory:", hosts=["api.weatherapi.com"]
+    )
+
+    with HttpxController(
+        use_cache=False, cache_type=None, rate_limiter=rate_limiter
+    ) as controller:
+        controller.send_request(httpx.Request("GET", f"{upstream}/forward"))
+
+    assert rate_limiter.remaining("127.0.0.1") == {"month": 100}
+    assert rate_limiter.remaining("api.weatherapi.com") == {"month": 100}